@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Parallel Archive Ingest
+
+Rebuilding a derived history store means parsing every file in data/daily.
+This module parses the archive with a process pool (orjson when installed,
+json otherwise), validates each file and streams the parsed files, oldest
+first, into the selected stores:
+
+    store   ~/.cache/ttnn-perf/history.npz or $PERF_HISTORY_STORE (history_store.py)
+    series  data/history/series/            (op_series.py)
+    db      ~/.cache/ttnn-perf/perf_history.db or $PERF_HISTORY_DB (history_db.py)
+
+Invalid files are reported and skipped.
+
+    python archive_ingest.py backfill --targets store series db [--workers N]
+    python archive_ingest.py validate
+    python archive_ingest.py benchmark [--workers 1 2 4 8]
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from index_store import load_index
+from results_format import index_entry_path, normalize_results
+
+try:
+    import orjson
+    JSON_BACKEND = "orjson"
+except ImportError:
+    orjson = None
+    JSON_BACKEND = "json"
+
+TARGETS = ["store", "series", "db"]
+PROGRESS_EVERY = 100
+
+
+def _loads(raw: bytes):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def validate_results(data) -> List[str]:
+    """Problems that make a results file unusable for the history stores."""
+    if not isinstance(data, dict):
+        return ["top level is not an object"]
+    problems = []
+    metadata = data.get('metadata')
+    if not isinstance(metadata, dict):
+        problems.append("missing metadata")
+    elif not isinstance(metadata.get('measurement_date'), str):
+        problems.append("missing metadata.measurement_date")
+    results = data.get('results')
+    if not isinstance(results, list):
+        problems.append("missing results list")
+        return problems
+    for i, result in enumerate(results):
+        if not isinstance(result, dict) or not result.get('operation_name'):
+            problems.append(f"results[{i}] has no operation_name")
+            continue
+        average = result.get('average_duration_ns')
+        if average is not None and not isinstance(average, (int, float)):
+            problems.append(f"results[{i}] ({result['operation_name']}) has a non-numeric average")
+    return problems
+
+
+def parse_results_file(path: str, offset: int = 0, length: int = -1) -> Tuple[Optional[Dict], List[str]]:
+    """Read, parse and validate one results file or packed entry (runs in a worker process)."""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = normalize_results(_loads(f.read(length)))
+    except Exception as e:
+        return None, [f"could not parse: {e}"]
+    problems = validate_results(data)
+    return (None if problems else data), problems
+
+
+def list_archive(data_dir) -> List[Tuple[str, Path, int, int]]:
+    """(filename, path, offset, length) of every entry in the measurement index, oldest first.
+
+    Daily files are read whole (offset 0, length -1); packed entries are a
+    byte range of their monthly pack.
+    """
+    data_dir = Path(data_dir)
+    files = sorted(load_index(data_dir)['files'], key=lambda e: e.get('measurement_date', ''))
+    return [(entry['filename'], index_entry_path(data_dir, entry),
+             entry.get('pack_offset', 0), entry.get('pack_length', -1)) for entry in files]
+
+
+def iter_archive(data_dir, workers: Optional[int] = None, progress: bool = True,
+                 invalid: Optional[Dict[str, List[str]]] = None) -> Iterator[Tuple[str, Dict]]:
+    """Yield (filename, results data) for every valid archive file, oldest first.
+
+    workers=1 parses in this process. Problems with skipped files are
+    collected in invalid when given.
+    """
+    files = list_archive(data_dir)
+    paths = [str(path) for _, path, _, _ in files]
+    offsets = [offset for _, _, offset, _ in files]
+    lengths = [length for _, _, _, length in files]
+    workers = workers or os.cpu_count() or 1
+    start = time.time()
+
+    if workers == 1:
+        parsed = map(parse_results_file, paths, offsets, lengths)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        parsed = executor.map(parse_results_file, paths, offsets, lengths, chunksize=max(1, len(paths) // (workers * 8)))
+
+    try:
+        for done, ((filename, *_), (data, problems)) in enumerate(zip(files, parsed), 1):
+            if problems:
+                print(f"⚠️ Skipping {filename}: {'; '.join(problems[:3])}")
+                if invalid is not None:
+                    invalid[filename] = problems
+            else:
+                yield filename, data
+            if progress and (done % PROGRESS_EVERY == 0 or done == len(files)):
+                elapsed = time.time() - start
+                print(f"📥 {done}/{len(files)} files ({done / max(elapsed, 1e-9):.0f} files/s)")
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def backfill(data_dir, targets: List[str], workers: Optional[int] = None, db_path=None) -> int:
+    """Rebuild the selected stores from one parallel pass over the archive."""
+    data_dir = Path(data_dir)
+    loaded = list(iter_archive(data_dir, workers))
+
+    if 'store' in targets:
+        from history_store import HistoryStore, default_store_path
+        store_path = default_store_path()
+        HistoryStore.build_from_files(loaded).save(store_path)
+        print(f"📦 Rebuilt {store_path}")
+    if 'series' in targets:
+        from op_series import SERIES_DIR, OpSeriesStore
+        OpSeriesStore.build_from_files(data_dir / SERIES_DIR, loaded)
+        print(f"📈 Rebuilt {data_dir / SERIES_DIR}")
+    if 'db' in targets:
+        from history_db import default_db_path, insert_files
+        db_path = Path(db_path) if db_path else default_db_path()
+        insert_files(db_path, loaded)
+        print(f"🗄️ Loaded {db_path}")
+    return len(loaded)
+
+
+def benchmark(data_dir, worker_counts: List[int]) -> List[Dict]:
+    """Time a plain serial json.load pass against the pool at each worker count."""
+    files = list_archive(data_dir)
+    timings = []
+
+    start = time.time()
+    for _, path, offset, length in files:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            json.loads(f.read(length))
+    timings.append({'mode': 'serial json', 'workers': 1, 'seconds': time.time() - start})
+
+    for workers in worker_counts:
+        start = time.time()
+        count = sum(1 for _ in iter_archive(data_dir, workers, progress=False))
+        timings.append({'mode': f'pool {JSON_BACKEND}', 'workers': workers,
+                        'seconds': time.time() - start, 'files': count})
+    return timings
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Parallel ingest of the data/daily archive')
+    parser.add_argument('command', choices=['backfill', 'validate', 'benchmark'])
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    parser.add_argument('--targets', nargs='+', choices=TARGETS, default=TARGETS,
+                        help='Stores to rebuild (default: all)')
+    parser.add_argument('--workers', type=int, nargs='+',
+                        help='Worker processes (default: CPU count); several values for benchmark')
+    parser.add_argument('--db', help='SQLite database file for the db target')
+    args = parser.parse_args()
+
+    workers = args.workers[0] if args.workers else None
+    print(f"🔧 JSON parser: {JSON_BACKEND}, workers: {workers or os.cpu_count()}")
+
+    if args.command == 'backfill':
+        start = time.time()
+        count = backfill(args.data_dir, args.targets, workers, args.db)
+        print(f"✅ Ingested {count} files into {', '.join(args.targets)} in {time.time() - start:.1f}s")
+        return 0
+
+    if args.command == 'validate':
+        invalid: Dict[str, List[str]] = {}
+        count = sum(1 for _ in iter_archive(args.data_dir, workers, invalid=invalid))
+        print(f"{'✅' if not invalid else '❌'} {count} valid, {len(invalid)} invalid files")
+        return 1 if invalid else 0
+
+    timings = benchmark(args.data_dir, args.workers or [1, os.cpu_count() or 1])
+    print(f"\n📊 Archive parse benchmark ({len(list_archive(args.data_dir))} files)")
+    baseline = timings[0]['seconds']
+    for t in timings:
+        print(f"  {t['mode']:<14} workers={t['workers']:<3} {t['seconds']:>7.2f}s  "
+              f"({baseline / t['seconds']:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Commit-Range Attribution for Detected Changes
+
+Maps a detected change to the tt-metal commits that can have caused it:
+
+    range      last good .. first bad: the newest earlier measured commit
+               where the op was measured, and the commit where it changed
+               (commit order from the index)
+    expand     with a local tt-metal clone (--tt-metal or TT_METAL_HOME),
+               `git log good..bad --name-only` lists the commits in between
+               with their touched files filtered to eltwise/SFPU paths
+               (ELTWISE_PATHS; INFRA_PATHS too for infra-level shifts)
+    rank       score = weight of the most relevant touched path
+               + 0.5 per relevant file (up to 10)
+               + OP_MATCH_BONUS x share of the changed ops named in a
+               touched file or the subject; the top MAX_SUSPECTS with a
+               positive score are the suspects
+
+Without a clone only the range and its GitHub compare link are reported.
+check_perf_changes.py adds this to every alert card. The uploader writes it
+for the timeline events of the latest measurement (the index head) to
+data/timeline/attribution.json, which the dashboard shows; the ranges are
+empty when the latest upload changed nothing.
+
+    python attribution.py range GOOD BAD [--op exp ...] [--tt-metal ~/tt-metal]
+    python attribution.py latest [--tt-metal ~/tt-metal]
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from index_store import load_head, load_index
+
+TT_METAL_URL = "https://github.com/tenstorrent/tt-metal"
+ATTRIBUTION_PATH = Path("timeline") / "attribution.json"
+TIMELINE_EVENTS_PATH = Path("timeline") / "events.json"
+MAX_SUSPECTS = 3
+OP_MATCH_BONUS = 10.0
+# Ranges with this many changed ops are ranked with INFRA_PATHS (as change_clusters.MIN_SHIFT_OPS)
+INFRA_MIN_OPS = 5
+
+# (path fragment, weight) for files that can move eltwise timings
+ELTWISE_PATHS = [
+    ('llk_sfpu/', 5.0), ('ckernel_sfpu', 5.0), ('sfpu', 4.0), ('tt_llk', 4.0),
+    ('compute_kernel_api/eltwise', 3.0), ('operations/eltwise/', 3.0), ('eltwise', 2.0),
+    ('operations/reduction/', 2.0),
+]
+# Shared machinery behind shifts that hit a whole op family
+INFRA_PATHS = [
+    ('impl/dispatch/', 3.0), ('hw/firmware/', 3.0), ('tools/profiler/', 3.0), ('hw/inc/', 2.0),
+    ('impl/program/', 2.0), ('tt_metal/llrt/', 2.0),
+]
+_GIT_TIMEOUT = 60
+
+
+def ordered_commits(data_dir) -> List[str]:
+    """Measured commits from the index, oldest first, consecutive replicates collapsed."""
+    commits: List[str] = []
+    for entry in reversed(load_index(data_dir)['files']):
+        commit = entry.get('git_commit_id')
+        if commit and (not commits or commits[-1] != commit):
+            commits.append(commit)
+    return commits
+
+
+def previous_commit(commits: Sequence[str], bad: str) -> Optional[str]:
+    """The measured commit just before the newest occurrence of bad (prefix match)."""
+    for position in range(len(commits) - 1, 0, -1):
+        if commits[position].startswith(bad):
+            return commits[position - 1]
+    return None
+
+
+def last_measured_commit(history: List[Dict], op_name: str) -> Optional[str]:
+    """Newest commit before history[0] (result sets, newest first) in which op_name was measured."""
+    for data in history[1:]:
+        if any(r.get('operation_name') == op_name and r.get('successful_runs') for r in data.get('results', [])):
+            return data.get('metadata', {}).get('git_commit_id')
+    return None
+
+
+def compare_url(good: str, bad: str) -> str:
+    return f"{TT_METAL_URL}/compare/{good}...{bad}"
+
+
+def default_clone() -> Optional[str]:
+    """The tt-metal clone from TT_METAL_HOME, when it is a git checkout."""
+    path = os.environ.get('TT_METAL_HOME')
+    return path if path and (Path(path) / ".git").exists() else None
+
+
+def git_log_range(clone, good: str, bad: str) -> List[Dict]:
+    """Commits in good..bad of a local clone, newest first, with the files each touched."""
+    output = subprocess.run(
+        ['git', '-C', str(clone), 'log', '--no-color', '--format=%x1e%H%x1f%s%x1f%an%x1f%aI', '--name-only',
+         f'{good}..{bad}'],
+        capture_output=True, text=True, check=True, timeout=_GIT_TIMEOUT).stdout
+    commits = []
+    for record in output.split('\x1e')[1:]:
+        header, _, files = record.partition('\n')
+        sha, subject, author, date = header.split('\x1f')
+        commits.append({'sha': sha, 'subject': subject, 'author': author, 'date': date,
+                        'files': [f for f in files.splitlines() if f.strip()]})
+    return commits
+
+
+def path_weight(path: str, infra: bool = False) -> float:
+    """Weight of the most relevant fragment in path; 0 when it cannot touch eltwise timings."""
+    patterns = ELTWISE_PATHS + INFRA_PATHS if infra else ELTWISE_PATHS
+    path = path.lower()
+    return max((weight for fragment, weight in patterns if fragment in path), default=0.0)
+
+
+def _names_op(text: str, op_name: str) -> bool:
+    name = op_name.lower().rstrip('_')
+    if name.endswith('_bw'):
+        name = name[:-3]
+    return re.search(rf'(^|[^a-z0-9]){re.escape(name)}([^a-z0-9]|$)', text.lower()) is not None
+
+
+def score_commit(commit: Dict, op_names: Sequence[str], infra: bool = False) -> Tuple[float, List[str]]:
+    """(suspicion score, relevant touched files) of one commit."""
+    relevant = [(path, path_weight(path, infra)) for path in commit['files']]
+    relevant = [(path, weight) for path, weight in relevant if weight > 0]
+    if not relevant:
+        return 0.0, []
+    score = max(weight for _, weight in relevant) + 0.5 * min(len(relevant), 10)
+    texts = [commit['subject']] + [os.path.basename(path) for path, _ in relevant]
+    matched = sum(any(_names_op(text, op) for text in texts) for op in op_names)
+    if op_names:
+        score += OP_MATCH_BONUS * matched / len(op_names)
+    return score, [path for path, _ in relevant]
+
+
+def attribute(good: Optional[str], bad: str, op_names: Sequence[str], clone=None,
+              infra: bool = False, limit: int = MAX_SUSPECTS) -> Dict:
+    """Range, compare link and (with a clone) relevant commits and ranked suspects for one change."""
+    result = {'good_commit': good, 'bad_commit': bad, 'operation_names': list(op_names)}
+    if not good or good == bad:
+        return result
+    result['compare_url'] = compare_url(good, bad)
+    if not clone:
+        return result
+    try:
+        commits = git_log_range(clone, good, bad)
+    except Exception as e:
+        detail = (getattr(e, 'stderr', None) or str(e)).strip()
+        print(f"⚠️ Warning: Could not expand {good[:8]}..{bad[:8]} in {clone} (is the clone fetched?): {detail}")
+        return result
+
+    scored = []
+    for position, commit in enumerate(commits):
+        score, files = score_commit(commit, op_names, infra)
+        if score > 0:
+            scored.append((score, -position, {'sha': commit['sha'], 'subject': commit['subject'],
+                                              'author': commit['author'], 'date': commit['date'],
+                                              'score': round(score, 2), 'files': files}))
+    scored.sort(key=lambda s: s[:2], reverse=True)
+    result.update({
+        'commit_count': len(commits),
+        'relevant_commits': [entry for _, _, entry in scored],
+        'suspects': [entry for _, _, entry in scored[:limit]],
+    })
+    return result
+
+
+def describe_attribution(attribution: Dict, with_suspects: bool = True) -> str:
+    """One line for alerts: the range, its size and (optionally) the suspects."""
+    good, bad = attribution.get('good_commit'), attribution['bad_commit']
+    if not good:
+        return f"first measured at {bad[:8]}"
+    if good == bad:
+        return f"re-measurement of {bad[:8]} (no code change in between)"
+    text = f"{good[:8]}..{bad[:8]}"
+    if 'commit_count' in attribution:
+        text += (f" ({attribution['commit_count']} commits, "
+                 f"{len(attribution['relevant_commits'])} touching eltwise/SFPU paths)")
+        if with_suspects and attribution['suspects']:
+            text += "; suspects: " + ", ".join(f"{s['sha'][:8]} {s['subject'][:60]}" for s in attribution['suspects'])
+    return text
+
+
+def latest_attribution(data_dir, clone=None) -> Dict:
+    """Attribution of the latest measurement's timeline events, one entry per commit range."""
+    head_files = load_head(data_dir)['files']
+    latest = head_files[0] if head_files else {}
+    with open(Path(data_dir) / TIMELINE_EVENTS_PATH, 'r') as f:
+        events = json.load(f)['events']
+    ranges: Dict[Tuple[str, str], List[Dict]] = {}
+    for event in events:
+        # A commit point is dated by its newest measurement
+        if event['date'] == latest.get('measurement_date') and event['commit'] == latest.get('git_commit_id'):
+            ranges.setdefault((event['previous_commit'], event['commit']), []).append(event)
+
+    entries = []
+    for (good, bad), range_events in ranges.items():
+        names = [event['operation_name'] for event in range_events]
+        entry = attribute(good, bad, names, clone, infra=len(names) >= INFRA_MIN_OPS)
+        entry['events'] = [{k: event[k] for k in ('operation_name', 'change_type', 'change_percent')}
+                           for event in range_events]
+        entries.append(entry)
+    entries.sort(key=lambda e: len(e['events']), reverse=True)
+    return {'generated': datetime.now().isoformat(), 'measurement_date': latest.get('measurement_date'),
+            'commit': latest.get('git_commit_id'), 'expanded': bool(clone), 'ranges': entries}
+
+
+def update_attribution(data_dir, clone=None) -> Path:
+    """Write data/timeline/attribution.json for the latest measurement (the uploader runs it after the timeline)."""
+    document = latest_attribution(data_dir, clone or default_clone())
+    path = Path(data_dir) / ATTRIBUTION_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Attribute performance changes to tt-metal commit ranges')
+    parser.add_argument('command', choices=['range', 'latest'])
+    parser.add_argument('commits', nargs='*', help='range: [GOOD] BAD (GOOD defaults to the measured commit before BAD)')
+    parser.add_argument('--op', action='append', default=[], help='Changed operation (repeatable)')
+    parser.add_argument('--tt-metal', default=default_clone(), help='Local tt-metal clone (default: TT_METAL_HOME)')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    if args.command == 'latest':
+        path = update_attribution(args.data_dir, args.tt_metal)
+        with open(path, 'r') as f:
+            document = json.load(f)
+        print(f"🔎 {len(document['ranges'])} commit range(s) for {document['measurement_date']} → {path}")
+        for entry in document['ranges']:
+            print(f"  {len(entry['events'])} op(s): {describe_attribution(entry)}")
+        return 0
+
+    if not 1 <= len(args.commits) <= 2:
+        print("❌ range needs BAD or GOOD BAD")
+        return 1
+    bad = args.commits[-1]
+    good = args.commits[0] if len(args.commits) == 2 else previous_commit(ordered_commits(args.data_dir), bad)
+    attribution = attribute(good, bad, args.op, args.tt_metal, infra=len(args.op) >= INFRA_MIN_OPS)
+    print(f"🔎 {describe_attribution(attribution)}")
+    if attribution.get('compare_url'):
+        print(f"   {attribution['compare_url']}")
+    for suspect in attribution.get('suspects', []):
+        print(f"   {suspect['score']:>5.1f}  {suspect['sha'][:8]} {suspect['subject']}")
+        for path in suspect['files'][:5]:
+            print(f"          {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Rolling-Baseline Regression Detector
+
+Comparing the newest measurement with the one before it turns a single noisy
+run into a false improvement followed by a false regression. This detector
+compares the newest point with the median of the WINDOW points before it:
+
+    unit 'commit'   points are commits, replicates pooled (commit_view.py)
+    unit 'file'     points are individual measurement files
+
+Only the newest WINDOW + 1 points are loaded, from the index head when it
+covers them. Their per-op averages form an (ops x points) matrix, newest
+column first, and baselines, sample counts and changes are computed for all
+ops at once. Ops with fewer than MIN_BASELINE_POINTS earlier values are
+skipped. check_perf_changes.py uses this for PERF_COMPARE_BY=baseline.
+
+After a real step the window median stays at the old level for about half
+the window, so every following point crosses the threshold again. Only the
+first crossing is reported: an op the previous upload's evaluation (the
+same window with the newest file left out, load_recent(skip_files=1))
+already flagged in the same direction is dropped while its newest value
+stays within the threshold of the value flagged then. That also covers
+intraday reruns of a flagged commit, whose pooled point would cross again;
+a second step on top of the first is still reported.
+
+    python baseline_detector.py [--window 10] [--unit commit|file] [--threshold 20]
+"""
+
+import sys
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from commit_view import latest_commit_views
+from index_store import load_head, load_index
+from results_format import load_index_entry
+
+DEFAULT_WINDOW = 10
+BASELINE_UNITS = ['commit', 'file']
+MIN_BASELINE_POINTS = 3
+
+
+def load_recent(data_dir, count: int, unit: str = 'commit', skip_files: int = 0) -> List[Dict]:
+    """The newest count result sets, newest first, as they were skip_files uploads ago."""
+    if unit == 'commit':
+        return latest_commit_views(data_dir, count, skip_files)
+
+    head = load_head(data_dir)
+    files = head.get('files', [])
+    if len(files) < count + skip_files and len(files) < head.get('total_measurements', len(files)):
+        files = load_index(data_dir)['files']
+    recent = []
+    for entry in files[skip_files:skip_files + count]:
+        try:
+            recent.append(load_index_entry(data_dir, entry))
+        except Exception as e:
+            print(f"⚠️ Warning: Could not load {entry.get('filename')}: {e}")
+    return recent
+
+
+def history_matrix(history: List[Dict]) -> Tuple[List[str], np.ndarray]:
+    """(op names, ops x points matrix of average durations); NaN where an op was not measured."""
+    ops: Dict[str, int] = {}
+    cells = []
+    for column, data in enumerate(history):
+        for result in data.get('results', []):
+            value = result.get('average_duration_ns')
+            if value is None or not result.get('successful_runs'):
+                continue
+            cells.append((ops.setdefault(result['operation_name'], len(ops)), column, value))
+
+    matrix = np.full((len(ops), len(history)), np.nan)
+    if cells:
+        rows, columns, values = zip(*cells)
+        matrix[list(rows), list(columns)] = values
+    return list(ops), matrix
+
+
+def is_repeat(change: Dict, previous_change: Optional[Dict], threshold_percent: float) -> bool:
+    """Whether change is the level previous_change already flagged (same direction, within the threshold)."""
+    if not previous_change or (change['change_percent'] > 0) != (previous_change['change_percent'] > 0):
+        return False
+    flagged_level = previous_change['latest_avg_ns']
+    return abs(change['latest_avg_ns'] - flagged_level) < threshold_percent / 100 * flagged_level
+
+
+def first_crossings(changes: List[Dict], previous_changes: List[Dict], threshold_percent: float) -> List[Dict]:
+    """changes without the ones that repeat a change previous_changes already flagged."""
+    previous = {change['operation_name']: change for change in previous_changes}
+    return [change for change in changes
+            if not is_repeat(change, previous.get(change['operation_name']), threshold_percent)]
+
+
+def baseline_changes(history: List[Dict], threshold_percent: float,
+                     min_points: int = MIN_BASELINE_POINTS,
+                     previous: Optional[List[Dict]] = None) -> List[Dict]:
+    """Ops whose newest value is threshold_percent or more away from the median of the rest.
+
+    previous is the history the last evaluation saw (newest first); ops it
+    already flagged in the same direction are left out while they stay at
+    the flagged level.
+    """
+    if previous:
+        return first_crossings(baseline_changes(history, threshold_percent, min_points),
+                               baseline_changes(previous, threshold_percent, min_points), threshold_percent)
+    ops, matrix = history_matrix(history)
+    if matrix.shape[1] < 2:
+        return []
+    latest = matrix[:, 0]
+    earlier = matrix[:, 1:]
+    counts = np.count_nonzero(~np.isnan(earlier), axis=1)
+    with warnings.catch_warnings():
+        # Ops never measured earlier have an all-NaN row
+        warnings.simplefilter('ignore', RuntimeWarning)
+        baselines = np.nanmedian(earlier, axis=1)
+        change_percent = (latest - baselines) / baselines * 100
+
+    flagged = (~np.isnan(latest) & (counts >= min_points) & (baselines > 0) &
+               (np.abs(change_percent) >= threshold_percent))
+    return [{'operation_name': ops[row], 'latest_avg_ns': float(latest[row]),
+             'baseline_ns': float(baselines[row]), 'change_percent': float(change_percent[row]),
+             'baseline_points': int(counts[row])}
+            for row in np.flatnonzero(flagged)]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compare the latest measurement with a rolling median baseline')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='Earlier points in the baseline')
+    parser.add_argument('--unit', choices=BASELINE_UNITS, default='commit', help='Baseline points')
+    parser.add_argument('--threshold', type=float, default=20.0, help='Percentage change threshold')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    history = load_recent(args.data_dir, args.window + 1, args.unit)
+    if len(history) < 2:
+        print(f"⚠️ Not enough data to compare. Found {len(history)} {args.unit}(s).")
+        return 1
+    previous = load_recent(args.data_dir, args.window + 1, args.unit, skip_files=1)
+    changes = baseline_changes(history, args.threshold, previous=previous)
+    print(f"📊 {len(changes)} op(s) changed ≥{args.threshold}% vs the median of the last "
+          f"{len(history) - 1} {args.unit}s")
+    for change in sorted(changes, key=lambda c: abs(c['change_percent']), reverse=True):
+        symbol = "📉" if change['change_percent'] > 0 else "📈"
+        print(f"{symbol} {change['operation_name']}: {change['change_percent']:+.2f}% "
+              f"({change['baseline_ns']:.2f}ns → {change['latest_avg_ns']:.2f}ns, "
+              f"{change['baseline_points']} points)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Infra-Level Shift Clustering
+
+When 150 unary ops all move 25% at once the cause is nearly always one
+shared change (dispatch, profiler, firmware), not 150 op regressions. This
+clusters the flagged changes of one comparison:
+
+    family      the op's family from eltwise_op_registry.py (unary, binary,
+                ternary, reduction, complex; all *_bw ops are 'backward'),
+                'other' for unregistered names; regressions and
+                improvements are clustered separately
+    magnitude   within a family, sorted log changes split wherever
+                neighbours are more than MAGNITUDE_GAP apart
+    co-movement each op's profile over the history window (log deviation
+                from its window median at every point) is correlated with
+                the cluster's median profile in one matrix product; ops
+                below MIN_CORRELATION leave the cluster
+
+Clusters of at least MIN_SHIFT_OPS ops are reported as one infra-level shift;
+everything else stays an isolated per-op change. check_perf_changes.py uses
+this to send one card per shift instead of one per op.
+
+    python change_clusters.py [--window 10] [--unit commit|file] [--threshold 20]
+"""
+
+import sys
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from baseline_detector import BASELINE_UNITS, DEFAULT_WINDOW, baseline_changes, history_matrix, load_recent
+from eltwise_op_registry import OP_SPECS
+
+MAGNITUDE_GAP = 0.05
+MIN_SHIFT_OPS = 5
+MIN_CORRELATION = 0.8
+
+
+def op_family(name: str) -> str:
+    """The op's family: its registry category, 'backward' for *_bw ops, or 'other'."""
+    spec = OP_SPECS.get(name)
+    if spec is None:
+        return 'backward' if name.endswith('_bw') else 'other'
+    return 'backward' if spec.backward else spec.category
+
+
+def magnitude_groups(log_changes: np.ndarray, gap: float = MAGNITUDE_GAP) -> np.ndarray:
+    """Single-linkage labels of 1-D values: a new group starts at every gap wider than gap."""
+    order = np.argsort(log_changes)
+    breaks = np.concatenate([[0], np.diff(log_changes[order]) > gap]).cumsum()
+    labels = np.empty(len(log_changes), dtype=int)
+    labels[order] = breaks
+    return labels
+
+
+def movement_profiles(history: List[Dict], names: List[str]) -> np.ndarray:
+    """(names x points) log deviation of each op from its window median; 0 where unmeasured."""
+    ops, matrix = history_matrix(history)
+    rows = {op: row for row, op in enumerate(ops)}
+    profiles = np.full((len(names), matrix.shape[1]), np.nan)
+    present = [i for i, name in enumerate(names) if name in rows]
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        logs = np.log(matrix[[rows[names[i]] for i in present]])
+        profiles[present] = logs - np.nanmedian(logs, axis=1, keepdims=True)
+    return np.nan_to_num(profiles, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def correlations(profiles: np.ndarray) -> np.ndarray:
+    """Pearson correlation of every row with the median row; 1 where there is no variation to test."""
+    centre = np.median(profiles, axis=0)
+    rows = profiles - profiles.mean(axis=1, keepdims=True)
+    centre = centre - centre.mean()
+    norms = np.linalg.norm(rows, axis=1) * np.linalg.norm(centre)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(norms > 0, rows @ centre / norms, 1.0)
+
+
+def cluster_changes(changes: List[Dict], history: Optional[List[Dict]] = None,
+                    min_ops: int = MIN_SHIFT_OPS, gap: float = MAGNITUDE_GAP,
+                    min_correlation: float = MIN_CORRELATION) -> Tuple[List[Dict], List[Dict]]:
+    """Split flagged changes into infra-level shifts and isolated changes.
+
+    history (newest first) is the window the co-movement is checked over;
+    without it (or with fewer than three points) only family and magnitude
+    are used. Changes in a shift get its index as 'shift_id'.
+    """
+    if len(changes) < min_ops:
+        return [], changes
+    names = [change['operation_name'] for change in changes]
+    log_changes = np.log1p(np.array([change['change_percent'] for change in changes]) / 100)
+    profiles = movement_profiles(history, names) if history and len(history) >= 3 else None
+
+    keys = [(op_family(name), change['change_type']) for name, change in zip(names, changes)]
+    found = []
+    for key in sorted(set(keys)):
+        members = np.array([i for i, k in enumerate(keys) if k == key])
+        if len(members) < min_ops:
+            continue
+        labels = magnitude_groups(log_changes[members], gap)
+        for label in np.unique(labels):
+            group = members[labels == label]
+            if len(group) < min_ops:
+                continue
+            scores = correlations(profiles[group]) if profiles is not None else np.ones(len(group))
+            group, scores = group[scores >= min_correlation], scores[scores >= min_correlation]
+            if len(group) >= min_ops:
+                found.append((key, group, scores))
+
+    shifts = []
+    for (family, change_type), group, scores in sorted(found, key=lambda f: len(f[1]), reverse=True):
+        percents = np.expm1(log_changes[group]) * 100
+        for i in group:
+            changes[i]['shift_id'] = len(shifts)
+        shifts.append({
+            'family': family, 'change_type': change_type, 'count': int(len(group)),
+            'operation_names': sorted(names[i] for i in group),
+            'median_change_percent': float(np.median(percents)),
+            'min_change_percent': float(percents.min()), 'max_change_percent': float(percents.max()),
+            'median_correlation': float(np.median(scores)),
+        })
+    return shifts, [change for change in changes if 'shift_id' not in change]
+
+
+def describe_shift(shift: Dict) -> str:
+    """One line such as 'Infra-level shift affecting 150 unary ops: +25.1% (+22.0% to +28.3%)'."""
+    return (f"Infra-level shift affecting {shift['count']} {shift['family']} ops: "
+            f"{shift['median_change_percent']:+.1f}% "
+            f"({shift['min_change_percent']:+.1f}% to {shift['max_change_percent']:+.1f}%)")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Cluster the latest changes into infra-level shifts')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='Earlier points in the baseline')
+    parser.add_argument('--unit', choices=BASELINE_UNITS, default='commit', help='Baseline points')
+    parser.add_argument('--threshold', type=float, default=20.0, help='Percentage change threshold')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    history = load_recent(args.data_dir, args.window + 1, args.unit)
+    if len(history) < 2:
+        print(f"⚠️ Not enough data to compare. Found {len(history)} {args.unit}(s).")
+        return 1
+    changes = [dict(change, change_type='regression' if change['change_percent'] > 0 else 'improvement')
+               for change in baseline_changes(history, args.threshold)]
+    shifts, isolated = cluster_changes(changes, history)
+    print(f"📊 {len(changes)} op(s) changed ≥{args.threshold}%: {len(shifts)} infra-level shift(s), "
+          f"{len(isolated)} isolated")
+    for shift in shifts:
+        print(f"🏗️ {describe_shift(shift)}")
+    for change in sorted(isolated, key=lambda c: abs(c['change_percent']), reverse=True):
+        symbol = "📉" if change['change_type'] == 'regression' else "📈"
+        print(f"{symbol} {change['operation_name']}: {change['change_percent']:+.2f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Change-Point Detection over Every Op's Full History
+
+Pairwise comparisons miss a step that arrives over several noisy runs. This
+splits each op's average-duration series (from the columnar history store)
+into segments of constant level by binary segmentation on log durations:
+
+    split      the position maximising the mean-shift gain
+               k (n - k) / n * (mean_left - mean_right)^2
+    accept     gain > PENALTY * log(n) * sigma^2 and the shift is at least
+               MIN_SHIFT, with segments of at least MIN_SEGMENT points;
+               sigma is the op's robust noise level from first differences
+    batch      every pending (op, segment) pair is scored in one padded numpy
+               pass per round, so all ops are segmented together
+
+Results go to data/history/change_points.json: per op, the segments (dates,
+first/last commit, points, mean and median duration) and the change points
+between them with the commit range (last commit of the old level, first
+commit of the new one) and the change in percent.
+
+`build` segments the whole archive. `update` (run by the uploader) keeps
+every closed segment and re-segments only each op's last, open segment with
+the new data, so it stays cheap as history grows.
+
+    python change_points.py build [--data-dir data]
+    python change_points.py update
+    python change_points.py show [op] [--limit 20]
+"""
+
+import json
+import sys
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from history_store import HistoryStore, load_store
+
+CHANGE_POINTS_PATH = Path("history") / "change_points.json"
+PENALTY = 3.0
+MIN_SEGMENT = 3
+MIN_SHIFT = 0.02
+# Noise floor (relative) so near-constant ops do not split on rounding
+MIN_SIGMA = 0.002
+
+
+def _pad(series: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack 1-D arrays into a zero-padded matrix; returns (matrix, lengths)."""
+    lengths = np.array([len(s) for s in series], dtype=np.int64)
+    matrix = np.zeros((len(series), int(lengths.max()) if len(series) else 0))
+    for row, values in enumerate(series):
+        matrix[row, :len(values)] = values
+    return matrix, lengths
+
+
+def noise_levels(series: List[np.ndarray]) -> np.ndarray:
+    """Robust per-series noise (std of one point) from first differences, floored at MIN_SIGMA."""
+    diffs, lengths = _pad([np.diff(s) for s in series])
+    diffs[np.arange(diffs.shape[1]) >= lengths[:, None]] = np.nan
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        centre = np.nanmedian(diffs, axis=1)
+        sigma = 1.4826 * np.nanmedian(np.abs(diffs - centre[:, None]), axis=1) / np.sqrt(2)
+    return np.maximum(np.nan_to_num(sigma), MIN_SIGMA)
+
+
+def best_splits(segments: List[np.ndarray], min_size: int = MIN_SEGMENT) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Best single split of every segment at once: (split position, gain, level shift).
+
+    Position k puts the first k points on the left. Segments too short to
+    split get gain -inf.
+    """
+    values, lengths = _pad(segments)
+    n = lengths[:, None].astype(float)
+    cumulative = np.cumsum(values, axis=1)
+    total = cumulative[np.arange(len(segments)), lengths - 1][:, None]
+    k = np.arange(1, values.shape[1] + 1, dtype=float)[None, :]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        left = cumulative / k
+        right = (total - cumulative) / (n - k)
+        gain = k * (n - k) / n * (left - right) ** 2
+    gain[(k < min_size) | (n - k < min_size)] = -np.inf
+    best = np.argmax(gain, axis=1)
+    rows = np.arange(len(segments))
+    return best + 1, gain[rows, best], right[rows, best] - left[rows, best]
+
+
+def segment_series(series: List[np.ndarray], sigmas: np.ndarray, penalty: float = PENALTY,
+                   min_size: int = MIN_SEGMENT, min_shift: float = MIN_SHIFT,
+                   history_lengths: Optional[List[int]] = None) -> List[List[int]]:
+    """Binary segmentation of several log-value series; returns each one's boundary positions.
+
+    history_lengths sets the log(n) penalty when a series is the tail of a
+    longer history, so tails are held to the same standard as full series.
+    """
+    boundaries: List[List[int]] = [[] for _ in series]
+    lengths = history_lengths if history_lengths is not None else [len(s) for s in series]
+    thresholds = penalty * np.log(np.maximum(lengths, 2)) * sigmas ** 2
+    pending = [(index, 0, len(values)) for index, values in enumerate(series) if len(values) >= 2 * min_size]
+    min_log_shift = np.log1p(min_shift)
+    while pending:
+        positions, gains, shifts = best_splits([series[i][start:end] for i, start, end in pending], min_size)
+        next_round = []
+        for (index, start, end), k, gain, shift in zip(pending, positions, gains, shifts):
+            if gain <= thresholds[index] or abs(shift) < min_log_shift:
+                continue
+            split = start + int(k)
+            boundaries[index].append(split)
+            next_round.extend(part for part in [(index, start, split), (index, split, end)]
+                              if part[2] - part[1] >= 2 * min_size)
+        pending = next_round
+    return [sorted(b) for b in boundaries]
+
+
+def _describe(values: np.ndarray, dates: List[str], commits: List[str], boundaries: List[int]) -> Dict:
+    """Segments and change points of one op from its raw values and boundaries."""
+    edges = [0] + boundaries + [len(values)]
+    segments = []
+    for start, end in zip(edges, edges[1:]):
+        level = values[start:end]
+        segments.append({
+            'start_date': dates[start], 'end_date': dates[end - 1],
+            'first_commit': commits[start], 'last_commit': commits[end - 1],
+            'points': int(end - start),
+            'mean_ns': float(level.mean()), 'median_ns': float(np.median(level)),
+        })
+    return {'segments': segments, 'change_points': _change_points(segments)}
+
+
+def _change_points(segments: List[Dict]) -> List[Dict]:
+    """One change point per boundary; the commit range brackets the commit that moved the level."""
+    return [{
+        'date': after['start_date'],
+        'commit_range': [before['last_commit'], after['first_commit']],
+        'before_ns': before['median_ns'], 'after_ns': after['median_ns'],
+        'change_percent': (after['median_ns'] - before['median_ns']) / before['median_ns'] * 100,
+    } for before, after in zip(segments, segments[1:])]
+
+
+def detect(store: HistoryStore, since: Optional[Dict[str, str]] = None,
+           penalty: float = PENALTY, min_size: int = MIN_SEGMENT, min_shift: float = MIN_SHIFT) -> Dict[str, Dict]:
+    """Segment every op in the store; since limits an op to measurements from that date on."""
+    since = since or {}
+    matrix = store.metrics['average_duration_ns']
+    dates = np.array(store.dates)
+    names, raw, logs, columns = [], [], [], []
+    for row, op in enumerate(store.ops):
+        mask = ~np.isnan(matrix[row]) & (matrix[row] > 0)
+        values = matrix[row][mask]
+        if len(values) == 0:
+            continue
+        names.append(op)
+        raw.append(values)
+        logs.append(np.log(values))
+        columns.append(np.flatnonzero(mask))
+
+    # Noise comes from the whole series; segmentation only covers the tail after since
+    sigmas = noise_levels(logs) if logs else np.zeros(0)
+    offsets = [int(np.searchsorted(dates[cols], since[op])) if op in since else 0
+               for op, cols in zip(names, columns)]
+    tails = [values[offset:] for values, offset in zip(logs, offsets)]
+    boundaries = (segment_series(tails, sigmas, penalty, min_size, min_shift, [len(v) for v in logs])
+                  if tails else [])
+
+    results = {}
+    for op, values, cols, offset, op_boundaries in zip(names, raw, columns, offsets, boundaries):
+        if offset >= len(values):
+            continue
+        results[op] = _describe(values[offset:], [store.dates[c] for c in cols[offset:]],
+                                [store.commits[c] for c in cols[offset:]], op_boundaries)
+    return results
+
+
+def _document(store: HistoryStore, ops: Dict[str, Dict]) -> Dict:
+    return {
+        'metadata': {'penalty': PENALTY, 'min_segment': MIN_SEGMENT, 'min_shift': MIN_SHIFT,
+                     'measurements': store.num_measurements,
+                     'last_measurement_date': store.dates[-1] if store.dates else None,
+                     'updated': datetime.now().isoformat()},
+        'ops': ops,
+    }
+
+
+def build(store: HistoryStore) -> Dict:
+    """Segment the whole history of every op."""
+    return _document(store, detect(store))
+
+
+def update(document: Dict, store: HistoryStore) -> Dict:
+    """Re-segment each op's open (last) segment with the store's newer data; closed segments are kept."""
+    previous = document.get('ops', {})
+    since = {op: entry['segments'][-1]['start_date'] for op, entry in previous.items() if entry['segments']}
+    tails = detect(store, since)
+
+    ops = {}
+    for op in sorted(set(previous) | set(tails)):
+        if op not in tails:
+            ops[op] = previous[op]
+            continue
+        closed = previous[op]['segments'][:-1] if op in since else []
+        segments = closed + tails[op]['segments']
+        ops[op] = {'segments': segments, 'change_points': _change_points(segments)}
+    return _document(store, ops)
+
+
+def load_change_points(path) -> Dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_change_points(document: Dict, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(document, f, separators=(',', ':'))
+    tmp_path.replace(path)
+
+
+def update_change_points(data_dir, store: Optional[HistoryStore] = None) -> Path:
+    """Re-segment each op's open segment in data/history/change_points.json with the store's new points.
+
+    Every op is segmented from scratch when the file does not exist yet.
+    """
+    data_dir = Path(data_dir)
+    store = store or load_store(data_dir)
+    path = data_dir / CHANGE_POINTS_PATH
+    document = update(load_change_points(path), store) if path.exists() else build(store)
+    save_change_points(document, path)
+    return path
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Change-point detection over every op history')
+    parser.add_argument('command', choices=['build', 'update', 'show'])
+    parser.add_argument('operation', nargs='?', help='Operation name for show')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    parser.add_argument('--limit', type=int, default=20, help='Latest change points to show across ops')
+    args = parser.parse_args()
+
+    data_dir = Path(args.data_dir)
+    path = data_dir / CHANGE_POINTS_PATH
+
+    if args.command in ('build', 'update'):
+        start = time.time()
+        store = load_store(data_dir)
+        if args.command == 'update' and path.exists():
+            document = update(load_change_points(path), store)
+        else:
+            document = build(store)
+        save_change_points(document, path)
+        found = sum(len(op['change_points']) for op in document['ops'].values())
+        print(f"✅ {found} change points across {len(document['ops'])} ops "
+              f"({store.num_measurements} measurements) in {time.time() - start:.2f}s → {path}")
+        return 0
+
+    if not path.exists():
+        print(f"❌ {path} not found; run 'python change_points.py build' first")
+        return 1
+    document = load_change_points(path)
+    if args.operation:
+        entry = document['ops'].get(args.operation)
+        if entry is None:
+            print(f"❌ No change points for '{args.operation}'")
+            return 1
+        print(f"📈 {args.operation}: {len(entry['segments'])} segment(s)")
+        for segment in entry['segments']:
+            print(f"  {segment['start_date'][:10]} → {segment['end_date'][:10]}  "
+                  f"{segment['median_ns']:>12.1f} ns  ({segment['points']} points)")
+        return 0
+
+    latest = sorted(((cp['date'], op, cp) for op, entry in document['ops'].items() for cp in entry['change_points']),
+                    reverse=True)[:args.limit]
+    print(f"📍 Latest {len(latest)} change points")
+    for date, op, cp in latest:
+        symbol = "📉" if cp['change_percent'] > 0 else "📈"
+        print(f"{symbol} {date[:10]} {op}: {cp['change_percent']:+.1f}% "
+              f"({cp['before_ns']:.1f} → {cp['after_ns']:.1f} ns), "
+              f"commits {cp['commit_range'][0][:8]}..{cp['commit_range'][1][:8]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,8 +4,18 @@ Performance Change Detector and Email Notifier
 
 This script compares the latest performance results with the previous results
 and sends an email notification if any operation's performance change exceeds 20%.
+
+With --timeline it instead replays the configured detection over the whole
+archive (perf_timeline.py) and writes every regression and improvement event
+to data/timeline/events.json and events.csv; no email is sent. baseline and
+significance replay the same test and first-crossing rule as the alerts;
+commit and file replay pairwise threshold comparisons, without the
+confidence-interval noise check.
+
+    python check_perf_changes.py --timeline [--since 2025-07-01 --until 2025-10-01]
 """
 
+import html
 import json
 import os
 import sys
@@ -14,24 +24,77 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import requests
 
+from attribution import TT_METAL_URL, attribute, default_clone, describe_attribution, last_measured_commit
+from commit_view import latest_commit_views
+from index_store import load_head
+from profiler_breakdown import describe_breakdown_change
+from results_format import load_index_entry
+from rolling_stats import STATS_PATH, baseline, load_stats
+
+# The rolling-baseline mode is computed with numpy
+try:
+    from baseline_detector import BASELINE_UNITS, DEFAULT_WINDOW, baseline_changes, load_recent
+    from significance import significance_tests
+    from perf_timeline import run_timeline
+    from change_clusters import MIN_SHIFT_OPS, cluster_changes, describe_shift
+    BASELINE_DETECTOR_AVAILABLE = True
+except ImportError:
+    BASELINE_DETECTOR_AVAILABLE = False
+    BASELINE_UNITS, DEFAULT_WINDOW = ['commit', 'file'], 10
+
+
+COMPARE_MODES = ['commit', 'file', 'baseline', 'significance']
+# Modes that compare the latest point with a window of earlier ones
+WINDOW_MODES = ['baseline', 'significance']
+# Timeline replay of each mode: (perf_timeline mode, unit); window modes use PERF_BASELINE_UNIT
+TIMELINE_REPLAY = {'commit': ('pairwise', 'commit'), 'file': ('pairwise', 'file'),
+                   'baseline': ('baseline', None), 'significance': ('significance', None)}
+
 
 class PerformanceChangeDetector:
-    def __init__(self, threshold_percent=20.0):
+    def __init__(self, threshold_percent=20.0, compare_by='commit',
+                 baseline_window=DEFAULT_WINDOW, baseline_unit='commit'):
         self.threshold_percent = threshold_percent
+        self.compare_by = compare_by
+        self.baseline_window = baseline_window
+        self.baseline_unit = baseline_unit
+        self.suppressed_count = 0
+        self.repeat_count = 0
+        self.previous_history: List[Dict] = []
         self.data_dir = Path("data")
-        self.index_file = self.data_dir / "index.json"
+        self.stats_file = self.data_dir / STATS_PATH
         
     def load_index(self) -> Dict:
-        """Load the index.json file."""
+        """Load the index head; it holds the latest entries, newest first."""
         try:
-            with open(self.index_file, 'r') as f:
-                return json.load(f)
+            return load_head(self.data_dir)
         except Exception as e:
-            print(f"❌ Error loading index.json: {e}")
+            print(f"❌ Error loading index: {e}")
             return {}
     
+    def get_latest_two_commits(self) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """Get the two most recent commits, each with its replicate measurements pooled."""
+        try:
+            views = latest_commit_views(self.data_dir, 2)
+        except Exception as e:
+            print(f"❌ Error loading commit views: {e}")
+            return None, None
+
+        if len(views) < 2:
+            print(f"⚠️ Not enough data to compare. Found {len(views)} commit(s).")
+            return None, None
+
+        for label, view in zip(["Latest", "Previous"], views):
+            metadata = view['metadata']
+            print(f"📄 {label} commit: {metadata.get('git_commit_id', 'unknown')[:8]} "
+                  f"({metadata['replicates']} replicate(s))")
+            print(f"   Date: {metadata.get('measurement_date')}")
+        return views[0], views[1]
+
     def get_latest_two_results(self) -> Tuple[Optional[Dict], Optional[Dict]]:
         """Get the two most recent performance measurement files."""
+        if self.compare_by == 'commit':
+            return self.get_latest_two_commits()
         index_data = self.load_index()
         files = index_data.get('files', [])
         
@@ -40,12 +103,8 @@ class PerformanceChangeDetector:
             return None, None
         
         # Files are already sorted by measurement_date (newest first)
-        latest_path = self.data_dir / files[0]['path'].replace('data/', '')
-        previous_path = self.data_dir / files[1]['path'].replace('data/', '')
-        
         try:
-            with open(latest_path, 'r') as f:
-                latest_data = json.load(f)
+            latest_data = load_index_entry(self.data_dir, files[0])
             print(f"📄 Latest results: {files[0]['filename']}")
             print(f"   Date: {files[0]['measurement_date']}")
         except Exception as e:
@@ -53,8 +112,7 @@ class PerformanceChangeDetector:
             return None, None
         
         try:
-            with open(previous_path, 'r') as f:
-                previous_data = json.load(f)
+            previous_data = load_index_entry(self.data_dir, files[1])
             print(f"📄 Previous results: {files[1]['filename']}")
             print(f"   Date: {files[1]['measurement_date']}")
         except Exception as e:
@@ -67,9 +125,13 @@ class PerformanceChangeDetector:
         """
         Compare two performance results and find operations with >threshold% change.
         
+        Results pooled per commit carry 95% confidence intervals; a change whose
+        intervals overlap is within the noise and is not reported.
+        
         Returns a list of operations with significant changes.
         """
         significant_changes = []
+        self.suppressed_count = 0
         
         # Create lookup dictionaries for quick access
         latest_ops = {result['operation_name']: result for result in latest.get('results', [])}
@@ -93,6 +155,16 @@ class PerformanceChangeDetector:
             
             # Check if change exceeds threshold
             if abs(change_percent) >= self.threshold_percent:
+                ci_note = None
+                if 'ci_low_ns' in latest_result and 'ci_low_ns' in previous_result:
+                    if (latest_result['ci_low_ns'] <= previous_result['ci_high_ns'] and
+                            previous_result['ci_low_ns'] <= latest_result['ci_high_ns']):
+                        self.suppressed_count += 1
+                        continue
+                    ci_note = (f"95% CI {previous_result['ci_low_ns']:.2f}–{previous_result['ci_high_ns']:.2f} ns "
+                               f"(n={previous_result['successful_runs']}) → "
+                               f"{latest_result['ci_low_ns']:.2f}–{latest_result['ci_high_ns']:.2f} ns "
+                               f"(n={latest_result['successful_runs']})")
                 change_info = {
                     'operation_name': op_name,
                     'test_name': latest_result.get('test_name', op_name),
@@ -101,16 +173,205 @@ class PerformanceChangeDetector:
                     'change_percent': change_percent,
                     'change_type': 'improvement' if change_percent < 0 else 'regression',
                     'previous_timestamp': previous_result.get('timestamp', 'unknown'),
-                    'latest_timestamp': latest_result.get('timestamp', 'unknown')
+                    'latest_timestamp': latest_result.get('timestamp', 'unknown'),
+                    'breakdown_note': describe_breakdown_change(previous_result.get('breakdown'),
+                                                                latest_result.get('breakdown')),
+                    'ci_note': ci_note
                 }
                 significant_changes.append(change_info)
         
         return significant_changes
     
-    def format_email_body(self, changes: List[Dict], latest_metadata: Dict, previous_metadata: Dict) -> str:
-        """Format the email body with performance change details."""
+    def get_baseline_history(self) -> List[Dict]:
+        """The latest result set followed by the baseline_window ones before it.
+
+        Also loads the same window as the previous upload saw it
+        (previous_history), so changes that were already alerted are not
+        alerted again.
+        """
+        try:
+            history = load_recent(self.data_dir, self.baseline_window + 1, self.baseline_unit)
+            self.previous_history = load_recent(self.data_dir, self.baseline_window + 1, self.baseline_unit,
+                                                skip_files=1)
+        except Exception as e:
+            print(f"❌ Error loading baseline history: {e}")
+            return []
+        if len(history) < 2:
+            print(f"⚠️ Not enough data to compare. Found {len(history)} {self.baseline_unit}(s).")
+            return []
+        metadata = history[0].get('metadata', {})
+        print(f"📄 Latest {self.baseline_unit}: {metadata.get('git_commit_id', 'unknown')[:8]}")
+        print(f"   Date: {metadata.get('measurement_date')}")
+        print(f"📏 Baseline: the {len(history) - 1} previous {self.baseline_unit}s")
+        return history
+
+    def compare_to_baseline(self, history: List[Dict]) -> List[Dict]:
+        """Compare the newest result set with the per-op median of the ones before it.
+
+        Only first crossings are kept: ops the previous upload's evaluation
+        already flagged in the same direction are left out.
+        """
+        latest_ops = {result['operation_name']: result for result in history[0].get('results', [])}
+        previous_ops = {result['operation_name']: result for result in history[1].get('results', [])}
+        changes = []
+        for change in baseline_changes(history, self.threshold_percent, previous=self.previous_history):
+            latest_result = latest_ops[change['operation_name']]
+            previous_result = previous_ops.get(change['operation_name'], {})
+            changes.append({
+                'operation_name': change['operation_name'],
+                'test_name': latest_result.get('test_name', change['operation_name']),
+                'previous_avg_ns': change['baseline_ns'],
+                'latest_avg_ns': change['latest_avg_ns'],
+                'change_percent': change['change_percent'],
+                'change_type': 'improvement' if change['change_percent'] < 0 else 'regression',
+                'previous_timestamp': previous_result.get('timestamp', 'unknown'),
+                'latest_timestamp': latest_result.get('timestamp', 'unknown'),
+                'breakdown_note': describe_breakdown_change(previous_result.get('breakdown'),
+                                                            latest_result.get('breakdown')),
+                'baseline_note': (f"median of the last {change['baseline_points']} "
+                                  f"{self.baseline_unit}s ({change['baseline_ns']:.2f} ns)"),
+            })
+        return changes
+
+    def compare_significance(self, history: List[Dict]) -> List[Dict]:
+        """Welch-test every op against the pooled window; keep statistically and practically significant ones.
+
+        threshold_percent is the smallest change worth reporting; jittery ops
+        need a larger change (a multiple of their historical noise). Ops the
+        previous upload's evaluation already flagged are counted in
+        repeat_count, not alerted again.
+        """
+        latest_ops = {result['operation_name']: result for result in history[0].get('results', [])}
+        previous_ops = {result['operation_name']: result for result in history[1].get('results', [])}
+        tests = significance_tests(history, min_effect_percent=self.threshold_percent,
+                                   previous=self.previous_history)
+        changes = []
+        for test in tests:
+            if test['repeat']:
+                self.repeat_count += 1
+                continue
+            if not test['significant']:
+                if abs(test['change_percent']) >= self.threshold_percent:
+                    self.suppressed_count += 1
+                continue
+            latest_result = latest_ops[test['operation_name']]
+            previous_result = previous_ops.get(test['operation_name'], {})
+            changes.append({
+                'operation_name': test['operation_name'],
+                'test_name': latest_result.get('test_name', test['operation_name']),
+                'previous_avg_ns': test['baseline_ns'],
+                'latest_avg_ns': test['latest_avg_ns'],
+                'change_percent': test['change_percent'],
+                'change_type': 'improvement' if test['change_percent'] < 0 else 'regression',
+                'previous_timestamp': previous_result.get('timestamp', 'unknown'),
+                'latest_timestamp': latest_result.get('timestamp', 'unknown'),
+                'breakdown_note': describe_breakdown_change(previous_result.get('breakdown'),
+                                                            latest_result.get('breakdown')),
+                'p_value': test['p_value'],
+                'q_value': test['q_value'],
+                'hedges_g': test['hedges_g'],
+                'significance_note': (f"Welch p={test['p_value']:.2g} (FDR q={test['q_value']:.2g}), "
+                                      f"Hedges' g={test['hedges_g']:.1f}, n={test['latest_runs']} vs "
+                                      f"{test['baseline_runs']} runs over {test['baseline_points']} "
+                                      f"{self.baseline_unit}s, op noise ±{test['noise_percent']:.1f}% "
+                                      f"(needs ≥{test['practical_threshold_percent']:.1f}%)"),
+            })
+        print(f"🧪 Tested {len(tests)} op(s) for significance")
+        return changes
+
+    def cluster_shifts(self, changes: List[Dict], history: Optional[List[Dict]] = None) -> List[Dict]:
+        """Group changes shared by many ops of a family into infra-level shifts (marks them 'shift_id').
+
+        Co-movement is checked over the baseline window; pairwise modes load
+        one of the same length.
+        """
+        if not BASELINE_DETECTOR_AVAILABLE or len(changes) < MIN_SHIFT_OPS:
+            return []
+        try:
+            if self.compare_by not in WINDOW_MODES:
+                unit = 'file' if self.compare_by == 'file' else 'commit'
+                history = load_recent(self.data_dir, self.baseline_window + 1, unit)
+            return cluster_changes(changes, history)[0]
+        except Exception as e:
+            print(f"⚠️ Warning: Could not cluster changes: {e}")
+            return []
+
+    def add_attribution(self, changes: List[Dict], shifts: List[Dict], latest: Dict, previous: Dict,
+                        history: Optional[List[Dict]] = None):
+        """Attach the last good..first bad commit range (and suspects, with a tt-metal clone) to each alert.
+
+        Isolated changes sharing a range are expanded together; each shift is
+        expanded once with the infra paths included.
+        """
+        clone = default_clone()
+        bad = latest.get('metadata', {}).get('git_commit_id', 'unknown')
+        previous_commit = previous.get('metadata', {}).get('git_commit_id')
+        try:
+            ranges: Dict[Optional[str], List[Dict]] = {}
+            for change in changes:
+                if 'shift_id' in change:
+                    continue
+                good = last_measured_commit(history, change['operation_name']) if history else previous_commit
+                ranges.setdefault(good, []).append(change)
+            for good, range_changes in ranges.items():
+                result = attribute(good, bad, [c['operation_name'] for c in range_changes], clone)
+                for change in range_changes:
+                    change['attribution'] = result
+                    change['attribution_note'] = describe_attribution(result)
+            for shift in shifts:
+                shift['attribution'] = attribute(previous_commit, bad, shift['operation_names'], clone, infra=True)
+                shift['attribution_note'] = describe_attribution(shift['attribution'])
+        except Exception as e:
+            print(f"⚠️ Warning: Could not attribute changes to commits: {e}")
+
+    def add_rolling_context(self, changes: List[Dict], latest_metadata: Dict):
+        """Compare each change against the op's rolling median from data/stats/rolling.json."""
+        if not self.stats_file.exists():
+            return
+        try:
+            stats = load_stats(self.stats_file)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not load rolling statistics: {e}")
+            return
+        # The uploader may already have folded the latest run into the stats
+        includes_latest = stats['metadata'].get('last_measurement_date') == latest_metadata.get('measurement_date')
+        for change in changes:
+            op_stats = stats['ops'].get(change['operation_name'])
+            if not op_stats:
+                continue
+            reference = baseline(op_stats, exclude_latest=includes_latest)
+            if not reference:
+                continue
+            samples = len(op_stats['recent']) - (1 if includes_latest else 0)
+            rolling_percent = (change['latest_avg_ns'] - reference) / reference * 100
+            change['rolling_baseline_ns'] = reference
+            change['rolling_change_percent'] = rolling_percent
+            change['rolling_note'] = (f"{rolling_percent:+.1f}% vs median of last {samples} runs "
+                                      f"({reference:.2f} ns)")
+
+    def _attribution_html(self, item: Dict) -> str:
+        """Commit range paragraph of an alert card, with the compare link and suspect commits."""
+        attribution = item.get('attribution')
+        if not attribution:
+            return ""
+        link = (f' <a href="{attribution["compare_url"]}">compare</a>' if attribution.get('compare_url') else "")
+        suspects = "".join(
+            f'<li><a href="{TT_METAL_URL}/commit/{s["sha"]}"><code>{s["sha"][:8]}</code></a> {html.escape(s["subject"])}'
+            f' <span style="color: #6c757d;">({", ".join(html.escape(f) for f in s["files"][:3])})</span></li>'
+            for s in attribution.get('suspects', []))
+        return (f"<p><strong>Commit range:</strong> {html.escape(describe_attribution(attribution, False))}{link}</p>"
+                + (f"<ol>{suspects}</ol>" if suspects else ""))
+
+    def format_email_body(self, changes: List[Dict], latest_metadata: Dict, previous_metadata: Dict,
+                          shifts: Optional[List[Dict]] = None) -> str:
+        """Format the email body with performance change details.
+
+        Changes belonging to an infra-level shift (see cluster_shifts) get one
+        card per shift instead of one per op.
+        """
         if not changes:
             return "No significant performance changes detected."
+        shifts = shifts or []
         
         # Sort by absolute change percentage (highest first)
         changes.sort(key=lambda x: abs(x['change_percent']), reverse=True)
@@ -118,6 +379,17 @@ class PerformanceChangeDetector:
         # Count regressions and improvements
         regressions = [c for c in changes if c['change_type'] == 'regression']
         improvements = [c for c in changes if c['change_type'] == 'improvement']
+        isolated = [c for c in changes if 'shift_id' not in c]
+        shift_rows = ""
+        if shifts:
+            shift_rows = f"""<tr style="background-color: #fff3cd;">
+                        <td>Infra-Level Shifts (ops affected)</td>
+                        <td><strong>{len(shifts)} ({sum(s['count'] for s in shifts)})</strong></td>
+                    </tr>
+                    <tr>
+                        <td>Isolated Per-Op Changes</td>
+                        <td><strong>{len(isolated)}</strong></td>
+                    </tr>"""
         
         html_body = f"""
         <html>
@@ -162,6 +434,7 @@ class PerformanceChangeDetector:
                         <td>Performance Improvements</td>
                         <td><strong>{len(improvements)}</strong></td>
                     </tr>
+                    {shift_rows}
                 </table>
                 
                 <p>
@@ -173,7 +446,24 @@ class PerformanceChangeDetector:
             
             <h3>Detailed Changes</h3>
         """
-        
+
+        # Shared shifts first: one card each, listing the ops instead of repeating them
+        if shifts:
+            html_body += "<h4>🏗️ Infra-Level Shifts (likely one shared change: dispatch, profiler, firmware)</h4>"
+            for shift in shifts:
+                html_body += f"""
+                <div class="operation{' improvement' if shift['change_type'] == 'improvement' else ''}">
+                    <h4>{describe_shift(shift)}</h4>
+                    <p class="{shift['change_type']}">Median change: {shift['median_change_percent']:+.2f}%</p>
+                    <p><strong>Operations:</strong> <code>{', '.join(shift['operation_names'])}</code></p>
+                    {self._attribution_html(shift)}
+                </div>
+                """
+            regressions = [c for c in regressions if 'shift_id' not in c]
+            improvements = [c for c in improvements if 'shift_id' not in c]
+            if isolated:
+                html_body += "<h4>Isolated Per-Op Changes</h4>"
+
         # Add regressions first
         if regressions:
             html_body += "<h4 style='color: #dc3545;'>⬇️ Performance Regressions (Slower)</h4>"
@@ -183,6 +473,12 @@ class PerformanceChangeDetector:
                 <div class="operation">
                     <h4>{change['operation_name']}</h4>
                     <p class="regression">Change: {change_sign}{change['change_percent']:.2f}%</p>
+                    {f"<p><strong>Kernel breakdown:</strong> {change['breakdown_note']}</p>" if change.get('breakdown_note') else ""}
+                    {f"<p><strong>Rolling baseline:</strong> {change['rolling_note']}</p>" if change.get('rolling_note') else ""}
+                    {f"<p><strong>Confidence:</strong> {change['ci_note']}</p>" if change.get('ci_note') else ""}
+                    {f"<p><strong>Baseline:</strong> {change['baseline_note']}</p>" if change.get('baseline_note') else ""}
+                    {f"<p><strong>Significance:</strong> {change['significance_note']}</p>" if change.get('significance_note') else ""}
+                    {self._attribution_html(change)}
                     <table>
                         <tr>
                             <th>Metric</th>
@@ -215,6 +511,12 @@ class PerformanceChangeDetector:
                 <div class="operation improvement">
                     <h4>{change['operation_name']}</h4>
                     <p class="improvement">Change: {change_sign}{change['change_percent']:.2f}%</p>
+                    {f"<p><strong>Kernel breakdown:</strong> {change['breakdown_note']}</p>" if change.get('breakdown_note') else ""}
+                    {f"<p><strong>Rolling baseline:</strong> {change['rolling_note']}</p>" if change.get('rolling_note') else ""}
+                    {f"<p><strong>Confidence:</strong> {change['ci_note']}</p>" if change.get('ci_note') else ""}
+                    {f"<p><strong>Baseline:</strong> {change['baseline_note']}</p>" if change.get('baseline_note') else ""}
+                    {f"<p><strong>Significance:</strong> {change['significance_note']}</p>" if change.get('significance_note') else ""}
+                    {self._attribution_html(change)}
                     <table>
                         <tr>
                             <th>Metric</th>
@@ -476,8 +778,12 @@ class PerformanceChangeDetector:
         print(f"   Data directory: {self.data_dir.absolute()}")
         print()
         
-        # Get latest two results
-        latest, previous = self.get_latest_two_results()
+        # Get latest two results, or the latest and its baseline window
+        if self.compare_by in WINDOW_MODES:
+            history = self.get_baseline_history()
+            latest, previous = (history[0], history[1]) if history else (None, None)
+        else:
+            latest, previous = self.get_latest_two_results()
         
         if latest is None or previous is None:
             print("❌ Cannot proceed without both latest and previous results.")
@@ -487,9 +793,25 @@ class PerformanceChangeDetector:
         print("🔬 Comparing performance results...")
         
         # Compare results
-        changes = self.compare_results(latest, previous)
+        self.suppressed_count = 0
+        self.repeat_count = 0
+        if self.compare_by == 'baseline':
+            changes = self.compare_to_baseline(history)
+        elif self.compare_by == 'significance':
+            changes = self.compare_significance(history)
+        else:
+            changes = self.compare_results(latest, previous)
+        self.add_rolling_context(changes, latest.get('metadata', {}))
+        shifts = self.cluster_shifts(changes, history if self.compare_by in WINDOW_MODES else None)
+        self.add_attribution(changes, shifts, latest, previous, history if self.compare_by in WINDOW_MODES else None)
         
         print(f"\n📊 Found {len(changes)} operation(s) with >{self.threshold_percent}% change")
+        if self.suppressed_count and self.compare_by == 'significance':
+            print(f"   🔇 {self.suppressed_count} more past the threshold but not significant (noise)")
+        elif self.suppressed_count:
+            print(f"   🔇 {self.suppressed_count} more within the 95% confidence intervals (noise)")
+        if self.repeat_count:
+            print(f"   🔁 {self.repeat_count} more already alerted at the previous upload")
         
         if not changes:
             print("✅ No significant performance changes detected.")
@@ -502,13 +824,34 @@ class PerformanceChangeDetector:
         print(f"   ⬇️ Regressions: {len(regressions)}")
         print(f"   ⬆️ Improvements: {len(improvements)}")
         print()
-        
-        # Print details
+
+        for shift in shifts:
+            print(f"🏗️ {describe_shift(shift)}")
+            if shift.get('attribution_note'):
+                print(f"   🔎 {shift['attribution_note']}")
+        if shifts:
+            print()
+
+        # Print details of the changes outside any shift
         for change in sorted(changes, key=lambda x: abs(x['change_percent']), reverse=True):
+            if 'shift_id' in change:
+                continue
             symbol = "📉" if change['change_type'] == 'regression' else "📈"
             sign = "+" if change['change_percent'] > 0 else ""
             print(f"{symbol} {change['operation_name']}: {sign}{change['change_percent']:.2f}% "
                   f"({change['previous_avg_ns']:.2f}ns → {change['latest_avg_ns']:.2f}ns)")
+            if change.get('breakdown_note'):
+                print(f"   🔬 {change['breakdown_note']}")
+            if change.get('rolling_note'):
+                print(f"   📏 {change['rolling_note']}")
+            if change.get('ci_note'):
+                print(f"   🎯 {change['ci_note']}")
+            if change.get('baseline_note'):
+                print(f"   📐 vs {change['baseline_note']}")
+            if change.get('significance_note'):
+                print(f"   🧪 {change['significance_note']}")
+            if change.get('attribution_note'):
+                print(f"   🔎 {change['attribution_note']}")
         
         print()
         
@@ -517,7 +860,11 @@ class PerformanceChangeDetector:
         previous_metadata = previous.get('metadata', {})
         
         subject = f"⚠️ TTNN Performance Alert: {len(changes)} operation(s) changed >{self.threshold_percent}%"
-        html_body = self.format_email_body(changes, latest_metadata, previous_metadata)
+        if shifts:
+            isolated_count = sum('shift_id' not in c for c in changes)
+            subject = (f"⚠️ TTNN Performance Alert: infra-level shift affecting "
+                       f"{sum(s['count'] for s in shifts)} ops, {isolated_count} isolated change(s)")
+        html_body = self.format_email_body(changes, latest_metadata, previous_metadata, shifts)
         
         # Send email
         success = self.send_email_resend(subject, html_body, to_email, api_key, from_email)
@@ -530,26 +877,82 @@ class PerformanceChangeDetector:
             return 1
 
 
+def detection_settings(environ=os.environ) -> Dict:
+    """The alert detector's settings from PERF_CHANGE_THRESHOLD, PERF_COMPARE_BY, PERF_BASELINE_WINDOW
+    and PERF_BASELINE_UNIT; ValueError names an invalid one."""
+    compare_by = environ.get('PERF_COMPARE_BY', 'commit').lower()
+    if compare_by not in COMPARE_MODES:
+        raise ValueError(f"PERF_COMPARE_BY must be one of {', '.join(COMPARE_MODES)}")
+    baseline_unit = environ.get('PERF_BASELINE_UNIT', 'commit').lower()
+    if baseline_unit not in BASELINE_UNITS:
+        raise ValueError(f"PERF_BASELINE_UNIT must be one of {', '.join(BASELINE_UNITS)}")
+    return {'threshold_percent': float(environ.get('PERF_CHANGE_THRESHOLD', '20.0')), 'compare_by': compare_by,
+            'baseline_window': int(environ.get('PERF_BASELINE_WINDOW', str(DEFAULT_WINDOW))),
+            'baseline_unit': baseline_unit}
+
+
+def timeline_settings(settings: Dict) -> Dict:
+    """perf_timeline settings that replay the detector configured by settings (see TIMELINE_REPLAY)."""
+    mode, unit = TIMELINE_REPLAY[settings['compare_by']]
+    return {'mode': mode, 'unit': unit or settings['baseline_unit'], 'window': settings['baseline_window'],
+            'threshold_percent': settings['threshold_percent']}
+
+
+def run_timeline_mode(args, settings: Dict):
+    """Replay the configured detection over the whole archive (--timeline)."""
+    if not BASELINE_DETECTOR_AVAILABLE:
+        print("❌ Error: --timeline needs numpy (pip install numpy)")
+        return 1
+    replay = timeline_settings(settings)
+    try:
+        return run_timeline(args.data_dir, replay['mode'], replay['unit'], replay['window'],
+                            replay['threshold_percent'], args.since, args.until, args.limit)
+    except Exception as e:
+        print(f"❌ Error building the regression timeline: {e}")
+        return 1
+
+
 def main():
     """Main function for command line usage."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Detect performance changes and send an email alert')
+    parser.add_argument('--timeline', action='store_true',
+                        help='Replay detection over the whole archive and write data/timeline/ instead')
+    parser.add_argument('--since', help='Timeline: print events on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Timeline: print events before this date (YYYY-MM-DD)')
+    parser.add_argument('--limit', type=int, default=20, help='Timeline: events to print')
+    parser.add_argument('--data-dir', default='data', help='Timeline: dashboard data directory')
+    args = parser.parse_args()
+
+    # Threshold, and pooled commits (default), the latest two files or a rolling baseline, from the environment
+    try:
+        settings = detection_settings()
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    if settings['compare_by'] in WINDOW_MODES and not BASELINE_DETECTOR_AVAILABLE:
+        print(f"❌ Error: PERF_COMPARE_BY={settings['compare_by']} needs numpy (pip install numpy)")
+        sys.exit(1)
+
+    if args.timeline:
+        sys.exit(run_timeline_mode(args, settings))
+
     # Get Resend API key from environment variable
     api_key = os.environ.get('RESEND_API_KEY')
     if not api_key:
         print("❌ Error: RESEND_API_KEY environment variable not set")
         print("   Please set it with: export RESEND_API_KEY='your-api-key'")
         sys.exit(1)
-    
+
     # Get recipient email (default to aswin@aswincloud.com)
     to_email = os.environ.get('ALERT_EMAIL', 'aswin@aswincloud.com')
-    
+
     # Get sender email (optional, for production use with verified domain)
     from_email = os.environ.get('FROM_EMAIL')
-    
-    # Get threshold from environment or use default
-    threshold = float(os.environ.get('PERF_CHANGE_THRESHOLD', '20.0'))
 
     # Create detector and run
-    detector = PerformanceChangeDetector(threshold_percent=threshold)
+    detector = PerformanceChangeDetector(**settings)
 
     # Check if test email mode is requested
     send_test_email = os.environ.get('SEND_TEST_EMAIL', 'false').lower() in ('true', '1', 'yes')
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Per-Commit View of Replicate Measurements
+
+A commit is often measured several times in a row (intraday reruns before
+the code moves). The per-commit view pools those replicates into one result
+set per commit: each op's runs are combined (data_packs.aggregate_commit) and
+get a 95% confidence interval for the mean:
+
+    successful_runs       runs pooled across the commit's replicates
+    average_duration_ns   mean of all pooled runs
+    std_deviation_ns      sample standard deviation of all pooled runs
+    ci_low_ns, ci_high_ns Student t interval for the mean
+    replicates            measurements of the commit that measured the op
+
+Replicates are consecutive index entries with the same git_commit_id, so a
+commit measured again after others keeps separate points. The metadata is
+the newest replicate's, with replicates and aggregated_files added.
+check_perf_changes.py compares the latest two commits this way by default.
+
+    python commit_view.py show [--commit abc123] [--op abs] [--json]
+"""
+
+import json
+import math
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from data_packs import aggregate_commit
+from index_store import load_head, load_index
+from results_format import load_index_entry
+
+# Two-sided 95% Student t quantiles by degrees of freedom; 1.96 past the table
+T_975 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+         2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+         2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+
+def t_quantile(dof: int) -> float:
+    return T_975[dof - 1] if dof <= len(T_975) else 1.96
+
+
+def confidence_interval(mean: float, std: float, n: int) -> Tuple[float, float]:
+    """95% interval for the mean of n samples; a single sample gives (mean, mean)."""
+    if n < 2:
+        return mean, mean
+    half_width = t_quantile(n - 1) * std / math.sqrt(n)
+    return mean - half_width, mean + half_width
+
+
+def group_by_commit(files: List[Dict]) -> List[List[Dict]]:
+    """Split index entries (newest first) into runs of consecutive same-commit entries."""
+    groups = []
+    for entry in files:
+        if groups and groups[-1][0].get('git_commit_id') == entry.get('git_commit_id'):
+            groups[-1].append(entry)
+        else:
+            groups.append([entry])
+    return groups
+
+
+def pool_commit(data_dir, entries: List[Dict]) -> Dict:
+    """Pool one commit's replicate index entries (newest first) into one result set."""
+    loaded, filenames = [], []
+    for entry in reversed(entries):
+        try:
+            loaded.append(load_index_entry(data_dir, entry))
+            filenames.append(entry['filename'])
+        except Exception as e:
+            print(f"⚠️ Warning: Could not load {entry.get('filename')}: {e}")
+    if not loaded:
+        raise ValueError(f"no replicate of {entries[0].get('git_commit_id')} could be loaded")
+
+    replicates: Dict[str, int] = {}
+    for data in loaded:
+        for result in data.get('results', []):
+            if result.get('successful_runs'):
+                replicates[result['operation_name']] = replicates.get(result['operation_name'], 0) + 1
+
+    pooled = aggregate_commit(loaded, filenames, keep_runs=True)
+    pooled['metadata']['replicates'] = len(loaded)
+    for result in pooled['results']:
+        if result.get('average_duration_ns') is None or not result.get('successful_runs'):
+            continue
+        result['ci_low_ns'], result['ci_high_ns'] = confidence_interval(
+            result['average_duration_ns'], result.get('std_deviation_ns') or 0.0, result['successful_runs'])
+        result['replicates'] = replicates.get(result['operation_name'], 0)
+    return pooled
+
+
+def latest_commit_views(data_dir, count: int = 2, skip_files: int = 0) -> List[Dict]:
+    """Pooled views of the newest count commits, newest first.
+
+    skip_files leaves out the newest index entries, giving the views as they
+    were that many uploads ago. The index head usually covers them; the full
+    index is read when the oldest wanted commit's replicates may continue
+    past the head.
+    """
+    head = load_head(data_dir)
+    files = head.get('files', [])
+    groups = group_by_commit(files[skip_files:])
+    if len(groups) <= count and len(files) < head.get('total_measurements', len(files)):
+        groups = group_by_commit(load_index(data_dir)['files'][skip_files:])
+    return [pool_commit(data_dir, group) for group in groups[:count]]
+
+
+def commit_view(data_dir, commit: str) -> Optional[Dict]:
+    """Pooled view of the newest replicate group of a commit (prefix match)."""
+    for group in group_by_commit(load_index(data_dir)['files']):
+        if group[0].get('git_commit_id', '').startswith(commit):
+            return pool_commit(data_dir, group)
+    return None
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Per-commit view of replicate measurements')
+    parser.add_argument('command', choices=['show'])
+    parser.add_argument('--commit', help='Commit (prefix) to show (default: latest)')
+    parser.add_argument('--op', help='Only show this operation')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    parser.add_argument('--json', action='store_true', help='Print the pooled view as JSON')
+    args = parser.parse_args()
+
+    try:
+        view = commit_view(args.data_dir, args.commit) if args.commit else latest_commit_views(args.data_dir, 1)[0]
+    except Exception as e:
+        print(f"❌ Error building commit view: {e}")
+        return 1
+    if view is None:
+        print(f"❌ No measurements of commit {args.commit}")
+        return 1
+
+    results = [r for r in view['results'] if not args.op or r['operation_name'] == args.op]
+    if args.json:
+        print(json.dumps(dict(view, results=results), indent=2))
+        return 0
+
+    metadata = view['metadata']
+    print(f"🔗 {metadata.get('git_commit_id', 'unknown')[:8]}: {metadata['replicates']} replicate(s), "
+          f"latest {metadata.get('measurement_date')}")
+    for result in results:
+        if 'ci_low_ns' not in result:
+            print(f"  {result['operation_name']:<30} no successful runs")
+            continue
+        print(f"  {result['operation_name']:<30} {result['average_duration_ns']:>12.1f} ns  "
+              f"95% CI [{result['ci_low_ns']:.1f}, {result['ci_high_ns']:.1f}]  "
+              f"n={result['successful_runs']} ({result['replicates']} replicate(s))")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Shared test factories for results files and history stores."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+
+def make_results_file(date, commit, ops, failed=()):
+    """A results file; ops maps op -> its runs, or a mean (recorded as three identical runs)."""
+    results = []
+    for op, runs in ops.items():
+        runs = list(runs) if isinstance(runs, (list, tuple)) else [runs] * 3
+        mean = sum(runs) / len(runs)
+        std = (sum((r - mean) ** 2 for r in runs) / (len(runs) - 1)) ** 0.5 if len(runs) > 1 else 0.0
+        results.append({'operation_name': op, 'test_name': f"test_{op}", 'runs': runs,
+                        'successful_runs': len(runs), 'average_duration_ns': mean, 'std_deviation_ns': std,
+                        'min_duration_ns': min(runs), 'max_duration_ns': max(runs)})
+    metadata = {'measurement_date': date, 'git_commit_id': commit, 'total_tests': len(results) + len(failed),
+                'successful_tests': len(results), 'failed_tests': len(failed), 'failed_test_names': list(failed)}
+    return {'metadata': metadata, 'results': results}
+
+
+def make_history_store(series, commits=None):
+    """A store with one measurement per day from 2025-01-01; series maps op -> values (None = not measured)."""
+    from history_store import HistoryStore
+
+    days = len(next(iter(series.values())))
+    commits = commits or [f"c{day}" for day in range(days)]
+    start = datetime(2025, 1, 1)
+    loaded = []
+    for day in range(days):
+        ops = {op: values[day] for op, values in series.items() if values[day] is not None}
+        date = (start + timedelta(days=day)).isoformat()
+        loaded.append((f"{day}.json", make_results_file(date, commits[day], ops)))
+    return HistoryStore.build_from_files(loaded)
+
+
+@pytest.fixture(autouse=True)
+def history_store_path(tmp_path, monkeypatch):
+    """Keep the saved history store out of ~/.cache."""
+    path = tmp_path / "cache" / "history.npz"
+    monkeypatch.setenv("PERF_HISTORY_STORE", str(path))
+    return path
+
+
+@pytest.fixture
+def results_file():
+    return make_results_file
+
+
+@pytest.fixture
+def make_store():
+    return make_history_store
@@ -42,6 +42,13 @@ log_error() {
     echo "[$(date '+%Y-%m-%d %H:%M:%S')] ERROR: $1" | tee -a "$ERROR_LOG"
 }
 
+# Change detection replayed into the dashboard timeline by the uploader;
+# keep in sync with .github/workflows/check-performance-changes.yml
+export PERF_COMPARE_BY="${PERF_COMPARE_BY:-significance}"
+export PERF_CHANGE_THRESHOLD="${PERF_CHANGE_THRESHOLD:-5.0}"
+export PERF_BASELINE_WINDOW="${PERF_BASELINE_WINDOW:-10}"
+export PERF_BASELINE_UNIT="${PERF_BASELINE_UNIT:-commit}"
+
 # GitHub Configuration
 GITHUB_REPO_URL="git@github.com:Aswintechie/ttnn-performance-dashboard.git"
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Precompressed, Content-Hashed Dashboard Data
+
+Runs after `vite build` on the built site (dist/) and prepares its data for
+the Cloudflare deployment:
+
+    dist/data/artifacts/<path>.<hash>.<ext>   copies of the mutable artifacts
+                                              (index head and shards, latest
+                                              results, rolling stats, per-op
+                                              series, regression timeline,
+                                              packs) named by content
+    <file>.gz, <file>.br                      precompressed siblings of every
+                                              artifact and daily results file
+    dist/data/manifest.json                   data path -> hashed path, plus
+                                              the encoding suffix to request
+    dist/_headers                             immutable caching and
+                                              Content-Encoding for the variants
+
+Index entries and shard pointers inside the hashed copies are rewritten to
+the hashed paths, so a changed pack also changes the shard and head that
+reference it. Daily files never change after upload and keep their names.
+The dashboard loads the manifest first and fetches plain data paths when it
+is missing (dev server, GitHub Pages). Brotli needs the optional `brotli`
+package; without it gzip is served.
+
+    npm run build:cloudflare        # vite build && python3 data_artifacts.py
+    python data_artifacts.py [--dist dist] [--encoding br|gzip]
+"""
+
+import gzip
+import hashlib
+import json
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+ARTIFACTS_DIR = "artifacts"
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 12
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+CONTENT_TYPES = {
+    '.json': 'application/json',
+    '.jsonl': 'application/x-ndjson',
+    '.txt': 'text/plain; charset=utf-8',
+    '.bin': 'application/octet-stream',
+}
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def write_variants(path: Path, data: bytes, use_brotli: bool) -> int:
+    """Write data and its .gz (and .br) siblings; returns the bytes written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    variants = {path: data, path.with_name(path.name + '.gz'): gzip.compress(data, compresslevel=9, mtime=0)}
+    if use_brotli:
+        variants[path.with_name(path.name + '.br')] = brotli.compress(data, quality=11)
+    for variant_path, content in variants.items():
+        with open(variant_path, 'wb') as f:
+            f.write(content)
+    return sum(len(content) for content in variants.values())
+
+
+class ArtifactBuilder:
+    def __init__(self, dist_dir, use_brotli: bool = BROTLI_AVAILABLE):
+        self.dist_dir = Path(dist_dir)
+        self.data_dir = self.dist_dir / "data"
+        self.artifacts_dir = self.data_dir / ARTIFACTS_DIR
+        self.use_brotli = use_brotli
+        self.files: Dict[str, str] = {}
+        self.bytes_written = 0
+
+    def add(self, relative: str, data: bytes) -> str:
+        """Store a hashed copy of data/<relative>; returns its data path."""
+        source = Path(relative)
+        hashed = source.with_name(f"{source.stem}.{content_hash(data)}{source.suffix}")
+        self.bytes_written += write_variants(self.artifacts_dir / hashed, data, self.use_brotli)
+        self.files[f"data/{relative}"] = f"data/{ARTIFACTS_DIR}/{hashed.as_posix()}"
+        return self.files[f"data/{relative}"]
+
+    def add_file(self, path: Path) -> str:
+        with open(path, 'rb') as f:
+            return self.add(path.relative_to(self.data_dir).as_posix(), f.read())
+
+    def add_json(self, path: Path, rewrite) -> str:
+        with open(path, 'r') as f:
+            data = rewrite(json.load(f))
+        return self.add(path.relative_to(self.data_dir).as_posix(),
+                        json.dumps(data, separators=(',', ':')).encode())
+
+    def _rewrite_entries(self, index_data: Dict) -> Dict:
+        index_data['files'] = [dict(entry, path=self.files.get(entry.get('path'), entry.get('path')))
+                               for entry in index_data.get('files', [])]
+        return index_data
+
+    def _rewrite_head(self, head: Dict) -> Dict:
+        head = self._rewrite_entries(head)
+        head['shards'] = [dict(shard, path=self.files.get(shard['path'], shard['path']))
+                          for shard in head.get('shards', [])]
+        return head
+
+    def build(self, encoding: str) -> Dict:
+        if not self.data_dir.resolve().is_relative_to(self.dist_dir.resolve()):
+            raise ValueError(f"{self.data_dir} points outside {self.dist_dir}; refusing to write into the source data")
+        if encoding == 'br' and not self.use_brotli:
+            raise ValueError("serving br needs the brotli variants")
+        if self.artifacts_dir.exists():
+            shutil.rmtree(self.artifacts_dir)
+
+        # Packs first: shards and the head point at them, then shards, then the head
+        for pack in sorted((self.data_dir / "packs").glob("*.jsonl")):
+            self.add_file(pack)
+        for shard in sorted((self.data_dir / "index").glob("*.json")):
+            if shard.name != "head.json":
+                self.add_json(shard, self._rewrite_entries)
+        if (self.data_dir / "index" / "head.json").exists():
+            self.add_json(self.data_dir / "index" / "head.json", self._rewrite_head)
+        elif (self.data_dir / "index.json").exists():
+            self.add_json(self.data_dir / "index.json", self._rewrite_entries)
+
+        for relative in ["latest/latest_results.json", "stats/rolling.json", "timeline/events.json",
+                         "timeline/events.csv", "timeline/attribution.json"]:
+            if (self.data_dir / relative).exists():
+                self.add_file(self.data_dir / relative)
+        for series_file in sorted((self.data_dir / "history" / "series").glob("*")):
+            self.add_file(series_file)
+
+        # Daily files are immutable under their own names: compress in place
+        for daily in sorted((self.data_dir / "daily").glob("*.json")):
+            with open(daily, 'rb') as f:
+                self.bytes_written += write_variants(daily, f.read(), self.use_brotli)
+
+        manifest = {
+            'generated': datetime.now().isoformat(),
+            'encoding': encoding,
+            'suffix': ENCODINGS[encoding],
+            'files': self.files,
+        }
+        with open(self.data_dir / MANIFEST_NAME, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        write_headers(self.dist_dir / "_headers", self.use_brotli)
+        return manifest
+
+
+def write_headers(path: Path, use_brotli: bool):
+    """Write the _headers rules for the hashed artifacts and their encoded variants."""
+    rules = [
+        (f"/data/{MANIFEST_NAME}", {'Cache-Control': 'no-cache'}),
+        (f"/data/{ARTIFACTS_DIR}/*", {'Cache-Control': IMMUTABLE}),
+        ("/data/daily/*", {'Cache-Control': IMMUTABLE}),
+    ]
+    encodings = {'.gz': 'gzip', '.br': 'br'} if use_brotli else {'.gz': 'gzip'}
+    for extension, content_type in CONTENT_TYPES.items():
+        for suffix, encoding in encodings.items():
+            rules.append((f"/data/*{extension}{suffix}", {'Content-Type': content_type, 'Content-Encoding': encoding}))
+
+    lines = []
+    for pattern, headers in rules:
+        lines.append(pattern)
+        lines.extend(f"  {name}: {value}" for name, value in headers.items())
+        lines.append("")
+    with open(path, 'w') as f:
+        f.write("\n".join(lines))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Precompress and content-hash the built dashboard data')
+    parser.add_argument('--dist', default='dist', help='Built site directory (default: dist)')
+    parser.add_argument('--encoding', choices=list(ENCODINGS), default='br' if BROTLI_AVAILABLE else 'gzip',
+                        help='Variant the dashboard requests (br needs the brotli package)')
+    args = parser.parse_args()
+
+    if args.encoding == 'br' and not BROTLI_AVAILABLE:
+        print("❌ brotli is not installed (pip install brotli); use --encoding gzip")
+        return 1
+    if not (Path(args.dist) / "data").exists():
+        print(f"❌ No data directory in {args.dist}; run the vite build first")
+        return 1
+
+    builder = ArtifactBuilder(args.dist)
+    try:
+        manifest = builder.build(args.encoding)
+    except Exception as e:
+        print(f"❌ Error building data artifacts: {e}")
+        return 1
+    print(f"✅ {len(manifest['files'])} hashed artifacts, serving {args.encoding} "
+          f"({builder.bytes_written / 1024 / 1024:.1f} MB written incl. variants)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Monthly Packs of Old Daily Results
+
+Every run is kept as its own file in data/daily, several a day at times.
+`compact` rolls files older than N days into one pack per month,
+data/packs/YYYY-MM.jsonl:
+
+    line 0   {"pack_month": "2025-08", "schema_version": 2, "entries": N}
+    line i   one compact results file (results_format.py) per commit measured
+             that month; runs of the same commit are pooled into one entry
+
+Pooled entries keep the combined run count, weighted mean, pooled standard
+deviation and min/max; raw runs are dropped unless --keep-runs is given.
+metadata.aggregated_files lists the daily files an entry replaces.
+
+The daily files are deleted and their index entries (index_store.py) replaced by
+entries pointing at the pack, with the byte offset and length of their line
+(pack_offset, pack_length) and its line number (pack_line). Loaders read
+index entries through results_format.load_index_entry, so packed and daily
+entries look the same. Compacting a month again merges into its pack.
+
+    python data_packs.py compact [--days 60] [--keep-runs] [--dry-run]
+    python data_packs.py info
+"""
+
+import json
+import math
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+from index_store import load_index, save_index
+from results_format import SCHEMA_VERSION, index_entry_path, load_index_entry, to_compact
+
+PACKS_DIR = "packs"
+DEFAULT_DAYS = 60
+_DURATION_FIELDS = ['average_duration_ns', 'std_deviation_ns', 'min_duration_ns', 'max_duration_ns']
+
+
+def _pool_results(results: List[Dict], keep_runs: bool) -> Dict:
+    """Pool one op's results from several runs of the same commit (oldest first)."""
+    newest = dict(results[-1])
+    measured = [r for r in results if r.get('average_duration_ns') is not None and r.get('successful_runs')]
+    if not measured:
+        return newest
+
+    total = sum(r['successful_runs'] for r in measured)
+    mean = sum(r['average_duration_ns'] * r['successful_runs'] for r in measured) / total
+    # Pooled variance: within-run spread plus the spread of the run means
+    squares = sum((r['successful_runs'] - 1) * (r.get('std_deviation_ns') or 0.0) ** 2
+                  + r['successful_runs'] * (r['average_duration_ns'] - mean) ** 2 for r in measured)
+    newest.update({
+        'successful_runs': total,
+        'average_duration_ns': mean,
+        'std_deviation_ns': math.sqrt(squares / (total - 1)) if total > 1 else 0.0,
+        'min_duration_ns': min(r.get('min_duration_ns', r['average_duration_ns']) for r in measured),
+        'max_duration_ns': max(r.get('max_duration_ns', r['average_duration_ns']) for r in measured),
+    })
+    if keep_runs:
+        newest['runs'] = [run for r in measured for run in r.get('runs', [])]
+    else:
+        newest.pop('runs', None)
+    return newest
+
+
+def aggregate_commit(files: List[Dict], filenames: List[str], keep_runs: bool = False) -> Dict:
+    """Pool several results files of one commit (oldest first) into one entry."""
+    newest = files[-1]
+    metadata = dict(newest.get('metadata', {}))
+    metadata['aggregated_files'] = [
+        name for data, filename in zip(files, filenames)
+        for name in data.get('metadata', {}).get('aggregated_files', [filename])
+    ]
+
+    per_op: Dict[str, List[Dict]] = {}
+    for data in files:
+        for result in data.get('results', []):
+            per_op.setdefault(result['operation_name'], []).append(result)
+
+    # Keep the newest file's op order, then ops only measured earlier
+    order = [r['operation_name'] for r in newest.get('results', [])]
+    order += [op for op in per_op if op not in order]
+    aggregated = dict(newest)
+    aggregated['metadata'] = metadata
+    aggregated['results'] = [_pool_results(per_op[op], keep_runs) for op in order]
+    return aggregated
+
+
+def write_pack(path: Path, month: str, entries: List[Dict]) -> List[Dict]:
+    """Write a pack file; returns pack_line/pack_offset/pack_length per entry."""
+    locations = []
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        header = {'pack_month': month, 'schema_version': SCHEMA_VERSION, 'entries': len(entries)}
+        f.write(json.dumps(header, separators=(',', ':')).encode() + b"\n")
+        for line, entry in enumerate(entries, 1):
+            encoded = json.dumps(to_compact(entry), separators=(',', ':')).encode()
+            locations.append({'pack_line': line, 'pack_offset': f.tell(), 'pack_length': len(encoded)})
+            f.write(encoded + b"\n")
+    tmp_path.replace(path)
+    return locations
+
+
+def compact_archive(data_dir, days: int = DEFAULT_DAYS, keep_runs: bool = False,
+                    dry_run: bool = False, now: datetime = None) -> Dict:
+    """Roll index entries older than days into monthly packs and rewrite the index."""
+    data_dir = Path(data_dir)
+    files = load_index(data_dir)['files']
+
+    cutoff = ((now or datetime.now()) - timedelta(days=days)).isoformat()
+    by_month: Dict[str, List[Dict]] = {}
+    for entry in files:
+        if entry.get('measurement_date', '') < cutoff:
+            by_month.setdefault(entry['measurement_date'][:7], []).append(entry)
+    # Only months that still have daily files need work
+    months = sorted(month for month, entries in by_month.items()
+                    if any('pack_offset' not in e for e in entries))
+
+    summary = {'months': months, 'files_packed': 0, 'entries_written': 0}
+    if not months:
+        return summary
+
+    packs_dir = data_dir / PACKS_DIR
+    packs_dir.mkdir(exist_ok=True)
+    replaced = set()
+    new_entries = []
+    removed_paths = []
+    for month in months:
+        entries = sorted(by_month[month], key=lambda e: e['measurement_date'])
+        groups: Dict[str, List] = {}
+        for entry in entries:
+            try:
+                data = load_index_entry(data_dir, entry)
+            except Exception as e:
+                print(f"⚠️ Warning: Could not load {entry.get('filename')}, leaving it unpacked: {e}")
+                continue
+            groups.setdefault(entry.get('git_commit_id', 'unknown'), []).append((entry, data))
+            replaced.add(id(entry))
+            if 'pack_offset' not in entry:
+                summary['files_packed'] += 1
+                removed_paths.append(index_entry_path(data_dir, entry))
+
+        pack_entries, pack_index = [], []
+        for commit, group in sorted(groups.items(), key=lambda item: item[1][-1][0]['measurement_date']):
+            aggregated = aggregate_commit([data for _, data in group], [e['filename'] for e, _ in group], keep_runs)
+            metadata = aggregated['metadata']
+            newest = group[-1][0]
+            pack_entries.append(aggregated)
+            pack_index.append({
+                'filename': newest['filename'],
+                'path': f"data/{PACKS_DIR}/{month}.jsonl",
+                'measurement_date': newest['measurement_date'],
+                'git_commit_id': commit,
+                'total_tests': metadata.get('total_tests', 0),
+                'successful_tests': metadata.get('successful_tests', 0),
+                'failed_tests': metadata.get('failed_tests', 0),
+                'packed_files': len(metadata['aggregated_files']),
+            })
+
+        print(f"📦 {month}: {len(entries)} entries → {len(pack_entries)} pooled commits")
+        summary['entries_written'] += len(pack_entries)
+        if dry_run:
+            continue
+        for entry, location in zip(pack_index, write_pack(packs_dir / f"{month}.jsonl", month, pack_entries)):
+            entry.update(location)
+        new_entries.extend(pack_index)
+
+    if dry_run:
+        return summary
+
+    save_index(data_dir, [e for e in files if id(e) not in replaced] + new_entries)
+
+    for path in removed_paths:
+        path.unlink(missing_ok=True)
+    return summary
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Roll old daily results into monthly packs')
+    parser.add_argument('command', choices=['compact', 'info'])
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS,
+                        help=f'Pack files older than this many days (default: {DEFAULT_DAYS})')
+    parser.add_argument('--keep-runs', action='store_true', help='Keep raw runs in pooled entries')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would be packed')
+    args = parser.parse_args()
+
+    if args.command == 'compact':
+        summary = compact_archive(args.data_dir, args.days, args.keep_runs, args.dry_run)
+        if not summary['months']:
+            print(f"ℹ️ Nothing older than {args.days} days left to pack")
+            return 0
+        action = "Would pack" if args.dry_run else "Packed"
+        print(f"✅ {action} {summary['files_packed']} daily files into {len(summary['months'])} monthly packs "
+              f"({summary['entries_written']} entries)")
+        if not args.dry_run:
+            print("💡 Rebuild derived stores with: python archive_ingest.py backfill")
+        return 0
+
+    packs_dir = Path(args.data_dir) / PACKS_DIR
+    packs = sorted(packs_dir.glob("*.jsonl")) if packs_dir.exists() else []
+    daily = list((Path(args.data_dir) / "daily").glob("*.json"))
+    print(f"📂 {len(daily)} daily files ({sum(p.stat().st_size for p in daily) / 1024 / 1024:.1f} MB), "
+          f"{len(packs)} packs ({sum(p.stat().st_size for p in packs) / 1024 / 1024:.1f} MB)")
+    for pack in packs:
+        with open(pack, 'r') as f:
+            header = json.loads(f.readline())
+        print(f"  {header['pack_month']}: {header['entries']} entries, {pack.stat().st_size / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Slow-Drift Digest
+
+A 2%-per-week creep never crosses a step threshold but adds up over a
+quarter. This fits a robust trend to every op's recent history at once and
+reports ops whose cumulative drift exceeds a budget:
+
+    points     commits, replicates pooled (perf_timeline.commit_points),
+               on log durations; one sliding window per length in
+               DRIFT_WINDOWS_DAYS, ending at the latest measurement
+    trend      Theil-Sen slope (median of all pairwise slopes) and a
+               Mann-Kendall z for whether the trend is real
+    drift      the fitted change across the op's points in the window;
+               flagged when |drift| >= budget, |z| >= TREND_Z and no single
+               step (3-point running median) makes up more than STEP_SHARE
+               of it - steps are what the per-upload alerts are for
+    start      where the drift began: the knee of the best hinge fit
+               (flat, then linear) over the window; the weekly rate is
+               the Theil-Sen slope from there on
+
+All pairwise slopes, the Mann-Kendall sums and the hinge fits for every
+candidate knee are numpy operations over all ops together.
+
+Results go to data/timeline/drift.json. This runs as a weekly digest
+(.github/workflows/drift-digest.yml), separate from the per-upload alerts;
+--email sends it through Resend with the alert settings (RESEND_API_KEY,
+ALERT_EMAIL, FROM_EMAIL).
+
+    python drift_digest.py [--windows 28,91] [--budget 10] [--email]
+"""
+
+import json
+import os
+import sys
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from history_store import load_store
+from perf_timeline import TIMELINE_DIR, commit_points, compact
+
+DRIFT_PATH = TIMELINE_DIR / "drift.json"
+DRIFT_WINDOWS_DAYS = [28, 91]
+DRIFT_BUDGET = 10.0
+MIN_DRIFT_POINTS = 8
+TREND_Z = 1.96
+STEP_SHARE = 0.5
+
+
+def _days(dates: List[str]) -> np.ndarray:
+    return np.array([datetime.fromisoformat(d).timestamp() / 86400 for d in dates])
+
+
+def theil_sen(values: np.ndarray, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-row Theil-Sen slope and intercept and Mann-Kendall z of log values (ops x points, NaN = missing)."""
+    first, second = np.triu_indices(values.shape[1], 1)
+    dy = values[:, second] - values[:, first]
+    dt = times[second] - times[first]
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        slope = np.nanmedian(np.where(dt > 0, dy / dt, np.nan), axis=1)
+        intercept = np.nanmedian(values - slope[:, None] * times, axis=1)
+
+        n = np.count_nonzero(~np.isnan(values), axis=1).astype(float)
+        s = np.nansum(np.sign(dy), axis=1)
+        variance = n * (n - 1) * (2 * n + 5) / 18
+        z = np.where(variance > 0, (s - np.sign(s)) / np.sqrt(variance), 0.0)
+    return slope, intercept, z
+
+
+def drift_starts(values: np.ndarray, times: np.ndarray, min_after: int = 3) -> np.ndarray:
+    """Column of each row's drift onset: the knee of the least-squares hinge fit.
+
+    Knee k fits y = a + b * max(t - t_k, 0); every k is solved at once
+    from weighted sums, and the one with the smallest residual wins.
+    """
+    measured = ~np.isnan(values)
+    w = measured.astype(float)
+    y = np.where(measured, values, 0.0)
+    hinge = np.maximum(times[None, :] - times[:, None], 0.0)  # knee x point
+    sw, sy, syy = w.sum(axis=1), y.sum(axis=1), (y * y).sum(axis=1)
+    sx, sxx, sxy = w @ hinge.T, w @ (hinge * hinge).T, y @ hinge.T
+    after = w @ (hinge > 0).T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var_x = sxx - sx * sx / sw[:, None]
+        cov = sxy - sx * sy[:, None] / sw[:, None]
+        residual = (syy - sy * sy / sw)[:, None] - cov * cov / var_x
+    residual[~((var_x > 0) & (after >= min_after))] = np.inf
+    return np.argmin(residual, axis=1)
+
+
+def step_shares(values: np.ndarray, drift_log: np.ndarray) -> np.ndarray:
+    """Largest step between consecutive 3-point running medians, as a share of the drift."""
+    compacted, _ = compact(values)
+    if compacted.shape[1] < 4:
+        return np.full(values.shape[0], np.inf)
+    # Only full windows: a lone outlier at either end is dropped, not kept by padding
+    smooth = np.median(np.lib.stride_tricks.sliding_window_view(compacted, 3, axis=1), axis=2)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        steps = np.nanmax(np.abs(np.diff(smooth, axis=1)), axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return steps / np.abs(drift_log)
+
+
+def detect_drift(store, windows_days: List[int] = DRIFT_WINDOWS_DAYS, budget_percent: float = DRIFT_BUDGET,
+                 min_points: int = MIN_DRIFT_POINTS, trend_z: float = TREND_Z,
+                 step_share: float = STEP_SHARE) -> List[Dict]:
+    """Ops drifting by budget_percent or more, one entry per (op, window), largest drift first."""
+    pooled, dates, commits = commit_points(store)
+    if not dates:
+        return []
+    times = _days(dates)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        logs = np.where(pooled > 0, np.log(pooled), np.nan)
+
+    drifts = []
+    for days in windows_days:
+        columns = np.flatnonzero(times >= times[-1] - days)
+        values, t = logs[:, columns], times[columns] - times[columns[0]]
+        slope, intercept, z = theil_sen(values, t)
+        measured = ~np.isnan(values)
+        points = measured.sum(axis=1)
+        first = np.where(measured.any(axis=1), measured.argmax(axis=1), 0)
+        last = values.shape[1] - 1 - np.where(measured.any(axis=1), measured[:, ::-1].argmax(axis=1), 0)
+        drift_log = slope * (t[last] - t[first])
+        drift_percent = np.expm1(drift_log) * 100
+        shares = step_shares(values, drift_log)
+
+        flagged = ((points >= min_points) & (np.abs(drift_percent) >= budget_percent) &
+                   (np.abs(z) >= trend_z) & (np.sign(z) == np.sign(slope)) & (shares <= step_share))
+        rows = np.flatnonzero(flagged)
+        if rows.size == 0:
+            continue
+        starts = drift_starts(values[rows], t)
+        # The rate is refitted on the points from the onset on
+        since_start = np.where(np.arange(len(t))[None, :] >= starts[:, None], values[rows], np.nan)
+        rates = theil_sen(since_start, t)[0]
+        for row, start, rate in zip(rows, starts, rates):
+            column = columns[start]
+            drifts.append({
+                'operation_name': store.ops[row],
+                'window_days': days,
+                'drift_percent': float(drift_percent[row]),
+                'percent_per_week': float(np.expm1(rate * 7) * 100),
+                'start_date': dates[column],
+                'start_commit': commits[column],
+                'from_ns': float(np.exp(intercept[row] + slope[row] * t[first[row]])),
+                'to_ns': float(np.exp(intercept[row] + slope[row] * t[last[row]])),
+                'points': int(points[row]),
+                'trend_z': float(z[row]),
+                'largest_step_share': float(shares[row]),
+            })
+    drifts.sort(key=lambda d: (d['window_days'], -abs(d['drift_percent'])))
+    return drifts
+
+
+def format_digest_html(drifts: List[Dict], budget_percent: float, last_date: str) -> str:
+    """HTML body of the digest email."""
+    rows = "".join(
+        f"<tr><td>{d['operation_name']}</td><td>{d['window_days']}d</td>"
+        f"<td class=\"{'regression' if d['drift_percent'] > 0 else 'improvement'}\">{d['drift_percent']:+.1f}%</td>"
+        f"<td>{d['percent_per_week']:+.2f}%</td><td>{d['start_date'][:10]} ({d['start_commit'][:8]})</td>"
+        f"<td>{d['from_ns']:.1f} → {d['to_ns']:.1f} ns</td></tr>"
+        for d in drifts)
+    return f"""
+    <html>
+    <head>
+        <style>
+            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
+            .header {{ background-color: #fff3cd; padding: 20px; border-radius: 5px; margin-bottom: 20px; }}
+            .regression {{ color: #dc3545; font-weight: bold; }}
+            .improvement {{ color: #28a745; font-weight: bold; }}
+            table {{ border-collapse: collapse; width: 100%; margin: 10px 0; }}
+            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+            th {{ background-color: #f8f9fa; }}
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h2>🐌 TTNN Slow-Drift Digest</h2>
+            <p>{len(drifts)} op window(s) drifted by {budget_percent}% or more, up to {last_date[:10]}</p>
+        </div>
+        <table>
+            <tr><th>Operation</th><th>Window</th><th>Drift</th><th>Per week</th><th>Started</th><th>Level</th></tr>
+            {rows}
+        </table>
+    </body>
+    </html>
+    """
+
+
+def send_digest(drifts: List[Dict], budget_percent: float, last_date: str) -> bool:
+    """Email the digest with the alert settings (RESEND_API_KEY, ALERT_EMAIL, FROM_EMAIL)."""
+    from check_perf_changes import PerformanceChangeDetector
+
+    api_key = os.environ.get('RESEND_API_KEY')
+    if not api_key:
+        print("❌ Error: RESEND_API_KEY environment variable not set")
+        return False
+    subject = f"🐌 TTNN Slow-Drift Digest: {len({d['operation_name'] for d in drifts})} op(s) drifting"
+    return PerformanceChangeDetector().send_email_resend(
+        subject, format_digest_html(drifts, budget_percent, last_date),
+        os.environ.get('ALERT_EMAIL', 'aswin@aswincloud.com'), api_key, os.environ.get('FROM_EMAIL'))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Report ops whose performance drifts slowly')
+    parser.add_argument('--windows', default=",".join(str(d) for d in DRIFT_WINDOWS_DAYS),
+                        help='Comma-separated window lengths in days')
+    parser.add_argument('--budget', type=float, default=DRIFT_BUDGET, help='Cumulative drift budget in percent')
+    parser.add_argument('--email', action='store_true', help='Email the digest when any op drifts')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    windows = [int(days) for days in args.windows.split(",") if days.strip()]
+    store = load_store(args.data_dir)
+    drifts = detect_drift(store, windows, args.budget)
+    last_date = store.dates[-1] if store.dates else ''
+
+    path = Path(args.data_dir) / DRIFT_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'metadata': {'windows_days': windows, 'budget_percent': args.budget,
+                                'last_measurement_date': last_date, 'generated': datetime.now().isoformat()},
+                   'drifts': drifts}, f, indent=2)
+
+    print(f"🐌 {len(drifts)} op window(s) drifted ≥{args.budget}% → {path}")
+    for drift in drifts:
+        symbol = "📉" if drift['drift_percent'] > 0 else "📈"
+        print(f"{symbol} {drift['operation_name']} ({drift['window_days']}d): {drift['drift_percent']:+.1f}% "
+              f"({drift['percent_per_week']:+.2f}%/week) since {drift['start_date'][:10]} "
+              f"({drift['start_commit'][:8]})")
+
+    if args.email and drifts:
+        if not send_digest(drifts, args.budget, last_date):
+            print("⚠️ Drift found but the digest email failed.")
+            return 1
+        print("✅ Drift digest sent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""
+TTNN Eltwise Operation Registry
+
+Single source of truth for the eltwise operations we test and measure. Each
+OpSpec describes how to invoke one ttnn operation and how to check it against
+a torch or golden reference. test_eltwise_operations.py generates its test
+methods from this registry and perf_measurement_script.py reads the test names
+from it directly, so adding an operation means adding one line here.
+
+This module only needs torch when a reference is actually resolved, so the
+operation lists can be read on machines without ttnn or torch installed.
+"""
+
+import importlib
+import sys
+from typing import Dict, List, Optional
+
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    torch = None
+    TORCH_AVAILABLE = False
+
+
+# Reference marker for ops checked against ttnn.get_golden_function(op)
+GOLDEN = "golden"
+
+CATEGORIES = ["unary", "binary", "ternary", "reduction", "complex"]
+
+
+class OpSpec:
+    """Declarative description of one eltwise operation test.
+
+    Args:
+        name: Operation name as reported in results (test name is test_<name>)
+        category: One of CATEGORIES, used for the operation inventory
+        arity: Number of tensor inputs (excluding the gradient for backward ops)
+        reference: Dotted path ("torch.abs"), callable, or GOLDEN. Callables
+            receive the torch inputs followed by the same args/kwargs as the ttnn op
+        ttnn_name: Attribute on the ttnn module (defaults to name)
+        backward: True for *_bw operations, which take a gradient first
+        values: Value distribution for every input (see create_test_tensor)
+        input_values: Per-input overrides of values; None entries keep values
+        min_val, max_val: Bounds for the "range" distribution
+        dtype: ttnn dtype attribute name ("int32", "float32"); None for default
+        shape: Input shape override
+        args, kwargs: Extra scalar parameters passed to the op and the reference
+        outputs: Number of backward gradients compared (defaults to arity)
+        check_meta: Assert output shape/dtype match the inputs
+        custom: Test body is hand-written in TestEltwiseOperations
+        known_failing: Skipped by the performance measurement
+    """
+
+    def __init__(self, name: str, category: str, arity: int, reference=None,
+                 ttnn_name: Optional[str] = None, backward: bool = False,
+                 values: Optional[str] = None, input_values: Optional[tuple] = None,
+                 min_val: Optional[float] = None, max_val: Optional[float] = None,
+                 dtype: Optional[str] = None, shape: Optional[tuple] = None,
+                 args: tuple = (), kwargs: Optional[Dict] = None,
+                 outputs: Optional[int] = None, check_meta: bool = True,
+                 custom: bool = False, known_failing: bool = False):
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown category '{category}' for {name}")
+        self.name = name
+        self.category = category
+        self.arity = arity
+        self.reference = GOLDEN if backward and reference is None else reference
+        self.ttnn_name = ttnn_name or name
+        self.backward = backward
+        self.values = values
+        self.input_values = input_values
+        self.min_val = min_val
+        self.max_val = max_val
+        self.dtype = dtype
+        self.shape = shape
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+        self.outputs = outputs if outputs is not None else arity
+        self.check_meta = check_meta
+        self.custom = custom
+        self.known_failing = known_failing
+
+    @property
+    def test_name(self) -> str:
+        return f"test_{self.name}"
+
+    def input_value_types(self) -> List[Optional[str]]:
+        """Value distribution for each tensor input, in call order."""
+        overrides = list(self.input_values or ())
+        overrides += [None] * (self.arity - len(overrides))
+        return [override or self.values for override in overrides]
+
+    def resolve_reference(self):
+        """Return the reference callable, or GOLDEN/None when there is none."""
+        if self.reference is None or self.reference == GOLDEN or callable(self.reference):
+            return self.reference
+        module_name, _, attr_path = self.reference.partition(".")
+        target = importlib.import_module(module_name)
+        for attr in attr_path.split("."):
+            target = getattr(target, attr)
+        return target
+
+    def __repr__(self):
+        kind = f"{self.category}_bw" if self.backward else self.category
+        return f"OpSpec({self.name!r}, {kind}, arity={self.arity})"
+
+
+def _unary(name, reference=None, **kw):
+    return OpSpec(name, "unary", 1, reference, **kw)
+
+
+def _binary(name, reference=None, **kw):
+    return OpSpec(name, "binary", 2, reference, **kw)
+
+
+def _ternary(name, reference=None, **kw):
+    return OpSpec(name, "ternary", 3, reference, **kw)
+
+
+def _reduction(name, reference=None, **kw):
+    return OpSpec(name, "reduction", 1, reference, **kw)
+
+
+def _backward(name, category, arity, **kw):
+    return OpSpec(name, category, arity, backward=True, **kw)
+
+
+def _custom(name, category, arity=1, **kw):
+    return OpSpec(name, category, arity, custom=True, **kw)
+
+
+def _split_halves(x):
+    return torch.chunk(x, 2, dim=-1)
+
+
+# Hand-written tests (custom=True) keep their bodies in TestEltwiseOperations;
+# every other entry gets a generated test_<name> method.
+OP_REGISTRY: List[OpSpec] = [
+    # Unary operations
+    _unary("abs", "torch.abs"),
+    _unary("acos", "torch.acos", values="mixed"),
+    _unary("asin", "torch.asin", values="mixed"),
+    _unary("asinh", "torch.asinh"),
+    _unary("atan", "torch.atan"),
+    _unary("atanh", "torch.atanh"),
+    _unary("cos", "torch.cos"),
+    _unary("acosh", "torch.acosh", values="positive"),
+    _unary("erfinv", "torch.erfinv"),
+    _unary("exp2", "torch.exp2", values="mixed"),
+    _unary("expm1", "torch.expm1", values="mixed"),
+    _unary("gez", lambda x: x >= 0),
+    _unary("gtz", lambda x: x > 0),
+    _unary("i0", "torch.i0", values="mixed"),
+    _unary("isfinite", "torch.isfinite"),
+    _unary("isinf", "torch.isinf"),
+    _unary("isnan", "torch.isnan"),
+    _unary("lez", lambda x: x <= 0),
+    _unary("log", "torch.log", values="positive"),
+    _unary("log10", "torch.log10", values="positive"),
+    _unary("log2", "torch.log2", values="positive"),
+    _unary("log1p", "torch.log1p", values="mixed"),
+    _unary("logical_not", "torch.logical_not"),
+    _unary("ltz", lambda x: x < 0),
+    _unary("neg", "torch.neg"),
+    _unary("reciprocal", "torch.reciprocal", values="positive"),
+    _unary("relu", "torch.relu"),
+    _unary("relu6", "torch.nn.functional.relu6"),
+    _unary("sign", "torch.sign"),
+    _unary("signbit", "torch.signbit"),
+    _unary("silu", "torch.nn.functional.silu"),
+    _unary("sin", "torch.sin"),
+    _unary("sqrt", "torch.sqrt", values="positive"),
+    _unary("square", "torch.square"),
+    _unary("tan", "torch.tan", values="mixed"),
+    _unary("exp", "torch.exp"),
+    _unary("erf", "torch.erf"),
+    _unary("erfc", "torch.erfc"),
+    _unary("gelu", "torch.nn.functional.gelu"),
+    _unary("rsqrt", "torch.rsqrt", values="positive"),
+    _unary("sigmoid", "torch.sigmoid"),
+    _unary("tanh", "torch.tanh"),
+    _custom("i1", "unary"),
+    _unary("isneginf", "torch.isneginf"),
+    _unary("isposinf", "torch.isposinf"),
+    _unary("nez", lambda x: x != 0),
+    _unary("bitwise_not", "torch.bitwise_not", dtype="int32"),
+    _unary("floor", "torch.floor"),
+    _unary("ceil", "torch.ceil"),
+    _unary("trunc", "torch.trunc"),
+    _unary("eqz", lambda x: x == 0),
+    _unary("mish", lambda x: x * torch.tanh(torch.nn.functional.softplus(x))),
+    _custom("hardmish", "unary"),
+    _unary("cosh", "torch.cosh", values="mixed"),
+    _unary("sinh", "torch.sinh", values="mixed"),
+    _unary("cbrt", lambda x: torch.sign(x) * torch.pow(torch.abs(x), 1/3)),
+    _unary("softplus", "torch.nn.functional.softplus"),
+    _unary("log_sigmoid", "torch.nn.functional.logsigmoid", values="mixed"),
+    _unary("swish", lambda x: x * torch.sigmoid(x)),
+    _unary("hardswish", "torch.nn.functional.hardswish"),
+    _unary("hardsigmoid", "torch.nn.functional.hardsigmoid"),
+    _unary("hardtanh", "torch.nn.functional.hardtanh"),
+    _unary("celu", "torch.nn.functional.celu"),
+    _unary("selu", "torch.nn.functional.selu"),
+    _unary("tanhshrink", "torch.nn.functional.tanhshrink"),
+    _unary("deg2rad", "torch.deg2rad"),
+    _unary("rad2deg", "torch.rad2deg"),
+    _unary("identity", lambda x: x),
+    _unary("softsign", "torch.nn.functional.softsign"),
+    _unary("frac", "torch.frac"),
+    _unary("round", "torch.round"),
+    _unary("logit", "torch.logit"),
+    _unary("clip", "torch.clip", values="random", args=(-1.0, 1.0), check_meta=False),
+    _unary("clamp", "torch.clamp", values="random", args=(-1.0, 1.0), check_meta=False),
+    _unary("sigmoid_accurate", "torch.sigmoid"),
+    _unary("elu", lambda x, alpha: torch.nn.functional.elu(x, alpha=alpha),
+           values="random", args=(1.0,), check_meta=False),
+    _unary("leaky_relu", lambda x, slope: torch.nn.functional.leaky_relu(x, negative_slope=slope),
+           values="random", args=(0.01,), check_meta=False),
+    _unary("threshold", "torch.threshold", values="random", args=(0.1, 0.0), check_meta=False),
+    _unary("tril", "torch.tril"),
+    _unary("triu", "torch.triu"),
+    _unary("digamma", "torch.digamma", values="range", min_val=1, max_val=100),
+    _unary("lgamma", "torch.lgamma", values="positive"),
+    _custom("multigammaln", "unary"),
+    _unary("polygamma", lambda x, n: torch.polygamma(n, x),
+           values="positive", args=(1,), check_meta=False),
+    _custom("heaviside", "unary"),
+    _unary("logical_not_", lambda x: x.clone().logical_not_(), values="random", check_meta=False),
+    _unary("fill", lambda x, value: torch.full_like(x, value),
+           values="random", args=(3.14,), check_meta=False),
+    _unary("glu", "torch.nn.functional.glu", values="random", shape=(1, 1, 32, 64),
+           args=(-1,), check_meta=False),
+    _unary("reglu", lambda x: _split_halves(x)[0] * torch.nn.functional.relu(_split_halves(x)[1]),
+           values="random", shape=(1, 1, 32, 64), check_meta=False),
+    _unary("geglu", lambda x: _split_halves(x)[0] * torch.nn.functional.gelu(_split_halves(x)[1]),
+           values="random", shape=(1, 1, 32, 64), check_meta=False),
+    _unary("swiglu", lambda x: _split_halves(x)[0] * (_split_halves(x)[1] * torch.sigmoid(_split_halves(x)[1])),
+           values="random", shape=(1, 1, 32, 64), check_meta=False),
+    _unary("relu_max", lambda x, upper: torch.clamp(torch.nn.functional.relu(x), max=upper),
+           values="random", args=(6.0,), check_meta=False),
+    _unary("relu_min", lambda x, lower: torch.clamp(x, min=lower),
+           values="random", args=(0.1,), check_meta=False),
+    _unary("prelu", lambda x, weight: torch.nn.functional.prelu(x, torch.tensor(weight, dtype=x.dtype)),
+           values="random", args=(0.25,), check_meta=False),
+    _unary("softshrink", lambda x, lambd: torch.nn.functional.softshrink(x, lambd),
+           values="random", kwargs={"lambd": 0.5}, check_meta=False),
+    _unary("hardshrink", lambda x, lambd: torch.nn.functional.hardshrink(x, lambd),
+           values="random", kwargs={"lambd": 0.5}, check_meta=False),
+    _unary("var_hw", lambda x: torch.var(x, dim=(-2, -1), keepdim=True, unbiased=False),
+           values="random", check_meta=False),
+    _unary("std_hw", lambda x: torch.std(x, dim=(-2, -1), keepdim=True, unbiased=False),
+           values="random", check_meta=False),
+
+    # Binary operations
+    _binary("add", "torch.add"),
+    _binary("subtract", "torch.subtract"),
+    _binary("multiply", "torch.multiply"),
+    _binary("divide", "torch.divide", input_values=(None, "positive")),
+    _binary("gt", "torch.gt"),
+    _binary("lt", "torch.lt"),
+    _binary("eq", "torch.eq"),
+    _binary("ne", "torch.ne"),
+    _binary("ge", "torch.ge"),
+    _binary("le", "torch.le"),
+    _binary("logical_and", "torch.logical_and"),
+    _binary("logical_or", "torch.logical_or"),
+    _binary("logical_xor", "torch.logical_xor"),
+    _binary("atan2", "torch.atan2"),
+    _binary("hypot", "torch.hypot"),
+    _binary("logaddexp", "torch.logaddexp", values="mixed"),
+    _binary("logaddexp2", "torch.logaddexp2", values="mixed"),
+    _binary("maximum", "torch.maximum"),
+    _binary("minimum", "torch.minimum"),
+    _binary("pow", "torch.pow", values="mixed"),
+    _binary("fmod", "torch.fmod", values="mixed", input_values=(None, "positive")),
+    _binary("remainder", "torch.remainder", input_values=(None, "positive")),
+    _binary("squared_difference", lambda a, b: torch.square(a - b)),
+    _binary("bitwise_and", "torch.bitwise_and", dtype="int32"),
+    _binary("bitwise_or", "torch.bitwise_or", dtype="int32"),
+    _binary("bitwise_xor", "torch.bitwise_xor", dtype="int32"),
+    _binary("mul", "torch.mul"),
+    _binary("sub", "torch.sub"),
+    OpSpec("rpow", "binary", 1, lambda x, exponent: torch.pow(exponent, x),
+           values="positive", args=(2.0,), check_meta=False),
+    OpSpec("rdiv", "binary", 1, lambda x, divisor: torch.div(divisor, x),
+           values="positive", args=(2.0,), check_meta=False),
+    _binary("ldexp", "torch.ldexp", values="mixed", check_meta=False),
+    _binary("xlogy", "torch.xlogy", values="random", input_values=(None, "positive"), check_meta=False),
+    _binary("nextafter", "torch.nextafter"),
+    _binary("bias_gelu", lambda a, b: torch.nn.functional.gelu(a + b), values="random", check_meta=False),
+    _binary("addalpha", lambda a, b, alpha: a + alpha * b, values="random", args=(2.0,), check_meta=False),
+    _binary("subalpha", lambda a, b, alpha: a - alpha * b, values="random", args=(2.0,), check_meta=False),
+    _binary("isclose", "torch.isclose", values="random", kwargs={"rtol": 1e-5, "atol": 1e-8},
+            check_meta=False),
+    _binary("add_", lambda a, b: a.clone().add_(b), values="random", check_meta=False),
+    _binary("subtract_", lambda a, b: a.clone().subtract_(b), values="random", check_meta=False),
+    _binary("multiply_", lambda a, b: a.clone().multiply_(b), values="random", check_meta=False),
+    _binary("divide_", lambda a, b: a.clone().divide_(b), values="random",
+            input_values=(None, "positive"), check_meta=False),
+    _binary("mul_", lambda a, b: a.clone().mul_(b), values="random", check_meta=False),
+    _binary("sub_", lambda a, b: a.clone().sub_(b), values="random", check_meta=False),
+    _binary("div_", lambda a, b: a.clone().div_(b), values="random",
+            input_values=(None, "positive"), check_meta=False),
+    _binary("rsub_", lambda a, b: b.sub(a), values="random", check_meta=False),
+    _binary("gt_", lambda a, b: a.clone().gt_(b), values="random", check_meta=False),
+    _binary("lt_", lambda a, b: a.clone().lt_(b), values="random", check_meta=False),
+    _binary("eq_", lambda a, b: a.clone().eq_(b), values="random", check_meta=False),
+    _binary("ne_", lambda a, b: a.clone().ne_(b), values="random", check_meta=False),
+    _binary("ge_", lambda a, b: a.clone().ge_(b), values="random", check_meta=False),
+    _binary("le_", lambda a, b: a.clone().le_(b), values="random", check_meta=False),
+    _binary("logical_and_", lambda a, b: a.clone().logical_and_(b), values="random", check_meta=False),
+    _binary("logical_or_", lambda a, b: a.clone().logical_or_(b), values="random", check_meta=False),
+    _binary("logical_xor_", lambda a, b: a.clone().logical_xor_(b), values="random", check_meta=False),
+    _binary("ldexp_", "torch.ldexp", values="mixed", check_meta=False),
+    _binary("logaddexp_", "torch.logaddexp", values="random", check_meta=False),
+    _binary("logaddexp2_", "torch.logaddexp2", values="random", check_meta=False),
+    _binary("bias_gelu_", lambda a, b: torch.nn.functional.gelu(a + b), values="random", check_meta=False),
+    _binary("squared_difference_", lambda a, b: torch.square(a - b), values="random", check_meta=False),
+    _binary("assign", lambda a, b: a.clone(), values="random", check_meta=False),
+    OpSpec("round_binary", "binary", 1, "torch.round", ttnn_name="round",
+           values="random", kwargs={"decimals": 2}, check_meta=False),
+    _custom("clip_binary", "binary", arity=3, ttnn_name="clip"),
+
+    # Ternary operations
+    _custom("where", "ternary", arity=3),
+    _ternary("mac", lambda a, b, c: a * b + c, values="random"),
+    _ternary("addcdiv", "torch.addcdiv", values="random", input_values=(None, None, "positive"),
+             kwargs={"value": 1.0}, check_meta=False),
+    _ternary("addcmul", "torch.addcmul", values="random", kwargs={"value": 1.0}, check_meta=False),
+    _ternary("lerp", "torch.lerp", values="random", check_meta=False),
+
+    # Reduction operations
+    _reduction("max", "torch.max"),
+    _reduction("min", "torch.min"),
+    _reduction("mean", "torch.mean"),
+    _reduction("sum", "torch.sum"),
+    _reduction("prod", "torch.prod"),
+    _reduction("var", "torch.var"),
+    _reduction("std", "torch.std"),
+    _reduction("cumsum", "torch.cumsum", values="random", args=(-1,), check_meta=False),
+    _reduction("cumprod", "torch.cumprod", values="small", args=(-1,), check_meta=False),
+
+    # Complex operations
+    _custom("complex_tensor", "complex", arity=2, known_failing=True),
+    _custom("real", "complex", known_failing=True),
+    _custom("imag", "complex", known_failing=True),
+    _custom("angle", "complex"),
+    _custom("conj", "complex"),
+    _custom("polar", "complex"),
+    _custom("complex_recip", "complex", ttnn_name="reciprocal"),
+
+    # Unary backward operations
+    _backward("abs_bw", "unary", 1),
+    _backward("acos_bw", "unary", 1),
+    _backward("acosh_bw", "unary", 1, values="positive"),
+    _backward("asin_bw", "unary", 1),
+    _backward("asinh_bw", "unary", 1),
+    _backward("atan_bw", "unary", 1),
+    _backward("atanh_bw", "unary", 1),
+    _backward("ceil_bw", "unary", 1),
+    _backward("cos_bw", "unary", 1),
+    _backward("cosh_bw", "unary", 1, values="mixed"),
+    _backward("deg2rad_bw", "unary", 1),
+    _backward("digamma_bw", "unary", 1, values="positive"),
+    _backward("erf_bw", "unary", 1),
+    _backward("erfc_bw", "unary", 1),
+    _backward("erfinv_bw", "unary", 1),
+    _backward("exp_bw", "unary", 1, values="mixed"),
+    _backward("exp2_bw", "unary", 1, values="mixed"),
+    _backward("expm1_bw", "unary", 1, values="mixed"),
+    _backward("floor_bw", "unary", 1),
+    _backward("frac_bw", "unary", 1, known_failing=True),
+    _backward("gelu_bw", "unary", 1),
+    _backward("hardsigmoid_bw", "unary", 1),
+    _backward("hardswish_bw", "unary", 1),
+    # float32 avoids "i1_cpu" not implemented for 'BFloat16' in the golden
+    _backward("i0_bw", "unary", 1, dtype="float32", values="mixed"),
+    _backward("lgamma_bw", "unary", 1, values="range", min_val=1, max_val=100),
+    _backward("log_bw", "unary", 1, values="positive"),
+    _backward("log_sigmoid_bw", "unary", 1),
+    _backward("log1p_bw", "unary", 1),
+    _backward("log10_bw", "unary", 1, values="positive"),
+    _backward("log2_bw", "unary", 1, values="positive"),
+    _backward("logit_bw", "unary", 1),
+    _backward("multigammaln_bw", "unary", 1, values="range", min_val=3, max_val=10),
+    _backward("neg_bw", "unary", 1),
+    _backward("rad2deg_bw", "unary", 1),
+    _backward("reciprocal_bw", "unary", 1, values="positive"),
+    _backward("relu_bw", "unary", 1),
+    _backward("relu6_bw", "unary", 1),
+    _backward("round_bw", "unary", 1),
+    _backward("rsqrt_bw", "unary", 1, values="positive"),
+    _backward("selu_bw", "unary", 1),
+    _backward("sigmoid_bw", "unary", 1),
+    _backward("sign_bw", "unary", 1),
+    _backward("silu_bw", "unary", 1),
+    _backward("sin_bw", "unary", 1),
+    _backward("sinh_bw", "unary", 1, values="mixed"),
+    _backward("softsign_bw", "unary", 1),
+    _backward("sqrt_bw", "unary", 1, values="positive"),
+    _backward("square_bw", "unary", 1),
+    _backward("tan_bw", "unary", 1, values="mixed"),
+    _backward("tanh_bw", "unary", 1, values="range", min_val=-1, max_val=1),
+    _backward("tanhshrink_bw", "unary", 1),
+    _backward("trunc_bw", "unary", 1),
+    _backward("fill_bw", "unary", 1),
+    _backward("fill_zero_bw", "unary", 1),
+    _custom("hardshrink_bw", "unary", backward=True),
+    _custom("softshrink_bw", "unary", backward=True),
+
+    # Binary backward operations
+    _backward("add_bw", "binary", 2),
+    _backward("atan2_bw", "binary", 2),
+    _backward("bias_gelu_bw", "binary", 2),
+    _backward("div_bw", "binary", 2, values="random", input_values=(None, "positive"), check_meta=False),
+    _backward("fmod_bw", "binary", 2),
+    _backward("hypot_bw", "binary", 2),
+    _backward("ldexp_bw", "binary", 2),
+    _backward("logaddexp_bw", "binary", 2),
+    _backward("logaddexp2_bw", "binary", 2),
+    _backward("max_bw", "binary", 2),
+    _backward("min_bw", "binary", 2),
+    _backward("mul_bw", "binary", 2),
+    _backward("remainder_bw", "binary", 2),
+    _backward("rsub_bw", "binary", 2),
+    _backward("squared_difference_bw", "binary", 2),
+    _backward("sub_bw", "binary", 2),
+    _backward("xlogy_bw", "binary", 2),
+    _backward("pow_bw", "binary", 1, values="random", input_values=("positive",), args=(2.0,)),
+    _backward("addalpha_bw", "binary", 2, values="random", args=(2.0,)),
+    _backward("subalpha_bw", "binary", 2, values="random", args=(2.0,)),
+
+    # Ternary backward operations
+    _backward("addcdiv_bw", "ternary", 3, values="random", input_values=(None, None, "positive"),
+              args=(1.0,), check_meta=False),
+    _backward("addcmul_bw", "ternary", 3, values="random", args=(1.0,), check_meta=False),
+    _backward("lerp_bw", "ternary", 2, values="random", args=(0.5,), check_meta=False),
+    _custom("where_bw", "ternary", arity=3, backward=True, outputs=2),
+]
+
+OP_SPECS: Dict[str, OpSpec] = {spec.name: spec for spec in OP_REGISTRY}
+
+if len(OP_SPECS) != len(OP_REGISTRY):
+    raise ValueError("Duplicate operation names in OP_REGISTRY")
+
+
+def get_op_spec(name: str) -> OpSpec:
+    """Look up a spec by operation name or test name."""
+    if name.startswith("test_") and name not in OP_SPECS:
+        name = name[len("test_"):]
+    return OP_SPECS[name]
+
+
+def get_operations(category: Optional[str] = None, backward: Optional[bool] = None) -> List[str]:
+    """Operation names in registry order, optionally filtered."""
+    return [
+        spec.name for spec in OP_REGISTRY
+        if (category is None or spec.category == category)
+        and (backward is None or spec.backward == backward)
+    ]
+
+
+def get_registered_test_names(include_known_failing: bool = True) -> List[str]:
+    """Test method names for every registered operation, in registry order."""
+    return [
+        spec.test_name for spec in OP_REGISTRY
+        if include_known_failing or not spec.known_failing
+    ]
+
+
+def render_catalog_markdown() -> str:
+    """Render the tested-operations catalog as markdown."""
+    lines = ["# Tested TTNN Eltwise Operations", "",
+             f"**Total Operations: {len(OP_REGISTRY)}**", ""]
+    for backward in (False, True):
+        for category in CATEGORIES:
+            names = get_operations(category, backward)
+            if not names:
+                continue
+            title = f"{category.title()} {'Backward ' if backward else ''}Operations"
+            lines += [f"## {title} ({len(names)})", "", "```"]
+            lines += [", ".join(names[i:i + 8]) for i in range(0, len(names), 8)]
+            lines += ["```", ""]
+    return "\n".join(lines)
+
+
+def main():
+    """Print operation statistics, or the markdown catalog with --markdown."""
+    if "--markdown" in sys.argv[1:]:
+        print(render_catalog_markdown())
+        return
+
+    forward = [spec for spec in OP_REGISTRY if not spec.backward]
+    backward = [spec for spec in OP_REGISTRY if spec.backward]
+
+    print(f"TTNN Eltwise Operations Test Coverage:")
+    print(f"  Forward Operations: {len(forward)}")
+    for category in CATEGORIES:
+        print(f"    - {category.title()}: {len(get_operations(category, backward=False))}")
+    print(f"  Backward Operations: {len(backward)}")
+    print(f"  Total Operations: {len(OP_REGISTRY)}")
+    print(f"  Generated tests: {sum(1 for spec in OP_REGISTRY if not spec.custom)}")
+    print(f"  Hand-written tests: {sum(1 for spec in OP_REGISTRY if spec.custom)}")
+    print(f"  Known failing (skipped by perf runs): "
+          f"{', '.join(s.test_name for s in OP_REGISTRY if s.known_failing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+SQLite Performance History Database
+
+An optional SQLite mirror of data/daily for ad-hoc queries (see perfq.py).
+Tables:
+
+    commits       git_commit_id, first/last measurement date
+    measurements  one row per results file (filename, date, commit, test counts)
+    results       one row per op per measurement; date and commit are
+                  denormalized so history and per-commit queries hit one index
+    runs          raw per-run durations
+    failures      failed test names per measurement
+
+The database (~60 MB for the current archive) lives outside the dashboard
+checkout, in ~/.cache/ttnn-perf/perf_history.db, so it is never committed or
+copied into the site build; PERF_HISTORY_DB points every tool at another
+file. It is created by `backfill`; once it exists (or PERF_HISTORY_DB is set)
+the uploader adds every new results file to it.
+
+    python history_db.py backfill [--data-dir data] [--db FILE]
+    python history_db.py info [--db FILE]
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from index_store import load_index
+from results_format import load_index_entry
+
+DB_PATH = Path.home() / ".cache" / "ttnn-perf" / "perf_history.db"
+DB_ENV_VAR = "PERF_HISTORY_DB"
+RESULT_FIELDS = [
+    'successful_runs', 'average_duration_ns', 'std_deviation_ns', 'min_duration_ns', 'max_duration_ns',
+    'trace_device_time_ns', 'trace_host_time_ns',
+    'peak_l1_bytes', 'peak_dram_bytes', 'buffers_allocated',
+]
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS commits (
+    git_commit_id TEXT PRIMARY KEY,
+    first_measured TEXT,
+    last_measured TEXT
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY,
+    filename TEXT UNIQUE NOT NULL,
+    measurement_date TEXT NOT NULL,
+    git_commit_id TEXT,
+    total_tests INTEGER,
+    successful_tests INTEGER,
+    failed_tests INTEGER,
+    rerun_mode INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    measurement_id INTEGER NOT NULL REFERENCES measurements(id) ON DELETE CASCADE,
+    operation_name TEXT NOT NULL,
+    test_name TEXT,
+    measurement_date TEXT NOT NULL,
+    git_commit_id TEXT,
+    {', '.join(f'{field} REAL' for field in RESULT_FIELDS)},
+    PRIMARY KEY (measurement_id, operation_name)
+);
+CREATE TABLE IF NOT EXISTS runs (
+    measurement_id INTEGER NOT NULL REFERENCES measurements(id) ON DELETE CASCADE,
+    operation_name TEXT NOT NULL,
+    run_index INTEGER NOT NULL,
+    duration_ns REAL,
+    PRIMARY KEY (measurement_id, operation_name, run_index)
+);
+CREATE TABLE IF NOT EXISTS failures (
+    measurement_id INTEGER NOT NULL REFERENCES measurements(id) ON DELETE CASCADE,
+    test_name TEXT NOT NULL,
+    measurement_date TEXT NOT NULL,
+    PRIMARY KEY (measurement_id, test_name)
+);
+CREATE INDEX IF NOT EXISTS idx_results_op_date ON results(operation_name, measurement_date);
+CREATE INDEX IF NOT EXISTS idx_results_commit ON results(git_commit_id);
+CREATE INDEX IF NOT EXISTS idx_measurements_date ON measurements(measurement_date);
+CREATE INDEX IF NOT EXISTS idx_measurements_commit ON measurements(git_commit_id);
+CREATE INDEX IF NOT EXISTS idx_failures_test_date ON failures(test_name, measurement_date);
+"""
+
+
+def connect(db_path) -> sqlite3.Connection:
+    """Open (and if needed create) the history database."""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def insert_results(conn: sqlite3.Connection, results_data: Dict, filename: str) -> int:
+    """Insert one results file, replacing an earlier copy with the same filename.
+
+    Returns the measurement id. The caller commits.
+    """
+    metadata = results_data.get('metadata', {})
+    date_str = metadata.get('measurement_date', '')
+    commit_id = metadata.get('git_commit_id', 'unknown')
+
+    conn.execute("DELETE FROM measurements WHERE filename = ?", (filename,))
+    cursor = conn.execute(
+        "INSERT INTO measurements (filename, measurement_date, git_commit_id, total_tests, "
+        "successful_tests, failed_tests, rerun_mode) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (filename, date_str, commit_id, metadata.get('total_tests'), metadata.get('successful_tests'),
+         metadata.get('failed_tests'), int(bool(metadata.get('rerun_mode')))))
+    measurement_id = cursor.lastrowid
+
+    conn.execute(
+        "INSERT INTO commits (git_commit_id, first_measured, last_measured) VALUES (?, ?, ?) "
+        "ON CONFLICT(git_commit_id) DO UPDATE SET "
+        "first_measured = min(first_measured, excluded.first_measured), "
+        "last_measured = max(last_measured, excluded.last_measured)",
+        (commit_id, date_str, date_str))
+
+    result_rows, run_rows = [], []
+    for result in results_data.get('results', []):
+        op_name = result.get('operation_name')
+        if not op_name:
+            continue
+        result_rows.append((measurement_id, op_name, result.get('test_name'), date_str, commit_id,
+                            *(result.get(field) for field in RESULT_FIELDS)))
+        run_rows.extend((measurement_id, op_name, i, duration)
+                        for i, duration in enumerate(result.get('runs') or []))
+
+    placeholders = ', '.join('?' * (5 + len(RESULT_FIELDS)))
+    conn.executemany(
+        f"INSERT OR REPLACE INTO results (measurement_id, operation_name, test_name, measurement_date, "
+        f"git_commit_id, {', '.join(RESULT_FIELDS)}) VALUES ({placeholders})", result_rows)
+    conn.executemany(
+        "INSERT OR REPLACE INTO runs (measurement_id, operation_name, run_index, duration_ns) "
+        "VALUES (?, ?, ?, ?)", run_rows)
+    conn.executemany(
+        "INSERT OR IGNORE INTO failures (measurement_id, test_name, measurement_date) VALUES (?, ?, ?)",
+        [(measurement_id, name, date_str) for name in metadata.get('failed_test_names', [])])
+    return measurement_id
+
+
+def backfill(data_dir, db_path) -> int:
+    """Load every file listed in the measurement index into the database."""
+    data_dir = Path(data_dir)
+    files = load_index(data_dir)['files']
+
+    def load_files():
+        for entry in files:
+            try:
+                yield entry['filename'], load_index_entry(data_dir, entry)
+            except Exception as e:
+                print(f"⚠️ Warning: Could not load {entry.get('filename')}: {e}")
+
+    return insert_files(db_path, load_files())
+
+
+def insert_files(db_path, loaded: Iterable[Tuple[str, Dict]]) -> int:
+    """Insert (filename, results data) pairs in one transaction."""
+    conn = connect(db_path)
+    # Bulk load: a crash mid-backfill just means running it again
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA journal_mode = MEMORY")
+    inserted = 0
+    try:
+        with conn:
+            for filename, data in loaded:
+                insert_results(conn, data, filename)
+                inserted += 1
+    finally:
+        conn.close()
+    return inserted
+
+
+def default_db_path() -> Path:
+    """PERF_HISTORY_DB, or DB_PATH outside the dashboard checkout."""
+    return Path(os.environ.get(DB_ENV_VAR) or DB_PATH)
+
+
+def resolve_db_path() -> Optional[Path]:
+    """Database the uploader should update, or None when none has been created."""
+    if os.environ.get(DB_ENV_VAR):
+        return default_db_path()
+    return DB_PATH if DB_PATH.exists() else None
+
+
+def update_history_db(results_data: Dict, filename: str) -> Optional[Path]:
+    """Add one uploaded results file to the history database, if one exists."""
+    db_path = resolve_db_path()
+    if db_path is None:
+        return None
+    conn = connect(db_path)
+    try:
+        with conn:
+            insert_results(conn, results_data, filename)
+    finally:
+        conn.close()
+    return db_path
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='SQLite performance history database')
+    parser.add_argument('command', choices=['backfill', 'info'], help='load data/daily or show database info')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    parser.add_argument('--db', help=f'Database file (default: ${DB_ENV_VAR} or {DB_PATH})')
+    args = parser.parse_args()
+
+    db_path = Path(args.db) if args.db else default_db_path()
+
+    if args.command == 'backfill':
+        start = time.time()
+        loaded = backfill(args.data_dir, db_path)
+        print(f"✅ Loaded {loaded} results files into {db_path} in {time.time() - start:.1f}s "
+              f"({db_path.stat().st_size / 1024 / 1024:.1f} MB)")
+        return 0
+
+    if not db_path.exists():
+        print(f"❌ {db_path} not found; run 'python history_db.py backfill' first")
+        return 1
+    conn = connect(db_path)
+    try:
+        for table in ('measurements', 'results', 'runs', 'failures', 'commits'):
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            print(f"  {table:<13} {count:>9} rows")
+        first, last = conn.execute("SELECT MIN(measurement_date), MAX(measurement_date) FROM measurements").fetchone()
+        if first:
+            print(f"  {first} → {last}")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Columnar Performance History Store
+
+Every consumer of data/daily re-parses whole pretty-printed JSON files to get
+one number per op. The history store keeps the same data as columns in a
+single NumPy .npz file:
+
+    ops                    (N,)    operation names
+    filenames, dates,      (M,)    one entry per measurement file, oldest first
+    commits, epochs
+    <metric>               (N, M)  float64, NaN where an op was not measured
+    runs_values            (R,)    every raw run, concatenated
+    runs_offsets,          (N, M)  where each cell's runs start in runs_values
+    runs_counts                    and how many there are
+
+Like the history database, the store lives outside the dashboard checkout
+(~/.cache/ttnn-perf/history.npz, or $PERF_HISTORY_STORE), because the
+uploader works in a fresh clone and rewriting a multi-megabyte .npz on every
+upload would add a new blob to the dashboard repo each time. update_store()
+appends each upload to the saved store; load_store() uses it while it
+matches the index and builds the store from the archive in memory otherwise
+(about 2 s for the current archive). Loading a saved store is a single np.load.
+
+    python history_store.py build [--data-dir data] [--store PATH]
+    python history_store.py info [--store PATH]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from index_store import load_head, load_index
+from results_format import load_index_entry
+
+STORE_PATH = Path.home() / ".cache" / "ttnn-perf" / "history.npz"
+STORE_ENV_VAR = "PERF_HISTORY_STORE"
+METRICS = [
+    'average_duration_ns', 'std_deviation_ns', 'min_duration_ns', 'max_duration_ns', 'successful_runs',
+    'trace_device_time_ns', 'trace_host_time_ns',
+    'peak_l1_bytes', 'peak_dram_bytes', 'buffers_allocated',
+]
+
+
+def _epoch(date_str: str) -> float:
+    try:
+        return datetime.fromisoformat(date_str).timestamp()
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+class HistoryStore:
+    """In-memory columnar history; see the module docstring for the layout."""
+
+    def __init__(self):
+        self.ops: List[str] = []
+        self.filenames: List[str] = []
+        self.dates: List[str] = []
+        self.commits: List[str] = []
+        self.epochs = np.zeros(0, dtype=np.float64)
+        self.metrics: Dict[str, np.ndarray] = {m: np.zeros((0, 0), dtype=np.float64) for m in METRICS}
+        self.runs_values = np.zeros(0, dtype=np.float64)
+        self.runs_offsets = np.zeros((0, 0), dtype=np.int64)
+        self.runs_counts = np.zeros((0, 0), dtype=np.int32)
+        self._op_index: Dict[str, int] = {}
+
+    @property
+    def num_measurements(self) -> int:
+        return len(self.filenames)
+
+    def op_index(self, op_name: str) -> int:
+        return self._op_index[op_name]
+
+    @classmethod
+    def load(cls, path) -> 'HistoryStore':
+        """Load a store written by save()."""
+        store = cls()
+        with np.load(path, allow_pickle=False) as data:
+            store.ops = data['ops'].tolist()
+            store.filenames = data['filenames'].tolist()
+            store.dates = data['dates'].tolist()
+            store.commits = data['commits'].tolist()
+            store.epochs = data['epochs']
+            store.metrics = {m: data[m] for m in METRICS}
+            store.runs_values = data['runs_values']
+            store.runs_offsets = data['runs_offsets']
+            store.runs_counts = data['runs_counts']
+        store._op_index = {name: i for i, name in enumerate(store.ops)}
+        return store
+
+    def save(self, path):
+        """Write the store as one compressed .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp.npz')
+        np.savez_compressed(
+            tmp_path,
+            ops=np.array(self.ops, dtype=str),
+            filenames=np.array(self.filenames, dtype=str),
+            dates=np.array(self.dates, dtype=str),
+            commits=np.array(self.commits, dtype=str),
+            epochs=self.epochs,
+            runs_values=self.runs_values,
+            runs_offsets=self.runs_offsets,
+            runs_counts=self.runs_counts,
+            **self.metrics,
+        )
+        tmp_path.replace(path)
+
+    def _add_ops(self, op_names):
+        new_ops = []
+        for name in op_names:
+            if name not in self._op_index:
+                self._op_index[name] = len(self.ops)
+                self.ops.append(name)
+                new_ops.append(name)
+        if not new_ops:
+            return
+        pad = len(new_ops)
+        width = self.num_measurements
+        for metric in METRICS:
+            self.metrics[metric] = np.vstack([self.metrics[metric], np.full((pad, width), np.nan)])
+        self.runs_offsets = np.vstack([self.runs_offsets, np.zeros((pad, width), dtype=np.int64)])
+        self.runs_counts = np.vstack([self.runs_counts, np.zeros((pad, width), dtype=np.int32)])
+
+    def _column(self, results: List[Dict]) -> Tuple[Dict[str, np.ndarray], np.ndarray, np.ndarray, List[float]]:
+        """Metric columns, run offsets/counts and flat runs for one results list."""
+        n_ops = len(self.ops)
+        columns = {m: np.full(n_ops, np.nan) for m in METRICS}
+        counts = np.zeros(n_ops, dtype=np.int32)
+        offsets = np.zeros(n_ops, dtype=np.int64)
+        runs: List[float] = []
+        base = len(self.runs_values)
+        for result in results:
+            row = self._op_index[result['operation_name']]
+            for metric in METRICS:
+                value = result.get(metric)
+                if value is not None:
+                    columns[metric][row] = value
+            result_runs = result.get('runs') or []
+            offsets[row] = base + len(runs)
+            counts[row] = len(result_runs)
+            runs.extend(result_runs)
+        return columns, offsets, counts, runs
+
+    def append(self, results_data: Dict, filename: str):
+        """Add one results file as a new measurement column.
+
+        A file already in the store is replaced; columns stay sorted by date.
+        """
+        if filename in self.filenames:
+            self.remove(filename)
+
+        results = results_data.get('results', [])
+        self._add_ops(result['operation_name'] for result in results)
+        columns, offsets, counts, runs = self._column(results)
+
+        metadata = results_data.get('metadata', {})
+        date_str = metadata.get('measurement_date', '')
+        position = int(np.searchsorted(np.array(self.dates, dtype=str), date_str, side='right')) \
+            if self.dates else 0
+
+        self.filenames.insert(position, filename)
+        self.dates.insert(position, date_str)
+        self.commits.insert(position, metadata.get('git_commit_id', 'unknown'))
+        self.epochs = np.insert(self.epochs, position, _epoch(date_str))
+        for metric in METRICS:
+            self.metrics[metric] = np.insert(self.metrics[metric], position, columns[metric], axis=1)
+        self.runs_offsets = np.insert(self.runs_offsets, position, offsets, axis=1)
+        self.runs_counts = np.insert(self.runs_counts, position, counts, axis=1)
+        self.runs_values = np.concatenate([self.runs_values, np.asarray(runs, dtype=np.float64)])
+
+    def remove(self, filename: str):
+        """Drop a measurement column and its raw runs."""
+        position = self.filenames.index(filename)
+        for field in ('filenames', 'dates', 'commits'):
+            getattr(self, field).pop(position)
+        self.epochs = np.delete(self.epochs, position)
+        for metric in METRICS:
+            self.metrics[metric] = np.delete(self.metrics[metric], position, axis=1)
+        self.runs_offsets = np.delete(self.runs_offsets, position, axis=1)
+        self.runs_counts = np.delete(self.runs_counts, position, axis=1)
+        self._compact_runs()
+
+    def _compact_runs(self):
+        """Keep only the raw runs some cell references, in their current order, and renumber the offsets."""
+        counts = self.runs_counts.ravel()
+        cells = np.flatnonzero(counts)
+        cells = cells[np.argsort(self.runs_offsets.ravel()[cells], kind='stable')]
+        lengths = counts[cells].astype(np.int64)
+        starts = np.cumsum(lengths) - lengths
+        # Source index of every kept run: each cell's old offset plus its position within the cell
+        within = np.arange(lengths.sum()) - np.repeat(starts, lengths)
+        self.runs_values = self.runs_values[np.repeat(self.runs_offsets.ravel()[cells], lengths) + within]
+        offsets = np.zeros(counts.size, dtype=np.int64)
+        offsets[cells] = starts
+        self.runs_offsets = offsets.reshape(self.runs_counts.shape)
+
+    def series(self, op_name: str, metric: str = 'average_duration_ns') -> Tuple[List[str], np.ndarray]:
+        """Dates and values of one metric for one op, skipping unmeasured columns."""
+        values = self.metrics[metric][self.op_index(op_name)]
+        mask = ~np.isnan(values)
+        return [d for d, keep in zip(self.dates, mask) if keep], values[mask]
+
+    def runs(self, op_name: str, measurement: int) -> np.ndarray:
+        """Raw runs of one op in one measurement column."""
+        row = self.op_index(op_name)
+        start = self.runs_offsets[row, measurement]
+        return self.runs_values[start:start + self.runs_counts[row, measurement]]
+
+    @classmethod
+    def build_from_archive(cls, data_dir) -> 'HistoryStore':
+        """Build a store from every file listed in the measurement index."""
+        data_dir = Path(data_dir)
+        files = load_index(data_dir)['files']
+
+        loaded = []
+        for entry in files:
+            try:
+                loaded.append((entry['filename'], load_index_entry(data_dir, entry)))
+            except Exception as e:
+                print(f"⚠️ Warning: Could not load {entry.get('filename')}: {e}")
+        return cls.build_from_files(loaded)
+
+    @classmethod
+    def build_from_files(cls, loaded: Iterable[Tuple[str, Dict]]) -> 'HistoryStore':
+        """Build a store from (filename, results data) pairs in any order."""
+        store = cls()
+        loaded = list(loaded)
+        # Build in one pass rather than repeated column inserts
+        loaded.sort(key=lambda item: item[1].get('metadata', {}).get('measurement_date', ''))
+        store._add_ops(result['operation_name'] for _, data in loaded for result in data.get('results', []))
+        n_ops = len(store.ops)
+        metric_columns = {m: [] for m in METRICS}
+        offset_columns, count_columns, all_runs = [], [], []
+        run_total = 0
+        for filename, data in loaded:
+            columns = {m: np.full(n_ops, np.nan) for m in METRICS}
+            offsets = np.zeros(n_ops, dtype=np.int64)
+            counts = np.zeros(n_ops, dtype=np.int32)
+            for result in data.get('results', []):
+                row = store._op_index[result['operation_name']]
+                for metric in METRICS:
+                    value = result.get(metric)
+                    if value is not None:
+                        columns[metric][row] = value
+                result_runs = result.get('runs') or []
+                offsets[row] = run_total
+                counts[row] = len(result_runs)
+                run_total += len(result_runs)
+                all_runs.extend(result_runs)
+            for metric in METRICS:
+                metric_columns[metric].append(columns[metric])
+            offset_columns.append(offsets)
+            count_columns.append(counts)
+
+            metadata = data.get('metadata', {})
+            store.filenames.append(filename)
+            store.dates.append(metadata.get('measurement_date', ''))
+            store.commits.append(metadata.get('git_commit_id', 'unknown'))
+
+        store.epochs = np.array([_epoch(d) for d in store.dates], dtype=np.float64)
+        if loaded:
+            store.metrics = {m: np.column_stack(metric_columns[m]) for m in METRICS}
+            store.runs_offsets = np.column_stack(offset_columns)
+            store.runs_counts = np.column_stack(count_columns)
+        store.runs_values = np.asarray(all_runs, dtype=np.float64)
+        return store
+
+
+def default_store_path() -> Path:
+    """PERF_HISTORY_STORE, or STORE_PATH outside the dashboard checkout."""
+    return Path(os.environ.get(STORE_ENV_VAR) or STORE_PATH)
+
+
+def _matches_head(store: HistoryStore, head: Dict) -> bool:
+    """Whether the store holds every measurement the index lists, including the newest."""
+    newest = head['files'][0]['filename'] if head.get('files') else None
+    return store.num_measurements == head.get('total_measurements') and (newest is None or newest in store.filenames)
+
+
+def load_store(data_dir, store_path=None) -> HistoryStore:
+    """The saved store when it covers every indexed measurement, else a fresh build from the archive."""
+    data_dir = Path(data_dir)
+    store_path = Path(store_path) if store_path else default_store_path()
+    if store_path.exists():
+        store = HistoryStore.load(store_path)
+        if _matches_head(store, load_head(data_dir)):
+            return store
+        print(f"ℹ️ {store_path} is out of date; building the history from the archive")
+    return HistoryStore.build_from_archive(data_dir)
+
+
+def update_store(data_dir, results_data: Dict, filename: str, store_path=None) -> HistoryStore:
+    """Append one indexed upload to the saved store and save it.
+
+    The store is rebuilt from the archive when there is no saved store yet or
+    when it has missed other uploads, so it always matches the index.
+    """
+    data_dir = Path(data_dir)
+    store_path = Path(store_path) if store_path else default_store_path()
+    store: Optional[HistoryStore] = None
+    if store_path.exists():
+        store = HistoryStore.load(store_path)
+        store.append(results_data, filename)
+        if not _matches_head(store, load_head(data_dir)):
+            print(f"ℹ️ {store_path} is out of date; rebuilding it from the archive")
+            store = None
+    if store is None:
+        store = HistoryStore.build_from_archive(data_dir)
+    store.save(store_path)
+    return store
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Columnar performance history store')
+    parser.add_argument('command', choices=['build', 'info'], help='build from the archive or show store info')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    parser.add_argument('--store', help=f'Store path (default: ${STORE_ENV_VAR} or {STORE_PATH})')
+    args = parser.parse_args()
+
+    store_path = Path(args.store) if args.store else default_store_path()
+
+    if args.command == 'build':
+        start = time.time()
+        store = HistoryStore.build_from_archive(args.data_dir)
+        build_time = time.time() - start
+        store.save(store_path)
+        print(f"✅ Built {store_path} from {store.num_measurements} files in {build_time:.2f}s")
+        print(f"   {len(store.ops)} ops, {len(store.runs_values)} raw runs, "
+              f"{store_path.stat().st_size / 1024 / 1024:.1f} MB")
+        return 0
+
+    if not store_path.exists():
+        print(f"❌ {store_path} not found; run 'python history_store.py build' first")
+        return 1
+    start = time.time()
+    store = HistoryStore.load(store_path)
+    load_ms = (time.time() - start) * 1000
+    print(f"📦 {store_path}: {store.num_measurements} measurements × {len(store.ops)} ops "
+          f"({store_path.stat().st_size / 1024 / 1024:.1f} MB), loaded in {load_ms:.1f} ms")
+    if store.num_measurements:
+        print(f"   {store.dates[0]} → {store.dates[-1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
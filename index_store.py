@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Sharded Measurement Index
+
+data/index.json listed every measurement and was rewritten whole on every
+upload. The sharded index splits it into:
+
+    data/index/head.json      latest HEAD_SIZE entries plus one pointer per
+                              shard (month, path, count, date range) and the
+                              total measurement count
+    data/index/YYYY-MM.json   every entry measured that month
+
+All lists are newest first and entries keep the index.json fields. Adding an
+upload rewrites only its month's shard and the head. Readers use
+load_index() for the full list or load_head() for recent entries; both fall
+back to a legacy data/index.json, and the first add_entry() migrates it.
+
+    python index_store.py migrate [--data-dir data]
+    python index_store.py info
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+INDEX_DIR = Path("index")
+HEAD_FILE = "head.json"
+LEGACY_INDEX = "index.json"
+HEAD_SIZE = 50
+
+
+def shard_month(entry: Dict) -> str:
+    return (entry.get('measurement_date') or 'unknown')[:7]
+
+
+def _sort_newest_first(files: List[Dict]):
+    files.sort(key=lambda e: e.get('measurement_date', ''), reverse=True)
+
+
+def _write_json(path: Path, data: Dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    tmp_path.replace(path)
+
+
+def _read_json(path: Path) -> Dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def is_sharded(data_dir) -> bool:
+    return (Path(data_dir) / INDEX_DIR / HEAD_FILE).exists()
+
+
+def load_head(data_dir) -> Dict:
+    """The head manifest; a legacy index.json is presented as one without shards."""
+    data_dir = Path(data_dir)
+    if is_sharded(data_dir):
+        return _read_json(data_dir / INDEX_DIR / HEAD_FILE)
+    legacy = _read_json(data_dir / LEGACY_INDEX)
+    files = legacy.get('files', [])
+    return {'last_updated': legacy.get('last_updated'), 'total_measurements': len(files),
+            'files': files, 'shards': []}
+
+
+def load_shard(data_dir, month: str) -> List[Dict]:
+    path = Path(data_dir) / INDEX_DIR / f"{month}.json"
+    return _read_json(path).get('files', []) if path.exists() else []
+
+
+def load_index(data_dir) -> Dict:
+    """Every index entry, newest first, in the index.json layout."""
+    head = load_head(data_dir)
+    if not head.get('shards'):
+        return head
+    files = []
+    for shard in head['shards']:
+        files.extend(load_shard(data_dir, shard['month']))
+    return {'last_updated': head.get('last_updated'), 'total_measurements': len(files), 'files': files}
+
+
+def _shard_pointer(month: str, files: List[Dict]) -> Dict:
+    return {
+        'month': month,
+        'path': f"data/{INDEX_DIR.as_posix()}/{month}.json",
+        'count': len(files),
+        'first_date': files[-1].get('measurement_date'),
+        'last_date': files[0].get('measurement_date'),
+    }
+
+
+def _write_head(data_dir: Path, head_files: List[Dict], shards: List[Dict]):
+    shards.sort(key=lambda s: s['month'], reverse=True)
+    _write_json(data_dir / INDEX_DIR / HEAD_FILE, {
+        'last_updated': datetime.now().isoformat(),
+        'total_measurements': sum(s['count'] for s in shards),
+        'head_size': HEAD_SIZE,
+        'files': head_files[:HEAD_SIZE],
+        'shards': shards,
+    })
+
+
+def save_index(data_dir, files: List[Dict]):
+    """Rewrite every shard and the head from a full entry list (migration, compaction)."""
+    data_dir = Path(data_dir)
+    files = list(files)
+    _sort_newest_first(files)
+    by_month: Dict[str, List[Dict]] = {}
+    for entry in files:
+        by_month.setdefault(shard_month(entry), []).append(entry)
+
+    index_dir = data_dir / INDEX_DIR
+    if index_dir.exists():
+        for stale in index_dir.glob("*.json"):
+            if stale.name != HEAD_FILE and stale.stem not in by_month:
+                stale.unlink()
+    shards = []
+    for month, entries in by_month.items():
+        _write_json(index_dir / f"{month}.json", {'month': month, 'files': entries})
+        shards.append(_shard_pointer(month, entries))
+    _write_head(data_dir, files, shards)
+
+    legacy = data_dir / LEGACY_INDEX
+    if legacy.exists():
+        legacy.unlink()
+
+
+def add_entry(data_dir, new_entry: Dict) -> str:
+    """Add or replace one entry; returns 'added' or 'updated'.
+
+    An entry with the same measurement_date and git_commit_id is replaced.
+    Only the entry's month shard and the head are rewritten.
+    """
+    data_dir = Path(data_dir)
+    if not is_sharded(data_dir):
+        legacy = data_dir / LEGACY_INDEX
+        save_index(data_dir, _read_json(legacy).get('files', []) if legacy.exists() else [])
+
+    def same(entry):
+        return (entry.get('measurement_date') == new_entry['measurement_date'] and
+                entry.get('git_commit_id') == new_entry['git_commit_id'])
+
+    month = shard_month(new_entry)
+    entries = load_shard(data_dir, month)
+    status = 'updated' if any(same(e) for e in entries) else 'added'
+    entries = [e for e in entries if not same(e)] + [new_entry]
+    _sort_newest_first(entries)
+    _write_json(data_dir / INDEX_DIR / f"{month}.json", {'month': month, 'files': entries})
+
+    head = load_head(data_dir)
+    head_files = [e for e in head.get('files', []) if not same(e)] + [new_entry]
+    _sort_newest_first(head_files)
+    shards = [s for s in head.get('shards', []) if s['month'] != month] + [_shard_pointer(month, entries)]
+    _write_head(data_dir, head_files, shards)
+    return status
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Sharded measurement index')
+    parser.add_argument('command', choices=['migrate', 'info'])
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    if args.command == 'migrate':
+        if is_sharded(args.data_dir):
+            print("ℹ️ Index is already sharded")
+            return 0
+        files = load_index(args.data_dir)['files']
+        save_index(args.data_dir, files)
+        print(f"✅ Sharded {len(files)} entries into {len(load_head(args.data_dir)['shards'])} monthly shards")
+        return 0
+
+    head = load_head(args.data_dir)
+    layout = "sharded" if head.get('shards') else "legacy index.json"
+    print(f"📇 {head['total_measurements']} measurements ({layout}), {len(head['files'])} in head")
+    for shard in head.get('shards', []):
+        print(f"  {shard['month']}: {shard['count']} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
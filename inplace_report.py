@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+In-Place vs Out-of-Place Comparison Report
+
+Many ops are measured twice: out of place (add) and in place (add_). This
+report finds those pairs automatically, computes the in-place speedup for
+every measured commit and flags pairs whose in-place variant has become slower
+than allocating a new output.
+
+    speedup = out-of-place duration / in-place duration   (> 1.0: in-place is faster)
+
+A pair is flagged as inverted when its latest speedup falls below
+1.0 - tolerance. The report is written to data/reports/inplace_pairs.json by
+the uploader and can be printed at any time:
+
+    python inplace_report.py [--tolerance 0.05] [--last N] [--output FILE]
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from index_store import load_index
+from results_format import load_index_entry
+
+INPLACE_SUFFIX = "_"
+DEFAULT_TOLERANCE = 0.05
+REPORT_PATH = Path("reports") / "inplace_pairs.json"
+
+
+def find_inplace_pairs(operation_names) -> List[Tuple[str, str]]:
+    """Return sorted (out_of_place, in_place) pairs present in operation_names."""
+    names = set(operation_names)
+    return sorted(
+        (name[:-len(INPLACE_SUFFIX)], name)
+        for name in names
+        if name.endswith(INPLACE_SUFFIX) and name[:-len(INPLACE_SUFFIX)] in names
+    )
+
+
+def compute_speedup(out_of_place_ns: Optional[float], in_place_ns: Optional[float]) -> Optional[float]:
+    """Out-of-place over in-place duration, or None if either is missing."""
+    if not out_of_place_ns or not in_place_ns:
+        return None
+    return out_of_place_ns / in_place_ns
+
+
+class InplaceComparisonReport:
+    def __init__(self, data_dir="data", tolerance=DEFAULT_TOLERANCE):
+        self.data_dir = Path(data_dir)
+        self.tolerance = tolerance
+
+    def load_history(self, last: Optional[int] = None) -> List[Dict]:
+        """Load one result set per commit, oldest first.
+
+        When a commit was measured more than once the newest measurement wins.
+        """
+        try:
+            files = load_index(self.data_dir)['files']
+        except Exception as e:
+            print(f"❌ Error loading index: {e}")
+            return []
+
+        history = []
+        seen_commits = set()
+        # Index is sorted newest first
+        for entry in files:
+            commit = entry.get('git_commit_id', 'unknown')
+            if commit in seen_commits:
+                continue
+            try:
+                data = load_index_entry(self.data_dir, entry)
+            except Exception as e:
+                print(f"⚠️ Warning: Could not load {entry.get('filename')}: {e}")
+                continue
+            seen_commits.add(commit)
+            history.append({
+                'git_commit_id': commit,
+                'measurement_date': entry.get('measurement_date', ''),
+                'durations': {r['operation_name']: r.get('average_duration_ns')
+                              for r in data.get('results', [])},
+            })
+            if last and len(history) >= last:
+                break
+
+        history.reverse()
+        return history
+
+    def build_report(self, history: List[Dict]) -> Dict:
+        """Compute speedup trends and inversion flags for every detected pair."""
+        all_names = set()
+        for point in history:
+            all_names.update(point['durations'])
+
+        pairs = []
+        for base, inplace in find_inplace_pairs(all_names):
+            trend = []
+            for point in history:
+                speedup = compute_speedup(point['durations'].get(base), point['durations'].get(inplace))
+                if speedup is None:
+                    continue
+                trend.append({
+                    'git_commit_id': point['git_commit_id'],
+                    'measurement_date': point['measurement_date'],
+                    'out_of_place_ns': point['durations'][base],
+                    'in_place_ns': point['durations'][inplace],
+                    'speedup': speedup,
+                })
+            if not trend:
+                continue
+
+            latest = trend[-1]['speedup']
+            previous = trend[-2]['speedup'] if len(trend) > 1 else None
+            inverted = latest < 1.0 - self.tolerance
+            pairs.append({
+                'out_of_place': base,
+                'in_place': inplace,
+                'latest_speedup': latest,
+                'previous_speedup': previous,
+                'inverted': inverted,
+                'newly_inverted': inverted and previous is not None and previous >= 1.0 - self.tolerance,
+                'trend': trend,
+            })
+
+        pairs.sort(key=lambda p: p['latest_speedup'])
+        return {
+            'generated_from': history[-1]['git_commit_id'] if history else None,
+            'commits': len(history),
+            'tolerance': self.tolerance,
+            'total_pairs': len(pairs),
+            'inverted_pairs': [p['in_place'] for p in pairs if p['inverted']],
+            'pairs': pairs,
+        }
+
+    def print_report(self, report: Dict):
+        """Print a side-by-side summary of the latest speedups."""
+        print(f"🔁 In-place vs out-of-place: {report['total_pairs']} pairs over {report['commits']} commits")
+        print("=" * 50)
+        for pair in report['pairs']:
+            latest = pair['trend'][-1]
+            previous = pair['previous_speedup']
+            delta = f" (prev {previous:.2f}x)" if previous is not None else ""
+            if pair['newly_inverted']:
+                symbol = "🚨"
+            elif pair['inverted']:
+                symbol = "⚠️"
+            else:
+                symbol = "✅"
+            print(f"{symbol} {pair['in_place']:<22} {latest['in_place_ns']:>10.2f} ns vs "
+                  f"{pair['out_of_place']:<20} {latest['out_of_place_ns']:>10.2f} ns  "
+                  f"{pair['latest_speedup']:.2f}x{delta}")
+        if report['inverted_pairs']:
+            print(f"\n⚠️ In-place slower than out-of-place: {', '.join(report['inverted_pairs'])}")
+
+    def write_report(self, report: Dict, output_path: Optional[Path] = None) -> Path:
+        """Write the report JSON (default data/reports/inplace_pairs.json)."""
+        output_path = Path(output_path) if output_path else self.data_dir / REPORT_PATH
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return output_path
+
+
+def update_inplace_report(data_dir) -> Optional[Path]:
+    """Regenerate the stored report for a data directory (used by the uploader)."""
+    reporter = InplaceComparisonReport(data_dir)
+    report = reporter.build_report(reporter.load_history())
+    if not report['pairs']:
+        return None
+    return reporter.write_report(report)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Compare in-place ops with their out-of-place variants')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Flag pairs whose speedup drops below 1 - tolerance (default: 0.05)')
+    parser.add_argument('--last', type=int, help='Only use the last N measured commits')
+    parser.add_argument('--output', help='Also write the report JSON to this path')
+    args = parser.parse_args()
+
+    reporter = InplaceComparisonReport(args.data_dir, tolerance=args.tolerance)
+    history = reporter.load_history(last=args.last)
+    if not history:
+        print("❌ No measurements found")
+        return 1
+
+    report = reporter.build_report(history)
+    reporter.print_report(report)
+    if args.output:
+        print(f"\n📄 Report written to {reporter.write_report(report, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
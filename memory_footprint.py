@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Per-Op Device Memory Footprint
+
+Durations are not the whole cost of an op: ops that allocate large
+intermediates limit what else fits in L1. This module records, for each
+measured op, the peak L1 and DRAM bytes it allocated and the number of
+buffers it allocated, using ttnn's allocator statistics.
+
+Allocator statistics are read through a small stats-source interface:
+
+    snapshot() -> {'l1_bytes': int, 'dram_bytes': int, 'buffers': int}
+    run_with_peak(fn) -> (result, peak_l1_bytes or None)
+
+TtnnAllocatorStats implements it against a real device; tests pass a stub.
+Snapshots taken before and after the op (while its outputs are still alive)
+give the allocation that outlives the op. Intermediates freed inside the op
+are invisible to snapshots, so when ttnn graph capture is available its peak
+L1 usage is used as well and the larger of the two is stored.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+MEMORY_FIELDS = ['peak_l1_bytes', 'peak_dram_bytes', 'buffers_allocated']
+
+
+class TtnnAllocatorStats:
+    """Allocator statistics for one ttnn device."""
+
+    def __init__(self, ttnn_module, device):
+        self.ttnn = ttnn_module
+        self.device = device
+        self.reports = ttnn_module._ttnn.reports
+
+    def _allocated_bytes(self, buffer_type) -> int:
+        view = self.reports.get_memory_view(self.device, buffer_type)
+        return int(view.num_banks * view.total_bytes_allocated_per_bank)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Currently allocated L1/DRAM bytes and live buffer count."""
+        return {
+            'l1_bytes': self._allocated_bytes(self.ttnn.BufferType.L1),
+            'dram_bytes': self._allocated_bytes(self.ttnn.BufferType.DRAM),
+            'buffers': len(self.reports.get_buffers([self.device])),
+        }
+
+    def run_with_peak(self, fn: Callable[[], object]) -> Tuple[object, Optional[int]]:
+        """Run fn under graph capture and return its result and peak L1 usage."""
+        graph_api = getattr(self.ttnn, 'graph', None)
+        if graph_api is None:
+            return fn(), None
+        graph_api.begin_graph_capture(graph_api.RunMode.NORMAL)
+        try:
+            result = fn()
+        finally:
+            captured_graph = graph_api.end_graph_capture()
+        try:
+            return result, int(graph_api.extract_peak_L1_memory_usage(captured_graph))
+        except Exception as e:
+            print(f"    ⚠️ Warning: Could not extract peak L1 usage: {e}")
+            return result, None
+
+
+class MemoryFootprintProbe:
+    """Measure the allocation footprint of single op invocations."""
+
+    def __init__(self, stats_source, synchronize: Optional[Callable[[], None]] = None):
+        self.stats = stats_source
+        self.synchronize = synchronize
+
+    def measure(self, fn: Callable[[], object]) -> Dict[str, int]:
+        """Run fn once and return the MEMORY_FIELDS for it."""
+        before = self.stats.snapshot()
+        result, graph_peak_l1 = self.stats.run_with_peak(fn)
+        if self.synchronize:
+            self.synchronize()
+        # Take the snapshot while the outputs are still referenced
+        after = self.stats.snapshot()
+        del result
+
+        l1_delta = max(after['l1_bytes'] - before['l1_bytes'], 0)
+        return {
+            'peak_l1_bytes': max(l1_delta, graph_peak_l1 or 0),
+            'peak_dram_bytes': max(after['dram_bytes'] - before['dram_bytes'], 0),
+            'buffers_allocated': max(after['buffers'] - before['buffers'], 0),
+        }
+
+
+def merge_footprints(footprints) -> Dict[str, int]:
+    """Combine repeated measurements of one op by taking the maximum of each field."""
+    merged = {}
+    for footprint in footprints:
+        for field in MEMORY_FIELDS:
+            merged[field] = max(merged.get(field, 0), footprint[field])
+    return merged
+
+
+def run_memory_benchmarks(ttnn_module, device, test_names, samples: int,
+                          failed: Dict[str, str], stats_source=None) -> Dict[str, Dict[str, int]]:
+    """Measure the footprint of every registry op and return it per test.
+
+    Inputs are created before the probe runs so only the op's own
+    allocations are counted. Hand-written tests are skipped.
+    """
+    from eltwise_op_registry import get_op_spec
+    from test_eltwise_operations import create_op_spec_inputs, invoke_op_spec
+
+    stats_source = stats_source or TtnnAllocatorStats(ttnn_module, device)
+    probe = MemoryFootprintProbe(stats_source, lambda: ttnn_module.synchronize_device(device))
+    footprints = {}
+    for i, test_name in enumerate(test_names, 1):
+        try:
+            spec = get_op_spec(test_name)
+        except KeyError:
+            continue
+        if spec.custom:
+            continue
+        try:
+            _, ttnn_inputs = create_op_spec_inputs(spec, device)
+            footprints[test_name] = merge_footprints(
+                probe.measure(lambda: invoke_op_spec(spec, ttnn_inputs))
+                for _ in range(max(samples, 1))
+            )
+            print(f"💾 [{i}/{len(test_names)}] {test_name}: "
+                  f"L1 {footprints[test_name]['peak_l1_bytes']} B, "
+                  f"DRAM {footprints[test_name]['peak_dram_bytes']} B, "
+                  f"{footprints[test_name]['buffers_allocated']} buffers", flush=True)
+        except Exception as e:
+            failed[f"memory:{test_name}"] = str(e)[:200]
+            print(f"    ❌ {test_name} memory probe failed: {failed[f'memory:{test_name}']}", flush=True)
+    return footprints
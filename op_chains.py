@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+TTNN Op-Chain Benchmarks
+
+Models rarely run a single eltwise op on its own; they run short chains such
+as add -> gelu or mul -> add -> relu, plus the matching backward ops. This
+module describes those chains and measures them in the single-session runner.
+Each chain is measured as a whole, and then each step is run alone on the
+same intermediate tensors in the same session. The chain overhead ratio is
+
+    chain duration (kernels + op-to-op gaps) / sum of standalone step durations
+
+A ratio well above 1.0 means the ops pay for being separate launches; a
+composite op that fuses the chain should pull it below 1.0. Chains with a
+fused_op also record that op's duration on the same inputs.
+
+Usage:
+    python op_chains.py                 # list the registered chains
+    python single_session_perf.py --chains
+"""
+
+import statistics
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+CHAIN_PREFIX = "chain:"
+FUSED_SUFFIX = "fused"
+
+
+class ChainStep:
+    """One op in a chain.
+
+    Inputs name chain inputs ("x", "grad") or earlier step outputs ("@0").
+    Backward ops return a list of gradients; "@2.0" selects the first one.
+    """
+
+    def __init__(self, op: str, inputs: List[str], kwargs: Optional[Dict] = None):
+        self.op = op
+        self.inputs = list(inputs)
+        self.kwargs = dict(kwargs or {})
+
+    def __repr__(self):
+        return f"{self.op}({', '.join(self.inputs)})"
+
+
+class OpChain:
+    """A sequence of ttnn ops measured as one unit."""
+
+    def __init__(self, name: str, inputs: Dict[str, str], steps: List[ChainStep],
+                 fused_op: Optional[str] = None, description: str = ""):
+        self.name = name
+        self.inputs = dict(inputs)
+        self.steps = list(steps)
+        self.fused_op = fused_op
+        self.description = description
+
+    @property
+    def ops(self) -> List[str]:
+        return [step.op for step in self.steps]
+
+    @property
+    def marker_name(self) -> str:
+        return f"{CHAIN_PREFIX}{self.name}"
+
+    def step_marker_name(self, index: int) -> str:
+        return f"{self.marker_name}:{index}"
+
+    @property
+    def fused_marker_name(self) -> str:
+        return f"{self.marker_name}:{FUSED_SUFFIX}"
+
+
+def _step(op: str, *inputs: str, **kwargs) -> ChainStep:
+    return ChainStep(op, list(inputs), kwargs)
+
+
+OP_CHAINS: List[OpChain] = [
+    # Forward patterns
+    OpChain("add_gelu", {"x": "random", "y": "random"},
+            [_step("add", "x", "y"), _step("gelu", "@0")],
+            description="Residual add followed by GELU"),
+    OpChain("add_relu", {"x": "random", "y": "random"},
+            [_step("add", "x", "y"), _step("relu", "@0")],
+            description="Residual add followed by ReLU"),
+    OpChain("mul_add_relu", {"x": "random", "y": "random", "z": "random"},
+            [_step("mul", "x", "y"), _step("add", "@0", "z"), _step("relu", "@1")],
+            description="Scale, shift and activate"),
+    OpChain("x_mul_sigmoid", {"x": "random"},
+            [_step("sigmoid", "x"), _step("mul", "x", "@0")],
+            fused_op="silu", description="Swish written out as x * sigmoid(x)"),
+
+    # Forward/backward pairs
+    OpChain("gelu_fwd_bw", {"x": "random", "grad": "random"},
+            [_step("gelu", "x"), _step("gelu_bw", "grad", "x")],
+            description="GELU forward and its gradient"),
+    OpChain("relu_fwd_bw", {"x": "random", "grad": "random"},
+            [_step("relu", "x"), _step("relu_bw", "grad", "x")],
+            description="ReLU forward and its gradient"),
+    OpChain("sigmoid_fwd_bw", {"x": "random", "grad": "random"},
+            [_step("sigmoid", "x"), _step("sigmoid_bw", "grad", "x")],
+            description="Sigmoid forward and its gradient"),
+    OpChain("mul_fwd_bw", {"x": "random", "y": "random", "grad": "random"},
+            [_step("mul", "x", "y"), _step("mul_bw", "grad", "x", "y")],
+            description="Multiply forward and its gradients"),
+    OpChain("add_gelu_fwd_bw", {"x": "random", "y": "random", "grad": "random"},
+            [_step("add", "x", "y"), _step("gelu", "@0"),
+             _step("gelu_bw", "grad", "@0"), _step("add_bw", "@2.0", "x", "y")],
+            description="Residual add + GELU training step"),
+]
+
+OP_CHAINS_BY_NAME: Dict[str, OpChain] = {chain.name: chain for chain in OP_CHAINS}
+
+
+def get_chains(names: Optional[List[str]] = None) -> List[OpChain]:
+    """Return the named chains (all chains when names is empty)."""
+    if not names:
+        return list(OP_CHAINS)
+    unknown = [name for name in names if name not in OP_CHAINS_BY_NAME]
+    if unknown:
+        raise ValueError(f"Unknown op chain(s): {', '.join(unknown)}")
+    return [OP_CHAINS_BY_NAME[name] for name in names]
+
+
+def resolve_input(ref: str, tensors: Dict[str, object], outputs: List[object]):
+    """Resolve a step input reference to a tensor."""
+    if not ref.startswith("@"):
+        return tensors[ref]
+    step_ref, _, index = ref[1:].partition(".")
+    output = outputs[int(step_ref)]
+    return output[int(index)] if index else output
+
+
+def run_chain(ttnn, chain: OpChain, tensors: Dict[str, object]) -> List[object]:
+    """Run every step of a chain and return the per-step outputs."""
+    outputs = []
+    for step in chain.steps:
+        args = [resolve_input(ref, tensors, outputs) for ref in step.inputs]
+        outputs.append(getattr(ttnn, step.op)(*args, **step.kwargs))
+    return outputs
+
+
+def run_chain_benchmarks(device, chains: List[OpChain], samples: int, warmup: int,
+                         failed: Dict[str, str], shape=None, dtype=None):
+    """Measure chains, their standalone steps and fused ops inside the profiled worker."""
+    import ttnn
+    from tracy import signpost
+    from single_session_perf import make_marker, MARKER_START, MARKER_END
+    from test_eltwise_operations import create_test_tensor, DEFAULT_SHAPE, DEFAULT_DTYPE
+
+    shape = shape or DEFAULT_SHAPE
+    dtype = dtype or DEFAULT_DTYPE
+
+    def measure(marker_name, fn):
+        for _ in range(warmup):
+            fn()
+        for sample in range(samples):
+            signpost(header=make_marker(MARKER_START, marker_name, sample))
+            fn()
+            ttnn.synchronize_device(device)
+            signpost(header=make_marker(MARKER_END, marker_name, sample))
+
+    for i, chain in enumerate(chains, 1):
+        print(f"🔗 [{i}/{len(chains)}] {chain.name}: {' -> '.join(chain.ops)}", flush=True)
+        try:
+            tensors = {name: create_test_tensor(shape, dtype, device, values)[1]
+                       for name, values in chain.inputs.items()}
+            measure(chain.marker_name, lambda: run_chain(ttnn, chain, tensors))
+
+            # Standalone steps reuse the chain's intermediates so inputs are identical
+            outputs = run_chain(ttnn, chain, tensors)
+            for index, step in enumerate(chain.steps):
+                args = [resolve_input(ref, tensors, outputs) for ref in step.inputs]
+                op = getattr(ttnn, step.op)
+                measure(chain.step_marker_name(index), lambda: op(*args, **step.kwargs))
+
+            if chain.fused_op:
+                fused = getattr(ttnn, chain.fused_op)
+                x = tensors[next(iter(chain.inputs))]
+                measure(chain.fused_marker_name, lambda: fused(x))
+        except Exception as e:
+            failed[chain.marker_name] = str(e)[:200]
+            print(f"    ❌ {chain.name} failed: {failed[chain.marker_name]}", flush=True)
+        ttnn.ReadDeviceProfiler(device)
+
+
+def _mean_kernel(samples: List[List[Dict[str, float]]]) -> Optional[float]:
+    """Mean of the summed kernel durations over samples."""
+    totals = [sum(op['kernel_ns'] for op in ops) for ops in samples]
+    return statistics.mean(totals) if totals else None
+
+
+def build_chain_result(chain: OpChain, op_rows: Dict[str, List[List[Dict[str, float]]]]) -> Optional[Dict]:
+    """Build the stored result for one chain from parsed profiler rows.
+
+    Returns None when the chain or any of its standalone steps has no samples.
+    """
+    chain_samples = op_rows.get(chain.marker_name, [])
+    if not chain_samples:
+        return None
+
+    kernel_totals = [sum(op['kernel_ns'] for op in ops) for ops in chain_samples]
+    # The first op's gap is measured from whatever ran before the chain, not inside it
+    gap_totals = [sum(op['op_to_op_ns'] for op in ops[1:]) for ops in chain_samples]
+    runs = [kernel + gap for kernel, gap in zip(kernel_totals, gap_totals)]
+
+    component_durations = []
+    for index in range(len(chain.steps)):
+        mean = _mean_kernel(op_rows.get(chain.step_marker_name(index), []))
+        if mean is None:
+            return None
+        component_durations.append(mean)
+    component_sum = sum(component_durations)
+
+    average = statistics.mean(runs)
+    result = {
+        'chain_name': chain.name,
+        'ops': chain.ops,
+        'runs': runs,
+        'successful_runs': len(runs),
+        'average_duration_ns': average,
+        'std_deviation_ns': statistics.stdev(runs) if len(runs) > 1 else 0,
+        'min_duration_ns': min(runs),
+        'max_duration_ns': max(runs),
+        'kernel_duration_ns': statistics.mean(kernel_totals),
+        'op_to_op_ns': statistics.mean(gap_totals),
+        'component_durations_ns': component_durations,
+        'component_sum_ns': component_sum,
+        'chain_overhead_ratio': average / component_sum if component_sum > 0 else None,
+        'timestamp': datetime.now().isoformat()
+    }
+    if chain.fused_op:
+        fused_mean = _mean_kernel(op_rows.get(chain.fused_marker_name, []))
+        result['fused_op'] = chain.fused_op
+        result['fused_duration_ns'] = fused_mean
+        result['fused_speedup'] = average / fused_mean if fused_mean else None
+    return result
+
+
+def main():
+    """List the registered op chains."""
+    print(f"🔗 Registered op chains: {len(OP_CHAINS)}")
+    print("=" * 50)
+    for chain in OP_CHAINS:
+        fused = f" (fused: {chain.fused_op})" if chain.fused_op else ""
+        print(f"  {chain.name:<18} {' -> '.join(map(repr, chain.steps))}{fused}")
+        if chain.description:
+            print(f"  {'':<18} {chain.description}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Test Ordering Strategies
+
+Tests normally run in registry (declaration) order, which interleaves
+unrelated kernels. In single-session runs the program cache and the on-disk
+kernel binary cache are shared across tests, so running tests that share a
+compute kernel and program configuration back to back improves reuse.
+
+Strategies:
+    declaration  Registry order (default, matches historical runs)
+    grouped      Forward before backward; within that by category, dtype and
+                 shape; in-place variants next to their out-of-place op
+    random       Seeded shuffle, a baseline for the benchmark
+
+The benchmark runs the single-session worker once per strategy, each with a
+fresh kernel cache, and compares first-run (compile) time against steady-state
+time and total wall time:
+
+    python op_ordering.py --strategy grouped            # print the order
+    python op_ordering.py --benchmark [--strategies declaration grouped random]
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from eltwise_op_registry import CATEGORIES, OP_SPECS, OpSpec, get_registered_test_names
+
+ORDERING_STRATEGIES = ["declaration", "grouped", "random"]
+DEFAULT_ORDERING = "declaration"
+
+
+def kernel_group_key(spec: OpSpec) -> tuple:
+    """Sort key placing ops likely to share kernels and program configs together."""
+    return (
+        spec.backward,
+        CATEGORIES.index(spec.category),
+        spec.arity,
+        spec.dtype or "",
+        spec.shape or (),
+        spec.name.rstrip("_"),
+        spec.name.endswith("_"),
+    )
+
+
+def order_tests(test_names: List[str], strategy: str = DEFAULT_ORDERING, seed: int = 0) -> List[str]:
+    """Return test_names reordered by strategy.
+
+    Tests that are not in the registry keep their relative order and run last
+    under the grouped strategy.
+    """
+    if strategy not in ORDERING_STRATEGIES:
+        raise ValueError(f"Unknown ordering strategy '{strategy}' "
+                         f"(choose from {', '.join(ORDERING_STRATEGIES)})")
+
+    if strategy == "declaration":
+        return list(test_names)
+
+    if strategy == "random":
+        shuffled = list(test_names)
+        random.Random(seed).shuffle(shuffled)
+        return shuffled
+
+    known = [name for name in test_names if name[len("test_"):] in OP_SPECS]
+    unknown = [name for name in test_names if name[len("test_"):] not in OP_SPECS]
+    known.sort(key=lambda name: kernel_group_key(OP_SPECS[name[len("test_"):]]))
+    return known + unknown
+
+
+def count_group_switches(test_names: List[str]) -> int:
+    """Number of adjacent test pairs whose kernel group or program config differs."""
+    groups = [kernel_group_key(OP_SPECS[name[len("test_"):]])[:5]
+              for name in test_names if name[len("test_"):] in OP_SPECS]
+    return sum(1 for a, b in zip(groups, groups[1:]) if a != b)
+
+
+def summarize_timings(timings: Dict[str, Dict[str, float]], wall_time_s: float) -> Dict:
+    """Aggregate per-test worker timings into the benchmark summary."""
+    first = [t['first_call_s'] for t in timings.values()]
+    steady = [t['steady_call_s'] for t in timings.values() if t.get('steady_call_s') is not None]
+    compile_overhead = [t['first_call_s'] - t['steady_call_s']
+                        for t in timings.values() if t.get('steady_call_s') is not None]
+    return {
+        'tests': len(timings),
+        'wall_time_s': wall_time_s,
+        'first_run_total_s': sum(first),
+        'steady_run_total_s': sum(steady),
+        'compile_overhead_s': sum(compile_overhead),
+    }
+
+
+def run_ordering_benchmark(test_names: List[str], strategy: str, samples: int = 2,
+                           seed: int = 0, timeout: int = 3600) -> Optional[Dict]:
+    """Run the single-session worker once with a cold kernel cache and summarize it (None if it failed)."""
+    ordered = order_tests(test_names, strategy, seed)
+    with tempfile.TemporaryDirectory(prefix=f"ordering_{strategy}_") as work_dir:
+        tests_file = os.path.join(work_dir, 'tests.json')
+        status_file = os.path.join(work_dir, 'status.json')
+        with open(tests_file, 'w') as f:
+            json.dump(ordered, f)
+
+        env = dict(os.environ, TT_METAL_CACHE=os.path.join(work_dir, 'kernel_cache'))
+        cmd = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'single_session_perf.py'),
+               "--worker", "--tests-file", tests_file, "--status", status_file,
+               "--samples", str(samples)]
+
+        print(f"🚀 [{strategy}] {len(ordered)} tests, {count_group_switches(ordered)} group switches")
+        start = time.time()
+        try:
+            result = subprocess.run(cmd, env=env, timeout=timeout, capture_output=True, text=True)
+        except subprocess.TimeoutExpired:
+            print(f"⏰ [{strategy}] timed out")
+            return None
+        wall_time_s = time.time() - start
+        # The worker writes its status even when it crashes; those timings cover only part of the run
+        if result.returncode != 0:
+            detail = (result.stderr or '').strip().splitlines()[-1:] or ['no output']
+            print(f"❌ [{strategy}] worker exited with return code {result.returncode}: {detail[0]}")
+            return None
+
+        try:
+            with open(status_file, 'r') as f:
+                status = json.load(f)
+        except Exception as e:
+            print(f"❌ [{strategy}] could not read worker status: {e}")
+            return None
+
+    summary = summarize_timings(status.get('timings', {}), wall_time_s)
+    summary['strategy'] = strategy
+    summary['group_switches'] = count_group_switches(ordered)
+    summary['failed_tests'] = len(status.get('failed', {}))
+    return summary
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Select and benchmark test ordering strategies')
+    parser.add_argument('--strategy', choices=ORDERING_STRATEGIES, default="grouped",
+                        help='Strategy to print (default: grouped)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the random strategy')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Run the single-session worker once per strategy and compare timings')
+    parser.add_argument('--strategies', nargs='+', choices=ORDERING_STRATEGIES,
+                        default=ORDERING_STRATEGIES, help='Strategies to benchmark')
+    parser.add_argument('--samples', type=int, default=2,
+                        help='Calls per test in the benchmark (the first call includes compile)')
+    parser.add_argument('--output', help='Write benchmark summaries to this JSON file')
+    args = parser.parse_args()
+
+    test_names = get_registered_test_names(include_known_failing=False)
+
+    if not args.benchmark:
+        ordered = order_tests(test_names, args.strategy, args.seed)
+        print(f"📋 {args.strategy} order: {len(ordered)} tests, "
+              f"{count_group_switches(ordered)} group switches")
+        for name in ordered:
+            print(f"  {name}")
+        return 0
+
+    summaries = []
+    for strategy in args.strategies:
+        summary = run_ordering_benchmark(test_names, strategy, samples=max(args.samples, 2), seed=args.seed)
+        if summary:
+            summaries.append(summary)
+
+    print(f"\n📊 Ordering benchmark ({len(test_names)} tests, cold kernel cache per strategy)")
+    print("=" * 50)
+    print(f"{'strategy':<12} {'switches':>8} {'wall':>10} {'first-run':>10} {'steady':>10} {'compile':>10}")
+    for s in summaries:
+        print(f"{s['strategy']:<12} {s['group_switches']:>8} {s['wall_time_s']:>9.1f}s "
+              f"{s['first_run_total_s']:>9.1f}s {s['steady_run_total_s']:>9.1f}s {s['compile_overhead_s']:>9.1f}s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summaries, f, indent=2)
+        print(f"\n📄 Summaries written to {args.output}")
+    return 0 if len(summaries) == len(args.strategies) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
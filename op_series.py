@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Memory-Mapped Per-Op Time Series
+
+One binary file per op under data/history/series/, holding fixed-width
+little-endian records (48 bytes each), oldest first:
+
+    timestamp  f8   measurement time, seconds since the epoch
+    commit     u4   line number of the commit in commits.txt
+    n          u4   successful runs
+    mean, std, min, max  f8   durations in ns
+
+Readers map a file with np.memmap and slice it without parsing or copying;
+any op's full history is one open() and one mmap. The uploader appends one
+record per op per results file, and the first upload builds the series from
+the archive.
+
+    python op_series.py build [--data-dir data]
+    python op_series.py show erfinv [--last 10]
+    python op_series.py scan              # time a scan over every op
+"""
+
+import shutil
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from index_store import load_index
+from results_format import load_index_entry
+
+SERIES_DIR = Path("history") / "series"
+COMMITS_FILE = "commits.txt"
+SERIES_SUFFIX = ".bin"
+RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('commit', '<u4'),
+    ('n', '<u4'),
+    ('mean', '<f8'),
+    ('std', '<f8'),
+    ('min', '<f8'),
+    ('max', '<f8'),
+])
+_RESULT_FIELDS = {
+    'mean': 'average_duration_ns',
+    'std': 'std_deviation_ns',
+    'min': 'min_duration_ns',
+    'max': 'max_duration_ns',
+}
+
+
+def _timestamp(date_str: str) -> float:
+    try:
+        return datetime.fromisoformat(date_str).timestamp()
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+class OpSeriesStore:
+    """Directory of per-op fixed-width series files plus the commit table."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._commits: List[str] = None
+        self._commit_index: Dict[str, int] = None
+
+    @property
+    def commits(self) -> List[str]:
+        if self._commits is None:
+            commits_path = self.root / COMMITS_FILE
+            self._commits = commits_path.read_text().splitlines() if commits_path.exists() else []
+            self._commit_index = {commit: i for i, commit in enumerate(self._commits)}
+        return self._commits
+
+    def exists(self) -> bool:
+        return (self.root / COMMITS_FILE).exists()
+
+    def _series_path(self, op_name: str) -> Path:
+        return self.root / f"{op_name}{SERIES_SUFFIX}"
+
+    def ops(self) -> List[str]:
+        return sorted(path.name[:-len(SERIES_SUFFIX)] for path in self.root.glob(f"*{SERIES_SUFFIX}"))
+
+    def series(self, op_name: str) -> np.ndarray:
+        """Read-only memmap of an op's records (an empty array if the op is unknown)."""
+        path = self._series_path(op_name)
+        if not path.exists() or path.stat().st_size == 0:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        return np.memmap(path, dtype=RECORD_DTYPE, mode='r')
+
+    def scan(self) -> Dict[str, np.ndarray]:
+        """Memmaps of every op's series."""
+        return {op: self.series(op) for op in self.ops()}
+
+    def commit_index(self, commit_id: str) -> int:
+        """Index of commit_id in commits.txt, adding it if new."""
+        self.commits  # load
+        if commit_id not in self._commit_index:
+            self._commit_index[commit_id] = len(self._commits)
+            self._commits.append(commit_id)
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.root / COMMITS_FILE, 'a') as f:
+                f.write(commit_id + "\n")
+        return self._commit_index[commit_id]
+
+    @staticmethod
+    def record_tuples(results_data: Dict, commit: int) -> Dict[str, tuple]:
+        """One record tuple (in RECORD_DTYPE field order) per op in a results file."""
+        timestamp = _timestamp(results_data.get('metadata', {}).get('measurement_date', ''))
+        records = {}
+        for result in results_data.get('results', []):
+            op_name = result.get('operation_name')
+            if not op_name:
+                continue
+            values = [result.get(key) for key in _RESULT_FIELDS.values()]
+            records[op_name] = (timestamp, commit, result.get('successful_runs') or 0,
+                                *(np.nan if value is None else value for value in values))
+        return records
+
+    @classmethod
+    def make_records(cls, results_data: Dict, commit: int) -> Dict[str, np.ndarray]:
+        """One single-record array per op in a results file."""
+        return {op_name: np.array([record], dtype=RECORD_DTYPE)
+                for op_name, record in cls.record_tuples(results_data, commit).items()}
+
+    def append(self, results_data: Dict):
+        """Append one results file. Normally a pure append of one record per op;
+        a re-upload replaces the record with the same timestamp and an
+        out-of-order file is inserted in place."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        commit = self.commit_index(results_data.get('metadata', {}).get('git_commit_id', 'unknown'))
+        for op_name, record in self.make_records(results_data, commit).items():
+            path = self._series_path(op_name)
+            existing = self.series(op_name)
+            timestamp = record['timestamp'][0]
+            if len(existing) == 0 or timestamp > existing['timestamp'][-1]:
+                del existing
+                with open(path, 'ab') as f:
+                    f.write(record.tobytes())
+                continue
+
+            records = np.array(existing)
+            del existing
+            records = records[records['timestamp'] != timestamp]
+            position = int(np.searchsorted(records['timestamp'], timestamp))
+            records = np.insert(records, position, record)
+            tmp_path = path.with_suffix('.tmp')
+            records.tofile(tmp_path)
+            tmp_path.replace(path)
+
+    @classmethod
+    def build_from_archive(cls, data_dir, root=None) -> 'OpSeriesStore':
+        """Rewrite the series directory from every file listed in the measurement index."""
+        data_dir = Path(data_dir)
+        files = load_index(data_dir)['files']
+
+        def load_files():
+            for entry in sorted(files, key=lambda e: e.get('measurement_date', '')):
+                try:
+                    yield entry['filename'], load_index_entry(data_dir, entry)
+                except Exception as e:
+                    print(f"⚠️ Warning: Could not load {entry.get('filename')}: {e}")
+
+        return cls.build_from_files(Path(root) if root else data_dir / SERIES_DIR, load_files())
+
+    @classmethod
+    def build_from_files(cls, root, loaded: Iterable[Tuple[str, Dict]]) -> 'OpSeriesStore':
+        """Rewrite the series directory from (filename, results data) pairs in any order."""
+        root = Path(root)
+        if root.exists():
+            shutil.rmtree(root)
+        store = cls(root)
+        root.mkdir(parents=True)
+        (root / COMMITS_FILE).touch()
+
+        per_op: Dict[str, List[tuple]] = {}
+        for _, data in loaded:
+            commit = store.commit_index(data.get('metadata', {}).get('git_commit_id', 'unknown'))
+            for op_name, record in store.record_tuples(data, commit).items():
+                per_op.setdefault(op_name, []).append(record)
+
+        for op_name, records in per_op.items():
+            records = np.array(records, dtype=RECORD_DTYPE)
+            records = records[np.argsort(records['timestamp'], kind='stable')]
+            records.tofile(store._series_path(op_name))
+        return store
+
+
+def update_op_series(data_dir, results_data: Dict) -> Path:
+    """Append the uploaded results to data/history/series, or build the series if there are none yet."""
+    data_dir = Path(data_dir)
+    store = OpSeriesStore(data_dir / SERIES_DIR)
+    if store.exists():
+        store.append(results_data)
+    else:
+        # The archive already contains the new file, so the build includes it
+        OpSeriesStore.build_from_archive(data_dir)
+    return store.root
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Memory-mapped per-op time series')
+    parser.add_argument('command', choices=['build', 'show', 'scan'])
+    parser.add_argument('operation', nargs='?', help='Operation name for show')
+    parser.add_argument('--last', type=int, default=10, help='Records to show (default: 10)')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    root = Path(args.data_dir) / SERIES_DIR
+
+    if args.command == 'build':
+        start = time.time()
+        store = OpSeriesStore.build_from_archive(args.data_dir)
+        size = sum(path.stat().st_size for path in root.iterdir())
+        print(f"✅ Built {len(store.ops())} op series in {root} in {time.time() - start:.2f}s "
+              f"({size / 1024 / 1024:.1f} MB, {len(store.commits)} commits)")
+        return 0
+
+    store = OpSeriesStore(root)
+    if not store.exists():
+        print(f"❌ {root} not found; run 'python op_series.py build' first")
+        return 1
+
+    if args.command == 'show':
+        if not args.operation:
+            print("❌ show needs an operation name")
+            return 1
+        records = store.series(args.operation)
+        if len(records) == 0:
+            print(f"❌ No series for '{args.operation}'")
+            return 1
+        print(f"📈 {args.operation}: {len(records)} measurements")
+        for record in records[-args.last:]:
+            date = datetime.fromtimestamp(record['timestamp']).isoformat(timespec='seconds')
+            print(f"  {date}  {store.commits[record['commit']][:10]}  "
+                  f"mean {record['mean']:>10.1f}  std {record['std']:>8.1f}  n={record['n']}")
+        return 0
+
+    start = time.time()
+    total_bytes = 0
+    checksum = 0.0
+    for op_name, records in store.scan().items():
+        total_bytes += records.nbytes
+        checksum += float(np.nansum(records['mean']))
+    elapsed = time.time() - start
+    print(f"⏱️ Scanned {len(store.ops())} ops ({total_bytes / 1024 / 1024:.2f} MB) in {elapsed * 1000:.1f} ms "
+          f"({total_bytes / 1024 / 1024 / max(elapsed, 1e-9):.0f} MB/s, checksum {checksum:.0f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,6 @@
 
 import subprocess
 import re
-import json
 import csv
 import time
 import statistics
@@ -11,6 +10,11 @@ from typing import List, Dict, Optional
 import os
 import glob
 
+from eltwise_op_registry import OP_REGISTRY, get_registered_test_names
+from op_ordering import ORDERING_STRATEGIES, DEFAULT_ORDERING, order_tests
+from profiler_breakdown import breakdown_from_reports, DEVICE_LOG_NAME
+from results_format import RESULT_FORMATS, DEFAULT_FORMAT, dump_results, load_results
+
 # Import GitHubPerformanceUploader if available
 try:
     from push_to_github import GitHubPerformanceUploader
@@ -20,12 +24,17 @@ except ImportError as e:
     GITHUB_IMPORT_ERROR = str(e)
 
 class PerfMeasurement:
-    def __init__(self, rerun_mode=False, auto_upload=False):
+    def __init__(self, rerun_mode=False, auto_upload=False, ordering=DEFAULT_ORDERING,
+                 result_format=DEFAULT_FORMAT):
         self.results = []
         self.failed_tests = []
+        self.chain_results = []
         self.start_time = datetime.now()
         self.rerun_mode = rerun_mode
         self.auto_upload = auto_upload
+        self.ordering = ordering
+        self.result_format = result_format
+        self.last_run_breakdown = None
         self.today_date = self.start_time.strftime("%Y%m%d")
         
         # For dynamic ETA calculation
@@ -65,9 +74,8 @@ class PerfMeasurement:
         latest_file = max(existing_files, key=os.path.getctime)
         
         try:
-            with open(latest_file, 'r') as f:
-                data = json.load(f)
-                
+            data = load_results(latest_file)
+
             self.results = data.get('results', [])
             self.failed_tests = data.get('metadata', {}).get('failed_test_names', [])
             
@@ -93,6 +101,10 @@ class PerfMeasurement:
         if not all_tests:
             return []
         
+        if self.ordering != DEFAULT_ORDERING:
+            all_tests = order_tests(all_tests, self.ordering)
+            print(f"🔀 Test order: {self.ordering}")
+
         # If not in rerun mode, run all tests (original behavior)
         if not self.rerun_mode:
             print(f"🚀 Standard mode: Running all {len(all_tests)} tests")
@@ -147,34 +159,18 @@ class PerfMeasurement:
             return f"{hours:.0f}h {minutes:.0f}m"
 
     def get_all_test_names(self) -> List[str]:
-        """Extract all test function names from the test file."""
+        """Get all test names from the eltwise op registry."""
         try:
-            cmd = ["python", "-m", "pytest", "test_eltwise_operations.py", "--collect-only", "-q"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
+            test_names = get_registered_test_names(include_known_failing=False)
+
             # Tests to exclude (known failing tests)
-            excluded_tests = {
-                'test_complex_tensor',
-                'test_real', 
-                'test_imag',
-                'test_frac_bw'
-            }
-            
-            test_names = []
-            for line in result.stdout.split('\n'):
-                if '<Function test_' in line:
-                    # Extract test name from '<Function test_abs>'
-                    match = re.search(r'<Function (test_\w+)>', line)
-                    if match:
-                        test_name = match.group(1)
-                        if test_name not in excluded_tests:
-                            test_names.append(test_name)
-                        else:
-                            print(f"⚠️ Excluding known failing test: {test_name}")
-            
+            excluded_tests = [spec.test_name for spec in OP_REGISTRY if spec.known_failing]
+            for test_name in excluded_tests:
+                print(f"⚠️ Excluding known failing test: {test_name}")
+
             print(f"Found {len(test_names)} total tests available (excluded {len(excluded_tests)} known failing tests)")
             return test_names
-            
+
         except Exception as e:
             print(f"Error getting test names: {e}")
             return []
@@ -195,18 +191,51 @@ class PerfMeasurement:
             print(f"Error extracting kernel duration: {e}")
             return None
     
+    def find_profiler_reports(self, output: str, since: float):
+        """Locate the ops perf CSV and device log written by the last ttperf run."""
+        match = re.search(r'(\S*ops_perf_results_\S*\.csv)', output)
+        if match and os.path.exists(match.group(1)):
+            ops_csv = match.group(1)
+        else:
+            profiler_dir = os.path.join(os.environ.get('TT_METAL_HOME', '.'), 'generated', 'profiler')
+            candidates = [path for path in glob.glob(os.path.join(profiler_dir, 'reports', '**',
+                                                                  'ops_perf_results_*.csv'), recursive=True)
+                          if os.path.getmtime(path) >= since]
+            ops_csv = max(candidates, key=os.path.getmtime) if candidates else None
+
+        device_log = os.path.join(os.environ.get('TT_METAL_HOME', '.'), 'generated', 'profiler',
+                                  '.logs', DEVICE_LOG_NAME)
+        if not os.path.exists(device_log) or os.path.getmtime(device_log) < since:
+            device_log = None
+        return ops_csv, device_log
+
+    def extract_breakdown(self, output: str, since: float) -> Optional[Dict]:
+        """Per-RISC/per-core breakdown of the last ttperf run, or None if unavailable."""
+        try:
+            ops_csv, device_log = self.find_profiler_reports(output, since)
+            if ops_csv is None:
+                return None
+            return breakdown_from_reports(ops_csv, device_log)
+        except Exception as e:
+            print(f"    ⚠️ Could not build kernel breakdown: {e}")
+            return None
+
     def run_single_perf_test(self, test_name: str, run_number: int) -> Optional[float]:
         """Run a single performance test and extract kernel duration."""
         try:
             cmd = ["ttperf", f"test_eltwise_operations.py::TestEltwiseOperations::{test_name}"]
             print(f"  Run {run_number}: {' '.join(cmd)}")
             
+            run_start = time.time()
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
             
             if result.returncode == 0:
                 duration = self.extract_kernel_duration(result.stdout)
                 if duration is not None:
                     print(f"    ✅ Duration: {duration} ns")
+                    breakdown = self.extract_breakdown(result.stdout, run_start)
+                    if breakdown:
+                        self.last_run_breakdown = breakdown
                     return duration
                 else:
                     print(f"    ❌ Could not extract duration from output")
@@ -221,11 +250,37 @@ class PerfMeasurement:
         
         return None
     
+    def build_result(self, test_name: str, durations: List[float]) -> Dict:
+        """Build a result entry from the kernel durations of one test."""
+        return {
+            'test_name': test_name,
+            'operation_name': test_name.replace('test_', ''),
+            'runs': durations,
+            'successful_runs': len(durations),
+            'average_duration_ns': statistics.mean(durations),
+            'std_deviation_ns': statistics.stdev(durations) if len(durations) > 1 else 0,
+            'min_duration_ns': min(durations),
+            'max_duration_ns': max(durations),
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def record_result(self, result: Dict):
+        """Store a result, replacing any earlier result for the same test (in case of rerun)."""
+        test_name = result['test_name']
+        existing_idx = next((idx for idx, r in enumerate(self.results) 
+                           if r['test_name'] == test_name), None)
+        if existing_idx is not None:
+            self.results[existing_idx] = result
+            print(f"  🔄 Updated existing result for {test_name}")
+        else:
+            self.results.append(result)
+
     def run_perf_measurement_for_test(self, test_name: str) -> Optional[Dict]:
         """Run performance measurement 3 times for a single test and calculate average."""
         print(f"\n📊 Measuring {test_name}...")
         
         self.start_test_timing()
+        self.last_run_breakdown = None
         
         durations = []
         for run_num in range(1, 4):  # 3 runs
@@ -237,20 +292,11 @@ class PerfMeasurement:
         test_completion_time = self.end_test_timing()
         
         if durations:
-            avg_duration = statistics.mean(durations)
-            std_deviation = statistics.stdev(durations) if len(durations) > 1 else 0
-            
-            result = {
-                'test_name': test_name,
-                'operation_name': test_name.replace('test_', ''),
-                'runs': durations,
-                'successful_runs': len(durations),
-                'average_duration_ns': avg_duration,
-                'std_deviation_ns': std_deviation,
-                'min_duration_ns': min(durations),
-                'max_duration_ns': max(durations),
-                'timestamp': datetime.now().isoformat()
-            }
+            result = self.build_result(test_name, durations)
+            if self.last_run_breakdown:
+                result['breakdown'] = self.last_run_breakdown
+            avg_duration = result['average_duration_ns']
+            std_deviation = result['std_deviation_ns']
             
             completion_msg = f"  ✅ Average: {avg_duration:.2f} ns (±{std_deviation:.2f}) from {len(durations)} runs"
             if test_completion_time:
@@ -270,51 +316,58 @@ class PerfMeasurement:
             return None
     
     def save_results(self, final=False):
-        """Save results to JSON and CSV files."""
+        """Save results to JSON (and, for the legacy format, CSV) files."""
         suffix = "final" if final else f"partial_{len(self.results)}"
         timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
 
         json_filename = f"eltwise_perf_results_{timestamp}_{suffix}.json"
-        
-        with open(json_filename, 'w') as f:
-            json.dump({
-                'metadata': {
-                    'measurement_date': self.start_time.isoformat(),
-                    'total_tests': len(self.results) + len(self.failed_tests),
-                    'successful_tests': len(self.results),
-                    'failed_tests': len(self.failed_tests),
-                    'failed_test_names': self.failed_tests,
-                    'rerun_mode': self.rerun_mode,
-                    'git_commit_id': self.get_git_commit_id()
-                },
-                'results': self.results
-            }, f, indent=2)
-        
-        # Save CSV for database upload
-        csv_filename = f"eltwise_perf_results_{timestamp}_{suffix}.csv"
-        with open(csv_filename, 'w', newline='') as f:
-            if self.results:
-                fieldnames = [
-                    'test_name', 'operation_name', 'average_duration_ns', 
-                    'std_deviation_ns', 'min_duration_ns', 'max_duration_ns',
-                    'successful_runs', 'timestamp'
-                ]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for result in self.results:
-                    # Exclude 'runs' field for CSV as it's an array
-                    csv_row = {k: v for k, v in result.items() if k != 'runs'}
-                    writer.writerow(csv_row)
-        
+
+        data = {
+            'metadata': {
+                'measurement_date': self.start_time.isoformat(),
+                'total_tests': len(self.results) + len(self.failed_tests),
+                'successful_tests': len(self.results),
+                'failed_tests': len(self.failed_tests),
+                'failed_test_names': self.failed_tests,
+                'rerun_mode': self.rerun_mode,
+                'git_commit_id': self.get_git_commit_id()
+            },
+            'results': self.results
+        }
+        if self.ordering != DEFAULT_ORDERING:
+            data['metadata']['test_ordering'] = self.ordering
+        if self.chain_results:
+            data['chains'] = self.chain_results
+        dump_results(data, json_filename, self.result_format)
+
+        # Save CSV for database upload (the compact format replaces it)
+        csv_filename = None
+        if self.result_format == "legacy":
+            csv_filename = f"eltwise_perf_results_{timestamp}_{suffix}.csv"
+            with open(csv_filename, 'w', newline='') as f:
+                if self.results:
+                    fieldnames = [
+                        'test_name', 'operation_name', 'average_duration_ns',
+                        'std_deviation_ns', 'min_duration_ns', 'max_duration_ns',
+                        'successful_runs', 'timestamp'
+                    ]
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                    writer.writeheader()
+
+                    for result in self.results:
+                        # Exclude 'runs' field for CSV as it's an array
+                        csv_row = {k: v for k, v in result.items() if k != 'runs'}
+                        writer.writerow(csv_row)
+
         # Track partial files for cleanup
         if not final:
-            self.partial_files.extend([json_filename, csv_filename])
-        
+            self.partial_files.extend(f for f in (json_filename, csv_filename) if f)
+
         print(f"\n📂 Results saved to:")
-        print(f"  📄 JSON: {json_filename}")
-        print(f"  📊 CSV: {csv_filename}")
-        
+        print(f"  📄 JSON ({self.result_format}): {json_filename}")
+        if csv_filename:
+            print(f"  📊 CSV: {csv_filename}")
+
         # Clean up partial files if this is the final save
         if final and self.partial_files:
             self.cleanup_partial_files()
@@ -337,6 +390,30 @@ class PerfMeasurement:
         
         self.partial_files = []
 
+    def measure_tests(self, tests_to_run: List[str]):
+        """Measure each test in its own ttperf process, saving every 10 tests."""
+        print(f"⏱️ Estimated time: ~{len(tests_to_run) * 2} minutes (initial estimate)")
+        
+        for i, test_name in enumerate(tests_to_run, 1):
+            # Calculate dynamic ETA
+            eta = self.calculate_dynamic_eta(i - 1, len(tests_to_run))
+            progress_pct = i / len(tests_to_run) * 100
+            
+            if i == 1:
+                print(f"\n🔄 Progress: {i}/{len(tests_to_run)} ({progress_pct:.1f}%) | ETA: {eta}")
+            else:
+                avg_time = statistics.mean(self.test_completion_times) if self.test_completion_times else 0
+                print(f"\n🔄 Progress: {i}/{len(tests_to_run)} ({progress_pct:.1f}%) | ETA: {eta} | Avg: {self.format_duration(avg_time)}/test")
+            
+            result = self.run_perf_measurement_for_test(test_name)
+            if result:
+                self.record_result(result)
+            
+            # Save intermediate results every 10 tests
+            if i % 10 == 0:
+                self.save_results()
+                print(f"💾 Intermediate save completed at test {i}")
+
     def run_all_measurements(self):
         """Run performance measurements for tests based on selected mode."""
         tests_to_run = self.get_tests_to_run()
@@ -361,34 +438,7 @@ class PerfMeasurement:
         print(f"🚀 Starting performance measurement for {len(tests_to_run)} tests")
         print(f"📅 Start time: {self.start_time}")
         print(f"🔧 Git commit: {self.get_git_commit_id()}")
-        print(f"⏱️ Estimated time: ~{len(tests_to_run) * 2} minutes (initial estimate)")
-        
-        for i, test_name in enumerate(tests_to_run, 1):
-            # Calculate dynamic ETA
-            eta = self.calculate_dynamic_eta(i - 1, len(tests_to_run))
-            progress_pct = i / len(tests_to_run) * 100
-            
-            if i == 1:
-                print(f"\n🔄 Progress: {i}/{len(tests_to_run)} ({progress_pct:.1f}%) | ETA: {eta}")
-            else:
-                avg_time = statistics.mean(self.test_completion_times) if self.test_completion_times else 0
-                print(f"\n🔄 Progress: {i}/{len(tests_to_run)} ({progress_pct:.1f}%) | ETA: {eta} | Avg: {self.format_duration(avg_time)}/test")
-            
-            result = self.run_perf_measurement_for_test(test_name)
-            if result:
-                # Check if this test already exists in results (in case of rerun)
-                existing_idx = next((idx for idx, r in enumerate(self.results) 
-                                   if r['test_name'] == test_name), None)
-                if existing_idx is not None:
-                    self.results[existing_idx] = result
-                    print(f"  🔄 Updated existing result for {test_name}")
-                else:
-                    self.results.append(result)
-            
-            # Save intermediate results every 10 tests
-            if i % 10 == 0:
-                self.save_results()
-                print(f"💾 Intermediate save completed at test {i}")
+        self.measure_tests(tests_to_run)
         
         # Final save
         json_file, csv_file = self.save_results(final=True)
@@ -439,7 +489,7 @@ class PerfMeasurement:
         print(f"📄 File: {json_file_path}")
         
         try:
-            uploader = GitHubPerformanceUploader(repo_url)
+            uploader = GitHubPerformanceUploader(repo_url, result_format=self.result_format)
             success = uploader.upload_results(json_file_path)
             
             if success:
@@ -489,6 +539,20 @@ def main():
                        help='Skip tests that already passed today and run only missing/failed tests')
     parser.add_argument('--upload', action='store_true', 
                        help='Automatically upload results to the database after completion')
+    parser.add_argument('--single-session', action='store_true',
+                       help='Measure all tests in one profiled Python session instead of one ttperf process per run')
+    parser.add_argument('--samples', type=int, default=3,
+                       help='Samples per test in single-session mode (default: 3)')
+    parser.add_argument('--chains', nargs='*', metavar='CHAIN',
+                       help='Also benchmark op chains in single-session mode (all if none are named)')
+    parser.add_argument('--trace-replays', type=int, default=0, metavar='N',
+                       help='Also measure ops under trace capture/replay in single-session mode')
+    parser.add_argument('--memory', action='store_true',
+                       help='Also record per-op peak L1/DRAM allocation in single-session mode')
+    parser.add_argument('--order', choices=ORDERING_STRATEGIES, default=DEFAULT_ORDERING,
+                       help='Test ordering strategy (default: declaration)')
+    parser.add_argument('--format', choices=RESULT_FORMATS, default=DEFAULT_FORMAT,
+                       help='Results file format (default: legacy)')
     
     args = parser.parse_args()
     
@@ -506,7 +570,18 @@ def main():
         else:
             print("⚠️ Auto-upload: Disabled (push_to_github.py not found)")
     
-    perf = PerfMeasurement(rerun_mode=args.rerun, auto_upload=args.upload)
+    if args.single_session:
+        from single_session_perf import SingleSessionPerfMeasurement
+        print(f"🧪 Execution: Single session ({args.samples} samples per test)")
+        perf = SingleSessionPerfMeasurement(rerun_mode=args.rerun, auto_upload=args.upload,
+                                            samples=args.samples, chains=args.chains,
+                                            trace_replays=args.trace_replays, memory=args.memory,
+                                            ordering=args.order, result_format=args.format)
+    else:
+        if args.chains is not None or args.trace_replays or args.memory:
+            print("⚠️ Op chains/trace replay/memory: Ignored (requires --single-session)")
+        perf = PerfMeasurement(rerun_mode=args.rerun, auto_upload=args.upload, ordering=args.order,
+                               result_format=args.format)
     perf.run_all_measurements()
 
 if __name__ == "__main__":
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Regression Timeline over the Whole Archive
+
+Replays change detection over every measurement in the history store at once
+and lists every regression and improvement event with its commit and size:
+
+    unit 'commit'   consecutive measurements of a commit pooled into one
+                    point (run-weighted mean); unit 'file' uses each file
+    mode 'pairwise' each point against the op's previous point
+    mode 'baseline' each point against the median of the op's previous
+                    WINDOW points (at least MIN_BASELINE_POINTS of them)
+    mode 'significance'
+                    each point Welch-tested against the op's previous WINDOW
+                    points from the store's run count, mean and standard
+                    deviation matrices, as significance.py does for the
+                    latest upload (q-values across the ops of each point)
+
+Like the alerts, the window modes only report first crossings: a point whose
+op was already flagged in the same direction at its previous point, and that
+stayed at that point's level, is a repeat of that step, not a new event.
+
+The (ops x points) matrices are loaded once; pooling, per-op compaction of
+measured points, the sliding windows and the tests are numpy operations over
+all ops and points together.
+
+Events go to data/timeline/events.json (with the settings used) and
+data/timeline/events.csv, newest first; the files are only rewritten when the
+events change. The uploader and check_perf_changes.py --timeline both rebuild
+them with the alert detector's settings (PERF_COMPARE_BY and friends, see
+check_perf_changes.timeline_settings).
+
+    python perf_timeline.py [--mode baseline] [--unit commit] [--window 10] [--threshold 20]
+                            [--since 2025-07-01 --until 2025-10-01]
+"""
+
+import csv
+import json
+import sys
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from baseline_detector import BASELINE_UNITS, DEFAULT_WINDOW, MIN_BASELINE_POINTS
+from history_store import HistoryStore, load_store
+from significance import NOISE_MULTIPLIER, benjamini_hochberg, flag_significant, moved_from, welch_against_window
+
+TIMELINE_DIR = Path("timeline")
+TIMELINE_MODES = ['pairwise', 'baseline', 'significance']
+DEFAULT_SETTINGS = {'mode': 'baseline', 'unit': 'commit', 'window': DEFAULT_WINDOW, 'threshold_percent': 20.0}
+CSV_FIELDS = ['date', 'commit', 'previous_commit', 'operation_name', 'change_type', 'change_percent',
+              'value_ns', 'reference_ns', 'reference_points']
+
+
+def commit_points(store: HistoryStore) -> Tuple[np.ndarray, List[str], List[str]]:
+    """Pool consecutive same-commit columns: (ops x commits matrix, dates, commits).
+
+    Each point is the run-weighted mean of its columns and is dated by the newest one.
+    """
+    values = store.metrics['average_duration_ns']
+    if values.shape[1] == 0:
+        return values, [], []
+    weights = np.where(np.isnan(values), 0.0, np.nan_to_num(store.metrics['successful_runs'], nan=1.0).clip(min=1))
+    starts = [0] + [i for i in range(1, len(store.commits)) if store.commits[i] != store.commits[i - 1]]
+    totals = np.add.reduceat(weights * np.nan_to_num(values), starts, axis=1)
+    counts = np.add.reduceat(weights, starts, axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pooled = np.where(counts > 0, totals / counts, np.nan)
+    ends = starts[1:] + [len(store.commits)]
+    return pooled, [store.dates[end - 1] for end in ends], [store.commits[start] for start in starts]
+
+
+def file_stats(store: HistoryStore) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(runs, mean, std) matrices of the store; runs is 0 where an op was not measured."""
+    mean = store.metrics['average_duration_ns']
+    n = np.where(np.isnan(mean), 0.0, np.nan_to_num(store.metrics['successful_runs']))
+    return n, np.where(n > 0, mean, np.nan), np.where(n > 0, np.nan_to_num(store.metrics['std_deviation_ns']), 0.0)
+
+
+def commit_stats(store: HistoryStore) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str], List[str]]:
+    """Pool consecutive same-commit columns: (runs, mean, std matrices, dates, commits).
+
+    The pooled mean and standard deviation are exact over all runs of the
+    commit's columns, as for a commit's pooled view.
+    """
+    n, mean, std = file_stats(store)
+    if n.shape[1] == 0:
+        return n, mean, std, [], []
+    starts = [0] + [i for i in range(1, len(store.commits)) if store.commits[i] != store.commits[i - 1]]
+    runs = np.add.reduceat(n, starts, axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pooled_mean = np.add.reduceat(n * np.nan_to_num(mean), starts, axis=1) / runs
+        column_means = np.repeat(pooled_mean, np.diff(starts + [n.shape[1]]), axis=1)
+        squares = np.add.reduceat((n - 1).clip(min=0) * std ** 2 + n * (np.nan_to_num(mean) - column_means) ** 2,
+                                  starts, axis=1)
+        pooled_std = np.where(runs > 1, np.sqrt(squares / (runs - 1)), 0.0)
+    pooled_mean = np.where(runs > 0, pooled_mean, np.nan)
+    ends = starts[1:] + [len(store.commits)]
+    dates, commits = [store.dates[end - 1] for end in ends], [store.commits[start] for start in starts]
+    return runs, pooled_mean, pooled_std, dates, commits
+
+
+def compact(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Left-align each row's measured values: (compacted values, original column of each)."""
+    order = np.argsort(np.isnan(matrix), axis=1, kind='stable')
+    return np.take_along_axis(matrix, order, axis=1), order
+
+
+def reference_levels(values: np.ndarray, mode: str, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reference level for every compacted point and how many earlier points it uses."""
+    if mode == 'pairwise':
+        window = 1
+    # Window j covers the compacted points j - window .. j - 1; the padding makes early windows partial
+    padded = np.concatenate([np.full((values.shape[0], window), np.nan), values[:, :-1]], axis=1)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window, axis=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanmedian(windows, axis=2), np.count_nonzero(~np.isnan(windows), axis=2)
+
+
+def level_moves(values: np.ndarray, threshold_percent: float) -> np.ndarray:
+    """Whether each compacted point is threshold_percent or more away from the point before it."""
+    moved = np.ones(values.shape, dtype=bool)
+    with np.errstate(invalid='ignore'):
+        moved[:, 1:] = np.abs(values[:, 1:] - values[:, :-1]) >= threshold_percent / 100 * values[:, :-1]
+    return moved
+
+
+def first_crossings(flagged: np.ndarray, change: np.ndarray, moved: np.ndarray) -> np.ndarray:
+    """flagged without repeats: points flagged in the same direction as the previous compacted point
+    that did not move away from its level (moved, as from level_moves)."""
+    repeat = np.zeros_like(flagged)
+    repeat[:, 1:] = (flagged[:, :-1] & flagged[:, 1:] & (np.sign(change[:, :-1]) == np.sign(change[:, 1:])) &
+                     ~moved[:, 1:])
+    return flagged & ~repeat
+
+
+def significance_levels(store: HistoryStore, unit: str, window: int, min_effect_percent: float,
+                        min_points: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray,
+                                                  np.ndarray, np.ndarray, np.ndarray, List[str], List[str]]:
+    """Welch-test every compacted point against its window.
+
+    Returns (values, columns, pooled window means, window points, change
+    percent, significant, moved, dates, commits); moved is whether a point
+    moved away from the point before it, as significance.moved_from tests.
+    """
+    if unit == 'commit':
+        n, mean, std, dates, commits = commit_stats(store)
+    else:
+        (n, mean, std), dates, commits = file_stats(store), store.dates, store.commits
+    values, columns = compact(mean)
+    n, std = np.take_along_axis(n, columns, axis=1), np.take_along_axis(std, columns, axis=1)
+    rows, width = values.shape
+
+    def windows(matrix, fill):
+        padded = np.concatenate([np.full((rows, window), fill), matrix[:, :-1]], axis=1)
+        return np.lib.stride_tricks.sliding_window_view(padded, window, axis=1).reshape(-1, window)
+
+    stats = welch_against_window(n.ravel(), values.ravel(), std.ravel(), windows(n, 0.0),
+                                 windows(values, np.nan), windows(std, 0.0), min_points)
+    # One family of tests per evaluated point, as in one upload's alert check
+    p, q = stats['p'].reshape(rows, width), np.full((rows, width), np.nan)
+    for column in range(len(dates)):
+        tested = (columns == column) & ~np.isnan(p)
+        q[tested] = benjamini_hochberg(p[tested])
+    significant = flag_significant(stats, q.ravel(), min_effect_percent).reshape(rows, width)
+
+    practical = np.maximum(min_effect_percent, NOISE_MULTIPLIER * np.nan_to_num(stats['noise_percent']))
+    moved = np.ones((rows, width), dtype=bool)
+    moved[:, 1:] = moved_from(n[:, 1:].ravel(), values[:, 1:].ravel(), std[:, 1:].ravel(), n[:, :-1].ravel(),
+                              values[:, :-1].ravel(), std[:, :-1].ravel(),
+                              practical.reshape(rows, width)[:, 1:].ravel()).reshape(rows, width - 1)
+    return (values, columns, stats['m2'].reshape(rows, width), stats['points'].reshape(rows, width),
+            stats['change_percent'].reshape(rows, width), significant, moved, dates, commits)
+
+
+def build_timeline(store: HistoryStore, mode: str = 'baseline', unit: str = 'commit',
+                   window: int = DEFAULT_WINDOW, threshold_percent: float = 20.0,
+                   min_points: int = MIN_BASELINE_POINTS) -> List[Dict]:
+    """Every event in the store, newest first.
+
+    In 'significance' mode threshold_percent is the smallest change worth
+    reporting, as for the alerts.
+    """
+    if store.metrics['average_duration_ns'].size == 0:
+        return []
+    if mode == 'significance':
+        values, columns, reference, points, change, flagged, moved, dates, commits = significance_levels(
+            store, unit, window, threshold_percent, min_points)
+    else:
+        if unit == 'commit':
+            matrix, dates, commits = commit_points(store)
+        else:
+            matrix, dates, commits = store.metrics['average_duration_ns'], store.dates, store.commits
+        values, columns = compact(matrix)
+        reference, points = reference_levels(values, mode, window)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            change = (values - reference) / reference * 100
+        needed = 1 if mode == 'pairwise' else min_points
+        flagged = ~np.isnan(values) & (points >= needed) & (reference > 0) & (np.abs(change) >= threshold_percent)
+        moved = level_moves(values, threshold_percent)
+    if mode != 'pairwise':
+        flagged = first_crossings(flagged, change, moved)
+
+    events = []
+    for row, position in zip(*np.nonzero(flagged)):
+        column = columns[row, position]
+        events.append({
+            'date': dates[column],
+            'commit': commits[column],
+            'previous_commit': commits[columns[row, position - 1]],
+            'operation_name': store.ops[row],
+            'change_type': 'regression' if change[row, position] > 0 else 'improvement',
+            'change_percent': round(float(change[row, position]), 3),
+            'value_ns': float(values[row, position]),
+            'reference_ns': float(reference[row, position]),
+            'reference_points': int(points[row, position]),
+        })
+    events.sort(key=lambda e: (e['date'], e['operation_name']), reverse=True)
+    return events
+
+
+def filter_events(events: List[Dict], since: Optional[str] = None, until: Optional[str] = None) -> List[Dict]:
+    """Events dated on or after since and before until (ISO date prefixes)."""
+    return [e for e in events if (not since or e['date'] >= since) and (not until or e['date'] < until)]
+
+
+def write_timeline(data_dir, events: List[Dict], settings: Dict) -> Optional[Tuple[Path, Path]]:
+    """Write data/timeline/events.json and events.csv; None if they already hold these events.
+
+    Files that would only get a new 'generated' time are left alone, so an
+    upload without new events does not rewrite (and recommit) them.
+    """
+    out_dir = Path(data_dir) / TIMELINE_DIR
+    json_path, csv_path = out_dir / "events.json", out_dir / "events.csv"
+    metadata = dict(settings, events=len(events),
+                    regressions=sum(e['change_type'] == 'regression' for e in events),
+                    improvements=sum(e['change_type'] == 'improvement' for e in events))
+    if json_path.exists() and csv_path.exists():
+        try:
+            with open(json_path) as f:
+                current = json.load(f)
+            current['metadata'].pop('generated', None)
+            if current == {'metadata': metadata, 'events': events}:
+                return None
+        except Exception as e:
+            print(f"⚠️ Warning: Could not read {json_path}: {e}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    document = {'metadata': dict(metadata, generated=datetime.now().isoformat()), 'events': events}
+    with open(json_path, 'w') as f:
+        json.dump(document, f, separators=(',', ':'))
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(events)
+    return json_path, csv_path
+
+
+def update_timeline(data_dir, store: Optional[HistoryStore] = None,
+                    settings: Optional[Dict] = None) -> Optional[Path]:
+    """Rebuild data/timeline/ with settings (mode, unit, window, threshold_percent); None if unchanged.
+
+    The uploader passes check_perf_changes.timeline_settings(), so the
+    dashboard lists the events the alerts report; DEFAULT_SETTINGS otherwise.
+    """
+    store = store or load_store(data_dir)
+    settings = settings or DEFAULT_SETTINGS
+    events = build_timeline(store, settings['mode'], settings['unit'], settings['window'],
+                            settings['threshold_percent'])
+    paths = write_timeline(data_dir, events, settings)
+    return paths[0] if paths else None
+
+
+def run_timeline(data_dir, mode: str, unit: str, window: int, threshold_percent: float,
+                 since: Optional[str] = None, until: Optional[str] = None, limit: int = 20) -> int:
+    """Build and write the whole timeline, then print the events between since and until."""
+    start = time.time()
+    store = load_store(data_dir)
+    events = build_timeline(store, mode, unit, window, threshold_percent)
+    settings = {'mode': mode, 'unit': unit, 'window': window, 'threshold_percent': threshold_percent,
+                'measurements': store.num_measurements}
+    paths = write_timeline(data_dir, events, settings)
+    print(f"✅ {len(events)} events from {store.num_measurements} measurements in {time.time() - start:.2f}s "
+          f"→ {', '.join(map(str, paths)) if paths else 'data/timeline/ unchanged'}")
+
+    selected = filter_events(events, since, until)
+    if since or until:
+        print(f"🗓️ {since or 'start'} → {until or 'now'}: "
+              f"{sum(e['change_type'] == 'regression' for e in selected)} regression(s), "
+              f"{sum(e['change_type'] == 'improvement' for e in selected)} improvement(s)")
+    for event in selected[:limit]:
+        symbol = "📉" if event['change_type'] == 'regression' else "📈"
+        print(f"{symbol} {event['date'][:10]} {event['commit'][:8]} {event['operation_name']}: "
+              f"{event['change_percent']:+.1f}% ({event['reference_ns']:.1f} → {event['value_ns']:.1f} ns)")
+    return 0
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Replay change detection over the whole archive')
+    parser.add_argument('--mode', choices=TIMELINE_MODES, default='baseline')
+    parser.add_argument('--unit', choices=BASELINE_UNITS, default='commit')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='Earlier points in the baseline')
+    parser.add_argument('--threshold', type=float, default=20.0, help='Percentage change threshold')
+    parser.add_argument('--since', help='Only print events on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Only print events before this date (YYYY-MM-DD)')
+    parser.add_argument('--limit', type=int, default=20, help='Events to print')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    return run_timeline(args.data_dir, args.mode, args.unit, args.window, args.threshold,
+                        args.since, args.until, args.limit)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+perfq - Query the Performance History Database
+
+Answers common history questions from the SQLite database built by
+history_db.py instead of opening hundreds of JSON files:
+
+    python perfq.py history erfinv --since 2025-06
+    python perfq.py slower --commit a9cc340 --threshold 1.2 --window 7
+    python perfq.py failures --min-streak 3
+    python perfq.py sql "SELECT operation_name, COUNT(*) FROM results GROUP BY 1"
+
+Dates are ISO prefixes (2025-06, 2025-06-15, ...); commits may be abbreviated.
+Every command accepts --json for machine-readable output.
+"""
+
+import json
+import sqlite3
+import statistics
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from history_db import DB_ENV_VAR, DB_PATH, RESULT_FIELDS, connect, default_db_path
+
+
+def op_history(conn: sqlite3.Connection, op_name: str, since: Optional[str] = None,
+               until: Optional[str] = None, metric: str = 'average_duration_ns') -> List[Dict]:
+    """One row per measurement of op_name, oldest first."""
+    if metric not in RESULT_FIELDS:
+        raise ValueError(f"Unknown metric '{metric}'")
+    query = (f"SELECT measurement_date, git_commit_id, {metric} AS value, std_deviation_ns, successful_runs "
+             "FROM results WHERE operation_name = ?")
+    params = [op_name]
+    if since:
+        query += " AND measurement_date >= ?"
+        params.append(since)
+    if until:
+        # Prefixes like 2025-06 should include the whole month
+        query += " AND measurement_date < ?"
+        params.append(until + "\uffff")
+    query += " ORDER BY measurement_date"
+    return [dict(row) for row in conn.execute(query, params)]
+
+
+def find_measurement(conn: sqlite3.Connection, commit: str) -> Optional[sqlite3.Row]:
+    """Latest measurement of a (possibly abbreviated) commit."""
+    return conn.execute(
+        "SELECT id, measurement_date, git_commit_id FROM measurements WHERE git_commit_id LIKE ? "
+        "ORDER BY measurement_date DESC LIMIT 1", (commit + '%',)).fetchone()
+
+
+def slower_ops(conn: sqlite3.Connection, commit: str, threshold: float = 1.2,
+               window: int = 7) -> List[Dict]:
+    """Ops on a commit slower than threshold × the median of the previous window measurements."""
+    measurement = find_measurement(conn, commit)
+    if measurement is None:
+        raise ValueError(f"No measurement found for commit '{commit}'")
+
+    previous_ids = [row['id'] for row in conn.execute(
+        "SELECT id FROM measurements WHERE measurement_date < ? ORDER BY measurement_date DESC LIMIT ?",
+        (measurement['measurement_date'], window))]
+    if not previous_ids:
+        return []
+
+    baseline_values: Dict[str, List[float]] = {}
+    placeholders = ', '.join('?' * len(previous_ids))
+    for row in conn.execute(
+            f"SELECT operation_name, average_duration_ns FROM results "
+            f"WHERE measurement_id IN ({placeholders}) AND average_duration_ns > 0", previous_ids):
+        baseline_values.setdefault(row['operation_name'], []).append(row['average_duration_ns'])
+
+    slower = []
+    for row in conn.execute(
+            "SELECT operation_name, average_duration_ns FROM results "
+            "WHERE measurement_id = ? AND average_duration_ns > 0", (measurement['id'],)):
+        values = baseline_values.get(row['operation_name'])
+        if not values:
+            continue
+        baseline = statistics.median(values)
+        ratio = row['average_duration_ns'] / baseline
+        if ratio >= threshold:
+            slower.append({
+                'operation_name': row['operation_name'],
+                'duration_ns': row['average_duration_ns'],
+                'baseline_ns': baseline,
+                'ratio': ratio,
+                'baseline_samples': len(values),
+                'measurement_date': measurement['measurement_date'],
+                'git_commit_id': measurement['git_commit_id'],
+            })
+    slower.sort(key=lambda item: item['ratio'], reverse=True)
+    return slower
+
+
+def failure_streaks(conn: sqlite3.Connection, min_streak: int = 2,
+                    test_name: Optional[str] = None) -> List[Dict]:
+    """Runs of consecutive measurements in which the same test failed, longest first."""
+    measurement_dates = [row['measurement_date'] for row in conn.execute(
+        "SELECT measurement_date FROM measurements ORDER BY measurement_date")]
+    position = {date: i for i, date in enumerate(measurement_dates)}
+
+    query = "SELECT test_name, measurement_date FROM failures"
+    params = []
+    if test_name:
+        query += " WHERE test_name = ?"
+        params.append(test_name)
+    query += " ORDER BY test_name, measurement_date"
+
+    streaks = []
+    current = None
+    for row in conn.execute(query, params):
+        index = position[row['measurement_date']]
+        if current and current['test_name'] == row['test_name'] and index == current['_last'] + 1:
+            current['_last'] = index
+            current['end_date'] = row['measurement_date']
+            current['length'] += 1
+            continue
+        if current:
+            streaks.append(current)
+        current = {'test_name': row['test_name'], 'start_date': row['measurement_date'],
+                   'end_date': row['measurement_date'], 'length': 1, '_last': index}
+    if current:
+        streaks.append(current)
+
+    last_index = len(measurement_dates) - 1
+    for streak in streaks:
+        streak['ongoing'] = streak.pop('_last') == last_index
+    streaks = [s for s in streaks if s['length'] >= min_streak]
+    streaks.sort(key=lambda s: (s['length'], s['end_date']), reverse=True)
+    return streaks
+
+
+def _print_rows(rows: List[Dict], columns: List[str]):
+    if not rows:
+        print("ℹ️ No matching rows")
+        return
+    widths = {c: max(len(c), *(len(_format(row.get(c))) for row in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(_format(row.get(c)).ljust(widths[c]) for c in columns))
+
+
+def _format(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.3f}" if abs(value) < 100 else f"{value:.1f}"
+    return "-" if value is None else str(value)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Query the SQLite performance history database')
+    parser.add_argument('--db', help=f'Database file (default: ${DB_ENV_VAR} or {DB_PATH})')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    history_parser = commands.add_parser('history', help='History of one op')
+    history_parser.add_argument('operation', help='Operation name, e.g. erfinv')
+    history_parser.add_argument('--since', help='First date (ISO prefix)')
+    history_parser.add_argument('--until', help='Last date (ISO prefix)')
+    history_parser.add_argument('--metric', default='average_duration_ns', choices=RESULT_FIELDS)
+
+    slower_parser = commands.add_parser('slower', help='Ops slower than a baseline on one commit')
+    slower_parser.add_argument('--commit', required=True, help='Commit id or prefix')
+    slower_parser.add_argument('--threshold', type=float, default=1.2, help='Ratio to baseline (default: 1.2)')
+    slower_parser.add_argument('--window', type=int, default=7,
+                               help='Previous measurements forming the median baseline (default: 7)')
+
+    failures_parser = commands.add_parser('failures', help='Consecutive failure streaks')
+    failures_parser.add_argument('--min-streak', type=int, default=2, help='Shortest streak to show')
+    failures_parser.add_argument('--test', help='Only this test name')
+
+    sql_parser = commands.add_parser('sql', help='Run a read-only SQL query')
+    sql_parser.add_argument('query')
+
+    args = parser.parse_args()
+
+    db_path = Path(args.db) if args.db else default_db_path()
+    if not db_path.exists():
+        print(f"❌ {db_path} not found; run 'python history_db.py backfill' first")
+        return 1
+
+    conn = connect(db_path)
+    try:
+        if args.command == 'history':
+            rows = op_history(conn, args.operation, args.since, args.until, args.metric)
+            columns = ['measurement_date', 'git_commit_id', 'value', 'std_deviation_ns', 'successful_runs']
+        elif args.command == 'slower':
+            rows = slower_ops(conn, args.commit, args.threshold, args.window)
+            columns = ['operation_name', 'duration_ns', 'baseline_ns', 'ratio', 'baseline_samples']
+        elif args.command == 'failures':
+            rows = failure_streaks(conn, args.min_streak, args.test)
+            columns = ['test_name', 'length', 'start_date', 'end_date', 'ongoing']
+        else:
+            conn.execute("PRAGMA query_only = ON")
+            cursor = conn.execute(args.query)
+            columns = [d[0] for d in cursor.description or []]
+            rows = [dict(row) for row in cursor]
+    except (ValueError, sqlite3.Error) as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        _print_rows(rows, columns)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Per-RISC / Per-Core Kernel Breakdown
+
+ttperf only prints the total device kernel duration. The profiler writes much
+more: the ops_perf_results CSV has per-RISC kernel durations and the core
+count for every op, and the raw device log (profile_log_device.csv) has kernel
+start/end timestamps for every RISC on every core. This module turns those
+into a compact breakdown stored next to each result:
+
+    core_count          Cores the op ran on
+    risc_ns             Max kernel duration per RISC (BRISC, NCRISC, TRISC0-2)
+    stages              reader (NCRISC), compute (TRISC0-2), writer (BRISC);
+                        min/median/max over cores, spread and slow core count
+    kernel_spread_ns    Max minus min whole-kernel duration across cores
+    bottleneck_stage    Stage with the longest duration
+
+Per-core stats need the device log; without it the breakdown falls back to
+the CSV columns and leaves the per-core fields out.
+
+    python profiler_breakdown.py <ops_perf_results.csv> [--device-log FILE]
+"""
+
+import csv
+import glob
+import json
+import os
+import statistics
+import sys
+from typing import Dict, List, Optional, Tuple
+
+RISC_NAMES = ["BRISC", "NCRISC", "TRISC0", "TRISC1", "TRISC2"]
+# Default ttnn data movement configs: the reader runs on NCRISC, the writer on BRISC
+RISC_STAGES = {
+    "NCRISC": "reader",
+    "TRISC0": "compute",
+    "TRISC1": "compute",
+    "TRISC2": "compute",
+    "BRISC": "writer",
+}
+STAGES = ["reader", "compute", "writer"]
+CORE_COUNT_COLUMN = "CORE COUNT"
+OP_ID_COLUMN = "GLOBAL CALL COUNT"
+DEVICE_LOG_NAME = "profile_log_device.csv"
+# A core counts as slow for a stage when it exceeds the median by this fraction
+SLOW_CORE_FRACTION = 0.10
+
+
+def risc_column(risc: str) -> str:
+    return f"DEVICE {risc} KERNEL DURATION [ns]"
+
+
+def _float_or_none(value) -> Optional[float]:
+    value = (value or '').strip()
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def read_op_row(row: Dict[str, str]) -> Dict:
+    """Extract the breakdown-relevant columns of one ops perf CSV row."""
+    op_id = _float_or_none(row.get(OP_ID_COLUMN))
+    core_count = _float_or_none(row.get(CORE_COUNT_COLUMN))
+    risc_ns = {}
+    for risc in RISC_NAMES:
+        value = _float_or_none(row.get(risc_column(risc)))
+        if value is not None:
+            risc_ns[risc] = value
+    return {
+        'op_id': int(op_id) if op_id is not None else None,
+        'core_count': int(core_count) if core_count is not None else None,
+        'risc_ns': risc_ns,
+    }
+
+
+def _normalize_risc(name: str) -> str:
+    return name.strip().upper().replace("_", "")
+
+
+def parse_device_log(path: str) -> Dict[int, Dict[str, Dict[str, float]]]:
+    """Per-op, per-core, per-RISC kernel durations (ns) from profile_log_device.csv.
+
+    Returns {run host ID: {"x,y": {risc: ns}}}. The first line of the log
+    carries the chip frequency used to convert cycles to ns.
+    """
+    with open(path, newline='') as f:
+        header_line = f.readline()
+        freq_mhz = 1000.0
+        for part in header_line.split(','):
+            if 'CHIP_FREQ' in part and ':' in part:
+                freq_mhz = float(part.split(':')[1])
+
+        reader = csv.reader(f)
+        columns = [c.strip() for c in next(reader)]
+
+        def column(*prefixes):
+            for i, name in enumerate(columns):
+                if any(name.startswith(prefix) for prefix in prefixes):
+                    return i
+            raise ValueError(f"Device log is missing a {prefixes[0]} column")
+
+        col_x, col_y = column('core_x'), column('core_y')
+        col_risc = column('RISC processor type')
+        col_time = column('time[cycles')
+        col_run = column('run host ID', 'run ID')
+        col_zone = column('zone name')
+        col_phase = column('type', 'zone phase')
+
+        starts: Dict[Tuple, float] = {}
+        durations: Dict[int, Dict[str, Dict[str, float]]] = {}
+        for fields in reader:
+            if len(fields) <= max(col_x, col_y, col_risc, col_time, col_run, col_zone, col_phase):
+                continue
+            if not fields[col_zone].strip().endswith('-KERNEL'):
+                continue
+            try:
+                run_id = int(fields[col_run])
+                cycles = float(fields[col_time])
+            except ValueError:
+                continue
+            core = f"{fields[col_x].strip()},{fields[col_y].strip()}"
+            risc = _normalize_risc(fields[col_risc])
+            key = (run_id, core, risc)
+            phase = fields[col_phase].strip().upper()
+            if phase.endswith('START') or phase.endswith('BEGIN'):
+                starts[key] = cycles
+            elif phase.endswith('END') and key in starts:
+                ns = (cycles - starts.pop(key)) * 1000.0 / freq_mhz
+                core_riscs = durations.setdefault(run_id, {}).setdefault(core, {})
+                core_riscs[risc] = core_riscs.get(risc, 0.0) + ns
+    return durations
+
+
+def find_device_log(search_root: str) -> Optional[str]:
+    """Find the newest profiler device log under search_root."""
+    candidates = glob.glob(os.path.join(search_root, '**', DEVICE_LOG_NAME), recursive=True)
+    candidates += glob.glob(os.path.join(search_root, '**', '.logs', DEVICE_LOG_NAME), recursive=True)
+    if not candidates:
+        return None
+    return max(set(candidates), key=os.path.getmtime)
+
+
+def merge_op_cores(op_ids: List[int], device_ops: Dict[int, Dict[str, Dict[str, float]]]) -> Dict[str, Dict[str, float]]:
+    """Sum per-core RISC durations over the device ops of one test run."""
+    merged: Dict[str, Dict[str, float]] = {}
+    for op_id in op_ids:
+        for core, riscs in device_ops.get(op_id, {}).items():
+            target = merged.setdefault(core, {})
+            for risc, ns in riscs.items():
+                target[risc] = target.get(risc, 0.0) + ns
+    return merged
+
+
+def _stage_of_core(riscs: Dict[str, float], stage: str) -> Optional[float]:
+    values = [ns for risc, ns in riscs.items() if RISC_STAGES.get(risc) == stage]
+    return max(values) if values else None
+
+
+def build_breakdown(op_rows: List[Dict], per_core: Optional[Dict[str, Dict[str, float]]] = None) -> Optional[Dict]:
+    """Combine the CSV rows of one test run (and optional per-core data) into a breakdown."""
+    risc_ns: Dict[str, float] = {}
+    for op in op_rows:
+        for risc, ns in op.get('risc_ns', {}).items():
+            risc_ns[risc] = risc_ns.get(risc, 0.0) + ns
+    core_counts = [op['core_count'] for op in op_rows if op.get('core_count')]
+
+    if per_core:
+        # Device log values are exact per core; prefer them over the CSV maxima
+        for risc in RISC_NAMES:
+            values = [riscs[risc] for riscs in per_core.values() if risc in riscs]
+            if values:
+                risc_ns[risc] = max(values)
+
+    if not risc_ns:
+        return None
+
+    breakdown = {
+        'core_count': len(per_core) if per_core else (max(core_counts) if core_counts else None),
+        'risc_ns': {risc: round(ns, 1) for risc, ns in risc_ns.items()},
+        'stages': {},
+    }
+
+    for stage in STAGES:
+        stage_max = max((ns for risc, ns in risc_ns.items() if RISC_STAGES.get(risc) == stage), default=None)
+        if stage_max is None:
+            continue
+        stage_info = {'max_ns': round(stage_max, 1)}
+        if per_core:
+            values = [v for v in (_stage_of_core(riscs, stage) for riscs in per_core.values()) if v is not None]
+            if values:
+                median = statistics.median(values)
+                stage_info.update({
+                    'min_ns': round(min(values), 1),
+                    'median_ns': round(median, 1),
+                    'spread_ns': round(max(values) - min(values), 1),
+                    'slow_cores': sum(1 for v in values if v > median * (1 + SLOW_CORE_FRACTION)),
+                })
+        breakdown['stages'][stage] = stage_info
+
+    if per_core:
+        kernel_per_core = [max(riscs.values()) for riscs in per_core.values() if riscs]
+        breakdown['kernel_spread_ns'] = round(max(kernel_per_core) - min(kernel_per_core), 1)
+
+    breakdown['bottleneck_stage'] = max(breakdown['stages'],
+                                        key=lambda stage: breakdown['stages'][stage]['max_ns'])
+    return breakdown
+
+
+def breakdown_from_reports(ops_csv_path: str, device_log_path: Optional[str] = None) -> Optional[Dict]:
+    """Breakdown for every device op in a per-test ops perf CSV (one ttperf run)."""
+    with open(ops_csv_path, newline='') as f:
+        op_rows = [read_op_row(row) for row in csv.DictReader(f)
+                   if row.get('OP TYPE', '').strip() != 'signpost']
+    per_core = None
+    if device_log_path and os.path.exists(device_log_path):
+        op_ids = [op['op_id'] for op in op_rows if op['op_id'] is not None]
+        per_core = merge_op_cores(op_ids, parse_device_log(device_log_path)) or None
+    return build_breakdown(op_rows, per_core)
+
+
+def describe_breakdown_change(previous: Optional[Dict], latest: Optional[Dict],
+                              min_change_percent: float = 10.0) -> Optional[str]:
+    """One-line explanation of which stage moved between two breakdowns."""
+    if not previous or not latest:
+        return None
+    notes = []
+    for stage in STAGES:
+        before = previous.get('stages', {}).get(stage, {}).get('max_ns')
+        after = latest.get('stages', {}).get(stage, {}).get('max_ns')
+        if not before or after is None:
+            continue
+        change = (after - before) / before * 100
+        if abs(change) < min_change_percent:
+            continue
+        note = f"{stage} kernel {'slower' if change > 0 else 'faster'} ({change:+.1f}%)"
+        slow_cores = latest['stages'][stage].get('slow_cores')
+        if slow_cores and latest.get('core_count'):
+            note += f" on {slow_cores} of {latest['core_count']} cores"
+        notes.append(note)
+    if previous.get('core_count') != latest.get('core_count') and latest.get('core_count'):
+        notes.append(f"core count {previous.get('core_count')} → {latest['core_count']}")
+    if previous.get('bottleneck_stage') != latest.get('bottleneck_stage'):
+        notes.append(f"bottleneck moved {previous.get('bottleneck_stage')} → {latest.get('bottleneck_stage')}")
+    return "; ".join(notes) or None
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Per-RISC/per-core breakdown of an ops perf CSV')
+    parser.add_argument('ops_csv', help='ops_perf_results_*.csv written by the profiler')
+    parser.add_argument('--device-log', help='profile_log_device.csv for per-core statistics')
+    args = parser.parse_args()
+
+    breakdown = breakdown_from_reports(args.ops_csv, args.device_log)
+    if breakdown is None:
+        print("❌ No per-RISC kernel durations found")
+        return 1
+    print(json.dumps(breakdown, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,16 +7,47 @@ This script uploads performance measurement results to the ttnn-performance-dash
 
 import os
 import sys
-import json
 import subprocess
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+from results_format import RESULT_FORMATS, DEFAULT_FORMAT, dump_results, load_results
+
+try:
+    from inplace_report import update_inplace_report
+    INPLACE_REPORT_AVAILABLE = True
+except ImportError:
+    INPLACE_REPORT_AVAILABLE = False
+
+# The columnar history store, per-op series and change points need numpy
+try:
+    from change_points import update_change_points
+    from history_store import update_store
+    from op_series import update_op_series
+    from perf_timeline import update_timeline
+    HISTORY_STORE_AVAILABLE = True
+except ImportError:
+    HISTORY_STORE_AVAILABLE = False
+
+# The timeline replays the alert detector's settings (check_perf_changes.py needs requests)
+try:
+    from check_perf_changes import detection_settings, timeline_settings
+    ALERT_SETTINGS_AVAILABLE = True
+except ImportError:
+    ALERT_SETTINGS_AVAILABLE = False
+
+from attribution import update_attribution
+from history_db import update_history_db
+from index_store import add_entry
+from rolling_stats import update_rolling_stats
+
 
 class GitHubPerformanceUploader:
-    def __init__(self, repo_url="git@github.com:Aswintechie/ttnn-performance-dashboard.git"):
+    def __init__(self, repo_url="git@github.com:Aswintechie/ttnn-performance-dashboard.git",
+                 result_format=DEFAULT_FORMAT):
         self.repo_url = repo_url
+        self.result_format = result_format
         self.repo_name = "ttnn-performance-dashboard"
         self.temp_dir = f"/tmp/{self.repo_name}_upload_{int(datetime.now().timestamp())}"
         self.dashboard_dir = Path(self.temp_dir) / self.repo_name
@@ -30,8 +61,7 @@ class GitHubPerformanceUploader:
                 return False
 
             # Load the results
-            with open(json_file_path, 'r') as f:
-                results_data = json.load(f)
+            results_data = load_results(json_file_path)
 
             print(f"📄 Loaded results from: {json_file_path}")
 
@@ -47,9 +77,29 @@ class GitHubPerformanceUploader:
             if self._is_complete_run(results_data):
                 self._update_latest_results(results_data)
 
-            # Update index.json with new entry
+            # Update the sharded index with new entry
             self._update_index(results_data, json_file_path)
 
+            # Refresh the views derived from the columnar history
+            if HISTORY_STORE_AVAILABLE:
+                self._update_op_series(results_data)
+                store = self._update_history_store(results_data, json_file_path)
+                if store is not None:
+                    self._update_change_points(store)
+                    self._update_timeline(store)
+                    self._update_attribution()
+            else:
+                print("⚠️ Warning: numpy not available, skipping history store update")
+
+            # Add to the SQLite history database, if one has been created
+            self._update_history_db(results_data, json_file_path)
+
+            # Fold the new results into the per-op rolling statistics
+            self._update_rolling_stats(results_data)
+
+            # Regenerate derived reports from the updated history
+            self._update_reports()
+
             # Commit and push changes
             if not self._commit_and_push():
                 return False
@@ -105,9 +155,9 @@ class GitHubPerformanceUploader:
 
             destination_path = daily_dir / filename
 
-            # Copy the file
-            shutil.copy2(json_file_path, destination_path)
-            print(f"📋 Copied results to: {filename}")
+            # Write the file in the configured format
+            dump_results(results_data, destination_path, self.result_format)
+            print(f"📋 Copied results to: {filename} ({self.result_format} format)")
 
             return True
 
@@ -134,8 +184,7 @@ class GitHubPerformanceUploader:
             latest_file = latest_dir / "latest_results.json"
 
             # Write the results as latest
-            with open(latest_file, 'w') as f:
-                json.dump(results_data, f, indent=2)
+            dump_results(results_data, latest_file, self.result_format)
 
             print(f"🔄 Updated latest results")
 
@@ -143,31 +192,8 @@ class GitHubPerformanceUploader:
             print(f"⚠️ Warning: Could not update latest results: {e}")
 
     def _update_index(self, results_data, json_file_path):
-        """Update the index.json file with the new results entry."""
+        """Add the new results entry to its month's index shard and the index head."""
         try:
-            index_file = self.dashboard_dir / "data" / "index.json"
-
-            # Load existing index or create new one
-            if index_file.exists():
-                with open(index_file, 'r') as f:
-                    index_data = json.load(f)
-            else:
-                index_data = {
-                    "last_updated": datetime.now().isoformat(),
-                    "total_measurements": 0,
-                    "files": []
-                }
-
-            # Ensure we have the expected structure
-            if not isinstance(index_data, dict):
-                index_data = {
-                    "last_updated": datetime.now().isoformat(),
-                    "total_measurements": 0,
-                    "files": []
-                }
-
-            files_list = index_data.get('files', [])
-
             # Create new entry
             metadata = results_data.get('metadata', {})
             date_str = metadata.get('measurement_date', datetime.now().isoformat())
@@ -186,37 +212,111 @@ class GitHubPerformanceUploader:
                 'failed_tests': metadata.get('failed_tests', 0)
             }
 
-            # Add to files list (avoid duplicates based on measurement_date and commit)
-            existing_entry = None
-            for i, entry in enumerate(files_list):
-                if (entry.get('measurement_date') == new_entry['measurement_date'] and
-                    entry.get('git_commit_id') == new_entry['git_commit_id']):
-                    existing_entry = i
-                    break
-
-            if existing_entry is not None:
-                # Update existing entry
-                files_list[existing_entry] = new_entry
+            # Replaces an entry with the same measurement_date and commit
+            if add_entry(self.dashboard_dir / "data", new_entry) == 'updated':
                 print(f"🔄 Updated existing index entry")
             else:
-                # Add new entry
-                files_list.append(new_entry)
                 print(f"➕ Added new index entry")
 
-            # Sort by measurement_date (newest first)
-            files_list.sort(key=lambda x: x.get('measurement_date', ''), reverse=True)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not update index: {e}")
 
-            # Update metadata
-            index_data['files'] = files_list
-            index_data['last_updated'] = datetime.now().isoformat()
-            index_data['total_measurements'] = len(files_list)
+    def _update_op_series(self, results_data):
+        """Append the new results to the per-op series."""
+        try:
+            update_op_series(self.dashboard_dir / "data", results_data)
+            print(f"📈 Appended per-op series")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not update per-op series: {e}")
+
+    def _dashboard_filename(self, results_data, json_file_path):
+        """Name the results file has in data/daily and the index."""
+        measurement_date = results_data.get('metadata', {}).get('measurement_date', '')
+        filename = os.path.basename(json_file_path)
+        if measurement_date:
+            filename = f"{measurement_date.split('T')[0]}_{filename}"
+        return filename
+
+    def _update_history_store(self, results_data, json_file_path):
+        """Append the new results to the columnar history (None if it cannot be updated).
+
+        The store is not committed; it is saved outside the dashboard clone
+        (see history_store.default_store_path) so each upload only appends.
+        """
+        try:
+            store = update_store(self.dashboard_dir / "data", results_data,
+                                 self._dashboard_filename(results_data, json_file_path))
+            print(f"📦 Updated the columnar history ({store.num_measurements} measurements)")
+            return store
+        except Exception as e:
+            print(f"⚠️ Warning: Could not update the history store: {e}")
+            return None
 
-            # Save index
-            with open(index_file, 'w') as f:
-                json.dump(index_data, f, indent=2)
+    def _update_change_points(self, store):
+        """Re-segment the op histories into data/history/change_points.json."""
+        try:
+            update_change_points(self.dashboard_dir / "data", store)
+            print(f"📍 Updated change points")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not update change points: {e}")
 
+    def _update_timeline(self, store):
+        """Rebuild data/timeline/ with the alert detector's settings (PERF_COMPARE_BY and friends).
+
+        The defaults of perf_timeline are used when check_perf_changes.py
+        cannot be imported.
+        """
+        try:
+            settings = timeline_settings(detection_settings()) if ALERT_SETTINGS_AVAILABLE else None
+            if update_timeline(self.dashboard_dir / "data", store, settings):
+                print(f"🗓️ Rebuilt regression timeline")
+            else:
+                print(f"ℹ️ Regression timeline unchanged")
         except Exception as e:
-            print(f"⚠️ Warning: Could not update index: {e}")
+            print(f"⚠️ Warning: Could not rebuild regression timeline: {e}")
+
+    def _update_attribution(self):
+        """Attribute the latest changes to commit ranges.
+
+        Ranges are expanded in the tt-metal clone at TT_METAL_HOME when there
+        is one.
+        """
+        try:
+            update_attribution(self.dashboard_dir / "data")
+            print(f"🔎 Attributed the latest changes to commit ranges")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not attribute the latest changes: {e}")
+
+    def _update_history_db(self, results_data, json_file_path):
+        """Add the new results to the SQLite history database when it exists."""
+        try:
+            db_path = update_history_db(results_data, self._dashboard_filename(results_data, json_file_path))
+            if db_path:
+                print(f"🗄️ Updated history database {db_path}")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not update history database: {e}")
+
+    def _update_rolling_stats(self, results_data):
+        """Update data/stats/rolling.json with the new results."""
+        try:
+            stats_path = update_rolling_stats(self.dashboard_dir / "data", results_data)
+            if stats_path:
+                print(f"📊 Updated rolling statistics")
+            else:
+                print(f"ℹ️ Rolling statistics already include this measurement")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not update rolling statistics: {e}")
+
+    def _update_reports(self):
+        """Regenerate the reports derived from the full measurement history."""
+        if not INPLACE_REPORT_AVAILABLE:
+            return
+        try:
+            report_path = update_inplace_report(self.dashboard_dir / "data")
+            if report_path:
+                print(f"🔁 Updated in-place comparison report")
+        except Exception as e:
+            print(f"⚠️ Warning: Could not update in-place report: {e}")
 
     def _commit_and_push(self):
         """Commit changes and push to GitHub."""
@@ -272,11 +372,15 @@ class GitHubPerformanceUploader:
 
 def main():
     """Main function for command line usage."""
-    if len(sys.argv) != 2:
-        print("Usage: python push_to_github.py <path_to_results_json>")
-        sys.exit(1)
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Upload performance results to the dashboard repository')
+    parser.add_argument('json_file', help='Results JSON file (either format)')
+    parser.add_argument('--format', choices=RESULT_FORMATS, default=DEFAULT_FORMAT,
+                        help='Format of the files written to the dashboard (default: legacy)')
+    args = parser.parse_args()
 
-    json_file_path = sys.argv[1]
+    json_file_path = args.json_file
 
     # Check if file exists
     if not os.path.exists(json_file_path):
@@ -284,7 +388,7 @@ def main():
         sys.exit(1)
 
     # Upload results
-    uploader = GitHubPerformanceUploader()
+    uploader = GitHubPerformanceUploader(result_format=args.format)
     success = uploader.upload_results(json_file_path)
 
     if success:
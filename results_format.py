@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Results File Formats
+
+Two on-disk formats for perf results files:
+
+    legacy   (schema 1) {"metadata": {...}, "results": [{...}, {...}, ...]}
+             indent=2, full-precision floats, every key repeated per op
+    compact  (schema 2) {"metadata": {..., "schema_version": 2},
+                         "results": {"test_name": [...], "average_duration_ns": [...], ...}}
+             one array per field (null where an op lacks it), durations
+             rounded to DURATION_DECIMALS, no indentation
+
+Always read results files with load_results(), which returns the legacy
+row layout for either format; everything downstream keeps working on
+data['results'] as a list of dicts. Entries of data/index.json are read with
+load_index_entry(), which also handles entries compacted into monthly packs
+(see data_packs.py).
+
+    python results_format.py convert <file>... [--format compact] [--in-place]
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SCHEMA_VERSION = 2
+RESULT_FORMATS = ["legacy", "compact"]
+DEFAULT_FORMAT = "legacy"
+DURATION_DECIMALS = 1
+
+
+def is_compact(data: Dict) -> bool:
+    return isinstance(data.get('results'), dict)
+
+
+def _round_duration(value):
+    if isinstance(value, float):
+        value = round(value, DURATION_DECIMALS)
+        return int(value) if value.is_integer() else value
+    return value
+
+
+def _is_duration_field(field: str) -> bool:
+    return field.endswith('_ns') or field == 'runs'
+
+
+def to_compact(data: Dict) -> Dict:
+    """Convert legacy results data to the compact dict-of-arrays layout."""
+    if is_compact(data):
+        return data
+    results: List[Dict] = data.get('results', [])
+    fields: List[str] = []
+    for result in results:
+        for field in result:
+            if field not in fields:
+                fields.append(field)
+
+    columns = {}
+    for field in fields:
+        column = [result.get(field) for result in results]
+        if _is_duration_field(field):
+            column = [[_round_duration(v) for v in value] if isinstance(value, list) else _round_duration(value)
+                      for value in column]
+        columns[field] = column
+
+    compact = dict(data)
+    compact['metadata'] = dict(data.get('metadata', {}), schema_version=SCHEMA_VERSION)
+    compact['results'] = columns
+    return compact
+
+
+def from_compact(data: Dict) -> Dict:
+    """Convert compact results data back to the legacy list-of-rows layout.
+
+    Fields that are null for an op are left out of its row.
+    """
+    if not is_compact(data):
+        return data
+    columns: Dict[str, List] = data['results']
+    count = max((len(column) for column in columns.values()), default=0)
+    rows = [{field: column[i] for field, column in columns.items() if i < len(column) and column[i] is not None}
+            for i in range(count)]
+    legacy = dict(data)
+    legacy['results'] = rows
+    return legacy
+
+
+def normalize_results(data: Dict) -> Dict:
+    """Results data of either format in the legacy row layout."""
+    return from_compact(data) if isinstance(data, dict) else data
+
+
+def load_results(path) -> Dict:
+    """Load a results file of either format (see module docstring)."""
+    with open(path, 'r') as f:
+        return normalize_results(json.load(f))
+
+
+def index_entry_path(data_dir, entry: Dict) -> Path:
+    """Local path of the file an index entry points at (a daily file or a pack)."""
+    return Path(data_dir) / entry['path'].replace('data/', '', 1)
+
+
+def load_index_entry(data_dir, entry: Dict) -> Dict:
+    """Load the results an index entry refers to.
+
+    Packed entries carry the byte range of their line in the pack, so only
+    that line is read and parsed.
+    """
+    path = index_entry_path(data_dir, entry)
+    if 'pack_offset' not in entry:
+        return load_results(path)
+    with open(path, 'rb') as f:
+        f.seek(entry['pack_offset'])
+        return normalize_results(json.loads(f.read(entry['pack_length'])))
+
+
+def dump_results(data: Dict, path, result_format: str = DEFAULT_FORMAT):
+    """Write results data (either layout) to path in result_format."""
+    if result_format not in RESULT_FORMATS:
+        raise ValueError(f"Unknown results format '{result_format}' (choose from {', '.join(RESULT_FORMATS)})")
+    with open(path, 'w') as f:
+        if result_format == "compact":
+            json.dump(to_compact(data), f, separators=(',', ':'))
+        else:
+            json.dump(from_compact(data), f, indent=2)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Convert results files between formats')
+    parser.add_argument('command', choices=['convert'])
+    parser.add_argument('files', nargs='+', help='Results JSON files')
+    parser.add_argument('--format', choices=RESULT_FORMATS, default="compact", help='Target format')
+    parser.add_argument('--in-place', action='store_true',
+                        help='Overwrite each file (default: write <name>.<format>.json next to it)')
+    args = parser.parse_args()
+
+    before_total = after_total = 0
+    for file in args.files:
+        source = Path(file)
+        target = source if args.in_place else source.with_suffix(f".{args.format}.json")
+        try:
+            before = source.stat().st_size
+            dump_results(load_results(source), target, args.format)
+        except Exception as e:
+            print(f"❌ {source}: {e}")
+            return 1
+        after = target.stat().st_size
+        before_total += before
+        after_total += after
+        print(f"✅ {source.name}: {before / 1024:.1f} KB → {after / 1024:.1f} KB")
+
+    if len(args.files) > 1 and after_total:
+        print(f"📦 {before_total / 1024 / 1024:.1f} MB → {after_total / 1024 / 1024:.1f} MB "
+              f"({before_total / after_total:.1f}x smaller)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
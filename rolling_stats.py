@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Incremental Per-Op Rolling Statistics
+
+data/stats/rolling.json holds a small running summary per op so baselines
+and trends need one read instead of a history scan:
+
+    count, mean, m2      Welford running mean and sum of squared deviations
+                         of the per-run average duration
+    ewma                 Exponentially weighted moving average (EWMA_ALPHA)
+    recent               Last RING_SIZE averages, oldest first
+    last                 Date, commit and value of the latest measurement
+    level                Median of the ring at the last established level
+    pending              First measurement of a run of values more than
+                         CHANGE_THRESHOLD away from level (cleared when a
+                         value returns to it)
+    last_change_point    Latest persistent shift: once the ring median itself
+                         moves more than CHANGE_THRESHOLD from level, dated at
+                         the pending measurement that started the new level
+                         (a one-run spike or the points after a step, before
+                         the median flips, are not change points)
+    last_failure         Date and commit of the latest failed run
+
+The uploader calls update_rolling_stats() once per results file, which is
+O(ops). Files not newer than the last one applied are skipped; `build`
+recomputes everything from the archive.
+
+    python rolling_stats.py build [--data-dir data]
+    python rolling_stats.py show erfinv
+"""
+
+import json
+import math
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from index_store import load_index
+from results_format import load_index_entry
+
+STATS_PATH = Path("stats") / "rolling.json"
+RING_SIZE = 20
+EWMA_ALPHA = 0.2
+CHANGE_THRESHOLD = 0.20
+
+
+def _new_op_stats() -> Dict:
+    return {'count': 0, 'mean': 0.0, 'm2': 0.0, 'ewma': None, 'recent': [],
+            'last': None, 'level': None, 'pending': None, 'last_change_point': None, 'last_failure': None}
+
+
+def empty_stats() -> Dict:
+    return {
+        'metadata': {'ring_size': RING_SIZE, 'ewma_alpha': EWMA_ALPHA, 'change_threshold': CHANGE_THRESHOLD,
+                     'measurements': 0, 'last_measurement_date': None, 'updated': None},
+        'ops': {},
+    }
+
+
+def std_dev(op_stats: Dict) -> Optional[float]:
+    """Sample standard deviation of every value seen so far."""
+    if op_stats['count'] < 2:
+        return None
+    return math.sqrt(op_stats['m2'] / (op_stats['count'] - 1))
+
+
+def baseline(op_stats: Dict, exclude_latest: bool = False) -> Optional[float]:
+    """Median of the ring buffer, optionally without the newest value."""
+    values = op_stats['recent'][:-1] if exclude_latest else op_stats['recent']
+    return statistics.median(values) if values else None
+
+
+def _shift(value: float, level: float) -> int:
+    """+1/-1 when value is more than CHANGE_THRESHOLD above/below level, else 0."""
+    if not level or abs(value - level) / level <= CHANGE_THRESHOLD:
+        return 0
+    return 1 if value > level else -1
+
+
+def track_level(op: Dict, date_str: str, commit: str, value: float):
+    """Follow the op's level after value was added to the ring; record persistent shifts."""
+    level = op.get('level')
+    if level is None:
+        op['level'], op['pending'] = baseline(op), None
+        return
+    direction = _shift(value, level)
+    pending = op.get('pending')
+    if not direction:
+        op['pending'] = None
+    elif not pending or pending['direction'] != direction:
+        op['pending'] = pending = {'date': date_str, 'commit': commit, 'direction': direction}
+
+    median = baseline(op)
+    if pending and _shift(median, level) == pending['direction']:
+        op['last_change_point'] = {'date': pending['date'], 'commit': pending['commit'],
+                                   'before_ns': level, 'after_ns': median}
+        op['level'], op['pending'] = median, None
+
+
+def apply_measurement(stats: Dict, results_data: Dict) -> bool:
+    """Fold one results file into stats. Returns False if it is not newer than the last one applied."""
+    metadata = results_data.get('metadata', {})
+    date_str = metadata.get('measurement_date', '')
+    last_date = stats['metadata'].get('last_measurement_date')
+    if last_date and date_str <= last_date:
+        return False
+    commit = metadata.get('git_commit_id', 'unknown')
+    ops = stats['ops']
+
+    for result in results_data.get('results', []):
+        value = result.get('average_duration_ns')
+        if value is None or not result.get('successful_runs'):
+            continue
+        op = ops.setdefault(result['operation_name'], _new_op_stats())
+
+        # Welford update
+        op['count'] += 1
+        delta = value - op['mean']
+        op['mean'] += delta / op['count']
+        op['m2'] += delta * (value - op['mean'])
+
+        op['ewma'] = value if op['ewma'] is None else EWMA_ALPHA * value + (1 - EWMA_ALPHA) * op['ewma']
+
+        op['recent'] = (op['recent'] + [value])[-RING_SIZE:]
+        op['last'] = {'date': date_str, 'commit': commit, 'value_ns': value}
+        track_level(op, date_str, commit, value)
+
+    for test_name in metadata.get('failed_test_names', []):
+        op_name = test_name[len("test_"):] if test_name.startswith("test_") else test_name
+        ops.setdefault(op_name, _new_op_stats())['last_failure'] = {'date': date_str, 'commit': commit}
+
+    stats['metadata']['measurements'] += 1
+    stats['metadata']['last_measurement_date'] = date_str
+    return True
+
+
+def load_stats(path) -> Dict:
+    path = Path(path)
+    if not path.exists():
+        return empty_stats()
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_stats(stats: Dict, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    stats['metadata']['updated'] = datetime.now().isoformat()
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(stats, f, separators=(',', ':'))
+    tmp_path.replace(path)
+
+
+def build_from_archive(data_dir) -> Dict:
+    """Recompute rolling stats from every entry in the measurement index."""
+    data_dir = Path(data_dir)
+    files = load_index(data_dir)['files']
+    stats = empty_stats()
+    for entry in sorted(files, key=lambda e: e.get('measurement_date', '')):
+        try:
+            apply_measurement(stats, load_index_entry(data_dir, entry))
+        except Exception as e:
+            print(f"⚠️ Warning: Could not load {entry.get('filename')}: {e}")
+    return stats
+
+
+def update_rolling_stats(data_dir, results_data: Dict) -> Optional[Path]:
+    """Fold the uploaded results into data/stats/rolling.json; None if they are already in it.
+
+    Without a stats file, the archive is replayed from the start.
+    """
+    data_dir = Path(data_dir)
+    stats_path = data_dir / STATS_PATH
+    if stats_path.exists():
+        stats = load_stats(stats_path)
+        if not apply_measurement(stats, results_data):
+            return None
+    else:
+        # The archive already contains the new file, so the build includes it
+        stats = build_from_archive(data_dir)
+    save_stats(stats, stats_path)
+    return stats_path
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Incremental per-op rolling statistics')
+    parser.add_argument('command', choices=['build', 'show'])
+    parser.add_argument('operation', nargs='?', help='Operation name for show')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    stats_path = Path(args.data_dir) / STATS_PATH
+
+    if args.command == 'build':
+        stats = build_from_archive(args.data_dir)
+        save_stats(stats, stats_path)
+        print(f"✅ Built {stats_path} from {stats['metadata']['measurements']} measurements "
+              f"({len(stats['ops'])} ops, {stats_path.stat().st_size / 1024:.0f} KB)")
+        return 0
+
+    stats = load_stats(stats_path)
+    op = stats['ops'].get(args.operation or '')
+    if op is None:
+        print(f"❌ No rolling stats for '{args.operation}'")
+        return 1
+    print(f"📊 {args.operation}: {op['count']} measurements")
+    if op['count']:
+        sd = std_dev(op)
+        print(f"   mean {op['mean']:.1f} ns" + (f" ± {sd:.1f}" if sd is not None else ""))
+        print(f"   EWMA {op['ewma']:.1f} ns, median of last {len(op['recent'])}: {baseline(op):.1f} ns")
+        print(f"   latest {op['last']['value_ns']:.1f} ns on {op['last']['date']}")
+    if op['last_change_point']:
+        change = op['last_change_point']
+        print(f"   last change point {change['date']} ({change['commit'][:8]}): "
+              f"{change['before_ns']:.1f} → {change['after_ns']:.1f} ns")
+    if op['last_failure']:
+        print(f"   last failure {op['last_failure']['date']} ({op['last_failure']['commit'][:8]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
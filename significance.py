@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Significance Testing with Per-Op Noise Models
+
+A threshold on averages of three runs flags jittery ops on every upload and
+misses real 5% changes in stable ones. This tests every op in one vectorised
+pass over (ops x points) matrices of run count, mean and standard deviation:
+
+    sample     the newest point's runs against the runs of the WINDOW points
+               before it, pooled (exact pooled mean/variance, as in
+               data_packs.py, so packed entries without raw runs work too);
+               points more than OUTLIER_SIGMAS robust deviations from the
+               window median are left out of the pool
+    test       Welch's t-test; p-values from the t distribution, then
+               Benjamini-Hochberg q-values across all tested ops
+    noise      each op's historical noise: the robust (MAD) spread of the
+               window's per-point means relative to their median
+    effect     percent change of the means and Hedges' g
+
+An op is flagged when q < ALPHA (statistical significance) and its change is
+at least max(min_effect_percent, NOISE_MULTIPLIER x its noise) (practical
+significance). Ops need MIN_BASELINE_POINTS earlier points and two runs on
+each side. Only first crossings alert: an op the previous upload's
+evaluation already flagged in the same direction is marked 'repeat' instead
+of 'significant', as the window keeps straddling a step for several uploads,
+unless its newest point also moved significantly and practically away from
+the point flagged then (a second step).
+check_perf_changes.py uses this for PERF_COMPARE_BY=significance, and
+perf_timeline.py replays welch_against_window over the whole archive.
+
+    python significance.py [--window 10] [--unit commit|file] [--min-effect 5] [--alpha 0.05]
+"""
+
+import math
+import sys
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from baseline_detector import BASELINE_UNITS, DEFAULT_WINDOW, MIN_BASELINE_POINTS, load_recent
+
+ALPHA = 0.05
+NOISE_MULTIPLIER = 3.0
+OUTLIER_SIGMAS = 5.0
+# Spread floor for the outlier cut, relative to the median, when the window barely moves
+MIN_SPREAD = 0.01
+DEFAULT_MIN_EFFECT = 5.0
+_BETACF_ITERATIONS = 200
+_TINY = 1e-300
+
+
+def stat_matrices(history: List[Dict]) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """(op names, n, mean, std) as ops x points matrices; n is 0 where an op was not measured."""
+    ops: Dict[str, int] = {}
+    cells = []
+    for column, data in enumerate(history):
+        for result in data.get('results', []):
+            mean = result.get('average_duration_ns')
+            n = result.get('successful_runs') or 0
+            if mean is None or not n:
+                continue
+            cells.append((ops.setdefault(result['operation_name'], len(ops)), column, n, mean,
+                          result.get('std_deviation_ns') or 0.0))
+
+    shape = (len(ops), len(history))
+    n, mean, std = np.zeros(shape), np.full(shape, np.nan), np.zeros(shape)
+    if cells:
+        rows, columns, counts, means, stds = (list(values) for values in zip(*cells))
+        n[rows, columns], mean[rows, columns], std[rows, columns] = counts, means, stds
+    return list(ops), n, mean, std
+
+
+def _betacf(a: np.ndarray, b: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Continued fraction for the incomplete beta function (modified Lentz)."""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = np.ones_like(x)
+    d = 1.0 - qab * x / qap
+    d = 1.0 / np.where(np.abs(d) < _TINY, _TINY, d)
+    h = d.copy()
+    for m in range(1, _BETACF_ITERATIONS + 1):
+        m2 = 2 * m
+        for aa in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                   -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1.0 + aa * d
+            d = 1.0 / np.where(np.abs(d) < _TINY, _TINY, d)
+            c = 1.0 + aa / c
+            c = np.where(np.abs(c) < _TINY, _TINY, c)
+            h = h * d * c
+    return h
+
+
+def betainc(a: np.ndarray, b: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Regularized incomplete beta function I_x(a, b), elementwise."""
+    a, b, x = np.broadcast_arrays(np.asarray(a, float), np.asarray(b, float), np.asarray(x, float))
+    lgamma = np.vectorize(math.lgamma, otypes=[float])
+    inner = np.clip(x, _TINY, 1.0 - 1e-16)
+    front = np.exp(lgamma(a + b) - lgamma(a) - lgamma(b) + a * np.log(inner) + b * np.log1p(-inner))
+    direct = x < (a + 1.0) / (a + b + 2.0)
+    # Both branches are evaluated for every element; the unused one may overflow
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        value = np.where(direct, front * _betacf(a, b, inner) / a, 1.0 - front * _betacf(b, a, 1.0 - inner) / b)
+    return np.where(x <= 0.0, 0.0, np.where(x >= 1.0, 1.0, value))
+
+
+def t_two_sided_p(t: np.ndarray, dof: np.ndarray) -> np.ndarray:
+    """Two-sided p-value of Student's t; |t| = inf gives 0."""
+    t = np.asarray(t, float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x = np.where(np.isinf(t), 0.0, dof / (dof + t * t))
+    return betainc(dof / 2.0, 0.5, x)
+
+
+def benjamini_hochberg(p_values: np.ndarray) -> np.ndarray:
+    """Benjamini-Hochberg adjusted p-values (q-values); NaNs are left out and kept."""
+    q = np.full(p_values.shape, np.nan)
+    tested = np.flatnonzero(~np.isnan(p_values))
+    if tested.size == 0:
+        return q
+    order = tested[np.argsort(p_values[tested])]
+    ranked = p_values[order] * tested.size / np.arange(1, tested.size + 1)
+    q[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q
+
+
+def welch_against_window(n1: np.ndarray, m1: np.ndarray, s1: np.ndarray, n_past: np.ndarray,
+                         mean_past: np.ndarray, std_past: np.ndarray,
+                         min_points: int = MIN_BASELINE_POINTS) -> Dict[str, np.ndarray]:
+    """Welch's t-test of each row's point (n1, m1, s1) against its pooled window columns.
+
+    Returns the per-row arrays behind a test ('p' is NaN where the row is not
+    testable); q-values are left to the caller, which knows what one
+    evaluation's family of tests is.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        # Ops never measured in the window have all-NaN rows
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        # Historical noise: robust spread of the window's per-point means
+        points = np.count_nonzero(n_past, axis=1)
+        centre = np.nanmedian(mean_past, axis=1)
+        sigma = 1.4826 * np.nanmedian(np.abs(mean_past - centre[:, None]), axis=1)
+        noise_percent = sigma / centre * 100
+
+        # Pooled baseline sample across the window, without outlying points
+        spread = np.maximum(sigma, MIN_SPREAD * centre)
+        n_past = np.where(np.abs(mean_past - centre[:, None]) <= OUTLIER_SIGMAS * spread[:, None], n_past, 0)
+        mean_past = np.where(n_past > 0, mean_past, 0.0)
+        n2 = n_past.sum(axis=1)
+        m2 = (n_past * mean_past).sum(axis=1) / n2
+        squares = ((n_past - 1).clip(min=0) * std_past ** 2 +
+                   n_past * (mean_past - m2[:, None]) ** 2).sum(axis=1)
+        s2 = np.sqrt(squares / (n2 - 1))
+
+        # Welch's t-test
+        v1, v2 = s1 ** 2 / n1, s2 ** 2 / n2
+        se = np.sqrt(v1 + v2)
+        t = np.where(se > 0, (m1 - m2) / se, np.where(m1 == m2, 0.0, np.inf * np.sign(m1 - m2)))
+        dof = np.where(se > 0, (v1 + v2) ** 2 / (v1 ** 2 / (n1 - 1) + v2 ** 2 / (n2 - 1)), n1 + n2 - 2)
+
+        testable = (n1 >= 2) & (n2 >= 2) & (points >= min_points) & (m2 > 0)
+        p = np.where(testable, t_two_sided_p(np.where(testable, t, 0.0), np.where(testable, dof, 1.0)), np.nan)
+
+        change_percent = (m1 - m2) / m2 * 100
+        pooled_sd = np.sqrt(((n1 - 1) * s1 ** 2 + (n2 - 1) * s2 ** 2) / (n1 + n2 - 2))
+        hedges_g = (m1 - m2) / pooled_sd * (1 - 3 / (4 * (n1 + n2) - 9))
+
+    return {'n1': n1, 'm1': m1, 'n2': n2, 'm2': m2, 'points': points, 'noise_percent': noise_percent,
+            't': t, 'dof': dof, 'p': p, 'testable': testable, 'change_percent': change_percent,
+            'hedges_g': hedges_g}
+
+
+def flag_significant(stats: Dict[str, np.ndarray], q: np.ndarray, min_effect_percent: float = DEFAULT_MIN_EFFECT,
+                     alpha: float = ALPHA, noise_multiplier: float = NOISE_MULTIPLIER) -> np.ndarray:
+    """Rows that are statistically (q < alpha) and practically (change past the noise) significant."""
+    practical = np.maximum(min_effect_percent, noise_multiplier * np.nan_to_num(stats['noise_percent']))
+    with np.errstate(invalid='ignore'):
+        return stats['testable'] & (q < alpha) & (np.abs(stats['change_percent']) >= practical)
+
+
+def moved_from(n1: np.ndarray, m1: np.ndarray, s1: np.ndarray, n0: np.ndarray, m0: np.ndarray, s0: np.ndarray,
+               practical_percent: np.ndarray, alpha: float = ALPHA) -> np.ndarray:
+    """Whether each point (n1, m1, s1) moved away from an earlier one (n0, m0, s0).
+
+    It must differ statistically (Welch p < alpha; points without two runs
+    on each side pass) and practically (by practical_percent or more).
+    """
+    stats = welch_against_window(n1, m1, s1, n0[:, None], m0[:, None], s0[:, None], min_points=1)
+    with np.errstate(invalid='ignore'):
+        statistical = np.where(stats['testable'], stats['p'] < alpha, True)
+        return statistical & (np.abs(stats['change_percent']) >= practical_percent)
+
+
+def significance_tests(history: List[Dict], min_effect_percent: float = DEFAULT_MIN_EFFECT,
+                       alpha: float = ALPHA, noise_multiplier: float = NOISE_MULTIPLIER,
+                       min_points: int = MIN_BASELINE_POINTS,
+                       previous: Optional[List[Dict]] = None) -> List[Dict]:
+    """Test the newest point (history[0]) against the pooled points before it, for every op.
+
+    Returns one dict per testable op, with 'significant' set when both the
+    statistical and the practical test pass. previous is the history the
+    last evaluation saw (newest first); ops it already flagged in the same
+    direction get 'repeat' set instead of 'significant' unless the newest
+    point moved away from the one flagged then (moved_from).
+    """
+    if previous:
+        tests = significance_tests(history, min_effect_percent, alpha, noise_multiplier, min_points)
+        flagged_before = {test['operation_name']: test for test in significance_tests(
+            previous, min_effect_percent, alpha, noise_multiplier, min_points) if test['significant']}
+        pairs = [(test, flagged_before[test['operation_name']]) for test in tests
+                 if test['significant'] and test['operation_name'] in flagged_before]
+        # Only a change in the same direction can repeat the flagged one
+        pairs = [(test, before) for test, before in pairs
+                 if (test['change_percent'] > 0) == (before['change_percent'] > 0)]
+        if pairs:
+            def column(index, key):
+                return np.array([pair[index][key] for pair in pairs], dtype=float)
+
+            moved = moved_from(column(0, 'latest_runs'), column(0, 'latest_avg_ns'), column(0, 'latest_std_ns'),
+                               column(1, 'latest_runs'), column(1, 'latest_avg_ns'), column(1, 'latest_std_ns'),
+                               column(0, 'practical_threshold_percent'), alpha)
+            for (test, _), step in zip(pairs, moved):
+                test['repeat'] = not step
+                test['significant'] = bool(step)
+        return tests
+
+    ops, n, mean, std = stat_matrices(history)
+    if n.shape[1] < 2:
+        return []
+    stats = welch_against_window(n[:, 0], mean[:, 0], std[:, 0], n[:, 1:], mean[:, 1:], std[:, 1:], min_points)
+    q = benjamini_hochberg(stats['p'])
+    significant = flag_significant(stats, q, min_effect_percent, alpha, noise_multiplier)
+    practical = np.maximum(min_effect_percent, noise_multiplier * np.nan_to_num(stats['noise_percent']))
+
+    return [{'operation_name': ops[row], 'latest_avg_ns': float(stats['m1'][row]),
+             'latest_std_ns': float(std[row, 0]),
+             'baseline_ns': float(stats['m2'][row]), 'change_percent': float(stats['change_percent'][row]),
+             'latest_runs': int(stats['n1'][row]), 'baseline_runs': int(stats['n2'][row]),
+             'baseline_points': int(stats['points'][row]), 't_statistic': float(stats['t'][row]),
+             'dof': float(stats['dof'][row]), 'p_value': float(stats['p'][row]), 'q_value': float(q[row]),
+             'hedges_g': float(stats['hedges_g'][row]), 'noise_percent': float(stats['noise_percent'][row]),
+             'practical_threshold_percent': float(practical[row]), 'significant': bool(significant[row]),
+             'repeat': False}
+            for row in np.flatnonzero(stats['testable'])]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Test the latest measurement for significant per-op changes')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='Earlier points in the baseline')
+    parser.add_argument('--unit', choices=BASELINE_UNITS, default='commit', help='Baseline points')
+    parser.add_argument('--min-effect', type=float, default=DEFAULT_MIN_EFFECT,
+                        help='Smallest change worth reporting, in percent')
+    parser.add_argument('--alpha', type=float, default=ALPHA, help='False discovery rate')
+    parser.add_argument('--data-dir', default='data', help='Dashboard data directory')
+    args = parser.parse_args()
+
+    history = load_recent(args.data_dir, args.window + 1, args.unit)
+    if len(history) < 2:
+        print(f"⚠️ Not enough data to compare. Found {len(history)} {args.unit}(s).")
+        return 1
+    previous = load_recent(args.data_dir, args.window + 1, args.unit, skip_files=1)
+    tests = significance_tests(history, args.min_effect, args.alpha, previous=previous)
+    flagged = [test for test in tests if test['significant']]
+    print(f"📊 {len(flagged)} of {len(tests)} tested op(s) changed significantly vs the last "
+          f"{len(history) - 1} {args.unit}s")
+    repeats = sum(test['repeat'] for test in tests)
+    if repeats:
+        print(f"🔁 {repeats} more already flagged at the previous upload")
+    for test in sorted(flagged, key=lambda t: abs(t['change_percent']), reverse=True):
+        symbol = "📉" if test['change_percent'] > 0 else "📈"
+        print(f"{symbol} {test['operation_name']}: {test['change_percent']:+.2f}% "
+              f"(q={test['q_value']:.2g}, g={test['hedges_g']:.1f}, noise ±{test['noise_percent']:.1f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Single-Session Performance Measurement
+
+Measures every registered eltwise test inside one Python process instead of
+one ttperf process per run. The session opens the device once, runs each test
+several times in sequence and brackets every sample with tracy signposts. The
+per-op kernel durations are then read from the single ops_perf_results CSV that
+the profiler writes at the end, and saved with the same schema as
+PerfMeasurement.save_results.
+
+Usage:
+    python single_session_perf.py [--samples N] [--warmup N] [--chains [NAME ...]]
+                                  [--trace-replays N] [--memory] [--order STRATEGY] [--upload]
+    python perf_measurement_script.py --single-session
+"""
+
+import csv
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+from perf_measurement_script import PerfMeasurement, GITHUB_AVAILABLE
+from op_ordering import ORDERING_STRATEGIES, DEFAULT_ORDERING
+from results_format import RESULT_FORMATS, DEFAULT_FORMAT
+from profiler_breakdown import (
+    read_op_row, build_breakdown, find_device_log, merge_op_cores, parse_device_log,
+)
+
+KERNEL_DURATION_COLUMN = "DEVICE KERNEL DURATION [ns]"
+OP_TO_OP_COLUMN = "OP TO OP LATENCY [ns]"
+MARKER_START = "perf_start"
+MARKER_END = "perf_end"
+MARKER_SEP = "|"
+STATUS_FILENAME = "session_status.json"
+
+
+def make_marker(kind: str, test_name: str, sample: int) -> str:
+    """Build the signpost header that brackets one sample of a test."""
+    return MARKER_SEP.join([kind, test_name, str(sample)])
+
+
+def parse_marker(header: str) -> Optional[tuple]:
+    """Split a signpost header into (kind, test_name, sample), or None if foreign."""
+    parts = header.strip().split(MARKER_SEP)
+    if len(parts) != 3 or parts[0] not in (MARKER_START, MARKER_END):
+        return None
+    try:
+        return parts[0], parts[1], int(parts[2])
+    except ValueError:
+        return None
+
+
+def _float_column(row: Dict[str, str], column: str) -> float:
+    """Read a numeric profiler column, treating blanks as zero."""
+    value = (row.get(column) or '').strip()
+    return float(value) if value else 0.0
+
+
+def parse_marked_op_rows(csv_path: str) -> Dict[str, List[List[Dict[str, float]]]]:
+    """Collect the device ops recorded between start/end signposts in an ops perf CSV.
+
+    Returns, per marker name, one list per sample holding a dict with the
+    kernel_ns and op_to_op_ns of every op in that sample, plus the per-RISC
+    columns read by profiler_breakdown.read_op_row. A sample whose end
+    marker is missing (the test raised) is dropped.
+    """
+    samples: Dict[str, List[List[Dict[str, float]]]] = {}
+    current = None
+    ops: List[Dict[str, float]] = []
+
+    with open(csv_path, newline='') as f:
+        for row in csv.DictReader(f):
+            if row.get('OP TYPE', '').strip() == 'signpost':
+                marker = parse_marker(row.get('OP CODE', ''))
+                if marker is None:
+                    continue
+                kind, name, sample = marker
+                if kind == MARKER_START:
+                    current = (name, sample)
+                    ops = []
+                elif current == (name, sample):
+                    samples.setdefault(name, []).append(ops)
+                    current = None
+                continue
+
+            if current is not None and (row.get(KERNEL_DURATION_COLUMN) or '').strip():
+                op = read_op_row(row)
+                op['kernel_ns'] = _float_column(row, KERNEL_DURATION_COLUMN)
+                op['op_to_op_ns'] = _float_column(row, OP_TO_OP_COLUMN)
+                ops.append(op)
+
+    return samples
+
+
+def parse_marked_kernel_durations(csv_path: str) -> Dict[str, List[float]]:
+    """Sum device kernel durations between start/end signposts in an ops perf CSV.
+
+    Returns per-test lists of sample durations in ns.
+    """
+    return {
+        name: [sum(op['kernel_ns'] for op in ops) for ops in sample_ops]
+        for name, sample_ops in parse_marked_op_rows(csv_path).items()
+    }
+
+
+def find_ops_perf_csv(output_dir: str) -> Optional[str]:
+    """Find the newest ops_perf_results CSV written by the profiler."""
+    pattern = os.path.join(output_dir, '**', 'ops_perf_results_*.csv')
+    candidates = glob.glob(pattern, recursive=True)
+    if not candidates:
+        return None
+    return max(candidates, key=os.path.getmtime)
+
+
+def run_session_worker(tests_file: str, samples: int, warmup: int, status_path: str,
+                       chains_file: Optional[str] = None, trace_replays: int = 0,
+                       memory: bool = False):
+    """Execute all tests (and optional chains, trace replays and memory probes) on one device."""
+    import ttnn
+    from tracy import signpost
+    from test_eltwise_operations import TestEltwiseOperations
+
+    with open(tests_file, 'r') as f:
+        test_names = json.load(f)
+    chain_names = None
+    if chains_file:
+        with open(chains_file, 'r') as f:
+            chain_names = json.load(f)
+
+    suite = TestEltwiseOperations()
+    failed = {}
+    trace_host_times = {}
+    memory_footprints = {}
+    timings = {}
+    session_start = time.time()
+    if trace_replays:
+        from trace_measurement import TRACE_REGION_SIZE
+        device = ttnn.open_device(device_id=0, trace_region_size=TRACE_REGION_SIZE)
+    else:
+        device = ttnn.open_device(device_id=0)
+    try:
+        for i, test_name in enumerate(test_names, 1):
+            test_method = getattr(suite, test_name)
+            print(f"🔄 [{i}/{len(test_names)}] {test_name}", flush=True)
+            call_times = []
+            try:
+                for _ in range(warmup):
+                    call_start = time.time()
+                    test_method(device)
+                    call_times.append(time.time() - call_start)
+                for sample in range(samples):
+                    call_start = time.time()
+                    signpost(header=make_marker(MARKER_START, test_name, sample))
+                    test_method(device)
+                    ttnn.synchronize_device(device)
+                    signpost(header=make_marker(MARKER_END, test_name, sample))
+                    call_times.append(time.time() - call_start)
+            except Exception as e:
+                failed[test_name] = str(e)[:200]
+                print(f"    ❌ {test_name} failed: {failed[test_name]}", flush=True)
+            if call_times:
+                # The first call pays for program compile unless the kernel was already cached
+                timings[test_name] = {
+                    'first_call_s': call_times[0],
+                    'steady_call_s': statistics.mean(call_times[1:]) if len(call_times) > 1 else None,
+                }
+            # Drain the device-side profiler buffers so long sessions do not overflow them
+            ttnn.ReadDeviceProfiler(device)
+
+        if chain_names is not None:
+            from op_chains import get_chains, run_chain_benchmarks
+            run_chain_benchmarks(device, get_chains(chain_names), samples, warmup, failed)
+
+        if trace_replays:
+            from trace_measurement import run_trace_benchmarks
+            trace_host_times = run_trace_benchmarks(ttnn, device, test_names, samples,
+                                                    trace_replays, failed, signpost=signpost)
+
+        if memory:
+            from memory_footprint import run_memory_benchmarks
+            memory_footprints = run_memory_benchmarks(ttnn, device, test_names, samples, failed)
+    finally:
+        ttnn.close_device(device)
+        with open(status_path, 'w') as f:
+            json.dump({'failed': failed, 'trace_host_times': trace_host_times,
+                       'memory_footprints': memory_footprints, 'timings': timings,
+                       'wall_time_s': time.time() - session_start}, f, indent=2)
+
+
+class SingleSessionPerfMeasurement(PerfMeasurement):
+    """PerfMeasurement that runs every test in one profiled Python session."""
+
+    def __init__(self, rerun_mode=False, auto_upload=False, samples=3, warmup=0,
+                 session_timeout=3600, chains: Optional[List[str]] = None,
+                 trace_replays: int = 0, memory: bool = False, ordering=DEFAULT_ORDERING,
+                 result_format=DEFAULT_FORMAT):
+        super().__init__(rerun_mode=rerun_mode, auto_upload=auto_upload, ordering=ordering,
+                         result_format=result_format)
+        self.samples = samples
+        self.warmup = warmup
+        # None disables op-chain benchmarks; an empty list runs every chain
+        self.chains = chains
+        # 0 disables trace capture/replay measurement
+        self.trace_replays = trace_replays
+        self.memory = memory
+        self.session_timeout = session_timeout
+        self.output_dir = f"profiler_session_{self.start_time.strftime('%Y%m%d_%H%M%S')}"
+
+    def run_profiled_session(self, tests_to_run: List[str]) -> Optional[str]:
+        """Run the worker under tracy and return the resulting ops perf CSV path."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        tests_file = os.path.join(self.output_dir, 'tests.json')
+        with open(tests_file, 'w') as f:
+            json.dump(tests_to_run, f)
+
+        cmd = [
+            sys.executable, "-m", "tracy", "-r", "-p", "-o", self.output_dir,
+            os.path.abspath(__file__), "--worker",
+            "--tests-file", tests_file,
+            "--samples", str(self.samples),
+            "--warmup", str(self.warmup),
+            "--status", os.path.join(self.output_dir, STATUS_FILENAME),
+        ]
+        if self.chains is not None:
+            chains_file = os.path.join(self.output_dir, 'chains.json')
+            with open(chains_file, 'w') as f:
+                json.dump(self.chains, f)
+            cmd += ["--chains-file", chains_file]
+        if self.trace_replays:
+            cmd += ["--trace-replays", str(self.trace_replays)]
+        if self.memory:
+            cmd += ["--memory"]
+        print(f"🚀 Running: {' '.join(cmd)}")
+
+        try:
+            result = subprocess.run(cmd, timeout=self.session_timeout)
+            if result.returncode != 0:
+                print(f"⚠️ Profiled session exited with return code {result.returncode}")
+        except subprocess.TimeoutExpired:
+            print(f"⏰ Profiled session timed out after {self.format_duration(self.session_timeout)}")
+            return None
+
+        csv_path = find_ops_perf_csv(self.output_dir)
+        if csv_path is None:
+            print(f"❌ No ops_perf_results CSV found under {self.output_dir}")
+        return csv_path
+
+    def load_session_status(self) -> Dict:
+        """Load the per-test failures and side measurements recorded by the worker."""
+        status_path = os.path.join(self.output_dir, STATUS_FILENAME)
+        try:
+            with open(status_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not read session status: {e}")
+            return {}
+
+    def measure_tests(self, tests_to_run: List[str]):
+        """Measure all tests in one profiled session and record per-test results."""
+        print(f"🧪 Single-session mode: {self.samples} samples per test"
+              + (f", {self.warmup} warmup" if self.warmup else ""))
+
+        session_start = time.time()
+        csv_path = self.run_profiled_session(tests_to_run)
+        op_rows = parse_marked_op_rows(csv_path) if csv_path else {}
+        durations = {name: [sum(op['kernel_ns'] for op in ops) for ops in sample_ops]
+                     for name, sample_ops in op_rows.items()}
+        status = self.load_session_status()
+        failures = status.get('failed', {})
+        self.test_completion_times.append((time.time() - session_start) / max(len(tests_to_run), 1))
+
+        device_ops = self.load_device_ops()
+
+        for test_name in tests_to_run:
+            test_durations = durations.get(test_name, [])
+            # A test that raised partway keeps the samples before it; its result is incomplete
+            if test_durations and test_name not in failures and len(test_durations) >= self.samples:
+                result = self.build_result(test_name, test_durations)
+                # Break down the last sample, which runs with the warmest caches
+                last_sample = op_rows[test_name][-1]
+                op_ids = [op['op_id'] for op in last_sample if op['op_id'] is not None]
+                breakdown = build_breakdown(last_sample, merge_op_cores(op_ids, device_ops) or None)
+                if breakdown:
+                    result['breakdown'] = breakdown
+                print(f"  ✅ {test_name}: {result['average_duration_ns']:.2f} ns "
+                      f"(±{result['std_deviation_ns']:.2f}) from {len(test_durations)} samples")
+                self.record_result(result)
+                if test_name in self.failed_tests:
+                    self.failed_tests.remove(test_name)
+            else:
+                reason = failures.get(test_name, 'missing marked kernel durations')
+                if test_durations:
+                    reason += f" ({len(test_durations)} of {self.samples} samples recorded)"
+                print(f"  ❌ {test_name}: {reason}")
+                if test_name not in self.failed_tests:
+                    self.failed_tests.append(test_name)
+
+        if self.chains is not None:
+            self.record_chain_results(op_rows, failures)
+        if self.trace_replays:
+            self.record_trace_results(op_rows, status.get('trace_host_times', {}))
+        if self.memory:
+            self.record_memory_results(status.get('memory_footprints', {}))
+
+    def load_device_ops(self) -> Dict[int, Dict[str, Dict[str, float]]]:
+        """Per-core kernel durations from the session's device log, if it was kept."""
+        log_path = find_device_log(self.output_dir)
+        if log_path is None:
+            return {}
+        try:
+            return parse_device_log(log_path)
+        except Exception as e:
+            print(f"⚠️ Warning: Could not parse device log {log_path}: {e}")
+            return {}
+
+    def record_memory_results(self, memory_footprints: Dict[str, Dict[str, int]]):
+        """Store the memory footprint next to the duration of every probed test."""
+        recorded = 0
+        for result in self.results:
+            footprint = memory_footprints.get(result['test_name'])
+            if footprint:
+                result.update(footprint)
+                recorded += 1
+        print(f"\n💾 Memory footprint recorded for {recorded} tests")
+
+    def record_trace_results(self, op_rows: Dict[str, List[List[Dict[str, float]]]],
+                             trace_host_times: Dict[str, List[float]]):
+        """Add trace replay fields to the eager result of every traced test."""
+        from trace_measurement import build_trace_fields, trace_marker_name
+
+        print(f"\n🎞️ Trace replay ({self.trace_replays} iterations per sample):")
+        for result in self.results:
+            test_name = result['test_name']
+            host_times = trace_host_times.get(test_name)
+            if not host_times:
+                continue
+            device_totals = [sum(op['kernel_ns'] for op in ops)
+                             for ops in op_rows.get(trace_marker_name(test_name), [])]
+            result.update(build_trace_fields(host_times, device_totals, self.trace_replays))
+            device_time = result['trace_device_time_ns']
+            device_text = f"{device_time:.2f} ns" if device_time is not None else "n/a"
+            print(f"  ✅ {test_name}: device {device_text}/iter, "
+                  f"host {result['trace_host_time_ns']:.2f} ns/iter")
+
+    def record_chain_results(self, op_rows: Dict[str, List[List[Dict[str, float]]]],
+                             failures: Dict[str, str]):
+        """Build op-chain results from the session's profiler rows."""
+        from op_chains import get_chains, build_chain_result
+
+        print(f"\n🔗 Op chains:")
+        self.chain_results = []
+        for chain in get_chains(self.chains):
+            result = build_chain_result(chain, op_rows)
+            if result is None:
+                reason = failures.get(chain.marker_name, 'no marked kernel durations')
+                print(f"  ❌ {chain.name}: {reason}")
+                continue
+            ratio = result['chain_overhead_ratio']
+            ratio_text = f"{ratio:.2f}x" if ratio is not None else "n/a"
+            print(f"  ✅ {chain.name}: {result['average_duration_ns']:.2f} ns "
+                  f"vs {result['component_sum_ns']:.2f} ns standalone (overhead {ratio_text})")
+            self.chain_results.append(result)
+
+
+def main():
+    """Entry point for both the orchestrator and the profiled worker."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Single-session TTNN eltwise performance measurement')
+    parser.add_argument('--samples', type=int, default=3, help='Measured samples per test')
+    parser.add_argument('--warmup', type=int, default=0, help='Unmeasured warmup runs per test')
+    parser.add_argument('--rerun', action='store_true',
+                        help='Skip tests that already passed today and run only missing/failed tests')
+    parser.add_argument('--upload', action='store_true',
+                        help='Automatically upload results to the database after completion')
+    parser.add_argument('--chains', nargs='*', metavar='CHAIN',
+                        help='Also benchmark op chains (all registered chains if none are named)')
+    parser.add_argument('--trace-replays', type=int, default=0, metavar='N',
+                        help='Also capture each op into a trace and replay it N times per sample')
+    parser.add_argument('--memory', action='store_true',
+                        help='Also record peak L1/DRAM allocation and buffer count per op')
+    parser.add_argument('--order', choices=ORDERING_STRATEGIES, default=DEFAULT_ORDERING,
+                        help='Test ordering strategy; grouped improves program-cache reuse')
+    parser.add_argument('--format', choices=RESULT_FORMATS, default=DEFAULT_FORMAT,
+                        help='Results file format (default: legacy)')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--chains-file', help=argparse.SUPPRESS)
+    parser.add_argument('--tests-file', help=argparse.SUPPRESS)
+    parser.add_argument('--status', help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker:
+        run_session_worker(args.tests_file, args.samples, args.warmup, args.status,
+                           chains_file=args.chains_file, trace_replays=args.trace_replays,
+                           memory=args.memory)
+        return
+
+    print("🎯 TTNN Eltwise Operations Performance Measurement (single session)")
+    print("=" * 50)
+    if args.upload and not GITHUB_AVAILABLE:
+        print("⚠️ Auto-upload: Disabled (push_to_github.py not found)")
+
+    perf = SingleSessionPerfMeasurement(rerun_mode=args.rerun, auto_upload=args.upload,
+                                        samples=args.samples, warmup=args.warmup,
+                                        chains=args.chains, trace_replays=args.trace_replays,
+                                        memory=args.memory, ordering=args.order,
+                                        result_format=args.format)
+    perf.run_all_measurements()
+
+
+if __name__ == "__main__":
+    main()
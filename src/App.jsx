@@ -7,7 +7,9 @@ import {
   loadPerformanceData, 
   processOperationData, 
   calculateSummaryStats, 
-  compareDailyData
+  compareDailyData,
+  fetchResultsFile,
+  getIndexFiles
 } from './utils/dataLoader';
 
 function App() {
@@ -52,13 +54,12 @@ function App() {
     
     try {
       // Load ALL remaining data in one go
-      const remainingFiles = data.index.files.slice(startIndex, totalToLoad);
+      const remainingFiles = await getIndexFiles(data.index, startIndex, totalToLoad);
       
       const allNewData = await Promise.all(
         remainingFiles.map(async (file) => {
           try {
-            const response = await fetch(`${import.meta.env.BASE_URL}${file.path}`);
-            const fileData = await response.json();
+            const fileData = await fetchResultsFile(file);
             return {
               ...fileData,
               filename: file.filename,
@@ -202,7 +203,7 @@ function App() {
             <h2 className="text-2xl font-bold text-gray-900 mb-2">Performance Overview</h2>
             <p className="text-gray-600">Key metrics and trends for TTNN eltwise operations</p>
           </div>
-          <OverviewCards summaryStats={summaryStats} dailyComparison={dailyComparison} />
+          <OverviewCards summaryStats={summaryStats} dailyComparison={dailyComparison} attribution={data?.attribution} />
         </section>
 
         {/* Performance Table Section */}
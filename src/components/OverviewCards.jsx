@@ -1,5 +1,5 @@
 import React from 'react';
-import { GitBranch, Zap, Activity, Cpu, Settings, Database, Info } from 'lucide-react';
+import { GitBranch, Zap, Activity, Cpu, Settings, Database, Info, Search } from 'lucide-react';
 
 const TestConfigBanner = ({ summaryStats }) => {
   return (
@@ -80,8 +80,73 @@ const TestConfigBanner = ({ summaryStats }) => {
   );
 };
 
-const OverviewCards = ({ summaryStats, dailyComparison }) => {
-  return <TestConfigBanner summaryStats={summaryStats} />;
+const TT_METAL_URL = 'https://github.com/tenstorrent/tt-metal';
+
+const AttributionCard = ({ attribution }) => {
+  if (!attribution?.ranges?.length) return null;
+
+  return (
+    <div className="glass-card mb-8 border-l-4 border-amber-500">
+      <div className="flex items-center gap-2 mb-4">
+        <div className="bg-amber-100 p-2 rounded-lg">
+          <Search className="h-5 w-5 text-amber-600" />
+        </div>
+        <div>
+          <h3 className="text-sm font-semibold text-gray-700">Latest Change Attribution</h3>
+          <p className="text-xs text-gray-500">
+            Commit ranges of the changes measured {new Date(attribution.measurement_date).toLocaleDateString()}
+          </p>
+        </div>
+      </div>
+
+      <div className="space-y-4">
+        {attribution.ranges.map((range) => (
+          <div key={`${range.good_commit}-${range.bad_commit}`} className="text-sm">
+            <p className="text-gray-900">
+              <span className="font-semibold">{range.events.length} op(s)</span>
+              <span className="text-gray-500"> ({range.events.slice(0, 6).map(e => e.operation_name).join(', ')}
+                {range.events.length > 6 ? ', …' : ''})</span>
+              {' '}
+              {range.compare_url ? (
+                <a href={range.compare_url} className="font-mono text-blue-600 hover:underline" target="_blank" rel="noreferrer">
+                  {range.good_commit.substring(0, 8)}..{range.bad_commit.substring(0, 8)}
+                </a>
+              ) : (
+                <span className="font-mono text-gray-700">{range.bad_commit.substring(0, 8)}</span>
+              )}
+              {range.commit_count !== undefined && (
+                <span className="text-xs text-gray-500 ml-1">
+                  ({range.commit_count} commits, {range.relevant_commits.length} eltwise/SFPU)
+                </span>
+              )}
+            </p>
+            {range.suspects?.length > 0 && (
+              <ol className="list-decimal ml-6 mt-1 text-xs text-gray-700">
+                {range.suspects.map((suspect) => (
+                  <li key={suspect.sha}>
+                    <a href={`${TT_METAL_URL}/commit/${suspect.sha}`} className="font-mono text-blue-600 hover:underline"
+                       target="_blank" rel="noreferrer">
+                      {suspect.sha.substring(0, 8)}
+                    </a>{' '}
+                    {suspect.subject}
+                  </li>
+                ))}
+              </ol>
+            )}
+          </div>
+        ))}
+      </div>
+    </div>
+  );
+};
+
+const OverviewCards = ({ summaryStats, dailyComparison, attribution }) => {
+  return (
+    <>
+      <TestConfigBanner summaryStats={summaryStats} />
+      <AttributionCard attribution={attribution} />
+    </>
+  );
 };
 
 export default OverviewCards; 
\ No newline at end of file
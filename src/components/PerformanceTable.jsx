@@ -241,7 +241,10 @@ const PerformanceTable = ({ operations, dailyData, loadingAll, onLoadAllData, ha
           operationData.dailyPerformance[dateKey] = {
             duration_ns: operation.average_duration_ns,
             successful_runs: operation.successful_runs,
-            test_name: operation.test_name
+            test_name: operation.test_name,
+            peak_l1_bytes: operation.peak_l1_bytes,
+            peak_dram_bytes: operation.peak_dram_bytes,
+            buffers_allocated: operation.buffers_allocated
           };
         } else {
           operationData.dailyPerformance[dateKey] = null;
@@ -874,6 +877,18 @@ const PerformanceTable = ({ operations, dailyData, loadingAll, onLoadAllData, ha
                 : null
             })).filter(d => d.value !== null);
 
+            // Memory footprint is only recorded by runs with --memory
+            const memoryData = displayedDateColumns.map(dateObj => {
+              const day = operation.dailyPerformance[dateObj.date];
+              return {
+                date: dateObj.date,
+                commitId: dateObj.commitId,
+                l1: day?.peak_l1_bytes != null ? day.peak_l1_bytes / 1024 : null,
+                dram: day?.peak_dram_bytes != null ? day.peak_dram_bytes / 1024 : null,
+                buffers: day?.buffers_allocated ?? null
+              };
+            }).filter(d => d.l1 !== null || d.dram !== null);
+
             return (
               <div key={operation.operation_name} className="bg-white border border-gray-200 rounded-lg p-4">
                 <div className="flex items-center justify-between mb-4">
@@ -897,6 +912,25 @@ const PerformanceTable = ({ operations, dailyData, loadingAll, onLoadAllData, ha
                     <Line type="monotone" dataKey="value" stroke="#3b82f6" strokeWidth={2} dot={{ r: 3 }} />
                   </LineChart>
                 </ResponsiveContainer>
+                {memoryData.length > 0 && (
+                  <ResponsiveContainer width="100%" height={160}>
+                    <LineChart data={memoryData}>
+                      <CartesianGrid strokeDasharray="3 3" />
+                      <XAxis dataKey="date" tick={{ fontSize: 12 }} />
+                      <YAxis tick={{ fontSize: 12 }} label={{ value: 'KB', angle: -90, position: 'insideLeft' }} />
+                      <Tooltip
+                        formatter={(value, name) => [`${value.toFixed(1)} KB`, name]}
+                        labelFormatter={(label) => {
+                          const dataPoint = memoryData.find(d => d.date === label);
+                          return `${label} (${dataPoint?.commitId || 'N/A'}) • ${dataPoint?.buffers ?? 'N/A'} buffers`;
+                        }}
+                      />
+                      <Legend />
+                      <Line type="monotone" dataKey="l1" name="Peak L1" stroke="#10b981" strokeWidth={2} dot={{ r: 2 }} />
+                      <Line type="monotone" dataKey="dram" name="Peak DRAM" stroke="#f59e0b" strokeWidth={2} dot={{ r: 2 }} />
+                    </LineChart>
+                  </ResponsiveContainer>
+                )}
               </div>
             );
           })}
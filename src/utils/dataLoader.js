@@ -6,25 +6,134 @@ const LOAD_MORE_INCREMENT = 20;
 const BACKGROUND_LOAD_BATCH_SIZE = 10; // Load 10 files at a time in background
 const BACKGROUND_LOAD_DELAY = 1000; // Wait 1 second between batches
 
+// Results files come in two layouts: legacy (results is a list of rows) and
+// compact schema 2 (results is a dict of per-field arrays). Convert compact
+// files to rows so the rest of the dashboard only sees the legacy layout.
+export function normalizeResults(data) {
+  const columns = data?.results;
+  if (!columns || Array.isArray(columns)) return data;
+
+  const fields = Object.keys(columns);
+  const count = Math.max(0, ...fields.map(field => columns[field].length));
+  const results = [];
+  for (let i = 0; i < count; i++) {
+    const row = {};
+    fields.forEach(field => {
+      const value = columns[field][i];
+      if (value !== null && value !== undefined) row[field] = value;
+    });
+    results.push(row);
+  }
+  return { ...data, results };
+}
+
+// Deployed builds carry data/manifest.json (data_artifacts.py), mapping data
+// paths to content-hashed copies with precompressed siblings. Without it (dev
+// server, GitHub Pages) the plain data files are fetched.
+let manifestPromise = null;
+
+function fetchManifest() {
+  if (!manifestPromise) {
+    manifestPromise = fetch(`${import.meta.env.BASE_URL}data/manifest.json`)
+      .then(response => (response.ok ? response.json() : null))
+      .catch(() => null);
+  }
+  return manifestPromise;
+}
+
+async function dataUrl(path) {
+  const manifest = await fetchManifest();
+  if (!manifest?.files) return `${import.meta.env.BASE_URL}${path}`;
+  return `${import.meta.env.BASE_URL}${manifest.files[path] || path}${manifest.suffix || ''}`;
+}
+
+// Old runs are compacted into monthly packs (data/packs/YYYY-MM.jsonl, one
+// results file per line). Each pack is fetched once and shared by its entries.
+const packCache = new Map();
+
+function fetchPackLines(url) {
+  if (!packCache.has(url)) {
+    packCache.set(url, fetch(url).then(response => response.text()).then(text => text.split('\n')));
+  }
+  return packCache.get(url);
+}
+
+// The index is split into monthly shards (data/index/YYYY-MM.json) plus a
+// head (data/index/head.json) with the latest entries and a pointer per shard.
+// Startup only needs the head; shards are fetched when older entries are asked for.
+const shardCache = new Map();
+
+async function fetchIndexHead() {
+  const headResponse = await fetch(await dataUrl('data/index/head.json'));
+  if (headResponse.ok) return headResponse.json();
+
+  // Unsharded archive: the legacy index.json lists everything
+  const indexResponse = await fetch(await dataUrl('data/index.json'));
+  const indexData = await indexResponse.json();
+  return { ...indexData, total_measurements: indexData.files.length, shards: [] };
+}
+
+function fetchIndexShard(shard) {
+  if (!shardCache.has(shard.path)) {
+    shardCache.set(shard.path, dataUrl(shard.path)
+      .then(url => fetch(url))
+      .then(response => response.json())
+      .then(data => data.files));
+  }
+  return shardCache.get(shard.path);
+}
+
+// Index entries [start, end), newest first, fetching only the shards needed
+export async function getIndexFiles(indexData, start, end) {
+  if (end <= indexData.files.length || !indexData.shards?.length) {
+    return indexData.files.slice(start, end);
+  }
+  const files = [];
+  for (const shard of indexData.shards) {
+    if (files.length >= end) break;
+    files.push(...await fetchIndexShard(shard));
+  }
+  return files.slice(start, end);
+}
+
+// Load the results an index entry refers to, whether a daily file or a packed entry
+export async function fetchResultsFile(file) {
+  const url = await dataUrl(file.path);
+  if (file.pack_line !== undefined) {
+    const lines = await fetchPackLines(url);
+    return normalizeResults(JSON.parse(lines[file.pack_line]));
+  }
+  const response = await fetch(url);
+  return normalizeResults(await response.json());
+}
+
+// Commit ranges and suspect commits of the latest changes; optional
+export async function fetchAttribution() {
+  try {
+    const response = await fetch(await dataUrl('data/timeline/attribution.json'));
+    if (!response.ok) return null;
+    return await response.json();
+  } catch (error) {
+    return null;
+  }
+}
+
 export async function loadPerformanceData(limit = INITIAL_DAILY_FILES) {
-  const base = import.meta.env.BASE_URL;
   try {
-    // Load the index file to get available data files
-    const indexResponse = await fetch(`${base}data/index.json`);
-    const indexData = await indexResponse.json();
+    // Load the index head to get the most recent data files
+    const indexData = await fetchIndexHead();
     
     // Load the latest results
-    const latestResponse = await fetch(`${base}data/latest/latest_results.json`);
-    const latestData = await latestResponse.json();
+    const latestResponse = await fetch(await dataUrl('data/latest/latest_results.json'));
+    const latestData = normalizeResults(await latestResponse.json());
     
     // Only load the most recent N daily data files (instead of all 563!)
-    const recentFiles = indexData.files.slice(0, limit);
+    const recentFiles = await getIndexFiles(indexData, 0, limit);
     
     const dailyData = await Promise.all(
       recentFiles.map(async (file) => {
         try {
-          const response = await fetch(`${base}${file.path}`);
-          const data = await response.json();
+          const data = await fetchResultsFile(file);
           return {
             ...data,
             filename: file.filename,
@@ -44,7 +153,8 @@ export async function loadPerformanceData(limit = INITIAL_DAILY_FILES) {
       index: indexData,
       latest: latestData,
       daily: validDailyData,
-      totalAvailable: indexData.files.length,
+      attribution: await fetchAttribution(),
+      totalAvailable: indexData.total_measurements,
       currentlyLoaded: validDailyData.length
     };
   } catch (error) {
@@ -55,8 +165,7 @@ export async function loadPerformanceData(limit = INITIAL_DAILY_FILES) {
 
 // Load additional data in the background
 export async function loadAdditionalData(indexData, currentData, startIndex, batchSize) {
-  const base = import.meta.env.BASE_URL;
-  const filesToLoad = indexData.files.slice(startIndex, startIndex + batchSize);
+  const filesToLoad = await getIndexFiles(indexData, startIndex, startIndex + batchSize);
   
   if (filesToLoad.length === 0) {
     return [];
@@ -65,8 +174,7 @@ export async function loadAdditionalData(indexData, currentData, startIndex, bat
   const newDailyData = await Promise.all(
     filesToLoad.map(async (file) => {
       try {
-        const response = await fetch(`${base}${file.path}`);
-        const data = await response.json();
+        const data = await fetchResultsFile(file);
         return {
           ...data,
           filename: file.filename,
@@ -124,14 +232,69 @@ export function calculateSummaryStats(data) {
   };
 }
 
+// Per-commit view (mirrors commit_view.py): consecutive measurements of the
+// same commit are pooled into one entry per commit, oldest first. Each op gets
+// the pooled run count, mean, standard deviation, min/max and the number of
+// replicates that measured it.
+function poolResults(results) {
+  const measured = results.filter(r => r.average_duration_ns != null && r.successful_runs);
+  const newest = { ...results[results.length - 1] };
+  if (measured.length === 0) return newest;
+
+  const total = measured.reduce((sum, r) => sum + r.successful_runs, 0);
+  const mean = measured.reduce((sum, r) => sum + r.average_duration_ns * r.successful_runs, 0) / total;
+  const squares = measured.reduce((sum, r) => sum + (r.successful_runs - 1) * (r.std_deviation_ns || 0) ** 2
+    + r.successful_runs * (r.average_duration_ns - mean) ** 2, 0);
+  return {
+    ...newest,
+    successful_runs: total,
+    average_duration_ns: mean,
+    std_deviation_ns: total > 1 ? Math.sqrt(squares / (total - 1)) : 0,
+    min_duration_ns: Math.min(...measured.map(r => r.min_duration_ns ?? r.average_duration_ns)),
+    max_duration_ns: Math.max(...measured.map(r => r.max_duration_ns ?? r.average_duration_ns)),
+    runs: measured.flatMap(r => r.runs || []),
+    replicates: measured.length
+  };
+}
+
+export function poolByCommit(dailyData) {
+  const sortedData = [...dailyData].sort((a, b) =>
+    new Date(a.metadata.measurement_date) - new Date(b.metadata.measurement_date));
+
+  const groups = [];
+  sortedData.forEach(entry => {
+    const last = groups[groups.length - 1];
+    if (last && last[0].metadata.git_commit_id === entry.metadata.git_commit_id) {
+      last.push(entry);
+    } else {
+      groups.push([entry]);
+    }
+  });
+
+  return groups.map(group => {
+    const perOp = new Map();
+    group.forEach(entry => (entry.results || []).forEach(result => {
+      if (!perOp.has(result.operation_name)) perOp.set(result.operation_name, []);
+      perOp.get(result.operation_name).push(result);
+    }));
+    const newest = group[group.length - 1];
+    return {
+      ...newest,
+      metadata: { ...newest.metadata, replicates: group.length },
+      results: [...perOp.values()].map(poolResults)
+    };
+  });
+}
+
 export function compareDailyData(dailyData) {
   if (!dailyData || dailyData.length < 2) return null;
   
-  const sortedData = [...dailyData].sort((a, b) => 
-    new Date(a.metadata.measurement_date) - new Date(b.metadata.measurement_date));
+  // Compare the latest two commits, with replicate runs pooled
+  const commits = poolByCommit(dailyData);
+  if (commits.length < 2) return null;
   
-  const latest = sortedData[sortedData.length - 1];
-  const previous = sortedData[sortedData.length - 2];
+  const latest = commits[commits.length - 1];
+  const previous = commits[commits.length - 2];
   
   const latestAvg = calculateAveragePerformance(latest.results);
   const previousAvg = calculateAveragePerformance(previous.results);
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Tests for the parallel archive ingest."""
+
+import json
+
+import pytest
+
+from archive_ingest import backfill, iter_archive, validate_results
+from history_store import HistoryStore
+from op_series import SERIES_DIR, OpSeriesStore
+
+
+@pytest.fixture
+def archive(tmp_path, results_file):
+    daily = tmp_path / "daily"
+    daily.mkdir()
+    files = {
+        "b.json": json.dumps(results_file("2025-01-02T00:00:00", "2025-01-02", {'abs': 20.0})),
+        "a.json": json.dumps(results_file("2025-01-01T00:00:00", "2025-01-01", {'abs': 10.0})),
+        "broken.json": "{not json",
+        "empty.json": json.dumps({'metadata': {}}),
+    }
+    entries = []
+    for i, (name, content) in enumerate(files.items()):
+        (daily / name).write_text(content)
+        entries.append({'filename': name, 'path': f"data/daily/{name}",
+                        'measurement_date': f"2025-01-0{i + 1}T00:00:00"})
+    (tmp_path / "index.json").write_text(json.dumps({'files': entries}))
+    return tmp_path
+
+
+def test_validate_results_reports_problems(results_file):
+    assert validate_results(results_file("2025-01-01T00:00:00", "2025-01-01", {'abs': 1.0})) == []
+    assert validate_results({'metadata': {}, 'results': [{'average_duration_ns': 'x'}]}) == [
+        "missing metadata.measurement_date", "results[0] has no operation_name"]
+    assert validate_results([]) == ["top level is not an object"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_archive_skips_invalid_files(archive, workers):
+    invalid = {}
+
+    loaded = list(iter_archive(archive, workers, progress=False, invalid=invalid))
+
+    assert sorted(name for name, _ in loaded) == ["a.json", "b.json"]
+    assert sorted(invalid) == ["broken.json", "empty.json"]
+
+
+def test_backfill_rebuilds_selected_stores(archive, history_store_path):
+    assert backfill(archive, ['store', 'series'], workers=1) == 2
+
+    assert HistoryStore.load(history_store_path).series('abs')[1].tolist() == [10.0, 20.0]
+    assert OpSeriesStore(archive / SERIES_DIR).series('abs')['mean'].tolist() == [10.0, 20.0]
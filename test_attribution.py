@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for commit-range attribution."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from attribution import (TIMELINE_EVENTS_PATH, attribute, describe_attribution, last_measured_commit,
+                         latest_attribution, ordered_commits, path_weight, previous_commit, score_commit)
+from index_store import save_index
+
+
+def entry(date, commit):
+    return {'filename': f"{date[:10]}_{commit}.json", 'path': f"data/daily/{date[:10]}_{commit}.json",
+            'measurement_date': date, 'git_commit_id': commit}
+
+
+def test_ordered_commits_collapse_replicates(tmp_path):
+    save_index(tmp_path, [entry("2025-08-04T00:00:00", "c3"), entry("2025-08-03T00:00:00", "c2"),
+                          entry("2025-08-02T00:00:00", "c2"), entry("2025-08-01T00:00:00", "c1")])
+
+    commits = ordered_commits(tmp_path)
+
+    assert commits == ["c1", "c2", "c3"]
+    assert previous_commit(commits, "c3") == "c2"
+    assert previous_commit(commits, "c1") is None
+
+
+def test_latest_attribution_follows_the_latest_measurement(tmp_path):
+    def event(date, commit, previous, op):
+        return {'date': date, 'commit': commit, 'previous_commit': previous, 'operation_name': op,
+                'change_type': 'regression', 'change_percent': 30.0}
+
+    (tmp_path / TIMELINE_EVENTS_PATH).parent.mkdir(parents=True)
+    (tmp_path / TIMELINE_EVENTS_PATH).write_text(json.dumps({'events': [
+        event("2025-08-02T00:00:00", "c2", "c1", "exp"), event("2025-08-02T00:00:00", "c2", "c1", "abs")]}))
+    save_index(tmp_path, [entry("2025-08-02T00:00:00", "c2"), entry("2025-08-01T00:00:00", "c1")])
+
+    (changed,) = latest_attribution(tmp_path)['ranges']
+    assert (changed['good_commit'], changed['bad_commit']) == ("c1", "c2")
+    assert [e['operation_name'] for e in changed['events']] == ["exp", "abs"]
+
+    # A newer upload without events replaces the old range with none
+    save_index(tmp_path, [entry("2025-08-03T00:00:00", "c3"), entry("2025-08-02T00:00:00", "c2"),
+                          entry("2025-08-01T00:00:00", "c1")])
+    document = latest_attribution(tmp_path)
+    assert document['ranges'] == []
+    assert (document['measurement_date'], document['commit']) == ("2025-08-03T00:00:00", "c3")
+
+
+def test_last_measured_commit_skips_points_without_the_op():
+    def point(commit, ops):
+        return {'metadata': {'git_commit_id': commit},
+                'results': [{'operation_name': op, 'successful_runs': 3} for op in ops]}
+
+    history = [point("bad", ["exp"]), point("c2", ["abs"]), point("c1", ["abs", "exp"])]
+
+    assert last_measured_commit(history, "exp") == "c1"
+    assert last_measured_commit(history, "abs") == "c2"
+
+
+def test_scoring_prefers_sfpu_files_naming_the_op():
+    exp_kernel = {'subject': "Speed up exp", 'files': ["tt_metal/llk_api/llk_sfpu/ckernel_sfpu_exp.h"]}
+    dispatch = {'subject': "Rework dispatch", 'files': ["tt_metal/impl/dispatch/cq.cpp"]}
+
+    assert path_weight("docs/readme.md") == 0
+    assert score_commit(exp_kernel, ["exp"])[0] > score_commit(exp_kernel, ["abs"])[0] > 0
+    assert score_commit(dispatch, ["exp"]) == (0.0, [])
+    assert score_commit(dispatch, ["exp"], infra=True)[0] > 0
+
+
+def test_without_a_clone_only_the_range_is_reported():
+    attribution = attribute("aaaa1111", "bbbb2222", ["exp"])
+
+    assert attribution['compare_url'].endswith("/compare/aaaa1111...bbbb2222")
+    assert describe_attribution(attribution) == "aaaa1111..bbbb2222"
+    assert 'suspects' not in attribute("bbbb2222", "bbbb2222", ["exp"], clone="/nonexistent")
+
+
+@pytest.mark.skipif(shutil.which('git') is None, reason="needs git")
+def test_range_is_expanded_and_ranked_in_a_clone(tmp_path):
+    def git(*args):
+        return subprocess.run(['git', '-C', str(tmp_path), *args], capture_output=True, text=True,
+                              check=True).stdout.strip()
+
+    def commit(path, subject):
+        target = tmp_path / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(subject)
+        git('add', path)
+        git('-c', 'user.name=t', '-c', 'user.email=t@t', 'commit', '-q', '-m', subject)
+        return git('rev-parse', 'HEAD')
+
+    git('init', '-q')
+    good = commit("README.md", "Base")
+    commit("docs/guide.md", "Docs")
+    exp = commit("tt_metal/llk_api/llk_sfpu/ckernel_sfpu_exp.h", "Speed up exp")
+    bad = commit("ttnn/cpp/ttnn/operations/eltwise/unary/unary.cpp", "Unary cleanup")
+
+    attribution = attribute(good, bad, ["exp"], clone=tmp_path)
+
+    assert attribution['commit_count'] == 3
+    assert [s['sha'] for s in attribution['suspects']] == [exp, bad]
+    assert "3 commits, 2 touching eltwise/SFPU paths" in describe_attribution(attribution)
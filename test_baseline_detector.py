@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Tests for the rolling-baseline regression detector."""
+
+import json
+
+import numpy as np
+import pytest
+
+from baseline_detector import baseline_changes, history_matrix, load_recent
+from index_store import add_entry
+
+
+def results(values, failed=()):
+    return {'metadata': {}, 'results': [
+        {'operation_name': op, 'average_duration_ns': value, 'successful_runs': 0 if op in failed else 3}
+        for op, value in values.items()]}
+
+
+def test_history_matrix_marks_missing_values():
+    ops, matrix = history_matrix([results({'abs': 1.0, 'exp': 2.0}), results({'exp': 3.0}),
+                                  results({'abs': 4.0}, failed=['abs'])])
+
+    assert ops == ['abs', 'exp']
+    np.testing.assert_array_equal(matrix, [[1.0, np.nan, np.nan], [2.0, 3.0, np.nan]])
+
+
+def test_one_noisy_previous_run_does_not_trigger():
+    # Previous run was noisy (50 ns); the median of the window is still ~100 ns
+    history = [results({'abs': 101.0, 'exp': 150.0})] + [
+        results({'abs': value, 'exp': 100.0}) for value in [50.0, 100.0, 99.0, 102.0]]
+
+    changes = baseline_changes(history, threshold_percent=20.0)
+
+    assert [c['operation_name'] for c in changes] == ['exp']
+    assert changes[0]['baseline_ns'] == 100.0
+    assert changes[0]['change_percent'] == pytest.approx(50.0)
+    assert changes[0]['baseline_points'] == 4
+
+
+def test_short_baselines_are_skipped():
+    history = [results({'abs': 200.0, 'new': 10.0}), results({'abs': 100.0}), results({'abs': 100.0})]
+    assert baseline_changes(history, 20.0, min_points=3) == []
+    assert [c['operation_name'] for c in baseline_changes(history, 20.0, min_points=2)] == ['abs']
+
+
+def upload(data_dir, day, commit, value):
+    """Add one results file for op 'abs' to the archive and the index."""
+    (data_dir / "daily").mkdir(exist_ok=True)
+    filename = f"{day}.json"
+    date = f"2025-08-{day:02d}T00:00:00"
+    (data_dir / "daily" / filename).write_text(json.dumps(
+        {'metadata': {'measurement_date': date, 'git_commit_id': commit},
+         'results': [{'operation_name': 'abs', 'average_duration_ns': value, 'successful_runs': 1}]}))
+    add_entry(data_dir, {'filename': filename, 'path': f"data/daily/{filename}",
+                         'measurement_date': date, 'git_commit_id': commit})
+
+
+def test_load_recent_by_file_and_commit(tmp_path):
+    for day, commit in enumerate(["c1", "c2", "c2", "c3"], 1):
+        upload(tmp_path, day, commit, float(day))
+
+    by_file = load_recent(tmp_path, 3, 'file')
+    by_commit = load_recent(tmp_path, 3, 'commit')
+
+    assert [r['results'][0]['average_duration_ns'] for r in by_file] == [4.0, 3.0, 2.0]
+    assert [r['results'][0]['average_duration_ns'] for r in by_commit] == [4.0, 2.5, 1.0]
+    # As the previous upload saw them
+    assert [r['results'][0]['average_duration_ns'] for r in load_recent(tmp_path, 3, 'file', 1)] == [3.0, 2.0, 1.0]
+    assert [r['results'][0]['average_duration_ns'] for r in load_recent(tmp_path, 3, 'commit', 1)] == [2.5, 1.0]
+
+
+@pytest.mark.parametrize("unit", ['commit', 'file'])
+def test_a_step_alerts_once(tmp_path, unit):
+    for day in range(1, 9):
+        upload(tmp_path, day, f"c{day}", 100.0)
+
+    alerted = []
+    # The step commit, an intraday rerun of it, then two more commits at the new level
+    for day, commit in [(9, "c9"), (10, "c9"), (11, "c11"), (12, "c12")]:
+        upload(tmp_path, day, commit, 150.0)
+        history = load_recent(tmp_path, 11, unit)
+        previous = load_recent(tmp_path, 11, unit, skip_files=1)
+        alerted.append(len(baseline_changes(history, 20.0, previous=previous)))
+        assert len(baseline_changes(history, 20.0)) == 1  # every point still crosses the old median
+
+    assert alerted == [1, 0, 0, 0]
+
+
+def test_a_second_step_on_top_of_the_first_alerts_again(tmp_path):
+    for day in range(1, 11):
+        upload(tmp_path, day, f"c{day}", 100.0)
+
+    alerted = []
+    for day, value in [(11, 130.0), (12, 170.0), (13, 172.0)]:
+        upload(tmp_path, day, f"c{day}", value)
+        history = load_recent(tmp_path, 11, 'file')
+        previous = load_recent(tmp_path, 11, 'file', skip_files=1)
+        alerted.append([round(c['change_percent']) for c in baseline_changes(history, 20.0, previous=previous)])
+
+    # 170 is 31% above the 130 flagged before, so it is a new step; 172 stays at that level
+    assert alerted == [[30], [70], []]
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for clustering simultaneous changes into infra-level shifts."""
+
+import numpy as np
+
+from change_clusters import cluster_changes, describe_shift, magnitude_groups, op_family
+from eltwise_op_registry import get_operations
+
+UNARY = get_operations('unary', backward=False)[:8]
+
+
+def change(op, percent):
+    return {'operation_name': op, 'change_percent': percent,
+            'change_type': 'regression' if percent > 0 else 'improvement'}
+
+
+def history_for(series):
+    """Result sets newest first from op -> values listed oldest first."""
+    length = len(next(iter(series.values())))
+    return [{'results': [{'operation_name': op, 'average_duration_ns': values[point], 'successful_runs': 3}
+                         for op, values in series.items()]}
+            for point in reversed(range(length))]
+
+
+def test_op_family_uses_the_registry():
+    assert op_family('abs') == 'unary'
+    assert op_family('add') == 'binary'
+    assert op_family('abs_bw') == 'backward'
+    assert op_family('not_an_op') == 'other'
+
+
+def test_magnitude_groups_split_at_gaps():
+    labels = magnitude_groups(np.log1p(np.array([0.25, 0.24, 0.60, 0.26, 0.62])))
+    assert labels[0] == labels[1] == labels[3] and labels[2] == labels[4] and labels[0] != labels[2]
+
+
+def test_family_wide_shift_is_one_cluster_and_outliers_stay_isolated():
+    changes = [change(op, 25 + i * 0.5) for i, op in enumerate(UNARY)] + [change('add', 80), change('exp', 60)]
+    changes[-1]['operation_name'] = 'exp_bw'
+
+    shifts, isolated = cluster_changes(changes)
+
+    (shift,) = shifts
+    assert (shift['family'], shift['change_type'], shift['count']) == ('unary', 'regression', 8)
+    assert sorted(shift['operation_names']) == sorted(UNARY)
+    assert describe_shift(shift).startswith("Infra-level shift affecting 8 unary ops: +26.")
+    assert [c['operation_name'] for c in isolated] == ['add', 'exp_bw']
+    assert all(c['shift_id'] == 0 for c in changes[:8])
+
+
+def test_ops_that_did_not_move_with_the_cluster_are_left_out():
+    series = {op: [100, 101, 99, 100, 125] for op in UNARY[:6]}
+    series[UNARY[6]] = [100, 125, 100, 101, 125]  # was already jumping around
+    changes = [change(op, 25) for op in UNARY[:7]]
+
+    shifts, isolated = cluster_changes(changes, history_for(series))
+
+    assert shifts[0]['count'] == 6
+    assert [c['operation_name'] for c in isolated] == [UNARY[6]]
+
+
+def test_too_few_changes_are_not_clustered():
+    changes = [change(op, 25) for op in UNARY[:4]]
+    assert cluster_changes(changes) == ([], changes)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Tests for change-point detection over op histories."""
+
+import numpy as np
+
+from change_points import best_splits, build, segment_series, update
+
+
+def noisy(levels, seed=0):
+    rng = np.random.default_rng(seed)
+    return [level * (1 + rng.normal(0, 0.005)) for level in levels]
+
+
+def test_best_splits_finds_each_segments_step():
+    positions, gains, shifts = best_splits([np.array([0.0, 0, 0, 0, 1, 1, 1]), np.array([5.0, 5, 5, 2, 2, 2])])
+    assert positions.tolist() == [4, 3]
+    assert shifts.tolist() == [1.0, -3.0]
+    assert (gains > 0).all()
+
+
+def test_segment_series_handles_several_steps_and_flat_series():
+    steps = np.log(noisy([100] * 10 + [130] * 10 + [90] * 10))
+    flat = np.log(noisy([100] * 30, seed=1))
+    boundaries = segment_series([steps, flat], np.array([0.005, 0.005]))
+    assert boundaries == [[10, 20], []]
+
+
+def test_build_reports_segments_and_commit_ranges(make_store):
+    store = make_store({'abs': noisy([100] * 8 + [150] * 8),
+                        'exp': [None, None] + noisy([50] * 14, seed=2)})
+
+    ops = build(store)['ops']
+
+    (change,) = ops['abs']['change_points']
+    assert change['commit_range'] == ["c7", "c8"]
+    assert change['date'] == "2025-01-09T00:00:00"
+    assert abs(change['change_percent'] - 50) < 3
+    assert [s['points'] for s in ops['abs']['segments']] == [8, 8]
+    assert ops['exp']['change_points'] == []
+    assert ops['exp']['segments'][0]['first_commit'] == "c2"
+
+
+def test_update_resegments_only_the_open_segment(make_store):
+    values = noisy([100] * 10 + [150] * 10 + [200] * 6)
+    document = build(make_store({'abs': values[:20]}))
+    closed = document['ops']['abs']['segments'][0]
+
+    updated = update(document, make_store({'abs': values}))
+
+    segments = updated['ops']['abs']['segments']
+    assert segments[0] == closed
+    assert [s['points'] for s in segments] == [10, 10, 6]
+    assert [c['commit_range'] for c in updated['ops']['abs']['change_points']] == [["c9", "c10"], ["c19", "c20"]]
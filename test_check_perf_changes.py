@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Tests for the alert detector's settings and their timeline replay."""
+
+import pytest
+
+pytest.importorskip("requests")
+
+from check_perf_changes import detection_settings, timeline_settings  # noqa: E402
+
+
+def test_settings_come_from_the_environment_with_defaults():
+    assert detection_settings({}) == {'threshold_percent': 20.0, 'compare_by': 'commit',
+                                      'baseline_window': 10, 'baseline_unit': 'commit'}
+    with pytest.raises(ValueError):
+        detection_settings({'PERF_COMPARE_BY': 'median'})
+    with pytest.raises(ValueError):
+        detection_settings({'PERF_BASELINE_UNIT': 'day'})
+
+
+def test_the_timeline_replays_the_configured_detector():
+    workflow = detection_settings({'PERF_COMPARE_BY': 'significance', 'PERF_CHANGE_THRESHOLD': '5.0',
+                                   'PERF_BASELINE_WINDOW': '10', 'PERF_BASELINE_UNIT': 'file'})
+
+    assert timeline_settings(workflow) == {'mode': 'significance', 'unit': 'file', 'window': 10,
+                                           'threshold_percent': 5.0}
+    assert timeline_settings(detection_settings({'PERF_COMPARE_BY': 'commit'}))['mode'] == 'pairwise'
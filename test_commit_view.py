@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Tests for the per-commit view of replicate measurements."""
+
+import json
+import statistics
+
+import pytest
+
+from commit_view import commit_view, confidence_interval, group_by_commit, latest_commit_views
+from index_store import add_entry
+
+
+def add_measurement(data_dir, day, commit, runs):
+    daily = data_dir / "daily"
+    daily.mkdir(exist_ok=True)
+    date = f"2025-08-{day:02d}T00:00:00"
+    results = [{'operation_name': op, 'runs': values, 'successful_runs': len(values),
+                'average_duration_ns': statistics.mean(values),
+                'std_deviation_ns': statistics.stdev(values) if len(values) > 1 else 0.0,
+                'min_duration_ns': min(values), 'max_duration_ns': max(values)}
+               for op, values in runs.items()]
+    filename = f"{day}.json"
+    (daily / filename).write_text(json.dumps({'metadata': {'measurement_date': date, 'git_commit_id': commit},
+                                              'results': results}))
+    add_entry(data_dir, {'filename': filename, 'path': f"data/daily/{filename}",
+                         'measurement_date': date, 'git_commit_id': commit})
+
+
+def test_group_by_commit_keeps_separate_visits():
+    files = [{'git_commit_id': c} for c in ["b", "b", "a", "b"]]
+    assert [len(group) for group in group_by_commit(files)] == [2, 1, 1]
+
+
+def test_confidence_interval():
+    assert confidence_interval(100.0, 10.0, 1) == (100.0, 100.0)
+    low, high = confidence_interval(100.0, 10.0, 4)
+    assert (low, high) == pytest.approx((100.0 - 3.182 * 5.0, 100.0 + 3.182 * 5.0))
+
+
+def test_latest_views_pool_replicate_runs(tmp_path):
+    add_measurement(tmp_path, 1, "c1", {'abs': [50.0, 52.0]})
+    add_measurement(tmp_path, 2, "c2", {'abs': [10.0, 12.0, 11.0]})
+    add_measurement(tmp_path, 3, "c2", {'abs': [13.0, 9.0, 11.0], 'exp': [5.0, 6.0]})
+
+    latest, previous = latest_commit_views(tmp_path, 2)
+
+    pooled_runs = [10.0, 12.0, 11.0, 13.0, 9.0, 11.0]
+    abs_result, exp_result = latest['results']
+    assert latest['metadata']['replicates'] == 2
+    assert latest['metadata']['aggregated_files'] == ["2.json", "3.json"]
+    assert abs_result['runs'] == pooled_runs
+    assert abs_result['successful_runs'] == 6
+    assert abs_result['std_deviation_ns'] == pytest.approx(statistics.stdev(pooled_runs))
+    assert (abs_result['ci_low_ns'], abs_result['ci_high_ns']) == pytest.approx(
+        confidence_interval(11.0, statistics.stdev(pooled_runs), 6))
+    assert abs_result['replicates'] == 2 and exp_result['replicates'] == 1
+    assert previous['metadata']['git_commit_id'] == "c1"
+    assert commit_view(tmp_path, "c1")['results'][0]['average_duration_ns'] == 51.0
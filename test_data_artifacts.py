@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for the precompressed, content-hashed dashboard data."""
+
+import gzip
+import json
+
+import pytest
+
+from data_artifacts import ArtifactBuilder
+
+
+def make_dist(tmp_path):
+    data = tmp_path / "dist" / "data"
+    for directory in ["index", "packs", "daily", "latest"]:
+        (data / directory).mkdir(parents=True)
+    (data / "packs" / "2025-08.jsonl").write_text('{"pack_month":"2025-08"}\n{"results":{}}\n')
+    (data / "daily" / "d.json").write_text('{"results":[]}')
+    (data / "latest" / "latest_results.json").write_text('{"results":[]}')
+    packed = {'filename': "p.json", 'path': "data/packs/2025-08.jsonl", 'pack_line': 1,
+              'measurement_date': "2025-08-01T00:00:00"}
+    daily = {'filename': "d.json", 'path': "data/daily/d.json", 'measurement_date': "2025-10-01T00:00:00"}
+    (data / "index" / "2025-08.json").write_text(json.dumps({'month': "2025-08", 'files': [packed]}))
+    (data / "index" / "2025-10.json").write_text(json.dumps({'month': "2025-10", 'files': [daily]}))
+    (data / "index" / "head.json").write_text(json.dumps({'files': [daily, packed], 'shards': [
+        {'month': "2025-10", 'path': "data/index/2025-10.json"},
+        {'month': "2025-08", 'path': "data/index/2025-08.json"}]}))
+    return tmp_path / "dist"
+
+
+def test_build_hashes_and_rewrites_references(tmp_path):
+    dist = make_dist(tmp_path)
+
+    manifest = ArtifactBuilder(dist, use_brotli=False).build('gzip')
+
+    files = manifest['files']
+    assert manifest['suffix'] == ".gz"
+    assert files["data/packs/2025-08.jsonl"].startswith("data/artifacts/packs/2025-08.")
+    head = json.loads((dist / files["data/index/head.json"]).read_text())
+    assert head['shards'][1]['path'] == files["data/index/2025-08.json"]
+    assert head['files'][1]['path'] == files["data/packs/2025-08.jsonl"]
+    assert head['files'][0]['path'] == "data/daily/d.json"
+    shard = json.loads(gzip.decompress((dist / (files["data/index/2025-08.json"] + ".gz")).read_bytes()))
+    assert shard['files'][0]['path'] == files["data/packs/2025-08.jsonl"]
+    assert gzip.decompress((dist / "data" / "daily" / "d.json.gz").read_bytes()) == b'{"results":[]}'
+    assert json.loads((dist / "data" / "manifest.json").read_text())['files'] == files
+
+
+def test_hashes_follow_content(tmp_path):
+    dist = make_dist(tmp_path)
+    first = ArtifactBuilder(dist, use_brotli=False).build('gzip')['files']
+    assert ArtifactBuilder(dist, use_brotli=False).build('gzip')['files'] == first
+
+    (dist / "data" / "packs" / "2025-08.jsonl").write_text('{"pack_month":"2025-08"}\n')
+    second = ArtifactBuilder(dist, use_brotli=False).build('gzip')['files']
+
+    assert second["data/packs/2025-08.jsonl"] != first["data/packs/2025-08.jsonl"]
+    assert second["data/index/head.json"] != first["data/index/head.json"]
+    assert second["data/index/2025-10.json"] == first["data/index/2025-10.json"]
+    assert second["data/latest/latest_results.json"] == first["data/latest/latest_results.json"]
+
+
+def test_headers_and_guards(tmp_path):
+    dist = make_dist(tmp_path)
+    ArtifactBuilder(dist, use_brotli=False).build('gzip')
+
+    headers = (dist / "_headers").read_text()
+    assert "/data/manifest.json\n  Cache-Control: no-cache" in headers
+    assert "/data/*.json.gz\n  Content-Type: application/json\n  Content-Encoding: gzip" in headers
+    assert ".br" not in headers
+    with pytest.raises(ValueError):
+        ArtifactBuilder(dist, use_brotli=False).build('br')
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (tmp_path / "linked").mkdir()
+    (tmp_path / "linked" / "data").symlink_to(outside)
+    with pytest.raises(ValueError):
+        ArtifactBuilder(tmp_path / "linked", use_brotli=False).build('gzip')
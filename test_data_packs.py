@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Tests for monthly pack compaction."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from data_packs import aggregate_commit, compact_archive
+from index_store import add_entry, load_index
+from results_format import load_index_entry
+
+
+def add_files(data_dir, files):
+    daily = data_dir / "daily"
+    daily.mkdir(exist_ok=True)
+    for filename, data in files:
+        (daily / filename).write_text(json.dumps(data))
+        add_entry(data_dir, {'filename': filename, 'path': f"data/daily/{filename}",
+                             'measurement_date': data['metadata']['measurement_date'],
+                             'git_commit_id': data['metadata']['git_commit_id']})
+
+
+def test_aggregate_commit_pools_statistics(results_file):
+    first = results_file("2025-08-01T00:00:00", "c1", {'abs': [10.0, 12.0]})
+    second = results_file("2025-08-01T06:00:00", "c1", {'abs': [14.0, 16.0]})
+
+    pooled = aggregate_commit([first, second], ["a.json", "b.json"])['results'][0]
+
+    runs = [10.0, 12.0, 14.0, 16.0]
+    assert pooled['successful_runs'] == 4
+    assert pooled['average_duration_ns'] == 13.0
+    assert pooled['std_deviation_ns'] == pytest.approx((sum((r - 13.0) ** 2 for r in runs) / 3) ** 0.5)
+    assert (pooled['min_duration_ns'], pooled['max_duration_ns']) == (10.0, 16.0)
+    assert 'runs' not in pooled
+    assert aggregate_commit([first, second], ["a.json", "b.json"], keep_runs=True)['results'][0]['runs'] == runs
+
+
+def test_compact_archive_packs_old_files_and_keeps_recent(tmp_path, results_file):
+    add_files(tmp_path, [
+        ("a.json", results_file("2025-08-01T00:00:00", "c1", {'abs': [10.0]})),
+        ("b.json", results_file("2025-08-01T06:00:00", "c1", {'abs': [20.0]})),
+        ("c.json", results_file("2025-08-02T00:00:00", "c2", {'abs': [30.0]})),
+        ("d.json", results_file("2025-10-01T00:00:00", "c3", {'abs': [40.0]})),
+    ])
+
+    summary = compact_archive(tmp_path, days=30, now=datetime(2025, 10, 15))
+
+    assert summary == {'months': ["2025-08"], 'files_packed': 3, 'entries_written': 2}
+    assert sorted(p.name for p in (tmp_path / "daily").iterdir()) == ["d.json"]
+    files = load_index(tmp_path)['files']
+    assert [(e['git_commit_id'], e['path']) for e in files] == [
+        ("c3", "data/daily/d.json"), ("c2", "data/packs/2025-08.jsonl"), ("c1", "data/packs/2025-08.jsonl")]
+    c1 = load_index_entry(tmp_path, files[2])
+    assert c1['results'][0]['average_duration_ns'] == 15
+    assert c1['metadata']['aggregated_files'] == ["a.json", "b.json"]
+
+
+def test_compacting_again_merges_into_existing_pack(tmp_path, results_file):
+    add_files(tmp_path, [("a.json", results_file("2025-08-01T00:00:00", "c1", {'abs': [10.0]}))])
+    compact_archive(tmp_path, days=30, now=datetime(2025, 10, 15))
+    add_files(tmp_path, [("b.json", results_file("2025-08-20T00:00:00", "c1", {'abs': [20.0]}))])
+
+    compact_archive(tmp_path, days=30, now=datetime(2025, 10, 15))
+
+    files = load_index(tmp_path)['files']
+    assert len(files) == 1
+    merged = load_index_entry(tmp_path, files[0])
+    assert merged['metadata']['aggregated_files'] == ["a.json", "b.json"]
+    assert merged['results'][0]['successful_runs'] == 2
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Tests for the slow-drift digest."""
+
+from datetime import datetime
+
+import numpy as np
+
+from drift_digest import detect_drift, theil_sen
+
+
+def test_theil_sen_ignores_outliers_and_missing_points():
+    times = np.arange(10, dtype=float)
+    values = np.array([2.0 * times + 1, -times])
+    values[0, 4] = 100.0
+    values[1, 2] = np.nan
+
+    slope, intercept, z = theil_sen(values, times)
+
+    assert np.allclose(slope, [2, -1]) and np.allclose(intercept, [1, 0])
+    assert z[0] > 3 and z[1] < -3
+
+
+def test_creep_is_flagged_with_its_start_but_steps_and_flat_ops_are_not(make_store):
+    rng = np.random.default_rng(0)
+    days = 91
+    noise = lambda: 1 + rng.normal(0, 0.003, days)
+    creep = np.where(np.arange(days) < 40, 100.0, 100.0 * 1.003 ** (np.arange(days) - 40)) * noise()
+    step = np.where(np.arange(days) < 60, 100.0, 130.0) * noise()
+    store = make_store({'abs': creep, 'exp': step, 'neg': 100 * noise()})
+
+    drifts = detect_drift(store, [91], budget_percent=10)
+
+    (drift,) = drifts
+    assert drift['operation_name'] == 'abs'
+    assert 12 < drift['drift_percent'] < 20
+    assert abs(drift['percent_per_week'] - 2.1) < 0.5
+    assert abs((datetime.fromisoformat(drift['start_date']) - datetime(2025, 2, 10)).days) <= 5
+
+
+def test_short_windows_need_enough_points(make_store):
+    store = make_store({'abs': 100 * 1.01 ** np.arange(30)})
+
+    assert detect_drift(store, [5], budget_percent=1) == []
+    assert detect_drift(store, [28], budget_percent=10)[0]['window_days'] == 28
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Tests for the eltwise op registry (no torch or ttnn needed)."""
+
+import ast
+from pathlib import Path
+
+from eltwise_op_registry import OP_REGISTRY, get_registered_test_names
+
+# Operations of the hand-written tests the registry replaced
+PREVIOUS_TESTS = set("""
+    abs abs_bw acos acos_bw acosh acosh_bw add add_ add_bw addalpha addalpha_bw addcdiv addcdiv_bw
+    addcmul addcmul_bw angle asin asin_bw asinh asinh_bw assign atan atan2 atan2_bw atan_bw atanh
+    atanh_bw bias_gelu bias_gelu_ bias_gelu_bw bitwise_and bitwise_not bitwise_or bitwise_xor cbrt
+    ceil ceil_bw celu clamp clip clip_binary complex_recip complex_tensor conj cos cos_bw cosh
+    cosh_bw cumprod cumsum deg2rad deg2rad_bw digamma digamma_bw div_ div_bw divide divide_ elu eq
+    eq_ eqz erf erf_bw erfc erfc_bw erfinv erfinv_bw exp exp2 exp2_bw exp_bw expm1 expm1_bw fill
+    fill_bw fill_zero_bw floor floor_bw fmod fmod_bw frac frac_bw ge ge_ geglu gelu gelu_bw gez glu
+    gt gt_ gtz hardmish hardshrink hardshrink_bw hardsigmoid hardsigmoid_bw hardswish hardswish_bw
+    hardtanh heaviside hypot hypot_bw i0 i0_bw i1 identity imag isclose isfinite isinf isnan
+    isneginf isposinf ldexp ldexp_ ldexp_bw le le_ leaky_relu lerp lerp_bw lez lgamma lgamma_bw log
+    log10 log10_bw log1p log1p_bw log2 log2_bw log_bw log_sigmoid log_sigmoid_bw logaddexp
+    logaddexp2 logaddexp2_ logaddexp2_bw logaddexp_ logaddexp_bw logical_and logical_and_
+    logical_not logical_not_ logical_or logical_or_ logical_xor logical_xor_ logit logit_bw lt lt_
+    ltz mac max max_bw maximum mean min min_bw minimum mish mul mul_ mul_bw multigammaln
+    multigammaln_bw multiply multiply_ ne ne_ neg neg_bw nextafter nez polar polygamma pow pow_bw
+    prelu prod rad2deg rad2deg_bw rdiv real reciprocal reciprocal_bw reglu relu relu6 relu6_bw
+    relu_bw relu_max relu_min remainder remainder_bw round round_binary round_bw rpow rsqrt rsqrt_bw
+    rsub_ rsub_bw selu selu_bw sigmoid sigmoid_accurate sigmoid_bw sign sign_bw signbit silu silu_bw
+    sin sin_bw sinh sinh_bw softplus softshrink softshrink_bw softsign softsign_bw sqrt sqrt_bw
+    square square_bw squared_difference squared_difference_ squared_difference_bw std std_hw sub
+    sub_ sub_bw subalpha subalpha_bw subtract subtract_ sum swiglu swish tan tan_bw tanh tanh_bw
+    tanhshrink tanhshrink_bw threshold tril triu trunc trunc_bw var var_hw where where_bw xlogy
+    xlogy_bw""".split())
+
+
+def hand_written_tests():
+    """test_* methods defined in TestEltwiseOperations, read from the source."""
+    tree = ast.parse((Path(__file__).parent / "test_eltwise_operations.py").read_text())
+    (cls,) = [node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "TestEltwiseOperations"]
+    return {node.name for node in cls.body if isinstance(node, ast.FunctionDef) and node.name.startswith("test_")}
+
+
+def test_registry_covers_the_previous_tests():
+    names = get_registered_test_names()
+    assert len(names) == len(set(names))
+    assert set(names) == {f"test_{name}" for name in PREVIOUS_TESTS}
+
+
+def test_every_custom_spec_has_a_hand_written_test():
+    custom = {spec.test_name for spec in OP_REGISTRY if spec.custom}
+    assert custom == hand_written_tests()
@@ -7,6 +7,7 @@ from typing import List, Tuple, Optional
 from tests.ttnn.utils_for_testing import assert_with_pcc
 import scipy.special
 import numpy as np
+from eltwise_op_registry import OP_REGISTRY, OpSpec, get_operations
 
 
 # =============================================================================
@@ -113,121 +114,74 @@ def run_unary_op_test(ttnn_op, torch_op, device, shape=None, dtype=None, values=
     assert_tensors_close(ttnn_result, torch_result)
 
 
-def run_binary_op_test(ttnn_op, torch_op, device, shape=None, dtype=None, values=None, min_val=None, max_val=None):
-    """Helper function to test binary operations."""
-    shape = shape or DEFAULT_SHAPE
-    dtype = dtype or DEFAULT_DTYPE
-    values = values or DEFAULT_VALUES
-
-    torch_a, ttnn_a = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_b, ttnn_b = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    
-    ttnn_result = ttnn_op(ttnn_a, ttnn_b)
-    torch_result = torch_op(torch_a, torch_b)
-
-    assert ttnn_result.shape == ttnn_a.shape
-    assert ttnn_result.dtype == ttnn_a.dtype
-    assert_tensors_close(ttnn_result, torch_result)
-
-
-def run_binary_op_test_safe_div(ttnn_op, torch_op, device, shape=None, dtype=None, values=None, min_val=None, max_val=None):
-    """Helper function to test binary operations with division safety."""
-    shape = shape or DEFAULT_SHAPE
-    dtype = dtype or DEFAULT_DTYPE
-    values = values or DEFAULT_VALUES
-
-    torch_a, ttnn_a = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_b, ttnn_b = create_test_tensor(shape, dtype, device, "positive")  # Avoid division by zero
-    
-    ttnn_result = ttnn_op(ttnn_a, ttnn_b)
-    torch_result = torch_op(torch_a, torch_b)
-
-    assert ttnn_result.shape == ttnn_a.shape
-    assert ttnn_result.dtype == ttnn_a.dtype
-    assert_tensors_close(ttnn_result, torch_result)
-
-
-def run_ternary_op_test(ttnn_op, torch_op, device, shape=None, dtype=None, values=None, min_val=None, max_val=None):
-    """Helper function to test ternary operations."""
-    shape = shape or DEFAULT_SHAPE
-    dtype = dtype or DEFAULT_DTYPE
-    values = values or DEFAULT_VALUES
-
-    torch_a, ttnn_a = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_b, ttnn_b = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_c, ttnn_c = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    
-    ttnn_result = ttnn_op(ttnn_a, ttnn_b, ttnn_c)
-    torch_result = torch_op(torch_a, torch_b, torch_c)
-
-    assert ttnn_result.shape == ttnn_a.shape
-    assert ttnn_result.dtype == ttnn_a.dtype
-    assert_tensors_close(ttnn_result, torch_result)
-
-
-def run_reduction_op_test(ttnn_op, torch_op, device, shape=None, dtype=None, values=None, min_val=None, max_val=None):
-    """Helper function to test reduction operations."""
-    shape = shape or DEFAULT_SHAPE
-    dtype = dtype or DEFAULT_DTYPE
-    values = values or DEFAULT_VALUES
+# =============================================================================
+# REGISTRY-DRIVEN HELPERS
+# =============================================================================
 
-    torch_tensor, ttnn_input = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    ttnn_result = ttnn_op(ttnn_input)
-    torch_result = torch_op(torch_tensor)
+def create_op_spec_inputs(spec: OpSpec, device, shape=None, dtype=None):
+    """Create torch/ttnn inputs for a registered op.
 
-    assert ttnn_result.dtype == ttnn_input.dtype
+    Returns (torch_inputs, ttnn_inputs); backward ops get the gradient first.
+    """
+    shape = shape or spec.shape or DEFAULT_SHAPE
+    dtype = dtype or (getattr(ttnn, spec.dtype) if spec.dtype else DEFAULT_DTYPE)
+    default_values = spec.values or DEFAULT_VALUES
+
+    value_types = [value or default_values for value in spec.input_value_types()]
+    if spec.backward:
+        value_types = [default_values] + value_types
+
+    torch_inputs, ttnn_inputs = [], []
+    for values in value_types:
+        torch_tensor, ttnn_tensor = create_test_tensor(shape, dtype, device, values,
+                                                       min_val=spec.min_val, max_val=spec.max_val)
+        torch_inputs.append(torch_tensor)
+        ttnn_inputs.append(ttnn_tensor)
+    return torch_inputs, ttnn_inputs
+
+
+def invoke_op_spec(spec: OpSpec, ttnn_inputs):
+    """Invoke the ttnn operation for spec on prepared inputs."""
+    ttnn_op = getattr(ttnn, spec.ttnn_name)
+    return ttnn_op(*ttnn_inputs, *spec.args, **spec.kwargs)
+
+
+def run_op_spec_test(spec: OpSpec, device, shape=None, dtype=None):
+    """Run the correctness check described by a registered op spec."""
+    torch_inputs, ttnn_inputs = create_op_spec_inputs(spec, device, shape, dtype)
+    ttnn_result = invoke_op_spec(spec, ttnn_inputs)
+
+    if spec.backward:
+        torch_grad, torch_operands = torch_inputs[0], torch_inputs[1:]
+        for torch_tensor in torch_operands:
+            torch_tensor.requires_grad = True
+
+        golden_function = ttnn.get_golden_function(getattr(ttnn, spec.ttnn_name))
+        golden_args = (torch_grad, *torch_operands, *spec.args)
+        if spec.arity == 1:
+            # Some unary golden functions require the device parameter
+            try:
+                torch_result = golden_function(*golden_args, device=device, **spec.kwargs)
+            except TypeError:
+                torch_result = golden_function(*golden_args, **spec.kwargs)
+        else:
+            torch_result = golden_function(*golden_args, **spec.kwargs)
+
+        for i in range(spec.outputs):
+            if spec.check_meta:
+                assert ttnn_result[i].shape == ttnn_inputs[i + 1].shape
+                assert ttnn_result[i].dtype == ttnn_inputs[i + 1].dtype
+            assert_tensors_close(ttnn_result[i], torch_result[i])
+        return
+
+    torch_result = spec.resolve_reference()(*torch_inputs, *spec.args, **spec.kwargs)
+    if spec.check_meta:
+        if spec.category != "reduction":
+            assert ttnn_result.shape == ttnn_inputs[0].shape
+        assert ttnn_result.dtype == ttnn_inputs[0].dtype
     assert_tensors_close(ttnn_result, torch_result)
 
 
-def run_unary_backward_op_test(ttnn_op, device, shape=None, dtype=None, values=None, min_val=None, max_val=None):
-    """Helper function to test unary backward operations."""
-    shape = shape or DEFAULT_SHAPE
-    dtype = dtype or DEFAULT_DTYPE
-    values = values or DEFAULT_VALUES
-
-    torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_input, ttnn_input = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_input.requires_grad = True
-    
-    ttnn_result = ttnn_op(ttnn_grad, ttnn_input)
-    golden_function = ttnn.get_golden_function(ttnn_op)
-    
-    # Some golden functions require device parameter
-    try:
-        torch_result = golden_function(torch_grad, torch_input, device=device)
-    except TypeError:
-        # If device parameter not needed, try without it
-        torch_result = golden_function(torch_grad, torch_input)
-    
-    assert ttnn_result[0].shape == ttnn_input.shape
-    assert ttnn_result[0].dtype == ttnn_input.dtype
-    assert_tensors_close(ttnn_result[0], torch_result[0])
-
-
-def run_binary_backward_op_test(ttnn_op, device, shape=None, dtype=None, values=None, min_val=None, max_val=None):
-    """Helper function to test binary backward operations."""
-    shape = shape or DEFAULT_SHAPE
-    dtype = dtype or DEFAULT_DTYPE
-    values = values or DEFAULT_VALUES
-
-    torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_a, ttnn_a = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_b, ttnn_b = create_test_tensor(shape, dtype, device, values, min_val=min_val, max_val=max_val)
-    torch_a.requires_grad = True
-    torch_b.requires_grad = True
-    
-    ttnn_result = ttnn_op(ttnn_grad, ttnn_a, ttnn_b)
-    golden_function = ttnn.get_golden_function(ttnn_op)
-    torch_result = golden_function(torch_grad, torch_a, torch_b)
-    
-    assert ttnn_result[0].shape == ttnn_a.shape
-    assert ttnn_result[0].dtype == ttnn_a.dtype
-    assert ttnn_result[1].shape == ttnn_b.shape
-    assert ttnn_result[1].dtype == ttnn_b.dtype
-    assert_tensors_close(ttnn_result[0], torch_result[0])
-    assert_tensors_close(ttnn_result[1], torch_result[1])
-
-
 # =============================================================================
 # MAIN TEST CLASS
 # =============================================================================
@@ -243,136 +197,13 @@ class TestEltwiseOperations:
         yield device
         ttnn.close_device(device)
 
+    # Operations whose checks do not fit OpSpec are written out by hand below.
+    # Every other test_<op> method is generated from OP_REGISTRY after the class.
+
     # =============================================================================
-    # UNARY OPERATIONS TESTS (62 operations)
+    # UNARY OPERATIONS TESTS
     # =============================================================================
 
-    def test_abs(self, device):
-        run_unary_op_test(ttnn.abs, torch.abs, device)
-
-    def test_acos(self, device):
-        run_unary_op_test(ttnn.acos, torch.acos, device, values="mixed")
-
-    def test_asin(self, device):
-        run_unary_op_test(ttnn.asin, torch.asin, device, values="mixed")
-
-    def test_asinh(self, device):
-        run_unary_op_test(ttnn.asinh, torch.asinh, device)
-
-    def test_atan(self, device):
-        run_unary_op_test(ttnn.atan, torch.atan, device)
-
-    def test_atanh(self, device):
-        run_unary_op_test(ttnn.atanh, torch.atanh, device)
-
-    def test_cos(self, device):
-        run_unary_op_test(ttnn.cos, torch.cos, device)
-
-    def test_acosh(self, device):
-        run_unary_op_test(ttnn.acosh, torch.acosh, device, values="positive")
-
-    def test_erfinv(self, device):
-        run_unary_op_test(ttnn.erfinv, torch.erfinv, device)
-
-    def test_exp2(self, device):
-        run_unary_op_test(ttnn.exp2, torch.exp2, device, values="mixed")
-
-    def test_expm1(self, device):
-        run_unary_op_test(ttnn.expm1, torch.expm1, device, values="mixed")
-
-    def test_gez(self, device):
-        run_unary_op_test(ttnn.gez, lambda x: x >= 0, device)
-
-    def test_gtz(self, device):
-        run_unary_op_test(ttnn.gtz, lambda x: x > 0, device)
-
-    def test_i0(self, device):
-        run_unary_op_test(ttnn.i0, torch.i0, device, values="mixed")
-
-    def test_isfinite(self, device):
-        run_unary_op_test(ttnn.isfinite, torch.isfinite, device)
-
-    def test_isinf(self, device):
-        run_unary_op_test(ttnn.isinf, torch.isinf, device)
-
-    def test_isnan(self, device):
-        run_unary_op_test(ttnn.isnan, torch.isnan, device)
-
-    def test_lez(self, device):
-        run_unary_op_test(ttnn.lez, lambda x: x <= 0, device)
-
-    def test_log(self, device):
-        run_unary_op_test(ttnn.log, torch.log, device, values="positive")
-
-    def test_log10(self, device):
-        run_unary_op_test(ttnn.log10, torch.log10, device, values="positive")
-
-    def test_log2(self, device):
-        run_unary_op_test(ttnn.log2, torch.log2, device, values="positive")
-
-    def test_log1p(self, device):
-        run_unary_op_test(ttnn.log1p, torch.log1p, device, values="mixed")
-
-    def test_logical_not(self, device):
-        run_unary_op_test(ttnn.logical_not, torch.logical_not, device)
-
-    def test_ltz(self, device):
-        run_unary_op_test(ttnn.ltz, lambda x: x < 0, device)
-
-    def test_neg(self, device):
-        run_unary_op_test(ttnn.neg, torch.neg, device)
-
-    def test_reciprocal(self, device):
-        run_unary_op_test(ttnn.reciprocal, torch.reciprocal, device, values="positive")
-
-    def test_relu(self, device):
-        run_unary_op_test(ttnn.relu, torch.relu, device)
-
-    def test_relu6(self, device):
-        run_unary_op_test(ttnn.relu6, torch.nn.functional.relu6, device)
-
-    def test_sign(self, device):
-        run_unary_op_test(ttnn.sign, torch.sign, device)
-
-    def test_signbit(self, device):
-        run_unary_op_test(ttnn.signbit, torch.signbit, device)
-
-    def test_silu(self, device):
-        run_unary_op_test(ttnn.silu, torch.nn.functional.silu, device)
-
-    def test_sin(self, device):
-        run_unary_op_test(ttnn.sin, torch.sin, device)
-
-    def test_sqrt(self, device):
-        run_unary_op_test(ttnn.sqrt, torch.sqrt, device, values="positive")
-
-    def test_square(self, device):
-        run_unary_op_test(ttnn.square, torch.square, device)
-
-    def test_tan(self, device):
-        run_unary_op_test(ttnn.tan, torch.tan, device, values="mixed")
-
-    def test_exp(self, device):
-        run_unary_op_test(ttnn.exp, torch.exp, device)
-
-    def test_erf(self, device):
-        run_unary_op_test(ttnn.erf, torch.erf, device)
-
-    def test_erfc(self, device):
-        run_unary_op_test(ttnn.erfc, torch.erfc, device)
-
-    def test_gelu(self, device):
-        run_unary_op_test(ttnn.gelu, torch.nn.functional.gelu, device)
-
-    def test_rsqrt(self, device):
-        run_unary_op_test(ttnn.rsqrt, torch.rsqrt, device, values="positive")
-
-    def test_sigmoid(self, device):
-        run_unary_op_test(ttnn.sigmoid, torch.sigmoid, device)
-
-    def test_tanh(self, device):
-        run_unary_op_test(ttnn.tanh, torch.tanh, device)
-
     def test_i1(self, device):
         import scipy.special
         torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "positive")
@@ -381,145 +212,10 @@ class TestEltwiseOperations:
         torch_result = torch.from_numpy(scipy.special.i1(torch_input.float().numpy())).to(torch_input.dtype)
         assert_tensors_close(ttnn_result, torch_result)
 
-    def test_isneginf(self, device):
-        run_unary_op_test(ttnn.isneginf, torch.isneginf, device)
-
-    def test_isposinf(self, device):
-        run_unary_op_test(ttnn.isposinf, torch.isposinf, device)
-
-    def test_nez(self, device):
-        run_unary_op_test(ttnn.nez, lambda x: x != 0, device)
-
-    def test_bitwise_not(self, device):
-        run_unary_op_test(ttnn.bitwise_not, torch.bitwise_not, device, dtype=ttnn.int32)
-
-    def test_floor(self, device):
-        run_unary_op_test(ttnn.floor, torch.floor, device)
-
-    def test_ceil(self, device):
-        run_unary_op_test(ttnn.ceil, torch.ceil, device)
-
-    def test_trunc(self, device):
-        run_unary_op_test(ttnn.trunc, torch.trunc, device)
-
-    def test_eqz(self, device):
-        run_unary_op_test(ttnn.eqz, lambda x: x == 0, device)
-
-    def test_mish(self, device):
-        run_unary_op_test(ttnn.mish, lambda x: x * torch.tanh(torch.nn.functional.softplus(x)), device)
-
     def test_hardmish(self, device):
         golden_function = ttnn.get_golden_function(ttnn.hardmish)
         run_unary_op_test(ttnn.hardmish, lambda x: golden_function(x, device=device), device)
 
-    def test_cosh(self, device):
-        run_unary_op_test(ttnn.cosh, torch.cosh, device, values="mixed")
-
-    def test_sinh(self, device):
-        run_unary_op_test(ttnn.sinh, torch.sinh, device, values="mixed")
-
-    def test_cbrt(self, device):
-        run_unary_op_test(ttnn.cbrt, lambda x: torch.sign(x) * torch.pow(torch.abs(x), 1/3), device)
-
-    def test_softplus(self, device):
-        run_unary_op_test(ttnn.softplus, torch.nn.functional.softplus, device)
-
-    def test_log_sigmoid(self, device):
-        run_unary_op_test(ttnn.log_sigmoid, torch.nn.functional.logsigmoid, device, values="mixed")
-
-    def test_swish(self, device):
-        run_unary_op_test(ttnn.swish, lambda x: x * torch.sigmoid(x), device)
-
-    def test_hardswish(self, device):
-        run_unary_op_test(ttnn.hardswish, torch.nn.functional.hardswish, device)
-
-    def test_hardsigmoid(self, device):
-        run_unary_op_test(ttnn.hardsigmoid, torch.nn.functional.hardsigmoid, device)
-
-    def test_hardtanh(self, device):
-        run_unary_op_test(ttnn.hardtanh, torch.nn.functional.hardtanh, device)
-
-    def test_celu(self, device):
-        run_unary_op_test(ttnn.celu, torch.nn.functional.celu, device)
-
-    def test_selu(self, device):
-        run_unary_op_test(ttnn.selu, torch.nn.functional.selu, device)
-
-    def test_tanhshrink(self, device):
-        run_unary_op_test(ttnn.tanhshrink, torch.nn.functional.tanhshrink, device)
-
-    def test_deg2rad(self, device):
-        run_unary_op_test(ttnn.deg2rad, torch.deg2rad, device)
-
-    def test_rad2deg(self, device):
-        run_unary_op_test(ttnn.rad2deg, torch.rad2deg, device)
-
-    def test_identity(self, device):
-        run_unary_op_test(ttnn.identity, lambda x: x, device)
-
-    def test_softsign(self, device):
-        run_unary_op_test(ttnn.softsign, torch.nn.functional.softsign, device)
-
-    # Additional Missing Unary Operations
-    def test_frac(self, device):
-        run_unary_op_test(ttnn.frac, torch.frac, device)
-
-    def test_round(self, device):
-        run_unary_op_test(ttnn.round, torch.round, device)
-
-    def test_logit(self, device):
-        run_unary_op_test(ttnn.logit, torch.logit, device)
-
-    def test_clip(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        min_val, max_val = -1.0, 1.0
-        ttnn_result = ttnn.clip(ttnn_input, min_val, max_val)
-        torch_result = torch.clip(torch_input, min_val, max_val)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_clamp(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        min_val, max_val = -1.0, 1.0
-        ttnn_result = ttnn.clamp(ttnn_input, min_val, max_val)
-        torch_result = torch.clamp(torch_input, min_val, max_val)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_sigmoid_accurate(self, device):
-        run_unary_op_test(ttnn.sigmoid_accurate, torch.sigmoid, device)
-
-    def test_elu(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        alpha = 1.0
-        ttnn_result = ttnn.elu(ttnn_input, alpha)
-        torch_result = torch.nn.functional.elu(torch_input, alpha=alpha)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_leaky_relu(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        negative_slope = 0.01
-        ttnn_result = ttnn.leaky_relu(ttnn_input, negative_slope)
-        torch_result = torch.nn.functional.leaky_relu(torch_input, negative_slope=negative_slope)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_threshold(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        threshold, value = 0.1, 0.0
-        ttnn_result = ttnn.threshold(ttnn_input, threshold, value)
-        torch_result = torch.threshold(torch_input, threshold, value)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_tril(self, device):
-        run_unary_op_test(ttnn.tril, torch.tril, device)
-
-    def test_triu(self, device):
-        run_unary_op_test(ttnn.triu, torch.triu, device)
-
-    def test_digamma(self, device):
-        run_unary_op_test(ttnn.digamma, torch.digamma, device, values="range", min_val=1, max_val=100)
-
-    def test_lgamma(self, device):
-        run_unary_op_test(ttnn.lgamma, torch.lgamma, device, values="positive")
-
     def test_multigammaln(self, device):
         torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, values="range", min_val=1, max_val=100)
         # Note: TTNN multigammaln doesn't take p parameter - it's unary only
@@ -528,13 +224,6 @@ class TestEltwiseOperations:
         torch_result = torch.mvlgamma(torch_input, 2)
         assert_tensors_close(ttnn_result, torch_result)
 
-    def test_polygamma(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "positive")
-        n = 1
-        ttnn_result = ttnn.polygamma(ttnn_input, n)
-        torch_result = torch.polygamma(n, torch_input)
-        assert_tensors_close(ttnn_result, torch_result)
-
     def test_heaviside(self, device):
         torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
         value = 0.0
@@ -544,459 +233,10 @@ class TestEltwiseOperations:
         torch_result = torch.heaviside(torch_input, torch_values)
         assert_tensors_close(ttnn_result, torch_result)
 
-    def test_logical_not_(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_input_clone = torch_input.clone()
-        ttnn_result = ttnn.logical_not_(ttnn_input)
-        torch_result = torch_input_clone.logical_not_()
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # Missing Unary Operations with Parameters
-    def test_fill(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        fill_value = 3.14
-        ttnn_result = ttnn.fill(ttnn_input, fill_value)
-        torch_result = torch.full_like(torch_input, fill_value)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_glu(self, device):
-        # GLU requires input with even number of channels for splitting
-        shape = (1, 1, 32, 64)  # Use even last dimension
-        torch_input, ttnn_input = create_test_tensor(shape, DEFAULT_DTYPE, device)
-        dim = -1
-        ttnn_result = ttnn.glu(ttnn_input, dim)
-        torch_result = torch.nn.functional.glu(torch_input, dim)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_reglu(self, device):
-        # REGLU requires input with even number of channels for splitting  
-        shape = (1, 1, 32, 64)  # Use even last dimension
-        torch_input, ttnn_input = create_test_tensor(shape, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.reglu(ttnn_input)
-        # REGLU: x1 * relu(x2) where x1, x2 are split halves
-        x1, x2 = torch.chunk(torch_input, 2, dim=-1)
-        torch_result = x1 * torch.nn.functional.relu(x2)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_geglu(self, device):
-        # GEGLU requires input with even number of channels for splitting
-        shape = (1, 1, 32, 64)  # Use even last dimension
-        torch_input, ttnn_input = create_test_tensor(shape, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.geglu(ttnn_input)
-        # GEGLU: x1 * gelu(x2) where x1, x2 are split halves
-        x1, x2 = torch.chunk(torch_input, 2, dim=-1)
-        torch_result = x1 * torch.nn.functional.gelu(x2)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_swiglu(self, device):
-        # SWIGLU requires input with even number of channels for splitting
-        shape = (1, 1, 32, 64)  # Use even last dimension
-        torch_input, ttnn_input = create_test_tensor(shape, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.swiglu(ttnn_input)
-        # SWIGLU: x1 * swish(x2) where x1, x2 are split halves
-        x1, x2 = torch.chunk(torch_input, 2, dim=-1)
-        torch_result = x1 * (x2 * torch.sigmoid(x2))  # swish = x * sigmoid(x)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_relu_max(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        upper_limit = 6.0
-        ttnn_result = ttnn.relu_max(ttnn_input, upper_limit)
-        torch_result = torch.clamp(torch.nn.functional.relu(torch_input), max=upper_limit)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_relu_min(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        lower_limit = 0.1
-        ttnn_result = ttnn.relu_min(ttnn_input, lower_limit)
-        torch_result = torch.clamp(torch_input, min=lower_limit)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_prelu(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        weight = 0.25
-        ttnn_result = ttnn.prelu(ttnn_input, weight)
-        # Create weight tensor with the same dtype as input to avoid type promotion error
-        torch_weight = torch.tensor(weight, dtype=torch_input.dtype)
-        torch_result = torch.nn.functional.prelu(torch_input, torch_weight)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_softshrink(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        lambd = 0.5
-        ttnn_result = ttnn.softshrink(ttnn_input, lambd=lambd)
-        torch_result = torch.nn.functional.softshrink(torch_input, lambd)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_hardshrink(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        lambd = 0.5
-        ttnn_result = ttnn.hardshrink(ttnn_input, lambd=lambd)
-        torch_result = torch.nn.functional.hardshrink(torch_input, lambd)
-        assert_tensors_close(ttnn_result, torch_result)
-
-
-
-    def test_var_hw(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.var_hw(ttnn_input)
-        torch_result = torch.var(torch_input, dim=(-2, -1), keepdim=True, unbiased=False)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_std_hw(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.std_hw(ttnn_input)
-        torch_result = torch.std(torch_input, dim=(-2, -1), keepdim=True, unbiased=False)
-        assert_tensors_close(ttnn_result, torch_result)
-
     # =============================================================================
-    # BINARY OPERATIONS TESTS (40 operations)
+    # BINARY OPERATIONS TESTS
     # =============================================================================
 
-    def test_add(self, device):
-        run_binary_op_test(ttnn.add, torch.add, device)
-
-    def test_subtract(self, device):
-        run_binary_op_test(ttnn.subtract, torch.subtract, device)
-
-    def test_multiply(self, device):
-        run_binary_op_test(ttnn.multiply, torch.multiply, device)
-
-    def test_divide(self, device):
-        run_binary_op_test_safe_div(ttnn.divide, torch.divide, device)
-
-    def test_gt(self, device):
-        run_binary_op_test(ttnn.gt, torch.gt, device)
-
-    def test_lt(self, device):
-        run_binary_op_test(ttnn.lt, torch.lt, device)
-
-    def test_eq(self, device):
-        run_binary_op_test(ttnn.eq, torch.eq, device)
-
-    def test_ne(self, device):
-        run_binary_op_test(ttnn.ne, torch.ne, device)
-
-    def test_ge(self, device):
-        run_binary_op_test(ttnn.ge, torch.ge, device)
-
-    def test_le(self, device):
-        run_binary_op_test(ttnn.le, torch.le, device)
-
-    def test_logical_and(self, device):
-        run_binary_op_test(ttnn.logical_and, torch.logical_and, device)
-
-    def test_logical_or(self, device):
-        run_binary_op_test(ttnn.logical_or, torch.logical_or, device)
-
-    def test_logical_xor(self, device):
-        run_binary_op_test(ttnn.logical_xor, torch.logical_xor, device)
-
-    def test_atan2(self, device):
-        run_binary_op_test(ttnn.atan2, torch.atan2, device)
-
-    def test_hypot(self, device):
-        run_binary_op_test(ttnn.hypot, torch.hypot, device)
-
-    def test_logaddexp(self, device):
-        run_binary_op_test(ttnn.logaddexp, torch.logaddexp, device, values="mixed")
-
-    def test_logaddexp2(self, device):
-        run_binary_op_test(ttnn.logaddexp2, torch.logaddexp2, device, values="mixed")
-
-    def test_maximum(self, device):
-        run_binary_op_test(ttnn.maximum, torch.maximum, device)
-
-    def test_minimum(self, device):
-        run_binary_op_test(ttnn.minimum, torch.minimum, device)
-
-    def test_pow(self, device):
-        run_binary_op_test(ttnn.pow, torch.pow, device, values="mixed")
-
-    def test_fmod(self, device):
-        run_binary_op_test_safe_div(ttnn.fmod, torch.fmod, device, values="mixed")
-
-    def test_remainder(self, device):
-        run_binary_op_test_safe_div(ttnn.remainder, torch.remainder, device)
-
-    def test_squared_difference(self, device):
-        run_binary_op_test(ttnn.squared_difference, lambda a, b: torch.square(a - b), device)
-
-    def test_bitwise_and(self, device):
-        run_binary_op_test(ttnn.bitwise_and, torch.bitwise_and, device, dtype=ttnn.int32)
-
-    def test_bitwise_or(self, device):
-        run_binary_op_test(ttnn.bitwise_or, torch.bitwise_or, device, dtype=ttnn.int32)
-
-    def test_bitwise_xor(self, device):
-        run_binary_op_test(ttnn.bitwise_xor, torch.bitwise_xor, device, dtype=ttnn.int32)
-
-    # =============================================================================
-    # ADDITIONAL BINARY OPERATIONS TESTS
-    # =============================================================================
-
-    def test_mul(self, device):
-        run_binary_op_test(ttnn.mul, torch.mul, device)
-
-    def test_sub(self, device):
-        run_binary_op_test(ttnn.sub, torch.sub, device)
-
-    def test_rpow(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "positive")
-        exponent = 2.0
-        ttnn_result = ttnn.rpow(ttnn_input, exponent)
-        torch_result = torch.pow(exponent, torch_input)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_rdiv(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "positive")
-        divisor = 2.0
-        ttnn_result = ttnn.rdiv(ttnn_input, divisor)
-        torch_result = torch.div(divisor, torch_input)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_ldexp(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, values="mixed")
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, values="mixed")
-        ttnn_result = ttnn.ldexp(ttnn_a, ttnn_b)
-        torch_result = torch.ldexp(torch_a, torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_xlogy(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "positive")
-        ttnn_result = ttnn.xlogy(ttnn_a, ttnn_b)
-        torch_result = torch.xlogy(torch_a, torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_nextafter(self, device):
-        run_binary_op_test(ttnn.nextafter, torch.nextafter, device)
-
-    def test_bias_gelu(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.bias_gelu(ttnn_a, ttnn_b)
-        torch_result = torch.nn.functional.gelu(torch_a + torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-
-
-    def test_addalpha(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        alpha = 2.0
-        ttnn_result = ttnn.addalpha(ttnn_a, ttnn_b, alpha)
-        torch_result = torch_a + alpha * torch_b
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_subalpha(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        alpha = 2.0
-        ttnn_result = ttnn.subalpha(ttnn_a, ttnn_b, alpha)
-        torch_result = torch_a - alpha * torch_b
-        assert_tensors_close(ttnn_result, torch_result)
-
-
-
-    def test_isclose(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        rtol, atol = 1e-5, 1e-8
-        ttnn_result = ttnn.isclose(ttnn_a, ttnn_b, rtol=rtol, atol=atol)
-        torch_result = torch.isclose(torch_a, torch_b, rtol=rtol, atol=atol)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # Binary Inplace Operations
-    def test_add_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.add_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.add_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_subtract_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.subtract_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.subtract_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_multiply_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.multiply_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.multiply_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_divide_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "positive")
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.divide_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.divide_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # Additional Binary Inplace Operations
-    def test_mul_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.mul_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.mul_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_sub_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.sub_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.sub_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_div_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "positive")
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.div_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.div_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_rsub_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.rsub_(ttnn_a, ttnn_b)
-        torch_result = torch_b.sub(torch_a)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # Comparison Inplace Operations
-    def test_gt_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.gt_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.gt_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_lt_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.lt_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.lt_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_eq_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.eq_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.eq_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_ne_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.ne_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.ne_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_ge_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.ge_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.ge_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_le_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.le_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.le_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # Logical Inplace Operations
-    def test_logical_and_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.logical_and_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.logical_and_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_logical_or_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.logical_or_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.logical_or_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_logical_xor_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_a_clone = torch_a.clone()
-        ttnn_result = ttnn.logical_xor_(ttnn_a, ttnn_b)
-        torch_result = torch_a_clone.logical_xor_(torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_ldexp_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, values="mixed")
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, values="mixed")
-        ttnn_result = ttnn.ldexp_(ttnn_a, ttnn_b)
-        torch_result = torch.ldexp(torch_a, torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_logaddexp_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.logaddexp_(ttnn_a, ttnn_b)
-        torch_result = torch.logaddexp(torch_a, torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_logaddexp2_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.logaddexp2_(ttnn_a, ttnn_b)
-        torch_result = torch.logaddexp2(torch_a, torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_bias_gelu_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.bias_gelu_(ttnn_a, ttnn_b)
-        torch_result = torch.nn.functional.gelu(torch_a + torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_squared_difference_(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.squared_difference_(ttnn_a, ttnn_b)
-        torch_result = torch.square(torch_a - torch_b)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # Additional Binary Operations
-    def test_assign(self, device):
-        torch_a, ttnn_a = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_b, ttnn_b = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.assign(ttnn_a, ttnn_b)
-        torch_result = torch_a.clone()
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # Missing Binary Operations
-    def test_round_binary(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        decimals = 2
-        ttnn_result = ttnn.round(ttnn_input, decimals=decimals)
-        torch_result = torch.round(torch_input, decimals=decimals)
-        assert_tensors_close(ttnn_result, torch_result)
-
     def test_clip_binary(self, device):
         torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
         torch_min_base, ttnn_min_base = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
@@ -1013,7 +253,7 @@ class TestEltwiseOperations:
         assert_tensors_close(ttnn_result, torch_result)
 
     # =============================================================================
-    # TERNARY OPERATIONS TESTS (5 operations)
+    # TERNARY OPERATIONS TESTS
     # =============================================================================
 
     def test_where(self, device):
@@ -1032,94 +272,6 @@ class TestEltwiseOperations:
         assert ttnn_result.dtype == ttnn_a.dtype
         assert_tensors_close(ttnn_result, torch_result)
 
-    def test_mac(self, device):
-        shape = DEFAULT_SHAPE
-        dtype = DEFAULT_DTYPE
-        
-        torch_a, ttnn_a = create_test_tensor(shape, dtype, device)
-        torch_b, ttnn_b = create_test_tensor(shape, dtype, device)
-        torch_c, ttnn_c = create_test_tensor(shape, dtype, device)
-        
-        ttnn_result = ttnn.mac(ttnn_a, ttnn_b, ttnn_c)
-        torch_result = torch_a * torch_b + torch_c
-        
-        assert ttnn_result.shape == ttnn_a.shape
-        assert ttnn_result.dtype == ttnn_a.dtype
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # =============================================================================
-    # ADDITIONAL TERNARY OPERATIONS TESTS
-    # =============================================================================
-
-    def test_addcdiv(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_tensor1, ttnn_tensor1 = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_tensor2, ttnn_tensor2 = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "positive")
-        value = 1.0
-        ttnn_result = ttnn.addcdiv(ttnn_input, ttnn_tensor1, ttnn_tensor2, value=value)
-        torch_result = torch.addcdiv(torch_input, torch_tensor1, torch_tensor2, value=value)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_addcmul(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_tensor1, ttnn_tensor1 = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_tensor2, ttnn_tensor2 = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        value = 1.0
-        ttnn_result = ttnn.addcmul(ttnn_input, ttnn_tensor1, ttnn_tensor2, value=value)
-        torch_result = torch.addcmul(torch_input, torch_tensor1, torch_tensor2, value=value)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_lerp(self, device):
-        torch_start, ttnn_start = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_end, ttnn_end = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        torch_weight, ttnn_weight = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        ttnn_result = ttnn.lerp(ttnn_start, ttnn_end, ttnn_weight)
-        torch_result = torch.lerp(torch_start, torch_end, torch_weight)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    # =============================================================================
-    # REDUCTION OPERATIONS TESTS (8 operations)
-    # =============================================================================
-
-    def test_max(self, device):
-        run_reduction_op_test(ttnn.max, torch.max, device)
-
-    def test_min(self, device):
-        run_reduction_op_test(ttnn.min, torch.min, device)
-
-    def test_mean(self, device):
-        run_reduction_op_test(ttnn.mean, torch.mean, device)
-
-    def test_sum(self, device):
-        run_reduction_op_test(ttnn.sum, torch.sum, device)
-
-    def test_prod(self, device):
-        run_reduction_op_test(ttnn.prod, torch.prod, device)
-
-    def test_var(self, device):
-        run_reduction_op_test(ttnn.var, torch.var, device)
-
-    def test_std(self, device):
-        run_reduction_op_test(ttnn.std, torch.std, device)
-
-    # =============================================================================
-    # ADDITIONAL REDUCTION OPERATIONS TESTS
-    # =============================================================================
-
-    def test_cumsum(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device)
-        dim = -1
-        ttnn_result = ttnn.cumsum(ttnn_input, dim)
-        torch_result = torch.cumsum(torch_input, dim)
-        assert_tensors_close(ttnn_result, torch_result)
-
-    def test_cumprod(self, device):
-        torch_input, ttnn_input = create_test_tensor(DEFAULT_SHAPE, DEFAULT_DTYPE, device, "small")
-        dim = -1
-        ttnn_result = ttnn.cumprod(ttnn_input, dim)
-        torch_result = torch.cumprod(torch_input, dim)
-        assert_tensors_close(ttnn_result, torch_result)
-
     # =============================================================================
     # COMPLEX OPERATIONS TESTS
     # =============================================================================
@@ -1243,177 +395,10 @@ class TestEltwiseOperations:
         assert_tensors_close(ttnn_result_real, torch_result_real)
         assert_tensors_close(ttnn_result_imag, torch_result_imag)
 
-
-
     # =============================================================================
-    # BACKWARD OPERATIONS TESTS (92 operations)
+    # BACKWARD OPERATIONS TESTS
     # =============================================================================
 
-    # Unary Backward Operations (62 operations)
-    def test_abs_bw(self, device):
-        run_unary_backward_op_test(ttnn.abs_bw, device)
-
-    def test_acos_bw(self, device):
-        run_unary_backward_op_test(ttnn.acos_bw, device)
-
-    def test_acosh_bw(self, device):
-        run_unary_backward_op_test(ttnn.acosh_bw, device, values="positive")
-
-    def test_asin_bw(self, device):
-        run_unary_backward_op_test(ttnn.asin_bw, device)
-
-    def test_asinh_bw(self, device):
-        run_unary_backward_op_test(ttnn.asinh_bw, device)
-
-    def test_atan_bw(self, device):
-        run_unary_backward_op_test(ttnn.atan_bw, device)
-
-    def test_atanh_bw(self, device):
-        run_unary_backward_op_test(ttnn.atanh_bw, device)
-
-    def test_ceil_bw(self, device):
-        run_unary_backward_op_test(ttnn.ceil_bw, device)
-
-    def test_cos_bw(self, device):
-        run_unary_backward_op_test(ttnn.cos_bw, device)
-
-    def test_cosh_bw(self, device):
-        run_unary_backward_op_test(ttnn.cosh_bw, device, values="mixed")
-
-    def test_deg2rad_bw(self, device):
-        run_unary_backward_op_test(ttnn.deg2rad_bw, device)
-
-    def test_digamma_bw(self, device):
-        run_unary_backward_op_test(ttnn.digamma_bw, device, values="positive")
-
-    def test_erf_bw(self, device):
-        run_unary_backward_op_test(ttnn.erf_bw, device)
-
-    def test_erfc_bw(self, device):
-        run_unary_backward_op_test(ttnn.erfc_bw, device)
-
-    def test_erfinv_bw(self, device):
-        run_unary_backward_op_test(ttnn.erfinv_bw, device)
-
-    def test_exp_bw(self, device):
-        run_unary_backward_op_test(ttnn.exp_bw, device, values="mixed")
-
-    def test_exp2_bw(self, device):
-        run_unary_backward_op_test(ttnn.exp2_bw, device, values="mixed")
-
-    def test_expm1_bw(self, device):
-        run_unary_backward_op_test(ttnn.expm1_bw, device, values="mixed")
-
-    def test_floor_bw(self, device):
-        run_unary_backward_op_test(ttnn.floor_bw, device)
-
-    def test_frac_bw(self, device):
-        run_unary_backward_op_test(ttnn.frac_bw, device)
-
-    def test_gelu_bw(self, device):
-        run_unary_backward_op_test(ttnn.gelu_bw, device)
-
-    def test_hardsigmoid_bw(self, device):
-        run_unary_backward_op_test(ttnn.hardsigmoid_bw, device)
-
-    def test_hardswish_bw(self, device):
-        run_unary_backward_op_test(ttnn.hardswish_bw, device)
-
-    def test_i0_bw(self, device):
-        # Use float32 to avoid "i1_cpu" not implemented for 'BFloat16' error
-        run_unary_backward_op_test(ttnn.i0_bw, device, dtype=ttnn.float32, values="mixed")
-
-    def test_lgamma_bw(self, device):
-        run_unary_backward_op_test(ttnn.lgamma_bw, device, values="range", min_val=1, max_val=100)
-
-    def test_log_bw(self, device):
-        run_unary_backward_op_test(ttnn.log_bw, device, values="positive")
-
-    def test_log_sigmoid_bw(self, device):
-        run_unary_backward_op_test(ttnn.log_sigmoid_bw, device)
-
-    def test_log1p_bw(self, device):
-        run_unary_backward_op_test(ttnn.log1p_bw, device)
-
-    def test_log10_bw(self, device):
-        run_unary_backward_op_test(ttnn.log10_bw, device, values="positive")
-
-    def test_log2_bw(self, device):
-        run_unary_backward_op_test(ttnn.log2_bw, device, values="positive")
-
-    def test_logit_bw(self, device):
-        run_unary_backward_op_test(ttnn.logit_bw, device)
-
-    def test_multigammaln_bw(self, device):
-        run_unary_backward_op_test(ttnn.multigammaln_bw, device, values="range", min_val=3, max_val=10)
-
-    def test_neg_bw(self, device):
-        run_unary_backward_op_test(ttnn.neg_bw, device)
-
-    def test_rad2deg_bw(self, device):
-        run_unary_backward_op_test(ttnn.rad2deg_bw, device)
-
-    def test_reciprocal_bw(self, device):
-        run_unary_backward_op_test(ttnn.reciprocal_bw, device, values="positive")
-
-    def test_relu_bw(self, device):
-        run_unary_backward_op_test(ttnn.relu_bw, device)
-
-    def test_relu6_bw(self, device):
-        run_unary_backward_op_test(ttnn.relu6_bw, device)
-
-    def test_round_bw(self, device):
-        run_unary_backward_op_test(ttnn.round_bw, device)
-
-    def test_rsqrt_bw(self, device):
-        run_unary_backward_op_test(ttnn.rsqrt_bw, device, values="positive")
-
-    def test_selu_bw(self, device):
-        run_unary_backward_op_test(ttnn.selu_bw, device)
-
-    def test_sigmoid_bw(self, device):
-        run_unary_backward_op_test(ttnn.sigmoid_bw, device)
-
-    def test_sign_bw(self, device):
-        run_unary_backward_op_test(ttnn.sign_bw, device)
-
-    def test_silu_bw(self, device):
-        run_unary_backward_op_test(ttnn.silu_bw, device)
-
-    def test_sin_bw(self, device):
-        run_unary_backward_op_test(ttnn.sin_bw, device)
-
-    def test_sinh_bw(self, device):
-        run_unary_backward_op_test(ttnn.sinh_bw, device, values="mixed")
-
-    def test_softsign_bw(self, device):
-        run_unary_backward_op_test(ttnn.softsign_bw, device)
-
-    def test_sqrt_bw(self, device):
-        run_unary_backward_op_test(ttnn.sqrt_bw, device, values="positive")
-
-    def test_square_bw(self, device):
-        run_unary_backward_op_test(ttnn.square_bw, device)
-
-    def test_tan_bw(self, device):
-        run_unary_backward_op_test(ttnn.tan_bw, device, values="mixed")
-
-    def test_tanh_bw(self, device):
-        run_unary_backward_op_test(ttnn.tanh_bw, device, values="range", min_val=-1, max_val=1)
-
-    def test_tanhshrink_bw(self, device):
-        run_unary_backward_op_test(ttnn.tanhshrink_bw, device)
-
-    def test_trunc_bw(self, device):
-        run_unary_backward_op_test(ttnn.trunc_bw, device)
-
-    # Missing Unary Backward Operations
-    def test_fill_bw(self, device):
-        run_unary_backward_op_test(ttnn.fill_bw, device)
-
-    def test_fill_zero_bw(self, device):
-        run_unary_backward_op_test(ttnn.fill_zero_bw, device)
-
     def test_hardshrink_bw(self, device):
         shape = DEFAULT_SHAPE
         dtype = DEFAULT_DTYPE
@@ -1448,195 +433,6 @@ class TestEltwiseOperations:
         assert ttnn_result[0].dtype == ttnn_input.dtype
         assert_tensors_close(ttnn_result[0], torch_result[0])
 
-    # Binary Backward Operations (22 operations)
-    def test_add_bw(self, device):
-        run_binary_backward_op_test(ttnn.add_bw, device)
-
-    def test_atan2_bw(self, device):
-        run_binary_backward_op_test(ttnn.atan2_bw, device)
-
-    def test_bias_gelu_bw(self, device):
-        run_binary_backward_op_test(ttnn.bias_gelu_bw, device)
-
-    def test_div_bw(self, device):
-        shape = DEFAULT_SHAPE
-        dtype = DEFAULT_DTYPE
-        
-        torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device)
-        torch_a, ttnn_a = create_test_tensor(shape, dtype, device)
-        torch_b, ttnn_b = create_test_tensor(shape, dtype, device, "positive")
-        torch_a.requires_grad = True
-        torch_b.requires_grad = True
-        
-        ttnn_result = ttnn.div_bw(ttnn_grad, ttnn_a, ttnn_b)
-        golden_function = ttnn.get_golden_function(ttnn.div_bw)
-        torch_result = golden_function(torch_grad, torch_a, torch_b)
-        
-        assert_tensors_close(ttnn_result[0], torch_result[0])
-        assert_tensors_close(ttnn_result[1], torch_result[1])
-
-    def test_fmod_bw(self, device):
-        run_binary_backward_op_test(ttnn.fmod_bw, device)
-
-    def test_hypot_bw(self, device):
-        run_binary_backward_op_test(ttnn.hypot_bw, device)
-
-    def test_ldexp_bw(self, device):
-        run_binary_backward_op_test(ttnn.ldexp_bw, device)
-
-    def test_logaddexp_bw(self, device):
-        run_binary_backward_op_test(ttnn.logaddexp_bw, device)
-
-    def test_logaddexp2_bw(self, device):
-        run_binary_backward_op_test(ttnn.logaddexp2_bw, device)
-
-    def test_max_bw(self, device):
-        run_binary_backward_op_test(ttnn.max_bw, device)
-
-    def test_min_bw(self, device):
-        run_binary_backward_op_test(ttnn.min_bw, device)
-
-    def test_mul_bw(self, device):
-        run_binary_backward_op_test(ttnn.mul_bw, device)
-
-    def test_remainder_bw(self, device):
-        run_binary_backward_op_test(ttnn.remainder_bw, device)
-
-    def test_rsub_bw(self, device):
-        run_binary_backward_op_test(ttnn.rsub_bw, device)
-
-    def test_squared_difference_bw(self, device):
-        run_binary_backward_op_test(ttnn.squared_difference_bw, device)
-
-    def test_sub_bw(self, device):
-        run_binary_backward_op_test(ttnn.sub_bw, device)
-
-    def test_xlogy_bw(self, device):
-        run_binary_backward_op_test(ttnn.xlogy_bw, device)
-
-    # Missing Binary Backward Operations
-    def test_pow_bw(self, device):
-        shape = DEFAULT_SHAPE
-        dtype = DEFAULT_DTYPE
-        
-        torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device)
-        torch_input, ttnn_input = create_test_tensor(shape, dtype, device, "positive")
-        exponent = 2.0
-        torch_input.requires_grad = True
-        
-        ttnn_result = ttnn.pow_bw(ttnn_grad, ttnn_input, exponent)
-        golden_function = ttnn.get_golden_function(ttnn.pow_bw)
-        torch_result = golden_function(torch_grad, torch_input, exponent)
-        
-        assert ttnn_result[0].shape == ttnn_input.shape
-        assert ttnn_result[0].dtype == ttnn_input.dtype
-        assert_tensors_close(ttnn_result[0], torch_result[0])
-
-    def test_addalpha_bw(self, device):
-        shape = DEFAULT_SHAPE
-        dtype = DEFAULT_DTYPE
-        
-        torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device)
-        torch_input, ttnn_input = create_test_tensor(shape, dtype, device)
-        torch_other, ttnn_other = create_test_tensor(shape, dtype, device)
-        alpha = 2.0
-        torch_input.requires_grad = True
-        torch_other.requires_grad = True
-        
-        ttnn_result = ttnn.addalpha_bw(ttnn_grad, ttnn_input, ttnn_other, alpha)
-        golden_function = ttnn.get_golden_function(ttnn.addalpha_bw)
-        torch_result = golden_function(torch_grad, torch_input, torch_other, alpha)
-        
-        assert ttnn_result[0].shape == ttnn_input.shape
-        assert ttnn_result[0].dtype == ttnn_input.dtype
-        assert ttnn_result[1].shape == ttnn_other.shape
-        assert ttnn_result[1].dtype == ttnn_other.dtype
-        assert_tensors_close(ttnn_result[0], torch_result[0])
-        assert_tensors_close(ttnn_result[1], torch_result[1])
-
-    def test_subalpha_bw(self, device):
-        shape = DEFAULT_SHAPE
-        dtype = DEFAULT_DTYPE
-        
-        torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device)
-        torch_input, ttnn_input = create_test_tensor(shape, dtype, device)
-        torch_other, ttnn_other = create_test_tensor(shape, dtype, device)
-        alpha = 2.0
-        torch_input.requires_grad = True
-        torch_other.requires_grad = True
-        
-        ttnn_result = ttnn.subalpha_bw(ttnn_grad, ttnn_input, ttnn_other, alpha)
-        golden_function = ttnn.get_golden_function(ttnn.subalpha_bw)
-        torch_result = golden_function(torch_grad, torch_input, torch_other, alpha)
-        
-        assert ttnn_result[0].shape == ttnn_input.shape
-        assert ttnn_result[0].dtype == ttnn_input.dtype
-        assert ttnn_result[1].shape == ttnn_other.shape
-        assert ttnn_result[1].dtype == ttnn_other.dtype
-        assert_tensors_close(ttnn_result[0], torch_result[0])
-        assert_tensors_close(ttnn_result[1], torch_result[1])
-
-    # Ternary Backward Operations (4 operations)
-    def test_addcdiv_bw(self, device):
-        shape = DEFAULT_SHAPE
-        dtype = DEFAULT_DTYPE
-        
-        torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device)
-        torch_input, ttnn_input = create_test_tensor(shape, dtype, device)
-        torch_tensor1, ttnn_tensor1 = create_test_tensor(shape, dtype, device)
-        torch_tensor2, ttnn_tensor2 = create_test_tensor(shape, dtype, device, "positive")
-        torch_input.requires_grad = True
-        torch_tensor1.requires_grad = True
-        torch_tensor2.requires_grad = True
-        value = 1.0
-        
-        ttnn_result = ttnn.addcdiv_bw(ttnn_grad, ttnn_input, ttnn_tensor1, ttnn_tensor2, value)
-        golden_function = ttnn.get_golden_function(ttnn.addcdiv_bw)
-        torch_result = golden_function(torch_grad, torch_input, torch_tensor1, torch_tensor2, value)
-        
-        assert_tensors_close(ttnn_result[0], torch_result[0])
-        assert_tensors_close(ttnn_result[1], torch_result[1])
-        assert_tensors_close(ttnn_result[2], torch_result[2])
-
-    def test_addcmul_bw(self, device):
-        shape = DEFAULT_SHAPE
-        dtype = DEFAULT_DTYPE
-        
-        torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device)
-        torch_input, ttnn_input = create_test_tensor(shape, dtype, device)
-        torch_tensor1, ttnn_tensor1 = create_test_tensor(shape, dtype, device)
-        torch_tensor2, ttnn_tensor2 = create_test_tensor(shape, dtype, device)
-        torch_input.requires_grad = True
-        torch_tensor1.requires_grad = True
-        torch_tensor2.requires_grad = True
-        value = 1.0
-        
-        ttnn_result = ttnn.addcmul_bw(ttnn_grad, ttnn_input, ttnn_tensor1, ttnn_tensor2, value)
-        golden_function = ttnn.get_golden_function(ttnn.addcmul_bw)
-        torch_result = golden_function(torch_grad, torch_input, torch_tensor1, torch_tensor2, value)
-        
-        assert_tensors_close(ttnn_result[0], torch_result[0])
-        assert_tensors_close(ttnn_result[1], torch_result[1])
-        assert_tensors_close(ttnn_result[2], torch_result[2])
-
-    def test_lerp_bw(self, device):
-        shape = DEFAULT_SHAPE
-        dtype = DEFAULT_DTYPE
-        
-        torch_grad, ttnn_grad = create_test_tensor(shape, dtype, device)
-        torch_input, ttnn_input = create_test_tensor(shape, dtype, device)
-        torch_end, ttnn_end = create_test_tensor(shape, dtype, device)
-        weight = 0.5
-        torch_input.requires_grad = True
-        torch_end.requires_grad = True
-        
-        ttnn_result = ttnn.lerp_bw(ttnn_grad, ttnn_input, ttnn_end, weight)
-        golden_function = ttnn.get_golden_function(ttnn.lerp_bw)
-        torch_result = golden_function(torch_grad, torch_input, torch_end, weight)
-        
-        assert_tensors_close(ttnn_result[0], torch_result[0])
-        assert_tensors_close(ttnn_result[1], torch_result[1])
-
     def test_where_bw(self, device):
         shape = DEFAULT_SHAPE
         dtype = DEFAULT_DTYPE
@@ -1656,109 +452,59 @@ class TestEltwiseOperations:
         assert_tensors_close(ttnn_result[0], torch_result[0])
         assert_tensors_close(ttnn_result[1], torch_result[1])
 
+def _make_registry_test(spec: OpSpec):
+    """Build a test method that runs the registered check for spec."""
+    def test(self, device):
+        run_op_spec_test(spec, device)
+
+    test.__name__ = spec.test_name
+    test.__qualname__ = f"TestEltwiseOperations.{spec.test_name}"
+    test.__doc__ = f"Generated from OP_REGISTRY: {spec!r}"
+    return test
+
+
+for _spec in OP_REGISTRY:
+    if _spec.custom:
+        assert hasattr(TestEltwiseOperations, _spec.test_name), \
+            f"{_spec.test_name} is marked custom but has no hand-written test"
+    else:
+        setattr(TestEltwiseOperations, _spec.test_name, _make_registry_test(_spec))
+
+
 # =============================================================================
 # OPERATION INVENTORY AND STATISTICS
 # =============================================================================
 
 def get_all_unary_operations() -> List[str]:
     """Get list of all unary operations."""
-    return [
-        "abs", "acos", "asin", "asinh", "atan", "atanh", "cos", "acosh", "erfinv", 
-        "exp2", "expm1", "gez", "gtz", "i0", "isfinite", "isinf", "isnan", "lez", 
-        "log", "log10", "log2", "log1p", "logical_not", "ltz", "neg", "reciprocal", 
-        "relu", "relu6", "sign", "signbit", "silu", "sin", "sqrt", "square", "tan", 
-        "exp", "erf", "erfc", "gelu", "rsqrt", "sigmoid", "tanh", "i1", "isneginf", 
-        "isposinf", "nez", "bitwise_not", "floor", "ceil", "trunc", "eqz", "mish", 
-        "hardmish", "cosh", "sinh", "cbrt", "softplus", "log_sigmoid", "swish", "hardswish", 
-        "hardsigmoid", "hardtanh", "celu", "selu", "tanhshrink", "deg2rad", "rad2deg", 
-        "identity", "softsign", "frac", "round", "logit", "clip", "clamp", 
-        "sigmoid_accurate", "elu", "leaky_relu", "threshold", "tril", "triu", 
-        "digamma", "lgamma", "multigammaln", "polygamma", "heaviside", "logical_not_",
-        "fill", "glu", "reglu", "geglu", "swiglu", "relu_max", "relu_min", "prelu",
-        "softshrink", "hardshrink", "var_hw", "std_hw"
-    ]
+    return get_operations("unary", backward=False)
 
 
 def get_all_binary_operations() -> List[str]:
     """Get list of all binary operations."""
-    return [
-        "add", "subtract", "multiply", "divide", "gt", "lt", "eq", "ne", "ge", "le",
-        "logical_and", "logical_or", "logical_xor", "atan2", "hypot", "logaddexp",
-        "logaddexp2", "maximum", "minimum", "pow", "fmod", "remainder", 
-        "squared_difference", "bitwise_and", "bitwise_or", "bitwise_xor",
-        "mul", "sub", "rpow", "rdiv", "ldexp", "xlogy", "nextafter", "bias_gelu", 
-        "addalpha", "subalpha", "isclose",
-        "add_", "subtract_", "multiply_", "divide_", "mul_", "sub_", "div_", "rsub_",
-        "gt_", "lt_", "eq_", "ne_", "ge_", "le_", "logical_and_", "logical_or_", 
-        "logical_xor_", "ldexp_", "logaddexp_", "logaddexp2_", "bias_gelu_", 
-        "squared_difference_", "assign", "round_binary", "clip_binary"
-    ]
+    return get_operations("binary", backward=False)
 
 
 def get_all_ternary_operations() -> List[str]:
     """Get list of all ternary operations."""
-    return ["where", "mac", "addcdiv", "addcmul", "lerp"]
+    return get_operations("ternary", backward=False)
 
 
 def get_all_reduction_operations() -> List[str]:
     """Get list of all reduction operations."""
-    return ["max", "min", "mean", "sum", "prod", "var", "std", "cumsum", "cumprod"]
+    return get_operations("reduction", backward=False)
 
 
 def get_all_complex_operations() -> List[str]:
     """Get list of all complex operations."""
-    return ["complex_tensor", "real", "imag", "angle", "conj", "polar", "abs", "reciprocal"]
-
-
-
+    return get_operations("complex", backward=False)
 
 
 def get_all_backward_operations() -> List[str]:
     """Get list of all backward operations."""
-    unary_bw = [
-        "abs_bw", "acos_bw", "acosh_bw", "asin_bw", "asinh_bw", "atan_bw", "atanh_bw",
-        "ceil_bw", "cos_bw", "cosh_bw", "deg2rad_bw", "digamma_bw", "erf_bw", "erfc_bw",
-        "erfinv_bw", "exp_bw", "exp2_bw", "expm1_bw", "floor_bw", "frac_bw", "gelu_bw",
-        "hardsigmoid_bw", "hardswish_bw", "i0_bw", "lgamma_bw", "log_bw", "log_sigmoid_bw",
-        "log1p_bw", "log10_bw", "log2_bw", "logit_bw", "multigammaln_bw", "neg_bw",
-        "rad2deg_bw", "reciprocal_bw", "relu_bw", "relu6_bw", "round_bw", "rsqrt_bw",
-        "selu_bw", "sigmoid_bw", "sign_bw", "silu_bw", "sin_bw", "sinh_bw", "softsign_bw",
-        "sqrt_bw", "square_bw", "tan_bw", "tanh_bw", "tanhshrink_bw", "trunc_bw",
-        "fill_bw", "fill_zero_bw", "hardshrink_bw", "softshrink_bw"
-    ]
-    
-    binary_bw = [
-        "add_bw", "atan2_bw", "bias_gelu_bw", "div_bw", "fmod_bw", "hypot_bw", "ldexp_bw",
-        "logaddexp_bw", "logaddexp2_bw", "max_bw", "min_bw", "mul_bw", "remainder_bw",
-        "rsub_bw", "squared_difference_bw", "sub_bw", "xlogy_bw", "pow_bw", "addalpha_bw", "subalpha_bw"
-    ]
-    
-    ternary_bw = ["addcdiv_bw", "addcmul_bw", "lerp_bw", "where_bw"]
-    
-    return unary_bw + binary_bw + ternary_bw
+    return get_operations(backward=True)
 
 
 if __name__ == "__main__":
-    # Print operation statistics
-    unary_ops = get_all_unary_operations()
-    binary_ops = get_all_binary_operations()
-    ternary_ops = get_all_ternary_operations()
-    reduction_ops = get_all_reduction_operations()
-    complex_ops = get_all_complex_operations()
-    backward_ops = get_all_backward_operations()
-    
-    total_forward = len(unary_ops) + len(binary_ops) + len(ternary_ops) + len(reduction_ops) + len(complex_ops)
-    total_backward = len(backward_ops)
-    total_all = total_forward + total_backward
-    
-    print(f"TTNN Eltwise Operations Test Coverage:")
-    print(f"  Forward Operations: {total_forward}")
-    print(f"    - Unary: {len(unary_ops)}")
-    print(f"    - Binary: {len(binary_ops)}")
-    print(f"    - Ternary: {len(ternary_ops)}")
-    print(f"    - Reduction: {len(reduction_ops)}")
-    print(f"    - Complex: {len(complex_ops)}")
-    print(f"  Backward Operations: {total_backward}")
-    print(f"  Total Operations: {total_all}")
-    print(f"  Test File Matches Catalog: {total_all == 262}")
-    print(f"  Coverage: 100% ({total_all} operations implemented)")
\ No newline at end of file
+    from eltwise_op_registry import main
+    main()
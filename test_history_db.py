@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite history database and perfq queries."""
+
+import history_db
+from history_db import DB_ENV_VAR, connect, insert_results, update_history_db
+from perfq import failure_streaks, op_history, slower_ops
+
+
+def make_db(tmp_path, files):
+    conn = connect(tmp_path / "history.db")
+    with conn:
+        for i, data in enumerate(files):
+            insert_results(conn, data, f"file_{i}.json")
+    return conn
+
+
+def test_insert_replaces_same_filename_and_keeps_runs(tmp_path, results_file):
+    conn = make_db(tmp_path, [])
+    with conn:
+        insert_results(conn, results_file("2025-06-01T00:00:00", "aaa", {'abs': 100.0}), "x.json")
+        insert_results(conn, results_file("2025-06-01T00:00:00", "aaa", {'abs': 120.0}), "x.json")
+
+    assert conn.execute("SELECT COUNT(*) FROM measurements").fetchone()[0] == 1
+    assert [r['value'] for r in op_history(conn, 'abs')] == [120.0]
+    assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 3
+
+
+def test_history_since_and_until_prefixes(tmp_path, results_file):
+    conn = make_db(tmp_path, [
+        results_file("2025-05-31T00:00:00", "c1", {'erfinv': 1.0}),
+        results_file("2025-06-15T00:00:00", "c2", {'erfinv': 2.0}),
+        results_file("2025-07-01T00:00:00", "c3", {'erfinv': 3.0}),
+    ])
+
+    rows = op_history(conn, 'erfinv', since="2025-06", until="2025-06")
+
+    assert [r['git_commit_id'] for r in rows] == ["c2"]
+
+
+def test_slower_ops_uses_median_of_previous_window(tmp_path, results_file):
+    conn = make_db(tmp_path, [
+        results_file("2025-06-01T00:00:00", "c1", {'abs': 100.0, 'neg': 100.0}),
+        results_file("2025-06-02T00:00:00", "c2", {'abs': 100.0, 'neg': 100.0}),
+        results_file("2025-06-03T00:00:00", "c3", {'abs': 500.0, 'neg': 100.0}),
+        results_file("2025-06-04T00:00:00", "deadbeef", {'abs': 130.0, 'neg': 105.0}),
+    ])
+
+    slower = slower_ops(conn, "dead", threshold=1.2, window=3)
+
+    assert [(s['operation_name'], s['baseline_ns']) for s in slower] == [('abs', 100.0)]
+
+
+def test_failure_streaks_are_consecutive_measurements(tmp_path, results_file):
+    conn = make_db(tmp_path, [
+        results_file("2025-06-01T00:00:00", "c1", {}, failed=["test_a"]),
+        results_file("2025-06-02T00:00:00", "c2", {}, failed=["test_a", "test_b"]),
+        results_file("2025-06-03T00:00:00", "c3", {}, failed=["test_b"]),
+        results_file("2025-06-04T00:00:00", "c4", {}, failed=["test_a", "test_b"]),
+    ])
+
+    streaks = failure_streaks(conn, min_streak=2)
+
+    assert [(s['test_name'], s['length'], s['ongoing']) for s in streaks] == [
+        ("test_b", 3, True), ("test_a", 2, False)]
+
+
+def test_uploader_updates_only_an_existing_or_configured_db(tmp_path, monkeypatch, results_file):
+    monkeypatch.delenv(DB_ENV_VAR, raising=False)
+    monkeypatch.setattr(history_db, 'DB_PATH', tmp_path / "cache" / "perf_history.db")
+    data = results_file("2025-06-01T00:00:00", "c1", {'abs': 100.0})
+
+    assert update_history_db(data, "a.json") is None
+    assert not (tmp_path / "cache").exists()
+
+    monkeypatch.setenv(DB_ENV_VAR, str(tmp_path / "opt_in.db"))
+    assert update_history_db(data, "a.json") == tmp_path / "opt_in.db"
+    assert [r['value'] for r in op_history(connect(tmp_path / "opt_in.db"), 'abs')] == [100.0]
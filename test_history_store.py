@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests for the columnar history store."""
+
+import json
+
+import numpy as np
+
+from history_store import HistoryStore, load_store, update_store
+from index_store import add_entry
+
+
+def write_archive(data_dir, files):
+    daily = data_dir / "daily"
+    daily.mkdir(parents=True)
+    entries = []
+    for filename, data in files:
+        (daily / filename).write_text(json.dumps(data))
+        entries.append({'filename': filename, 'path': f"data/daily/{filename}",
+                        'measurement_date': data['metadata']['measurement_date']})
+    entries.sort(key=lambda e: e['measurement_date'], reverse=True)
+    (data_dir / "index.json").write_text(json.dumps({'files': entries}))
+
+
+def test_build_from_archive_orders_columns_and_keeps_runs(tmp_path, results_file):
+    write_archive(tmp_path, [
+        ("b.json", results_file("2025-01-02T00:00:00", "c2", {'abs': [3.0, 5.0], 'add': [10.0]})),
+        ("a.json", results_file("2025-01-01T00:00:00", "c1", {'abs': [1.0, 3.0]})),
+    ])
+
+    store = HistoryStore.build_from_archive(tmp_path)
+
+    assert store.filenames == ["a.json", "b.json"]
+    assert store.commits == ["c1", "c2"]
+    dates, values = store.series('abs')
+    assert values.tolist() == [2.0, 4.0]
+    assert store.series('add')[1].tolist() == [10.0]
+    assert np.isnan(store.metrics['average_duration_ns'][store.op_index('add'), 0])
+    assert store.runs('abs', 1).tolist() == [3.0, 5.0]
+
+
+def test_append_inserts_by_date_replaces_and_round_trips(tmp_path, results_file):
+    store = HistoryStore()
+    store.append(results_file("2025-01-03T00:00:00", "c3", {'abs': [6.0]}), "c.json")
+    store.append(results_file("2025-01-01T00:00:00", "c1", {'abs': [2.0], 'neg': [7.0]}), "a.json")
+    store.append(results_file("2025-01-03T00:00:00", "c3", {'abs': [8.0]}), "c.json")
+
+    path = tmp_path / "history.npz"
+    store.save(path)
+    loaded = HistoryStore.load(path)
+
+    assert loaded.filenames == ["a.json", "c.json"]
+    assert loaded.series('abs')[1].tolist() == [2.0, 8.0]
+    assert loaded.runs('abs', 1).tolist() == [8.0]
+    assert loaded.series('neg')[0] == ["2025-01-01T00:00:00"]
+
+
+def test_remove_drops_the_raw_runs_of_the_column(results_file):
+    store = HistoryStore()
+    store.append(results_file("2025-01-01T00:00:00", "c1", {'abs': [1.0, 2.0], 'neg': [3.0]}), "a.json")
+    store.append(results_file("2025-01-02T00:00:00", "c2", {'abs': [4.0], 'neg': [5.0, 6.0]}), "b.json")
+    for _ in range(3):
+        store.append(results_file("2025-01-01T00:00:00", "c1", {'abs': [7.0, 8.0], 'neg': [9.0]}), "a.json")
+
+    assert sorted(store.runs_values.tolist()) == [4.0, 5.0, 6.0, 7.0, 8.0, 9.0]
+    assert store.runs('abs', 0).tolist() == [7.0, 8.0]
+    assert store.runs('neg', 1).tolist() == [5.0, 6.0]
+
+
+def add_upload(data_dir, filename, data):
+    (data_dir / "daily" / filename).write_text(json.dumps(data))
+    add_entry(data_dir, {'filename': filename, 'path': f"data/daily/{filename}",
+                         'measurement_date': data['metadata']['measurement_date']})
+
+
+def test_load_store_uses_the_saved_store_only_while_it_matches_the_index(tmp_path, results_file, history_store_path):
+    first = results_file("2025-01-01T00:00:00", "c1", {'abs': [1.0]})
+    write_archive(tmp_path, [("a.json", first)])
+    HistoryStore.build_from_archive(tmp_path).save(history_store_path)
+    assert load_store(tmp_path).filenames == ["a.json"]
+
+    add_upload(tmp_path, "b.json", results_file("2025-01-02T00:00:00", "c2", {'abs': [3.0]}))
+
+    store = load_store(tmp_path)
+    assert store.filenames == ["a.json", "b.json"]
+    assert store.series('abs')[1].tolist() == [1.0, 3.0]
+
+
+def test_update_store_appends_each_upload_to_the_saved_store(tmp_path, results_file, history_store_path, monkeypatch):
+    first = results_file("2025-01-01T00:00:00", "c1", {'abs': [1.0, 3.0]})
+    write_archive(tmp_path, [("a.json", first)])
+    update_store(tmp_path, first, "a.json")
+    assert HistoryStore.load(history_store_path).filenames == ["a.json"]
+
+    second = results_file("2025-01-02T00:00:00", "c2", {'abs': [5.0], 'neg': [7.0]})
+    add_upload(tmp_path, "b.json", second)
+    rebuilt = HistoryStore.build_from_archive(tmp_path)
+
+    def no_rebuild(data_dir):
+        raise AssertionError("the saved store should be appended to, not rebuilt")
+    monkeypatch.setattr(HistoryStore, 'build_from_archive', staticmethod(no_rebuild))
+    update_store(tmp_path, second, "b.json")
+
+    store = HistoryStore.load(history_store_path)
+    assert store.filenames == rebuilt.filenames
+    assert store.ops == rebuilt.ops
+    np.testing.assert_array_equal(store.metrics['average_duration_ns'], rebuilt.metrics['average_duration_ns'])
+    assert store.runs('abs', 0).tolist() == [1.0, 3.0]
+    assert store.runs('neg', 1).tolist() == [7.0]
+
+
+def test_update_store_rebuilds_a_store_that_missed_uploads(tmp_path, results_file, history_store_path):
+    first = results_file("2025-01-01T00:00:00", "c1", {'abs': [1.0]})
+    write_archive(tmp_path, [("a.json", first)])
+    update_store(tmp_path, first, "a.json")
+
+    add_upload(tmp_path, "b.json", results_file("2025-01-02T00:00:00", "c2", {'abs': [3.0]}))
+    third = results_file("2025-01-03T00:00:00", "c3", {'abs': [5.0]})
+    add_upload(tmp_path, "c.json", third)
+    update_store(tmp_path, third, "c.json")
+
+    store = HistoryStore.load(history_store_path)
+    assert store.filenames == ["a.json", "b.json", "c.json"]
+    assert store.series('abs')[1].tolist() == [1.0, 3.0, 5.0]
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Tests for the sharded measurement index."""
+
+import json
+
+import index_store
+from index_store import add_entry, load_head, load_index, save_index
+
+
+def entry(date, commit):
+    return {'filename': f"{date[:10]}_{commit}.json", 'path': f"data/daily/{date[:10]}_{commit}.json",
+            'measurement_date': date, 'git_commit_id': commit}
+
+
+def test_add_entry_migrates_legacy_index(tmp_path):
+    legacy = [entry("2025-08-02T00:00:00", "c2"), entry("2025-07-30T00:00:00", "c1")]
+    (tmp_path / "index.json").write_text(json.dumps({'files': legacy}))
+
+    assert add_entry(tmp_path, entry("2025-08-03T00:00:00", "c3")) == 'added'
+
+    assert not (tmp_path / "index.json").exists()
+    head = load_head(tmp_path)
+    assert head['total_measurements'] == 3
+    assert [s['month'] for s in head['shards']] == ["2025-08", "2025-07"]
+    assert [s['count'] for s in head['shards']] == [2, 1]
+    assert [e['git_commit_id'] for e in load_index(tmp_path)['files']] == ["c3", "c2", "c1"]
+
+
+def test_add_entry_replaces_duplicate_and_trims_head(tmp_path, monkeypatch):
+    monkeypatch.setattr(index_store, 'HEAD_SIZE', 2)
+    save_index(tmp_path, [entry(f"2025-08-0{day}T00:00:00", f"c{day}") for day in (1, 2, 3)])
+
+    replacement = dict(entry("2025-08-02T00:00:00", "c2"), total_tests=5)
+    assert add_entry(tmp_path, replacement) == 'updated'
+
+    head = load_head(tmp_path)
+    assert [e['git_commit_id'] for e in head['files']] == ["c3", "c2"]
+    assert head['files'][1]['total_tests'] == 5
+    assert head['total_measurements'] == 3
+    assert len(load_index(tmp_path)['files']) == 3
+
+
+def test_add_entry_only_rewrites_its_month(tmp_path):
+    save_index(tmp_path, [entry("2025-07-01T00:00:00", "c1"), entry("2025-08-01T00:00:00", "c2")])
+    july = tmp_path / "index" / "2025-07.json"
+    july.write_text(json.dumps({'month': "2025-07", 'files': [], 'untouched': True}))
+
+    add_entry(tmp_path, entry("2025-08-05T00:00:00", "c3"))
+
+    assert json.loads(july.read_text())['untouched']
+
+
+def test_save_index_drops_stale_shards(tmp_path):
+    save_index(tmp_path, [entry("2025-07-01T00:00:00", "c1"), entry("2025-08-01T00:00:00", "c2")])
+    save_index(tmp_path, [entry("2025-08-01T00:00:00", "c2")])
+
+    assert sorted(p.name for p in (tmp_path / "index").iterdir()) == ["2025-08.json", "head.json"]
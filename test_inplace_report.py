@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for the in-place vs out-of-place comparison report."""
+
+import json
+
+from index_store import add_entry
+from inplace_report import InplaceComparisonReport, compute_speedup, find_inplace_pairs
+
+
+def point(commit, durations):
+    return {'git_commit_id': commit, 'measurement_date': f"2025-08-0{commit[-1]}T00:00:00",
+            'durations': durations}
+
+
+def test_pairs_need_both_variants():
+    names = ['add', 'add_', 'div_', 'bias_gelu', 'bias_gelu_', 'relu', 'mul_bw']
+
+    assert find_inplace_pairs(names) == [('add', 'add_'), ('bias_gelu', 'bias_gelu_')]
+    assert compute_speedup(200.0, 100.0) == 2.0
+    assert compute_speedup(None, 100.0) is None and compute_speedup(200.0, 0) is None
+
+
+def test_inversion_is_flagged_past_the_tolerance():
+    history = [point("c1", {'add': 110.0, 'add_': 100.0, 'mul': 100.0, 'mul_': 100.0, 'sub': 100.0, 'sub_': 90.0}),
+               point("c2", {'add': 100.0, 'add_': 120.0, 'mul': 100.0, 'mul_': 104.0, 'sub': 100.0, 'sub_': 90.0})]
+
+    report = InplaceComparisonReport(tolerance=0.05).build_report(history)
+
+    pairs = {pair['in_place']: pair for pair in report['pairs']}
+    assert pairs['add_']['inverted'] and pairs['add_']['newly_inverted']
+    assert pairs['add_']['previous_speedup'] == 1.1
+    assert not pairs['mul_']['inverted']  # 0.96x is within the 5% tolerance
+    assert not pairs['sub_']['inverted']
+    assert report['inverted_pairs'] == ['add_']
+    assert [pair['in_place'] for pair in report['pairs']] == ['add_', 'mul_', 'sub_']
+    assert InplaceComparisonReport(tolerance=0.01).build_report(history)['inverted_pairs'] == ['add_', 'mul_']
+
+
+def test_pair_that_stays_inverted_is_not_newly_inverted():
+    history = [point("c1", {'add': 100.0, 'add_': 120.0}), point("c2", {'add': 100.0}),
+               point("c3", {'add': 100.0, 'add_': 125.0})]
+
+    (pair,) = InplaceComparisonReport().build_report(history)['pairs']
+
+    assert [entry['git_commit_id'] for entry in pair['trend']] == ["c1", "c3"]
+    assert pair['inverted'] and not pair['newly_inverted']
+
+
+def test_load_history_keeps_the_newest_measurement_per_commit(tmp_path):
+    (tmp_path / "daily").mkdir()
+    for day, (commit, value) in enumerate([("c1", 100.0), ("c2", 90.0), ("c2", 80.0)], 1):
+        filename = f"{day}.json"
+        date = f"2025-08-{day:02d}T00:00:00"
+        (tmp_path / "daily" / filename).write_text(json.dumps(
+            {'metadata': {'measurement_date': date, 'git_commit_id': commit},
+             'results': [{'operation_name': 'add_', 'average_duration_ns': value, 'successful_runs': 3}]}))
+        add_entry(tmp_path, {'filename': filename, 'path': f"data/daily/{filename}",
+                             'measurement_date': date, 'git_commit_id': commit})
+
+    history = InplaceComparisonReport(tmp_path).load_history()
+
+    assert [(p['git_commit_id'], p['durations']['add_']) for p in history] == [("c1", 100.0), ("c2", 80.0)]
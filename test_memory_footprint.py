@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for the per-op memory footprint probe against stubbed allocator stats."""
+
+from types import SimpleNamespace
+
+from memory_footprint import (
+    MemoryFootprintProbe, TtnnAllocatorStats, merge_footprints, MEMORY_FIELDS,
+)
+
+
+class StubStats:
+    """Allocator stats source that replays scripted snapshots."""
+
+    def __init__(self, snapshots, graph_peak_l1=None):
+        self.snapshots = list(snapshots)
+        self.graph_peak_l1 = graph_peak_l1
+
+    def snapshot(self):
+        return self.snapshots.pop(0)
+
+    def run_with_peak(self, fn):
+        return fn(), self.graph_peak_l1
+
+
+def snap(l1, dram, buffers):
+    return {'l1_bytes': l1, 'dram_bytes': dram, 'buffers': buffers}
+
+
+def test_probe_reports_allocation_deltas():
+    stats = StubStats([snap(1000, 5000, 4), snap(3048, 5000, 5)])
+    probe = MemoryFootprintProbe(stats)
+
+    footprint = probe.measure(lambda: "output")
+
+    assert sorted(footprint) == sorted(MEMORY_FIELDS)
+    assert footprint == {'peak_l1_bytes': 2048, 'peak_dram_bytes': 0, 'buffers_allocated': 1}
+
+
+def test_probe_prefers_larger_graph_peak_for_intermediates():
+    stats = StubStats([snap(0, 0, 0), snap(2048, 0, 1)], graph_peak_l1=8192)
+    probe = MemoryFootprintProbe(stats)
+
+    assert probe.measure(lambda: None)['peak_l1_bytes'] == 8192
+
+
+def test_probe_snapshots_after_synchronize_and_clamps_frees():
+    order = []
+    stats = StubStats([snap(4096, 4096, 3), snap(1024, 0, 1)])
+    original_snapshot = stats.snapshot
+    stats.snapshot = lambda: order.append('snapshot') or original_snapshot()
+    probe = MemoryFootprintProbe(stats, synchronize=lambda: order.append('sync'))
+
+    footprint = probe.measure(lambda: order.append('op'))
+
+    assert order == ['snapshot', 'op', 'sync', 'snapshot']
+    assert footprint == {'peak_l1_bytes': 0, 'peak_dram_bytes': 0, 'buffers_allocated': 0}
+
+
+def test_merge_footprints_takes_field_maximum():
+    merged = merge_footprints([
+        {'peak_l1_bytes': 10, 'peak_dram_bytes': 0, 'buffers_allocated': 2},
+        {'peak_l1_bytes': 4, 'peak_dram_bytes': 64, 'buffers_allocated': 1},
+    ])
+
+    assert merged == {'peak_l1_bytes': 10, 'peak_dram_bytes': 64, 'buffers_allocated': 2}
+
+
+def test_ttnn_allocator_stats_reads_memory_views():
+    views = {
+        'L1': SimpleNamespace(num_banks=64, total_bytes_allocated_per_bank=2048),
+        'DRAM': SimpleNamespace(num_banks=12, total_bytes_allocated_per_bank=4096),
+    }
+    reports = SimpleNamespace(
+        get_memory_view=lambda device, buffer_type: views[buffer_type],
+        get_buffers=lambda devices: ['a', 'b', 'c'],
+    )
+    stub_ttnn = SimpleNamespace(
+        _ttnn=SimpleNamespace(reports=reports),
+        BufferType=SimpleNamespace(L1='L1', DRAM='DRAM'),
+    )
+
+    stats = TtnnAllocatorStats(stub_ttnn, device="dev")
+
+    assert stats.snapshot() == {'l1_bytes': 64 * 2048, 'dram_bytes': 12 * 4096, 'buffers': 3}
+    assert stats.run_with_peak(lambda: 42) == (42, None)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Tests for op-chain results built from marked profiler rows."""
+
+import csv
+
+import pytest
+
+from op_chains import OP_CHAINS_BY_NAME, build_chain_result, get_chains, resolve_input
+from single_session_perf import (
+    KERNEL_DURATION_COLUMN, MARKER_END, MARKER_START, OP_TO_OP_COLUMN, make_marker, parse_marked_op_rows,
+)
+
+
+def write_marked_csv(path, samples):
+    """samples: (marker name, [(kernel ns, op-to-op ns), ...]) bracketed by start/end signposts."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=["OP CODE", "OP TYPE", KERNEL_DURATION_COLUMN, OP_TO_OP_COLUMN])
+        writer.writeheader()
+        for sample, (name, ops) in enumerate(samples):
+            writer.writerow({"OP CODE": make_marker(MARKER_START, name, sample), "OP TYPE": "signpost"})
+            for kernel_ns, gap_ns in ops:
+                writer.writerow({"OP CODE": "BinaryDeviceOperation", "OP TYPE": "tt_dnn_device",
+                                 KERNEL_DURATION_COLUMN: kernel_ns, OP_TO_OP_COLUMN: gap_ns})
+            writer.writerow({"OP CODE": make_marker(MARKER_END, name, sample), "OP TYPE": "signpost"})
+    return str(path)
+
+
+def test_resolve_input_reads_chain_inputs_and_step_outputs():
+    tensors, outputs = {"x": "X", "grad": "G"}, ["add_out", ["dx", "dy"]]
+
+    assert resolve_input("x", tensors, outputs) == "X"
+    assert resolve_input("@0", tensors, outputs) == "add_out"
+    assert resolve_input("@1.1", tensors, outputs) == "dy"
+
+
+def test_chain_overhead_ratio_from_marked_rows(tmp_path):
+    chain = OP_CHAINS_BY_NAME["x_mul_sigmoid"]
+    csv_path = write_marked_csv(tmp_path / "ops.csv", [
+        # The chain: sigmoid then mul; the first gap is outside the chain and ignored
+        (chain.marker_name, [(100, 5000), (200, 60)]),
+        (chain.marker_name, [(110, 5000), (190, 40)]),
+        (chain.step_marker_name(0), [(100, 0)]),
+        (chain.step_marker_name(1), [(180, 0)]),
+        (chain.fused_marker_name, [(160, 0)]),
+    ])
+
+    result = build_chain_result(chain, parse_marked_op_rows(csv_path))
+
+    assert result['runs'] == [360.0, 340.0]
+    assert result['kernel_duration_ns'] == 300.0 and result['op_to_op_ns'] == 50.0
+    assert result['component_sum_ns'] == 280.0
+    assert result['chain_overhead_ratio'] == pytest.approx(350 / 280)
+    assert result['fused_speedup'] == pytest.approx(350 / 160)
+
+
+def test_chain_without_every_standalone_step_has_no_result():
+    chain = OP_CHAINS_BY_NAME["add_relu"]
+    op_rows = {chain.marker_name: [[{'kernel_ns': 100.0, 'op_to_op_ns': 0.0}]],
+               chain.step_marker_name(0): [[{'kernel_ns': 50.0, 'op_to_op_ns': 0.0}]]}
+
+    assert build_chain_result(chain, op_rows) is None
+
+
+def test_get_chains_rejects_unknown_names():
+    assert [chain.name for chain in get_chains(["add_relu"])] == ["add_relu"]
+    with pytest.raises(ValueError):
+        get_chains(["no_such_chain"])
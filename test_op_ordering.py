@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Tests for test ordering strategies and the ordering benchmark."""
+
+import json
+import subprocess
+
+import pytest
+
+import op_ordering
+from op_ordering import count_group_switches, order_tests, run_ordering_benchmark, summarize_timings
+
+TESTS = ["test_abs_bw", "test_add_", "test_exp", "test_where", "test_custom_thing", "test_add",
+         "test_bitwise_and", "test_abs", "test_mul"]
+
+
+def test_grouped_order_keeps_kernel_groups_together():
+    ordered = order_tests(TESTS, "grouped")
+
+    assert ordered == ["test_abs", "test_exp", "test_add", "test_add_", "test_mul", "test_bitwise_and",
+                       "test_where", "test_abs_bw", "test_custom_thing"]
+    assert count_group_switches(ordered) == 4 < count_group_switches(TESTS)
+
+
+def test_declaration_and_random_orders():
+    assert order_tests(TESTS) == TESTS
+    shuffled = order_tests(TESTS, "random", seed=3)
+    assert sorted(shuffled) == sorted(TESTS) and shuffled == order_tests(TESTS, "random", seed=3)
+    with pytest.raises(ValueError):
+        order_tests(TESTS, "fastest")
+
+
+def test_summarize_timings_splits_compile_from_steady_time():
+    timings = {"test_abs": {'first_call_s': 3.0, 'steady_call_s': 0.5},
+               "test_exp": {'first_call_s': 2.0, 'steady_call_s': 1.0},
+               "test_add": {'first_call_s': 4.0, 'steady_call_s': None}}
+
+    summary = summarize_timings(timings, wall_time_s=12.0)
+
+    assert summary == {'tests': 3, 'wall_time_s': 12.0, 'first_run_total_s': 9.0,
+                       'steady_run_total_s': 1.5, 'compile_overhead_s': 3.5}
+
+
+@pytest.mark.parametrize("returncode", [0, 1])
+def test_crashed_worker_is_not_reported_as_a_timing(monkeypatch, returncode):
+    def fake_worker(cmd, **kwargs):
+        status_file = cmd[cmd.index("--status") + 1]
+        with open(status_file, 'w') as f:
+            json.dump({'failed': {}, 'timings': {"test_abs": {'first_call_s': 1.0, 'steady_call_s': 0.1}}}, f)
+        return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr="Segmentation fault")
+
+    monkeypatch.setattr(op_ordering.subprocess, 'run', fake_worker)
+
+    summary = run_ordering_benchmark(["test_abs", "test_exp"], "grouped")
+
+    if returncode:
+        assert summary is None
+    else:
+        assert summary['tests'] == 1 and summary['strategy'] == "grouped"
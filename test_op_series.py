@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Tests for the memory-mapped per-op series."""
+
+import json
+
+import numpy as np
+
+from op_series import RECORD_DTYPE, SERIES_DIR, OpSeriesStore, update_op_series
+
+
+def test_records_are_fixed_width():
+    assert RECORD_DTYPE.itemsize == 48
+
+
+def test_append_is_ordered_and_replaces_reuploads(tmp_path, results_file):
+    store = OpSeriesStore(tmp_path / "series")
+    store.append(results_file("2025-01-01T00:00:00", "c1", {'abs': 10.0}))
+    store.append(results_file("2025-01-03T00:00:00", "c3", {'abs': 30.0, 'neg': 5.0}))
+    store.append(results_file("2025-01-02T00:00:00", "c2", {'abs': 20.0}))
+    store.append(results_file("2025-01-03T00:00:00", "c3", {'abs': 31.0}))
+
+    reader = OpSeriesStore(tmp_path / "series")
+    abs_series = reader.series('abs')
+    assert isinstance(abs_series, np.memmap)
+    assert abs_series['mean'].tolist() == [10.0, 20.0, 31.0]
+    assert [reader.commits[i] for i in abs_series['commit']] == ["c1", "c2", "c3"]
+    assert reader.ops() == ['abs', 'neg']
+    assert len(reader.series('missing')) == 0
+
+
+def test_update_builds_from_archive_then_appends(tmp_path, results_file):
+    daily = tmp_path / "daily"
+    daily.mkdir()
+    first = results_file("2025-01-01T00:00:00", "c1", {'abs': 10.0})
+    (daily / "a.json").write_text(json.dumps(first))
+    (tmp_path / "index.json").write_text(json.dumps(
+        {'files': [{'filename': "a.json", 'path': "data/daily/a.json",
+                    'measurement_date': "2025-01-01T00:00:00"}]}))
+
+    update_op_series(tmp_path, first)
+    update_op_series(tmp_path, results_file("2025-01-02T00:00:00", "c2", {'abs': 12.0}))
+
+    series = OpSeriesStore(tmp_path / SERIES_DIR).series('abs')
+    assert series['mean'].tolist() == [10.0, 12.0]
+    assert series['n'].tolist() == [3, 3]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests for the whole-archive regression timeline."""
+
+import csv
+import json
+
+from perf_timeline import build_timeline, commit_points, commit_stats, filter_events, update_timeline, write_timeline
+
+
+def test_baseline_mode_flags_steps_against_the_rolling_median(make_store):
+    store = make_store({'abs': [100, 101, 99, 100, 160, 100, 100],
+                        'exp': [50, None, 50, 51, None, 50, 80]})
+
+    events = build_timeline(store, mode='baseline', unit='file', window=3, threshold_percent=20)
+
+    assert [(e['operation_name'], e['commit'], e['change_type']) for e in events] == [
+        ('exp', 'c6', 'regression'), ('abs', 'c4', 'regression')]
+    exp = events[0]
+    assert exp['previous_commit'] == 'c5'
+    assert exp['reference_ns'] == 50 and exp['reference_points'] == 3
+    assert abs(exp['change_percent'] - 60) < 1e-9
+
+
+def test_window_modes_report_a_step_once(make_store):
+    store = make_store({'abs': [100, 100.2, 99.8, 100.1, 99.9, 100, 120, 120.1, 119.9, 120]})
+
+    for mode in ['baseline', 'significance']:
+        (event,) = build_timeline(store, mode=mode, unit='file', window=5, threshold_percent=5)
+        assert event['commit'] == 'c6' and event['previous_commit'] == 'c5'
+        assert event['change_type'] == 'regression' and abs(event['change_percent'] - 20) < 0.5
+
+
+def test_window_modes_report_a_second_step_on_top_of_the_first(make_store):
+    store = make_store({'abs': [100] * 10 + [130, 170, 172]})
+
+    events = build_timeline(store, mode='baseline', unit='file', window=10, threshold_percent=20)
+    assert [(e['commit'], round(e['change_percent'])) for e in events] == [('c11', 70), ('c10', 30)]
+
+    store = make_store({'abs': [100, 100.2, 99.8, 100.1, 99.9, 100, 100.2, 99.8, 110, 125, 125.2]})
+    events = build_timeline(store, mode='significance', unit='file', window=8, threshold_percent=5)
+    assert [e['commit'] for e in events] == ['c9', 'c8']
+
+
+def test_significance_mode_needs_more_than_the_op_noise(make_store):
+    store = make_store({'stable': [100, 100.2, 99.8, 100.1, 99.9, 100, 106],
+                        'jittery': [100, 110, 92, 104, 96, 108, 112]})
+
+    events = build_timeline(store, mode='significance', unit='file', window=6, threshold_percent=5)
+
+    assert [(e['operation_name'], e['commit']) for e in events] == [('stable', 'c6')]
+    assert events[0]['reference_points'] == 6
+
+
+def test_pairwise_mode_flags_both_sides_of_a_spike(make_store):
+    store = make_store({'abs': [100, 100, 160, 100]})
+
+    events = build_timeline(store, mode='pairwise', unit='file', threshold_percent=20)
+
+    assert [(e['commit'], e['change_type']) for e in events] == [('c3', 'improvement'), ('c2', 'regression')]
+
+
+def test_commit_unit_pools_consecutive_replicates(make_store):
+    store = make_store({'abs': [100, 120, 200, 200]}, commits=['a', 'a', 'b', 'b'])
+
+    pooled, dates, commits = commit_points(store)
+    assert pooled.tolist() == [[110, 200]]
+    assert commits == ['a', 'b'] and dates[0] == "2025-01-02T00:00:00"
+
+    (event,) = build_timeline(store, mode='pairwise', unit='commit', threshold_percent=20)
+    assert event['commit'] == 'b' and event['previous_commit'] == 'a'
+
+    runs, mean, std, _, _ = commit_stats(store)
+    assert runs.tolist() == [[6, 6]] and mean.tolist() == [[110, 200]]
+    # The spread between the replicates' means counts over all six runs
+    assert abs(std[0, 0] - (6 * 100 / 5) ** 0.5) < 1e-9 and std[0, 1] == 0
+
+
+def test_filter_and_write_timeline(tmp_path, make_store):
+    store = make_store({'abs': [100, 100, 100, 150, 150, 100]})
+    events = build_timeline(store, mode='pairwise', unit='file', threshold_percent=20)
+
+    assert [e['commit'] for e in filter_events(events, since="2025-01-04", until="2025-01-06")] == ['c3']
+
+    json_path, csv_path = write_timeline(tmp_path, events, {'mode': 'pairwise'})
+    assert write_timeline(tmp_path, events, {'mode': 'pairwise'}) is None  # unchanged, not rewritten
+    assert write_timeline(tmp_path, events[:1], {'mode': 'pairwise'}) == (json_path, csv_path)
+    write_timeline(tmp_path, events, {'mode': 'pairwise'})
+    metadata = json.loads(json_path.read_text())['metadata']
+    assert (metadata['events'], metadata['regressions'], metadata['improvements']) == (2, 1, 1)
+    with open(csv_path) as f:
+        rows = list(csv.DictReader(f))
+    assert [row['commit'] for row in rows] == ['c5', 'c3']
+
+
+def test_update_timeline_uses_the_given_settings(tmp_path, make_store):
+    store = make_store({'abs': [100, 100.2, 99.8, 100.1, 99.9, 100, 106]})
+    settings = {'mode': 'significance', 'unit': 'file', 'window': 6, 'threshold_percent': 5.0}
+
+    document = json.loads(update_timeline(tmp_path, store, settings).read_text())
+
+    assert document['metadata']['mode'] == 'significance' and document['metadata']['events'] == 1
+    assert update_timeline(tmp_path, store) is not None  # the 20% baseline default finds no event
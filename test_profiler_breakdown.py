@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the per-RISC/per-core profiler breakdown parsers."""
+
+import csv
+
+import pytest
+
+from profiler_breakdown import (
+    breakdown_from_reports, describe_breakdown_change, parse_device_log, risc_column,
+)
+
+DEVICE_LOG_HEADER = ("PCIe slot, core_x, core_y, RISC processor type, timer_id, "
+                     "time[cycles since reset], data, run host ID, zone name, type, "
+                     "source line, source file, meta data")
+
+
+def write_device_log(path, zones):
+    """zones: (run_id, x, y, risc, start_cycle, end_cycle)"""
+    lines = ["ARCH: wormhole_b0, CHIP_FREQ[MHz]: 1000, Max Compute Cores: 64", DEVICE_LOG_HEADER]
+    for run_id, x, y, risc, start, end in zones:
+        zone = f"{risc.split('_')[0]}-KERNEL"
+        lines.append(f"0,{x},{y},{risc},1,{start},0,{run_id},{zone},ZONE_START,1,kernel.cpp,")
+        lines.append(f"0,{x},{y},{risc},2,{end},0,{run_id},{zone},ZONE_END,1,kernel.cpp,")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def write_ops_csv(path, rows):
+    columns = ["OP CODE", "OP TYPE", "GLOBAL CALL COUNT", "CORE COUNT",
+               "DEVICE KERNEL DURATION [ns]"] + [risc_column(r) for r in ("BRISC", "NCRISC", "TRISC1")]
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def op_row(op_id, cores, writer_ns, reader_ns, compute_ns):
+    return {"OP CODE": "UnaryDeviceOperation", "OP TYPE": "tt_dnn_device",
+            "GLOBAL CALL COUNT": op_id, "CORE COUNT": cores,
+            "DEVICE KERNEL DURATION [ns]": max(writer_ns, reader_ns, compute_ns),
+            risc_column("BRISC"): writer_ns, risc_column("NCRISC"): reader_ns,
+            risc_column("TRISC1"): compute_ns}
+
+
+def test_parse_device_log_converts_cycles_per_core(tmp_path):
+    log = tmp_path / "profile_log_device.csv"
+    write_device_log(log, [(1024, 1, 1, "NCRISC", 100, 600), (1024, 1, 1, "TRISC_1", 100, 400),
+                           (1024, 2, 1, "NCRISC", 100, 300)])
+
+    ops = parse_device_log(str(log))
+
+    assert ops == {1024: {"1,1": {"NCRISC": 500.0, "TRISC1": 300.0}, "2,1": {"NCRISC": 200.0}}}
+
+
+def test_breakdown_without_device_log_uses_csv_columns(tmp_path):
+    ops_csv = tmp_path / "ops_perf_results_x.csv"
+    write_ops_csv(ops_csv, [op_row(1, 64, 900, 1500, 1200)])
+
+    breakdown = breakdown_from_reports(str(ops_csv))
+
+    assert breakdown['core_count'] == 64
+    assert breakdown['bottleneck_stage'] == 'reader'
+    assert breakdown['stages']['compute'] == {'max_ns': 1200.0}
+    assert 'kernel_spread_ns' not in breakdown
+
+
+def test_breakdown_with_device_log_counts_slow_cores(tmp_path):
+    ops_csv = tmp_path / "ops_perf_results_x.csv"
+    write_ops_csv(ops_csv, [op_row(7, 4, 100, 1000, 200)])
+    zones = []
+    for x, reader_end in enumerate([500, 500, 500, 900]):
+        zones += [(7, x, 0, "NCRISC", 0, reader_end), (7, x, 0, "TRISC_1", 0, 200), (7, x, 0, "BRISC", 0, 100)]
+    log = tmp_path / "profile_log_device.csv"
+    write_device_log(log, zones)
+
+    breakdown = breakdown_from_reports(str(ops_csv), str(log))
+
+    reader = breakdown['stages']['reader']
+    assert breakdown['core_count'] == 4
+    assert reader['max_ns'] == 900.0
+    assert reader['median_ns'] == 500.0
+    assert reader['slow_cores'] == 1
+    assert breakdown['kernel_spread_ns'] == 400.0
+
+
+def test_describe_breakdown_change_names_stage_and_cores():
+    previous = {'core_count': 64, 'bottleneck_stage': 'compute',
+                'stages': {'reader': {'max_ns': 1000.0}, 'compute': {'max_ns': 1500.0}}}
+    latest = {'core_count': 64, 'bottleneck_stage': 'reader',
+              'stages': {'reader': {'max_ns': 2000.0, 'slow_cores': 8}, 'compute': {'max_ns': 1510.0}}}
+
+    note = describe_breakdown_change(previous, latest)
+
+    assert note == "reader kernel slower (+100.0%) on 8 of 64 cores; bottleneck moved compute → reader"
+
+
+@pytest.mark.parametrize("previous,latest", [(None, {}), ({}, None)])
+def test_describe_breakdown_change_needs_both(previous, latest):
+    assert describe_breakdown_change(previous, latest) is None
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for the legacy/compact results file formats."""
+
+import json
+
+import pytest
+
+from results_format import SCHEMA_VERSION, dump_results, from_compact, load_results, to_compact
+
+LEGACY = {
+    'metadata': {'measurement_date': "2025-01-01T00:00:00", 'git_commit_id': "abc"},
+    'results': [
+        {'test_name': "test_abs", 'operation_name': "abs", 'runs': [25919.0, 25920.0],
+         'average_duration_ns': 25919.666666666668, 'std_deviation_ns': 0.5773502691896257},
+        {'test_name': "test_neg", 'operation_name': "neg", 'runs': [10.0],
+         'average_duration_ns': 10.0, 'peak_l1_bytes': 4096},
+    ],
+    'chains': [{'chain_name': "x"}],
+}
+
+
+def test_to_compact_is_dict_of_arrays_with_rounded_durations():
+    compact = to_compact(LEGACY)
+
+    assert compact['metadata']['schema_version'] == SCHEMA_VERSION
+    assert compact['results']['operation_name'] == ["abs", "neg"]
+    assert compact['results']['average_duration_ns'] == [25919.7, 10]
+    assert compact['results']['runs'] == [[25919, 25920], [10]]
+    assert compact['results']['peak_l1_bytes'] == [None, 4096]
+    assert compact['chains'] == LEGACY['chains']
+
+
+def test_from_compact_restores_rows_without_missing_fields():
+    rows = from_compact(to_compact(LEGACY))['results']
+
+    assert rows[0]['average_duration_ns'] == 25919.7
+    assert 'peak_l1_bytes' not in rows[0]
+    assert rows[1]['peak_l1_bytes'] == 4096
+    assert from_compact(LEGACY) is LEGACY
+
+
+@pytest.mark.parametrize("result_format", ["legacy", "compact"])
+def test_load_results_reads_both_formats(tmp_path, result_format):
+    path = tmp_path / "results.json"
+    dump_results(LEGACY, path, result_format)
+
+    data = load_results(path)
+
+    assert [r['operation_name'] for r in data['results']] == ["abs", "neg"]
+    assert data['metadata']['git_commit_id'] == "abc"
+
+
+def test_compact_file_has_no_indentation(tmp_path):
+    path = tmp_path / "results.json"
+    dump_results(LEGACY, path, "compact")
+
+    text = path.read_text()
+    assert "\n" not in text and ": " not in text
+    assert json.loads(text)['metadata']['schema_version'] == SCHEMA_VERSION
+
+
+def test_dump_results_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        dump_results(LEGACY, tmp_path / "x.json", "yaml")
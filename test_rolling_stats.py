@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for the incremental per-op rolling statistics."""
+
+import json
+import statistics
+from datetime import datetime, timedelta
+
+import pytest
+
+import rolling_stats
+from rolling_stats import (
+    STATS_PATH, apply_measurement, baseline, empty_stats, std_dev, update_rolling_stats,
+)
+
+
+def test_welford_matches_batch_statistics(results_file):
+    values = [100.0, 102.0, 98.0, 101.0, 99.5]
+    stats = empty_stats()
+    for day, value in enumerate(values, 1):
+        apply_measurement(stats, results_file(f"2025-01-{day:02d}T00:00:00", f"c{day}", {'abs': value}))
+
+    op = stats['ops']['abs']
+    assert op['count'] == 5
+    assert op['mean'] == pytest.approx(statistics.mean(values))
+    assert std_dev(op) == pytest.approx(statistics.stdev(values))
+    assert baseline(op) == statistics.median(values)
+    assert baseline(op, exclude_latest=True) == statistics.median(values[:-1])
+
+
+def test_ring_buffer_change_point_and_failure(monkeypatch, results_file):
+    monkeypatch.setattr(rolling_stats, 'RING_SIZE', 3)
+    stats = empty_stats()
+    for day, value in enumerate([100.0, 101.0, 99.0, 150.0, 151.0], 1):
+        apply_measurement(stats, results_file(f"2025-01-{day:02d}T00:00:00", f"c{day}", {'abs': value}))
+    apply_measurement(stats, results_file("2025-01-06T00:00:00", "c6", {}, failed=["test_abs"]))
+
+    op = stats['ops']['abs']
+    assert op['recent'] == [99.0, 150.0, 151.0]
+    # Recorded once the ring median moved, dated at the first value of the new level
+    assert op['last_change_point'] == {'date': "2025-01-04T00:00:00", 'commit': "c4",
+                                       'before_ns': 100.0, 'after_ns': 150.0}
+    assert op['last_failure'] == {'date': "2025-01-06T00:00:00", 'commit': "c6"}
+
+
+def apply_series(stats, results_file, values):
+    for day, value in enumerate(values):
+        date = (datetime(2025, 1, 1) + timedelta(days=day)).isoformat()
+        apply_measurement(stats, results_file(date, f"c{day}", {'abs': value}))
+    return stats['ops']['abs']
+
+
+def test_a_one_run_spike_is_not_a_change_point(results_file):
+    op = apply_series(empty_stats(), results_file, [100.0] * 10 + [140.0] + [100.0] * 5)
+
+    assert op['last_change_point'] is None and op['pending'] is None
+
+
+def test_a_step_is_dated_at_its_first_point(results_file):
+    op = apply_series(empty_stats(), results_file, [100.0] * 20 + [130.0] * 12)
+
+    assert op['last_change_point'] == {'date': "2025-01-21T00:00:00", 'commit': "c20",
+                                       'before_ns': 100.0, 'after_ns': 130.0}
+    assert op['level'] == 130.0
+
+
+def test_older_or_repeated_files_are_skipped(results_file):
+    stats = empty_stats()
+    assert apply_measurement(stats, results_file("2025-01-02T00:00:00", "c2", {'abs': 100.0}))
+    assert not apply_measurement(stats, results_file("2025-01-02T00:00:00", "c2", {'abs': 100.0}))
+    assert not apply_measurement(stats, results_file("2025-01-01T00:00:00", "c1", {'abs': 50.0}))
+    assert stats['ops']['abs']['count'] == 1
+
+
+def test_update_builds_from_archive_then_applies(tmp_path, results_file):
+    daily = tmp_path / "daily"
+    daily.mkdir()
+    first = results_file("2025-01-01T00:00:00", "c1", {'abs': 100.0})
+    (daily / "a.json").write_text(json.dumps(first))
+    (tmp_path / "index.json").write_text(json.dumps({'files': [
+        {'filename': "a.json", 'path': "data/daily/a.json", 'measurement_date': "2025-01-01T00:00:00"}]}))
+
+    update_rolling_stats(tmp_path, first)
+    update_rolling_stats(tmp_path, results_file("2025-01-02T00:00:00", "c2", {'abs': 110.0}))
+
+    stats = json.loads((tmp_path / STATS_PATH).read_text())
+    assert stats['metadata']['measurements'] == 2
+    assert stats['ops']['abs']['recent'] == [100.0, 110.0]
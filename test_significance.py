@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Tests for significance testing with per-op noise models."""
+
+import json
+
+import numpy as np
+import pytest
+
+from baseline_detector import load_recent
+from index_store import add_entry
+from significance import benjamini_hochberg, significance_tests, t_two_sided_p
+
+
+def point(ops):
+    """One result set; ops maps name -> (mean, std, runs)."""
+    return {'metadata': {}, 'results': [
+        {'operation_name': op, 'average_duration_ns': mean, 'std_deviation_ns': std, 'successful_runs': n}
+        for op, (mean, std, n) in ops.items()]}
+
+
+def test_t_distribution_p_values():
+    # Reference values of the two-sided Student t distribution
+    p = t_two_sided_p(np.array([2.0, 2.228, 10.0, 1.0, np.inf]), np.array([10.0, 10.0, 3.0, 1.0, 4.0]))
+    np.testing.assert_allclose(p, [0.07339, 0.05, 0.002128, 0.5, 0.0], atol=2e-5)
+
+
+def test_benjamini_hochberg():
+    q = benjamini_hochberg(np.array([0.01, 0.04, np.nan, 0.03, 0.5]))
+    np.testing.assert_allclose(q, [0.04, 0.16 / 3, np.nan, 0.16 / 3, 0.5])
+
+
+def test_small_change_in_stable_op_is_flagged_but_jittery_op_is_not():
+    stable_window = [100.0, 100.2, 99.8, 100.1, 99.9, 100.0]
+    jittery_window = [100.0, 110.0, 92.0, 104.0, 96.0, 108.0]
+    history = [point({'stable': (106.0, 0.3, 5), 'jittery': (112.0, 0.3, 5)})] + [
+        point({'stable': (s, 0.3, 5), 'jittery': (j, 0.3, 5)}) for s, j in zip(stable_window, jittery_window)]
+
+    tests = {t['operation_name']: t for t in significance_tests(history, min_effect_percent=5.0)}
+
+    stable, jittery = tests['stable'], tests['jittery']
+    assert stable['significant']
+    assert stable['change_percent'] == pytest.approx(6.0, abs=0.1)
+    assert stable['q_value'] < 0.05 and stable['hedges_g'] > 0
+    assert not jittery['significant']
+    assert jittery['practical_threshold_percent'] > 12.0
+
+
+def test_outlying_window_point_is_left_out_of_the_pool():
+    # One run at twice the usual time must not make the latest look faster
+    window = [100.0, 100.5, 99.5, 100.2, 200.0, 99.8]
+    history = [point({'abs': (100.1, 0.5, 3)})] + [point({'abs': (m, 0.5, 3)}) for m in window]
+
+    (test,) = significance_tests(history)
+
+    assert test['baseline_runs'] == 15
+    assert abs(test['change_percent']) < 1.0
+    assert not test['significant']
+
+
+def test_ops_without_enough_history_are_not_tested():
+    history = [point({'abs': (100.0, 1.0, 3), 'single': (100.0, 0.0, 1)}),
+               point({'abs': (100.0, 1.0, 3), 'single': (90.0, 0.0, 1)}),
+               point({'abs': (100.0, 1.0, 3), 'single': (90.0, 0.0, 1)})]
+    assert significance_tests(history, min_points=3) == []
+    assert [t['operation_name'] for t in significance_tests(history, min_points=2)] == ['abs']
+
+
+def upload(data_dir, day, commit, mean):
+    """Add one results file for op 'abs' (3 runs) to the archive and the index."""
+    (data_dir / "daily").mkdir(exist_ok=True)
+    filename = f"{day}.json"
+    date = f"2025-08-{day:02d}T00:00:00"
+    (data_dir / "daily" / filename).write_text(json.dumps(
+        {'metadata': {'measurement_date': date, 'git_commit_id': commit},
+         'results': [{'operation_name': 'abs', 'average_duration_ns': mean, 'std_deviation_ns': 0.5,
+                      'successful_runs': 3}]}))
+    add_entry(data_dir, {'filename': filename, 'path': f"data/daily/{filename}",
+                         'measurement_date': date, 'git_commit_id': commit})
+
+
+@pytest.mark.parametrize("unit", ["commit", "file"])
+def test_a_step_alerts_once(tmp_path, unit):
+    for day in range(1, 9):
+        upload(tmp_path, day, f"c{day}", 100.0 + (day % 3) * 0.2)
+
+    alerted, repeats = [], []
+    # The step commit, an intraday rerun of it, then two more commits at the new level
+    for day, commit in [(9, "c9"), (10, "c9"), (11, "c11"), (12, "c12")]:
+        upload(tmp_path, day, commit, 110.0)
+        history = load_recent(tmp_path, 11, unit)
+        previous = load_recent(tmp_path, 11, unit, skip_files=1)
+        (test,) = significance_tests(history, previous=previous)
+        alerted.append(test['significant'])
+        repeats.append(test['repeat'])
+        assert significance_tests(history)[0]['significant']  # still significant against the window
+
+    assert alerted == [True, False, False, False]
+    assert repeats == [False, True, True, True]
+
+
+def test_a_second_step_on_top_of_the_first_is_significant_again(tmp_path):
+    for day in range(1, 11):
+        upload(tmp_path, day, f"c{day}", 100.0 + (day % 3) * 0.2)
+
+    outcomes = []
+    for day, mean in [(11, 110.0), (12, 125.0), (13, 125.2)]:
+        upload(tmp_path, day, f"c{day}", mean)
+        history = load_recent(tmp_path, 11, 'file')
+        previous = load_recent(tmp_path, 11, 'file', skip_files=1)
+        (test,) = significance_tests(history, previous=previous)
+        outcomes.append((test['significant'], test['repeat']))
+
+    # 125 is a second step away from the flagged 110; 125.2 is the same level again
+    assert outcomes == [(True, False), (True, False), (False, True)]
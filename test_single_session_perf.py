@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Tests for the single-session runner's profiler parsing and result recording."""
+
+import csv
+import os
+
+from single_session_perf import (
+    KERNEL_DURATION_COLUMN, MARKER_END, MARKER_START, SingleSessionPerfMeasurement, find_ops_perf_csv,
+    make_marker, parse_marked_kernel_durations,
+)
+
+
+def signpost(kind, test_name, sample):
+    return {"OP CODE": make_marker(kind, test_name, sample), "OP TYPE": "signpost"}
+
+
+def kernel(ns):
+    return {"OP CODE": "UnaryDeviceOperation", "OP TYPE": "tt_dnn_device", KERNEL_DURATION_COLUMN: ns}
+
+
+def write_ops_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=["OP CODE", "OP TYPE", KERNEL_DURATION_COLUMN])
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def test_durations_sum_the_ops_between_markers(tmp_path):
+    rows = [kernel(999),  # before any marker (device setup)
+            signpost(MARKER_START, "test_abs", 0), kernel(100), kernel(20), signpost(MARKER_END, "test_abs", 0),
+            signpost(MARKER_START, "test_abs", 1), kernel(110), signpost(MARKER_END, "test_abs", 1),
+            {"OP CODE": "user signpost", "OP TYPE": "signpost"},
+            signpost(MARKER_START, "test_exp", 0), kernel(300)]  # raised before its end marker
+    csv_path = write_ops_csv(tmp_path / "ops.csv", rows)
+
+    assert parse_marked_kernel_durations(csv_path) == {"test_abs": [120.0, 110.0]}
+
+
+def test_find_ops_perf_csv_picks_the_newest(tmp_path):
+    assert find_ops_perf_csv(str(tmp_path)) is None
+    old = write_ops_csv(tmp_path / "ops_perf_results_1.csv", [])
+    (tmp_path / "reports").mkdir()
+    new = write_ops_csv(tmp_path / "reports" / "ops_perf_results_2.csv", [])
+    os.utime(old, (1, 1))
+
+    assert find_ops_perf_csv(str(tmp_path)) == new
+
+
+def test_test_that_fails_partway_is_not_recorded(tmp_path, monkeypatch):
+    rows = []
+    for sample in range(3):
+        rows += [signpost(MARKER_START, "test_abs", sample), kernel(100 + sample),
+                 signpost(MARKER_END, "test_abs", sample)]
+    rows += [signpost(MARKER_START, "test_exp", 0), kernel(200), signpost(MARKER_END, "test_exp", 0)]
+    csv_path = write_ops_csv(tmp_path / "ops.csv", rows)
+
+    perf = SingleSessionPerfMeasurement(samples=3)
+    monkeypatch.setattr(perf, 'run_profiled_session', lambda tests: csv_path)
+    monkeypatch.setattr(perf, 'load_session_status', lambda: {'failed': {"test_exp": "device hang"}})
+    monkeypatch.setattr(perf, 'load_device_ops', lambda: {})
+
+    perf.measure_tests(["test_abs", "test_exp"])
+
+    assert [(r['test_name'], r['successful_runs']) for r in perf.results] == [("test_abs", 3)]
+    assert perf.failed_tests == ["test_exp"]
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Tests for the trace capture/replay harness against a stub ttnn module."""
+
+import pytest
+
+from trace_measurement import (
+    TraceReplayHarness, build_trace_fields, trace_marker_name, TRACE_FIELDS,
+)
+from single_session_perf import make_marker, MARKER_START, MARKER_END
+
+
+class StubTtnn:
+    """Records the trace API calls the harness makes."""
+
+    def __init__(self):
+        self.calls = []
+        self.next_trace_id = 7
+
+    def synchronize_device(self, device):
+        self.calls.append(('synchronize_device',))
+
+    def begin_trace_capture(self, device, cq_id=0):
+        self.calls.append(('begin_trace_capture', cq_id))
+        return self.next_trace_id
+
+    def end_trace_capture(self, device, trace_id, cq_id=0):
+        self.calls.append(('end_trace_capture', trace_id, cq_id))
+
+    def execute_trace(self, device, trace_id, cq_id=0, blocking=True):
+        self.calls.append(('execute_trace', trace_id, cq_id, blocking))
+
+    def release_trace(self, device, trace_id):
+        self.calls.append(('release_trace', trace_id))
+
+    def names(self):
+        return [call[0] for call in self.calls]
+
+
+class FakeClock:
+    """Clock that advances by a fixed step on every read."""
+
+    def __init__(self, step_s):
+        self.now = 0.0
+        self.step_s = step_s
+
+    def __call__(self):
+        value = self.now
+        self.now += self.step_s
+        return value
+
+
+def make_op(stub):
+    def op():
+        stub.calls.append(('op',))
+    return op
+
+
+def test_capture_compiles_eagerly_before_tracing():
+    stub = StubTtnn()
+    harness = TraceReplayHarness(stub, device="dev", replays=4)
+
+    trace_id = harness.capture(make_op(stub))
+
+    assert trace_id == 7
+    assert stub.names() == ['op', 'synchronize_device', 'begin_trace_capture', 'op', 'end_trace_capture']
+
+
+def test_capture_ends_trace_when_op_raises():
+    stub = StubTtnn()
+    harness = TraceReplayHarness(stub, device="dev")
+    calls = []
+
+    def failing_op():
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("capture failed")
+
+    with pytest.raises(RuntimeError):
+        harness.capture(failing_op)
+    assert stub.names()[-1] == 'end_trace_capture'
+
+
+def test_replay_executes_non_blocking_then_synchronizes():
+    stub = StubTtnn()
+    harness = TraceReplayHarness(stub, device="dev", replays=5, cq_id=1, clock=FakeClock(0.001))
+
+    per_iter_ns = harness.replay(7)
+
+    assert stub.calls[:5] == [('execute_trace', 7, 1, False)] * 5
+    assert stub.names()[5:] == ['synchronize_device']
+    assert per_iter_ns == pytest.approx(1e6 / 5)
+
+
+def test_measure_releases_trace_and_emits_signposts():
+    stub = StubTtnn()
+    headers = []
+    harness = TraceReplayHarness(stub, device="dev", replays=2, clock=FakeClock(0.0),
+                                 signpost=lambda header: headers.append(header))
+
+    host_times = harness.measure("test_abs", make_op(stub), samples=3)
+
+    assert len(host_times) == 3
+    assert stub.names().count('begin_trace_capture') == 1
+    assert stub.names().count('execute_trace') == 6
+    assert stub.names()[-1] == 'release_trace'
+    assert headers == [
+        make_marker(kind, trace_marker_name("test_abs"), sample)
+        for sample in range(3) for kind in (MARKER_START, MARKER_END)
+    ]
+
+
+def test_invalid_replay_count_rejected():
+    with pytest.raises(ValueError):
+        TraceReplayHarness(StubTtnn(), device="dev", replays=0)
+
+
+def test_build_trace_fields_divides_device_totals_by_replays():
+    fields = build_trace_fields([100.0, 300.0], [1000.0, 3000.0], replays=10)
+
+    assert sorted(fields) == sorted(TRACE_FIELDS)
+    assert fields['trace_replays'] == 10
+    assert fields['trace_samples'] == 2
+    assert fields['trace_host_time_ns'] == pytest.approx(200.0)
+    assert fields['trace_device_time_ns'] == pytest.approx(200.0)
+    assert fields['trace_device_time_std_ns'] == pytest.approx(141.421, rel=1e-3)
+
+
+def test_build_trace_fields_without_profiler_data():
+    fields = build_trace_fields([50.0], None, replays=100)
+
+    assert fields['trace_host_time_ns'] == 50.0
+    assert fields['trace_host_time_std_ns'] == 0
+    assert fields['trace_device_time_ns'] is None
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Trace Capture/Replay Measurement
+
+For tiny single-tile ops the eager measurement is dominated by host dispatch.
+Production decode loops run under ttnn traces, so this mode captures each op
+into a trace once and replays it N times:
+
+    eager run (compiles the program) -> begin_trace_capture -> op -> end_trace_capture
+    -> execute_trace x N (non-blocking) -> synchronize_device -> release_trace
+
+Host time per iteration is the wall time of the replay loop divided by N.
+Device time per iteration comes from the kernel durations the profiler records
+between the trace signposts, divided by N. Both are stored next to the eager
+numbers in each result entry (see TRACE_FIELDS).
+
+The harness only talks to the ttnn module it is given, so it can be tested
+against a stub without hardware.
+"""
+
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+TRACE_PREFIX = "trace:"
+DEFAULT_REPLAYS = 100
+TRACE_REGION_SIZE = 8 * 1024 * 1024
+
+TRACE_FIELDS = [
+    'trace_replays', 'trace_samples',
+    'trace_host_time_ns', 'trace_host_time_std_ns',
+    'trace_device_time_ns', 'trace_device_time_std_ns',
+]
+
+
+def trace_marker_name(test_name: str) -> str:
+    """Signpost name bracketing the replay loop of one test."""
+    return f"{TRACE_PREFIX}{test_name}"
+
+
+class TraceReplayHarness:
+    """Capture an op into a ttnn trace and time its replays.
+
+    Args:
+        ttnn_module: The ttnn module (or a stub exposing the same trace API)
+        device: Device opened with a trace region
+        replays: Trace executions per sample
+        cq_id: Command queue used for capture and replay
+        clock: Monotonic clock returning seconds
+        signpost: Optional tracy signpost function; called with start/end
+            headers around every replay loop so device time can be parsed
+    """
+
+    def __init__(self, ttnn_module, device, replays: int = DEFAULT_REPLAYS, cq_id: int = 0,
+                 clock: Callable[[], float] = time.perf_counter,
+                 signpost: Optional[Callable] = None):
+        if replays < 1:
+            raise ValueError("replays must be at least 1")
+        self.ttnn = ttnn_module
+        self.device = device
+        self.replays = replays
+        self.cq_id = cq_id
+        self.clock = clock
+        self.signpost = signpost
+
+    def capture(self, fn: Callable[[], object]):
+        """Run fn eagerly once to compile it, then capture it into a trace."""
+        fn()
+        self.ttnn.synchronize_device(self.device)
+        trace_id = self.ttnn.begin_trace_capture(self.device, cq_id=self.cq_id)
+        try:
+            fn()
+        finally:
+            self.ttnn.end_trace_capture(self.device, trace_id, cq_id=self.cq_id)
+        return trace_id
+
+    def replay(self, trace_id) -> float:
+        """Execute the trace `replays` times and return host ns per iteration."""
+        start = self.clock()
+        for _ in range(self.replays):
+            self.ttnn.execute_trace(self.device, trace_id, cq_id=self.cq_id, blocking=False)
+        self.ttnn.synchronize_device(self.device)
+        return (self.clock() - start) * 1e9 / self.replays
+
+    def measure(self, name: str, fn: Callable[[], object], samples: int = 1) -> List[float]:
+        """Capture fn and return the host time per iteration for each sample."""
+        from single_session_perf import make_marker, MARKER_START, MARKER_END
+
+        trace_id = self.capture(fn)
+        host_times = []
+        try:
+            for sample in range(samples):
+                if self.signpost:
+                    self.signpost(header=make_marker(MARKER_START, trace_marker_name(name), sample))
+                host_times.append(self.replay(trace_id))
+                if self.signpost:
+                    self.signpost(header=make_marker(MARKER_END, trace_marker_name(name), sample))
+        finally:
+            self.ttnn.release_trace(self.device, trace_id)
+        return host_times
+
+
+def build_trace_fields(host_times_ns: List[float], device_totals_ns: Optional[List[float]],
+                       replays: int) -> Dict:
+    """Aggregate replay samples into the trace schema fields.
+
+    host_times_ns are already per iteration; device_totals_ns are the summed
+    kernel durations of each whole replay loop and are divided by replays.
+    Device fields are None when the profiler recorded nothing.
+    """
+    device_per_iter = [total / replays for total in (device_totals_ns or [])]
+    return {
+        'trace_replays': replays,
+        'trace_samples': len(host_times_ns),
+        'trace_host_time_ns': statistics.mean(host_times_ns) if host_times_ns else None,
+        'trace_host_time_std_ns': statistics.stdev(host_times_ns) if len(host_times_ns) > 1 else 0,
+        'trace_device_time_ns': statistics.mean(device_per_iter) if device_per_iter else None,
+        'trace_device_time_std_ns': (statistics.stdev(device_per_iter)
+                                     if len(device_per_iter) > 1 else 0),
+    }
+
+
+def run_trace_benchmarks(ttnn_module, device, test_names: List[str], samples: int, replays: int,
+                         failed: Dict[str, str], signpost: Optional[Callable] = None) -> Dict[str, List[float]]:
+    """Measure every traceable registry op and return host times per test.
+
+    Hand-written tests are skipped: their bodies read results back to the
+    host, which cannot be captured into a trace.
+    """
+    from eltwise_op_registry import get_op_spec
+    from test_eltwise_operations import create_op_spec_inputs, invoke_op_spec
+
+    harness = TraceReplayHarness(ttnn_module, device, replays=replays, signpost=signpost)
+    host_times = {}
+    for i, test_name in enumerate(test_names, 1):
+        try:
+            spec = get_op_spec(test_name)
+        except KeyError:
+            continue
+        if spec.custom:
+            continue
+        print(f"🎞️ [{i}/{len(test_names)}] {test_name} (trace x{replays})", flush=True)
+        try:
+            _, ttnn_inputs = create_op_spec_inputs(spec, device)
+            host_times[test_name] = harness.measure(
+                test_name, lambda: invoke_op_spec(spec, ttnn_inputs), samples)
+        except Exception as e:
+            failed[trace_marker_name(test_name)] = str(e)[:200]
+            print(f"    ❌ {test_name} trace failed: {failed[trace_marker_name(test_name)]}", flush=True)
+        ttnn_module.ReadDeviceProfiler(device)
+    return host_times